@@ -12,8 +12,19 @@ import logging
 import traceback
 from pathlib import Path
 from datetime import datetime
+
+# Handle path for both script and bundled exe
+if not getattr(sys, 'frozen', False):
+    # Add src directory to Python path when running as a script
+    src_path = Path(__file__).parent / 'src'
+    sys.path.insert(0, str(src_path))
+
+# Medir el arranque desde aqui: imports por modulo y fases hasta el primer pintado
+from core.startup_timeline import timeline
+timeline.install_import_timer()
+
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtWebEngineWidgets import QWebEngineView  # Necesario para inicializar QtWebEngine
 
 # Fix encoding for Windows console
 if sys.platform == 'win32' and sys.stdout:
@@ -61,12 +72,6 @@ sys.excepthook = exception_hook
 # Setup logging
 logger = setup_logging()
 
-# Handle path for both script and bundled exe
-if not getattr(sys, 'frozen', False):
-    # Add src directory to Python path when running as a script
-    src_path = Path(__file__).parent / 'src'
-    sys.path.insert(0, str(src_path))
-
 from controllers.main_controller import MainController
 from views.main_window import MainWindow
 from core.auth_manager import AuthManager
@@ -74,6 +79,8 @@ from core.session_manager import SessionManager
 from views.first_time_wizard import FirstTimeWizard
 from views.login_dialog import LoginDialog
 
+timeline.mark("modules imported")
+
 
 def get_app_dir() -> Path:
     """
@@ -169,18 +176,25 @@ def main():
         logger.info("Ensuring database exists...")
         ensure_database(db_path)
         logger.info("Database ready")
+        timeline.mark("database ready")
 
         # Initialize PyQt6 application
         logger.info("Initializing PyQt6 application...")
+        # QtWebEngine se importa al abrir el navegador, despues de crear la
+        # aplicacion: eso exige compartir los contextos OpenGL desde antes
+        QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
         app = QApplication(sys.argv)
         app.setApplicationName("Widget Sidebar")
         logger.info("PyQt6 application initialized")
+        timeline.mark("QApplication created")
 
         # Authentication flow
         logger.info("=" * 60)
         logger.info("AUTHENTICATION")
         logger.info("=" * 60)
-        if not authenticate():
+        with timeline.exclude("authentication"):
+            authenticated = authenticate()
+        if not authenticated:
             logger.info("Authentication cancelled - exiting application")
             sys.exit(0)
         logger.info("Authentication successful")
@@ -190,20 +204,18 @@ def main():
         logger.info("Initializing MVC architecture...")
         controller = MainController()
         logger.info("MainController initialized")
+        timeline.mark("MainController initialized")
 
         # Create main window with controller
         logger.info("Creating main window...")
         window = MainWindow(controller)
         logger.info("MainWindow created")
+        timeline.mark("MainWindow created")
 
         # Set controller's main_window reference for bidirectional communication
         controller.main_window = window
         logger.info("Controller main_window reference set")
 
-        # Set main_window reference in browser_manager for positioning
-        controller.browser_manager.set_main_window(window)
-        logger.info("Browser manager main_window reference set")
-
         # Load categories into sidebar
         logger.info("Loading categories into UI...")
         categories = controller.get_categories()
@@ -211,11 +223,15 @@ def main():
 
         window.load_categories(categories)
         logger.info("Categories loaded into sidebar")
+        timeline.mark("categories loaded into sidebar")
 
         # Show window
         logger.info("Showing window...")
+        # El informe de arranque se escribe al pintarse el sidebar por primera vez
+        timeline.watch_first_paint(window.sidebar or window)
         window.show()
         logger.info("Window shown")
+        timeline.mark("window shown")
 
         logger.info(f"[OK] Loaded {len(categories)} categories from SQLite")
         logger.info("[OK] UI fully functional")
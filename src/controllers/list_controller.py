@@ -52,7 +52,7 @@ class ListController(QObject):
         """
         super().__init__()
         self.db = db_manager
-        self.clipboard_manager = clipboard_manager or ClipboardManager()
+        self.clipboard_manager = clipboard_manager or ClipboardManager.get_shared()
 
         # Estado de ejecución secuencial
         self._execution_timer = None
@@ -8,9 +8,6 @@ from typing import List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.config_manager import ConfigManager
 from core.clipboard_manager import ClipboardManager
-from core.category_filter_engine import CategoryFilterEngine
-from core.pinned_panels_manager import PinnedPanelsManager
-from core.simple_browser_manager import SimpleBrowserManager
 from controllers.clipboard_controller import ClipboardController
 from controllers.list_controller import ListController
 from models.category import Category
@@ -26,10 +23,12 @@ class MainController:
     def __init__(self):
         # Initialize managers
         self.config_manager = ConfigManager(db_path="widget_sidebar.db")
-        self.clipboard_manager = ClipboardManager()
-        self.category_filter_engine = CategoryFilterEngine(db_path="widget_sidebar.db")
-        self.pinned_panels_manager = PinnedPanelsManager(self.config_manager.db)
-        self.browser_manager = SimpleBrowserManager(self.config_manager.db)
+        self.clipboard_manager = ClipboardManager.get_shared()
+        # Filter engine, pinned panels and browser (QtWebEngine) are created
+        # on first use, see the properties below
+        self._category_filter_engine = None
+        self._pinned_panels_manager = None
+        self._browser_manager = None
 
         # Initialize controllers
         self.clipboard_controller = ClipboardController(self.clipboard_manager)
@@ -46,6 +45,32 @@ class MainController:
         # Load initial data
         self.load_data()
 
+    @property
+    def category_filter_engine(self):
+        """Category filter engine (created on first use)"""
+        if self._category_filter_engine is None:
+            from core.category_filter_engine import CategoryFilterEngine
+            self._category_filter_engine = CategoryFilterEngine(
+                db_path="widget_sidebar.db", change_bus=self.config_manager.db.changes
+            )
+        return self._category_filter_engine
+
+    @property
+    def pinned_panels_manager(self):
+        """Pinned panels manager (created on first use)"""
+        if self._pinned_panels_manager is None:
+            from core.pinned_panels_manager import PinnedPanelsManager
+            self._pinned_panels_manager = PinnedPanelsManager(self.config_manager.db)
+        return self._pinned_panels_manager
+
+    @property
+    def browser_manager(self):
+        """Embedded browser manager (imports QtWebEngine on first use)"""
+        if self._browser_manager is None:
+            from core.simple_browser_manager import SimpleBrowserManager
+            self._browser_manager = SimpleBrowserManager(self.config_manager.db, self.main_window)
+        return self._browser_manager
+
     def load_data(self) -> None:
         """Load configuration and categories"""
         print("Loading configuration...")
@@ -170,7 +195,8 @@ class MainController:
             logger.info("Loading all categories (clearing filters)")
 
             # Clear filter engine cache (database may have changed)
-            self.category_filter_engine.clear_cache()
+            if self._category_filter_engine is not None:
+                self._category_filter_engine.clear_cache()
 
             # Reload ALL categories from database
             self._all_categories = self.config_manager.load_default_categories()
@@ -194,10 +220,10 @@ class MainController:
         This should be called after any category/item modifications
         """
         logger.debug("Invalidating filter engine cache")
-        self.category_filter_engine.clear_cache()
+        if self._category_filter_engine is not None:
+            self._category_filter_engine.clear_cache()
         # Also clear config manager cache
-        if hasattr(self.config_manager, '_categories_cache'):
-            self.config_manager._categories_cache = None
+        self.config_manager.invalidate_categories_cache()
 
     def toggle_browser(self):
         """Toggle browser window visibility"""
@@ -210,7 +236,7 @@ class MainController:
 
     def __del__(self):
         """Cleanup: close database connection and browser"""
-        if hasattr(self, 'browser_manager'):
-            self.browser_manager.cleanup()
+        if getattr(self, '_browser_manager', None) is not None:
+            self._browser_manager.cleanup()
         if hasattr(self, 'config_manager'):
             self.config_manager.close()
@@ -24,6 +24,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.models.category import Category
+# Mismo módulo que el resto de managers (un solo pool compartido por base de datos)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from database.connection_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +51,8 @@ class CategoryFilterEngine:
     - Optimización con índices
     """
 
-    def __init__(self, db_path: str, cache_enabled: bool = True, cache_max_size: int = 100):
+    def __init__(self, db_path: str, cache_enabled: bool = True, cache_max_size: int = 100,
+                 change_bus=None):
         """
         Inicializar el motor de filtrado
 
@@ -56,6 +60,8 @@ class CategoryFilterEngine:
             db_path: Ruta a la base de datos SQLite
             cache_enabled: Si está habilitado el caché de resultados
             cache_max_size: Tamaño máximo del caché (número de entradas)
+            change_bus: ChangeBus de la base de datos (DBManager.changes); el caché
+                se descarta solo con los cambios que afectan a las categorías
         """
         self.db_path = db_path
         self.last_query = None
@@ -68,6 +74,21 @@ class CategoryFilterEngine:
         self._result_cache: Dict[str, List[Category]] = {}
         self._cache_hits = 0
         self._cache_misses = 0
+        self._cache_stale = False
+
+        # Los filtros solo leen columnas de categories: editar un item no cambia
+        # el resultado, agregar/eliminar items si (item_count)
+        if change_bus is not None:
+            change_bus.subscribe(self._on_data_changed)
+
+    def _on_data_changed(self, event) -> None:
+        """Marcar el caché como obsoleto si el cambio afecta a las categorías"""
+        if event.changes_membership:
+            self._cache_stale = True
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Obtener conexión del pool compartido (close() la devuelve al pool)"""
+        return ConnectionPool.get_shared(str(self.db_path)).acquire()
 
     def apply_filters(self, filters: Dict[str, Any]) -> List[Category]:
         """
@@ -96,6 +117,9 @@ class CategoryFilterEngine:
 
         # Verificar caché
         filter_hash = None
+        if self._cache_stale:
+            self._cache_stale = False
+            self._result_cache.clear()
         if self.cache_enabled:
             filter_hash = self._hash_filters(filters)
 
@@ -136,8 +160,7 @@ class CategoryFilterEngine:
             self.last_params = params
 
             # Ejecutar query
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_connection()
             cursor = conn.cursor()
 
             logger.debug(f"Executing query: {query}")
@@ -386,7 +409,7 @@ class CategoryFilterEngine:
             Lista de colores (hex) únicos
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -413,7 +436,7 @@ class CategoryFilterEngine:
             Diccionario con fechas mínimas y máximas
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -451,7 +474,7 @@ class CategoryFilterEngine:
             Diccionario con estadísticas min/max/avg
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -0,0 +1,114 @@
+"""
+Clipboard Backend
+Acceso al portapapeles del sistema
+
+QtClipboardBackend usa el QClipboard de la aplicación (en proceso, sin
+lanzar xclip/xsel por cada copia) y admite contenido con tipo MIME (HTML,
+URLs). PyperclipBackend es el respaldo sin interfaz gráfica (scripts, sin
+QGuiApplication o fuera del hilo de la interfaz): solo texto plano.
+"""
+
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ClipboardBackend:
+    """Interfaz de un backend de portapapeles"""
+
+    name = "base"
+
+    def set_text(self, text: str) -> None:
+        """Copy plain text"""
+        raise NotImplementedError
+
+    def set_html(self, html: str, text: str) -> None:
+        """
+        Copy HTML with its plain-text alternative
+
+        Args:
+            html: HTML fragment
+            text: Plain text for targets that do not accept HTML
+        """
+        raise NotImplementedError
+
+    def set_urls(self, urls: List[str]) -> None:
+        """Copy URLs (text/uri-list plus one URL per line as text)"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Empty the clipboard"""
+        raise NotImplementedError
+
+    def text(self) -> Optional[str]:
+        """Current clipboard text"""
+        raise NotImplementedError
+
+
+class QtClipboardBackend(ClipboardBackend):
+    """Portapapeles de Qt (requiere QGuiApplication; solo desde el hilo de la interfaz)"""
+
+    name = "qt"
+
+    def _clipboard(self):
+        from PyQt6.QtGui import QGuiApplication
+        return QGuiApplication.clipboard()
+
+    def set_text(self, text: str) -> None:
+        self._clipboard().setText(text)
+
+    def set_html(self, html: str, text: str) -> None:
+        from PyQt6.QtCore import QMimeData
+        mime = QMimeData()
+        mime.setHtml(html)
+        mime.setText(text)
+        self._clipboard().setMimeData(mime)
+
+    def set_urls(self, urls: List[str]) -> None:
+        from PyQt6.QtCore import QMimeData, QUrl
+        mime = QMimeData()
+        mime.setUrls([QUrl.fromUserInput(url) for url in urls])
+        mime.setText("\n".join(urls))
+        self._clipboard().setMimeData(mime)
+
+    def clear(self) -> None:
+        self._clipboard().clear()
+
+    def text(self) -> Optional[str]:
+        return self._clipboard().text()
+
+
+class PyperclipBackend(ClipboardBackend):
+    """Respaldo con pyperclip (en Linux lanza xclip/xsel en cada operación)"""
+
+    name = "pyperclip"
+
+    def set_text(self, text: str) -> None:
+        import pyperclip
+        pyperclip.copy(text)
+
+    def set_html(self, html: str, text: str) -> None:
+        # Solo texto plano
+        self.set_text(text)
+
+    def set_urls(self, urls: List[str]) -> None:
+        self.set_text("\n".join(urls))
+
+    def clear(self) -> None:
+        self.set_text("")
+
+    def text(self) -> Optional[str]:
+        import pyperclip
+        return pyperclip.paste()
+
+
+def qt_clipboard_available() -> bool:
+    """Whether the Qt clipboard can be used from the current thread"""
+    try:
+        from PyQt6.QtCore import QThread
+        from PyQt6.QtGui import QGuiApplication
+    except ImportError:
+        return False
+    app = QGuiApplication.instance()
+    return isinstance(app, QGuiApplication) and QThread.currentThread() == app.thread()
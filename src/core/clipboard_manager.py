@@ -1,14 +1,21 @@
 """
 Clipboard Manager
 """
-import pyperclip
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
+from collections import deque
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.item import Item
+from models.item import Item, ItemType
+from core.clipboard_backend import (ClipboardBackend, QtClipboardBackend, PyperclipBackend,
+                                    qt_clipboard_available)
+from core import services
+
+# Latencias de copia recientes guardadas para las métricas
+LATENCY_SAMPLES = 100
 
 
 class ClipboardHistory:
@@ -19,25 +26,78 @@ class ClipboardHistory:
 
 
 class ClipboardManager:
-    """Manages clipboard operations"""
-
-    def __init__(self, max_history: int = 20):
+    """Manages clipboard operations
+
+    Copies go through the in-process Qt clipboard when called from the GUI
+    thread of a QGuiApplication, and through pyperclip otherwise (headless).
+    """
+
+    def __init__(self, max_history: int = 20, backend: Optional[ClipboardBackend] = None):
+        """
+        Args:
+            max_history: Clipboard history size
+            backend: Force a backend (None = Qt if available, pyperclip otherwise)
+        """
         self.max_history = max_history
         self.history: List[ClipboardHistory] = []
-
-    def copy_text(self, content: str) -> bool:
-        """Copy text to clipboard"""
+        self.backend = backend
+        self._qt_backend = QtClipboardBackend()
+        self._fallback_backend = PyperclipBackend()
+        self._metrics = {'copies': 0, 'failures': 0, 'qt': 0, 'pyperclip': 0}
+        self._latencies_ms = deque(maxlen=LATENCY_SAMPLES)
+        self._max_latency_ms = 0.0
+
+    @classmethod
+    def get_shared(cls) -> "ClipboardManager":
+        """Shared instance (the one of the main controller and the widgets)"""
+        return services.get_shared(cls)
+
+    def get_backend(self) -> ClipboardBackend:
+        """Backend for the current call"""
+        if self.backend is not None:
+            return self.backend
+        return self._qt_backend if qt_clipboard_available() else self._fallback_backend
+
+    def _copy(self, operation: str, *args) -> bool:
+        """Run a backend copy operation and record its latency"""
+        backend = self.get_backend()
+        started = time.perf_counter()
         try:
-            pyperclip.copy(content)
-            return True
+            getattr(backend, operation)(*args)
         except Exception as e:
-            print(f"Error copying to clipboard: {e}")
+            self._metrics['failures'] += 1
+            print(f"Error copying to clipboard ({backend.name}): {e}")
             return False
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._metrics['copies'] += 1
+        self._metrics[backend.name] = self._metrics.get(backend.name, 0) + 1
+        self._latencies_ms.append(latency_ms)
+        self._max_latency_ms = max(self._max_latency_ms, latency_ms)
+        return True
+
+    def copy_text(self, content: str) -> bool:
+        """Copy text to clipboard"""
+        return self._copy('set_text', content)
+
+    def copy_html(self, html: str, text: str) -> bool:
+        """Copy HTML with its plain-text alternative (text only with pyperclip)"""
+        return self._copy('set_html', html, text)
+
+    def copy_urls(self, urls: List[str]) -> bool:
+        """Copy URLs as text/uri-list and as text (text only with pyperclip)"""
+        return self._copy('set_urls', list(urls))
+
+    def clear_clipboard(self) -> bool:
+        """Empty the clipboard"""
+        return self._copy('clear')
 
     def copy_item(self, item: Item) -> bool:
         """Copy an item's content to clipboard"""
         try:
-            success = self.copy_text(item.content)
+            if item.type == ItemType.URL and self.validate_url(item.content):
+                success = self.copy_urls([item.content])
+            else:
+                success = self.copy_text(item.content)
             if success:
                 # Update item's last used timestamp
                 item.update_last_used()
@@ -51,11 +111,27 @@ class ClipboardManager:
     def get_clipboard_content(self) -> Optional[str]:
         """Get current clipboard content"""
         try:
-            return pyperclip.paste()
+            return self.get_backend().text()
         except Exception as e:
             print(f"Error getting clipboard content: {e}")
             return None
 
+    def get_metrics(self) -> Dict:
+        """
+        Copy metrics
+
+        Returns:
+            Dict: copies, failures, copies per backend ('qt', 'pyperclip'),
+                last_latency_ms, avg_latency_ms (last LATENCY_SAMPLES) and
+                max_latency_ms
+        """
+        latencies = list(self._latencies_ms)
+        metrics = dict(self._metrics)
+        metrics['last_latency_ms'] = round(latencies[-1], 3) if latencies else 0.0
+        metrics['avg_latency_ms'] = round(sum(latencies) / len(latencies), 3) if latencies else 0.0
+        metrics['max_latency_ms'] = round(self._max_latency_ms, 3)
+        return metrics
+
     def validate_url(self, url: str) -> bool:
         """Validate if a string is a URL"""
         return url.startswith(('http://', 'https://', 'www.', 'ftp://'))
@@ -0,0 +1,302 @@
+"""
+Command Runner
+Ejecucion no bloqueante de comandos (items CODE) con QProcess
+
+Cada comando se ejecuta en un QProcess del hilo de la interfaz sin bloquear
+el bucle de eventos: la salida (stdout/stderr) se emite a medida que llega,
+se puede cancelar, tiene un tiempo maximo y un limite de texto capturado.
+Un CommandRunner compartido limita cuantos comandos corren a la vez; los
+demas esperan en cola.
+"""
+
+import codecs
+import locale
+import logging
+import platform
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from PyQt6.QtCore import QObject, QProcess, QTimer, pyqtSignal
+
+from core import services
+
+logger = logging.getLogger(__name__)
+
+# Comandos ejecutandose a la vez (el resto espera en cola)
+MAX_CONCURRENT_COMMANDS = 4
+
+# Tiempo maximo de ejecucion de un comando (milisegundos)
+DEFAULT_TIMEOUT_MS = 30000
+
+# Caracteres capturados por stream (stdout/stderr); el resto se descarta
+MAX_OUTPUT_CHARS = 1_000_000
+
+TRUNCATED_NOTICE = "\n[... salida truncada ...]\n"
+
+# Estados de una ejecucion
+QUEUED, RUNNING, FINISHED = "queued", "running", "finished"
+
+
+class CommandExecution(QObject):
+    """
+    Una ejecucion de comando
+
+    Signals:
+        started(): The process started (it may have waited in the queue)
+        output_received(str, str): Stream ('stdout'/'stderr') and new text
+        finished(dict): Result with 'command', 'output', 'error',
+            'return_code', 'success', 'cancelled', 'timed_out',
+            'truncated' and 'duration_ms'
+    """
+
+    started = pyqtSignal()
+    output_received = pyqtSignal(str, str)
+    finished = pyqtSignal(dict)
+
+    def __init__(self, command: str, cwd: Optional[str] = None,
+                 timeout_ms: int = DEFAULT_TIMEOUT_MS,
+                 max_output_chars: int = MAX_OUTPUT_CHARS, parent=None):
+        """
+        Args:
+            command: Shell command
+            cwd: Working directory (optional)
+            timeout_ms: Maximum run time (0 = no limit)
+            max_output_chars: Characters kept per stream
+            parent: QObject parent
+        """
+        super().__init__(parent)
+        self.command = command
+        self.cwd = cwd
+        self.timeout_ms = timeout_ms
+        self.max_output_chars = max_output_chars
+        self.state = QUEUED
+        self.result: Optional[Dict] = None
+
+        self._process: Optional[QProcess] = None
+        self._timer: Optional[QTimer] = None
+        self._start_time = 0.0
+        self._cancelled = False
+        self._timed_out = False
+        self._chunks = {'stdout': [], 'stderr': []}
+        self._sizes = {'stdout': 0, 'stderr': 0}
+        self._truncated = False
+        encoding = locale.getpreferredencoding(False)
+        self._decoders = {
+            stream: codecs.getincrementaldecoder(encoding)(errors='replace')
+            for stream in ('stdout', 'stderr')
+        }
+
+    @property
+    def is_running(self) -> bool:
+        return self.state == RUNNING
+
+    def start(self) -> None:
+        """Start the process (called by CommandRunner)"""
+        if self.state != QUEUED:
+            return
+
+        self.state = RUNNING
+        self._start_time = time.perf_counter()
+        self._process = QProcess(self)
+        if self.cwd:
+            self._process.setWorkingDirectory(self.cwd)
+        self._process.readyReadStandardOutput.connect(lambda: self._read('stdout'))
+        self._process.readyReadStandardError.connect(lambda: self._read('stderr'))
+        self._process.finished.connect(self._on_process_finished)
+        self._process.errorOccurred.connect(self._on_process_error)
+
+        if self.timeout_ms:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._on_timeout)
+            self._timer.start(self.timeout_ms)
+
+        # En Windows, usar cmd.exe; en Unix-like systems, usar bash
+        if platform.system() == 'Windows':
+            self._process.start("cmd.exe", ["/c", self.command])
+        else:
+            self._process.start("/bin/bash", ["-c", self.command])
+        self.started.emit()
+
+    def cancel(self) -> None:
+        """Cancel the command (kills it if running, drops it if queued)"""
+        if self.state == FINISHED:
+            return
+        self._cancelled = True
+        if self.state == QUEUED:
+            self._finish(-1, "Comando cancelado")
+        else:
+            self._process.kill()
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """
+        Block until the process ends (tests and application shutdown)
+
+        Args:
+            timeout_ms: Maximum wait (-1 = no limit)
+
+        Returns:
+            bool: True if the execution finished
+        """
+        if self.state == RUNNING and self._process is not None:
+            self._process.waitForFinished(timeout_ms)
+        return self.state == FINISHED
+
+    def _read(self, stream: str) -> None:
+        if stream == 'stdout':
+            data = self._process.readAllStandardOutput()
+        else:
+            data = self._process.readAllStandardError()
+        self._append(stream, self._decoders[stream].decode(bytes(data)))
+
+    def _append(self, stream: str, text: str) -> None:
+        """Keep text up to max_output_chars per stream and emit it"""
+        if not text:
+            return
+        room = self.max_output_chars - self._sizes[stream]
+        if room <= 0:
+            self._truncated = True
+            return
+        if len(text) > room:
+            text = text[:room] + TRUNCATED_NOTICE
+            self._truncated = True
+            self._sizes[stream] = self.max_output_chars
+        else:
+            self._sizes[stream] += len(text)
+        self._chunks[stream].append(text)
+        self.output_received.emit(stream, text)
+
+    def _on_timeout(self) -> None:
+        if self.state == RUNNING:
+            logger.error(f"Command timeout ({self.timeout_ms} ms): {self.command}")
+            self._timed_out = True
+            self._process.kill()
+
+    def _on_process_error(self, error) -> None:
+        # FailedToStart no emite finished
+        if error == QProcess.ProcessError.FailedToStart and self.state == RUNNING:
+            self._finish(-1, self._process.errorString())
+
+    def _on_process_finished(self, exit_code: int, exit_status) -> None:
+        if self.state != RUNNING:
+            return
+        # Resto de la salida y bytes pendientes de los decodificadores
+        self._read('stdout')
+        self._read('stderr')
+        for stream, decoder in self._decoders.items():
+            self._append(stream, decoder.decode(b"", final=True))
+
+        error_msg = None
+        if self._timed_out:
+            error_msg = f"Comando excedió el tiempo de espera ({self.timeout_ms / 1000:g} segundos)"
+        elif self._cancelled:
+            error_msg = "Comando cancelado"
+        elif exit_status == QProcess.ExitStatus.CrashExit:
+            error_msg = "El proceso terminó de forma inesperada"
+        self._finish(exit_code if error_msg is None else -1, error_msg)
+
+    def _finish(self, return_code: int, error_msg: Optional[str]) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+        self.state = FINISHED
+
+        error = "".join(self._chunks['stderr'])
+        if error_msg:
+            error = f"{error}\n{error_msg}" if error else error_msg
+        success = error_msg is None and return_code == 0
+        self.result = {
+            'command': self.command,
+            'output': "".join(self._chunks['stdout']),
+            'error': error,
+            'return_code': return_code,
+            'success': success,
+            'cancelled': self._cancelled,
+            'timed_out': self._timed_out,
+            'truncated': self._truncated,
+            'duration_ms': round((time.perf_counter() - self._start_time) * 1000) if self._start_time else 0,
+        }
+        self.finished.emit(self.result)
+
+
+class CommandRunner(QObject):
+    """Ejecuta comandos con un limite global de ejecuciones simultaneas"""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_COMMANDS,
+                 default_timeout_ms: int = DEFAULT_TIMEOUT_MS,
+                 max_output_chars: int = MAX_OUTPUT_CHARS, parent=None):
+        """
+        Args:
+            max_concurrent: Commands running at the same time
+            default_timeout_ms: Timeout of commands started without one
+            max_output_chars: Characters kept per stream of every command
+            parent: QObject parent
+        """
+        super().__init__(parent)
+        self.max_concurrent = max(1, max_concurrent)
+        self.default_timeout_ms = default_timeout_ms
+        self.max_output_chars = max_output_chars
+        self._queue = deque()
+        self._running = set()
+
+    @classmethod
+    def get_shared(cls) -> "CommandRunner":
+        """
+        Get the process-wide runner (the concurrency limit is global)
+
+        Returns:
+            CommandRunner: Shared instance (GUI thread)
+        """
+        return services.get_shared(cls)
+
+    def start(self, command: str, cwd: Optional[str] = None,
+              timeout_ms: Optional[int] = None) -> CommandExecution:
+        """
+        Start a command, or queue it if the limit is reached
+
+        Args:
+            command: Shell command
+            cwd: Working directory (optional)
+            timeout_ms: Maximum run time (default: default_timeout_ms, 0 = no limit)
+
+        Returns:
+            CommandExecution: Connect to its signals to follow it
+        """
+        execution = CommandExecution(
+            command, cwd,
+            self.default_timeout_ms if timeout_ms is None else timeout_ms,
+            self.max_output_chars, parent=self
+        )
+        execution.finished.connect(lambda _result, e=execution: self._on_finished(e))
+        self._queue.append(execution)
+        # Conectar las señales antes de arrancar: se arranca en el bucle de eventos
+        QTimer.singleShot(0, self._start_next)
+        return execution
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Runner state
+
+        Returns:
+            Dict: 'running', 'queued' and 'max_concurrent'
+        """
+        return {'running': len(self._running), 'queued': len(self._queue),
+                'max_concurrent': self.max_concurrent}
+
+    def cancel_all(self) -> None:
+        """Cancel queued and running commands (application shutdown)"""
+        for execution in list(self._queue) + list(self._running):
+            execution.cancel()
+
+    def _start_next(self) -> None:
+        while self._queue and len(self._running) < self.max_concurrent:
+            execution = self._queue.popleft()
+            self._running.add(execution)
+            execution.start()
+
+    def _on_finished(self, execution: CommandExecution) -> None:
+        self._running.discard(execution)
+        if execution in self._queue:
+            self._queue.remove(execution)  # cancelada mientras esperaba
+        execution.deleteLater()
+        self._start_next()
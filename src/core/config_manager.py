@@ -10,8 +10,9 @@ from typing import Dict, List, Any, Optional
 # Add models to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.category import Category
-from models.item import Item, ItemType
+from models.item import Item, ItemType, SensitiveContent
 from database.db_manager import DBManager
+from database.change_events import ChangeTracker, PendingChanges
 from core.encryption_manager import EncryptionManager
 
 
@@ -47,10 +48,12 @@ class ConfigManager:
 
         # Initialize encryption manager
         env_path = str(self.base_dir / ".env")
-        self.encryption_manager = EncryptionManager(env_path)
+        self.encryption_manager = EncryptionManager.get_shared(env_path)
 
-        # Cache for categories
+        # Cache for categories, patched per category from the database change events
         self._categories_cache: Optional[List[Category]] = None
+        self._item_categories: Dict[int, int] = {}  # item id -> category id
+        self._changes = ChangeTracker(self.db.changes)
 
     def load_config(self) -> Dict[str, Any]:
         """
@@ -85,33 +88,92 @@ class ConfigManager:
         """
         Get all active categories with their items
 
+        The cached list is kept up to date with the database change events:
+        only the categories touched since the last call are reloaded.
+
         Returns:
             List[Category]: List of Category objects
         """
         # Return cached categories if available
         if self._categories_cache is not None:
-            return self._categories_cache
-
-        # Load from database
-        categories_data = self.db.get_categories(include_inactive=False)
+            if self._changes.is_current():
+                return self._categories_cache
+            pending = self._changes.take()
+            if not pending.reload_all:
+                self._patch_categories(pending)
+                return self._categories_cache
+
+        # Everything pending is covered by the full load
+        self._changes.take()
+
+        # Load categories and items at once (sensitive content stays encrypted)
+        categories_data = self.db.get_categories_with_items(include_inactive=False, decrypt=False)
         categories = []
 
         for cat_data in categories_data:
             # Convert database dict to Category object
             category = self._dict_to_category(cat_data)
-
-            # Load items for this category
-            items_data = self.db.get_items_by_category(cat_data['id'])
-            for item_data in items_data:
-                item = self._dict_to_item(item_data)
-                category.add_item(item)
-
+            category.add_items([self._dict_to_item(item_data) for item_data in cat_data['items']])
             categories.append(category)
 
         # Cache results
         self._categories_cache = categories
+        self._index_items()
         return categories
 
+    def invalidate_categories_cache(self) -> None:
+        """Drop the categories cache (next get_categories() reloads everything)"""
+        self._categories_cache = None
+
+    def _patch_categories(self, pending: PendingChanges) -> None:
+        """
+        Reload in the cache only the categories touched by pending changes
+
+        Args:
+            pending: Changes taken from the change tracker
+        """
+        category_ids = set(pending.category_ids)
+        category_ids.update(self._item_categories[item_id] for item_id in pending.item_ids
+                            if item_id in self._item_categories)
+        if not category_ids:
+            return
+
+        cache = self._categories_cache
+        positions = {category.id: index for index, category in enumerate(cache)}
+        for cat_id in category_ids:
+            cat_data = self.db.get_category(cat_id)
+            index = positions.get(str(cat_id))
+            if cat_data and cat_data.get('is_active'):
+                category = self._load_category(cat_data)
+                if index is None:
+                    cache.append(category)
+                else:
+                    cache[index] = category
+            elif index is not None:
+                # Deleted or deactivated
+                cache[index] = None
+
+        cache[:] = sorted((category for category in cache if category is not None),
+                          key=lambda category: category.order_index)
+        self._index_items()
+
+    def _index_items(self) -> None:
+        """Rebuild the item id -> category id map of the cache"""
+        self._item_categories = {
+            int(item.id): int(category.id)
+            for category in self._categories_cache
+            for item in category.items
+        }
+
+    def _load_category(self, cat_data: Dict) -> Category:
+        """Build a Category with its items from its database row"""
+        category = self._dict_to_category(cat_data)
+
+        # Load items (sensitive content stays encrypted)
+        items_data = self.db.get_items_by_category(cat_data['id'], decrypt=False)
+        category.add_items([self._dict_to_item(item_data) for item_data in items_data])
+        return category
+
     def get_category(self, category_id) -> Optional[Category]:
         """
         Get a specific category by ID
@@ -138,19 +200,18 @@ class ConfigManager:
             else:
                 cat_id = int(category_id)
 
+            # Warm cache first (kept current by the change events); inactive
+            # categories are not cached and still come from the database
+            if self._categories_cache is not None:
+                for cat in self.get_categories():
+                    if cat.id == str(cat_id):
+                        return cat
+
             cat_data = self.db.get_category(cat_id)
             if not cat_data:
                 return None
 
-            category = self._dict_to_category(cat_data)
-
-            # Load items
-            items_data = self.db.get_items_by_category(cat_id)
-            for item_data in items_data:
-                item = self._dict_to_item(item_data)
-                category.add_item(item)
-
-            return category
+            return self._load_category(cat_data)
 
         except (ValueError, TypeError):
             return None
@@ -175,36 +236,38 @@ class ConfigManager:
             import logging
             logger = logging.getLogger(__name__)
 
-            # Add category to database WITH order_index
-            cat_id = self.db.add_category(
-                name=category.name,
-                icon=category.icon,
-                is_predefined=category.is_predefined,
-                order_index=category.order_index  # FIX: Pass order_index
-            )
-            logger.info(f"[ConfigManager] Category added to DB: {category.name} (ID: {cat_id}, order_index: {category.order_index})")
-
-            # Add items
-            for item in category.items:
-                item_id = self.db.add_item(
-                    category_id=cat_id,
-                    label=item.label,
-                    content=item.content,
-                    item_type=item.type.value.upper(),
-                    icon=item.icon,
-                    is_sensitive=item.is_sensitive,
-                    is_favorite=getattr(item, 'is_favorite', False),  # FIX: Add is_favorite
-                    tags=item.tags,
-                    description=item.description,
-                    working_dir=getattr(item, 'working_dir', None),
-                    color=getattr(item, 'color', None),  # FIX: Add color
-                    is_active=getattr(item, 'is_active', True),  # Add is_active (default True)
-                    is_archived=getattr(item, 'is_archived', False)  # Add is_archived (default False)
+            # Category and items are written together (all or nothing)
+            with self.db.transaction():
+                # Add category to database WITH order_index
+                cat_id = self.db.add_category(
+                    name=category.name,
+                    icon=category.icon,
+                    is_predefined=category.is_predefined,
+                    order_index=category.order_index  # FIX: Pass order_index
                 )
-                logger.info(f"  [ConfigManager] Item added: {item.label} (ID: {item_id})")
+                logger.info(f"[ConfigManager] Category added to DB: {category.name} (ID: {cat_id}, order_index: {category.order_index})")
+
+                # Add items (single batched insert)
+                item_ids = self.db.add_items_bulk([
+                    {
+                        'category_id': cat_id,
+                        'label': item.label,
+                        'content': item.content,
+                        'type': item.type.value.upper(),
+                        'icon': item.icon,
+                        'is_sensitive': item.is_sensitive,
+                        'is_favorite': getattr(item, 'is_favorite', False),
+                        'tags': item.tags,
+                        'description': item.description,
+                        'working_dir': getattr(item, 'working_dir', None),
+                        'color': getattr(item, 'color', None),
+                        'is_active': getattr(item, 'is_active', True),
+                        'is_archived': getattr(item, 'is_archived', False)
+                    }
+                    for item in category.items
+                ])
+                logger.info(f"  [ConfigManager] {len(item_ids)} items added to category {cat_id}")
 
-            # Clear cache
-            self._categories_cache = None
             return True
 
         except Exception as e:
@@ -273,8 +336,6 @@ class ConfigManager:
                     is_archived=getattr(item, 'is_archived', False)  # Add is_archived (default False)
                 )
 
-            # Clear cache
-            self._categories_cache = None
             return True
 
         except Exception as e:
@@ -301,8 +362,6 @@ class ConfigManager:
 
             self.db.delete_category(cat_id)
 
-            # Clear cache
-            self._categories_cache = None
             return True
 
         except Exception as e:
@@ -414,20 +473,20 @@ class ConfigManager:
             with open(import_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
 
-            # Import settings
-            settings = data.get('settings', {})
-            for key, value in settings.items():
-                self.db.set_setting(key, value)
+            # Import everything in one transaction (one commit instead of one per row)
+            with self.db.transaction():
+                # Import settings
+                settings = data.get('settings', {})
+                for key, value in settings.items():
+                    self.db.set_setting(key, value)
 
-            # Import categories
-            categories_data = data.get('categories', [])
-            for cat_data in categories_data:
-                category = Category.from_dict(cat_data)
-                if category.validate():
-                    self.add_category(category)
+                # Import categories
+                categories_data = data.get('categories', [])
+                for cat_data in categories_data:
+                    category = Category.from_dict(cat_data)
+                    if category.validate():
+                        self.add_category(category)
 
-            # Clear cache
-            self._categories_cache = None
             return True
 
         except Exception as e:
@@ -458,8 +517,6 @@ class ConfigManager:
             for category in categories:
                 self.add_category(category)
 
-            # Clear cache
-            self._categories_cache = None
             return True
 
         except Exception as e:
@@ -522,10 +579,15 @@ class ConfigManager:
         except ValueError:
             item_type = ItemType.TEXT
 
+        # Sensitive content still encrypted: decrypt only when it's used
+        content = data['content']
+        if data.get('content_encrypted'):
+            content = SensitiveContent(content, self.db.decrypt_content)
+
         item = Item(
             item_id=str(data['id']),  # Convert to string for compatibility
             label=data['label'],
-            content=data['content'],
+            content=content,
             item_type=item_type,
             icon=data.get('icon'),
             is_sensitive=bool(data.get('is_sensitive', False)),
@@ -537,6 +599,11 @@ class ConfigManager:
             is_active=bool(data.get('is_active', True)),  # Add is_active (default True)
             is_archived=bool(data.get('is_archived', False))  # Add is_archived (default False)
         )
+
+        # Usage data (badges and search ranking)
+        item.use_count = data.get('use_count') or 0
+        if data.get('last_used'):
+            item.last_used = data['last_used']
         return item
 
     def _category_to_dict(self, category: Category) -> Dict:
@@ -3,11 +3,17 @@ Dashboard Manager
 Manages business logic for the Structure Dashboard
 """
 
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 import logging
 
+from core.fuzzy_matcher import FuzzyIndex, DEFAULT_LIMIT
+from database.change_events import ChangeTracker, PendingChanges
+
 logger = logging.getLogger(__name__)
 
+# Campos de items que la estructura guarda como bool
+STRUCTURE_BOOL_FIELDS = ('is_favorite', 'is_sensitive', 'is_list', 'is_archived')
+
 
 class DashboardManager:
     """Manager for dashboard data loading and processing"""
@@ -22,12 +28,19 @@ class DashboardManager:
         self.db = db_manager
         self._structure_cache = None
         self._statistics_cache = None
+        self._positions_cache = None
+        self._fuzzy_cache = None
+        # Cambios de la base de datos aun no aplicados a _structure_cache
+        self._changes = ChangeTracker(db_manager.changes)
         logger.info("DashboardManager initialized")
 
     def get_full_structure(self, force_refresh: bool = False) -> Dict:
         """
         Get complete structure of categories and items
 
+        The cached structure follows the database change events: only the
+        categories touched since the last call are reloaded (in place).
+
         Args:
             force_refresh: If True, force reload from database (default: False)
 
@@ -59,53 +72,33 @@ class DashboardManager:
         """
         # Return cached if available and no force refresh
         if self._structure_cache and not force_refresh:
-            logger.debug("Returning cached structure")
-            return self._structure_cache
+            if self._changes.is_current():
+                logger.debug("Returning cached structure")
+                return self._structure_cache
+            pending = self._changes.take()
+            if not pending.reload_all:
+                try:
+                    self._patch_structure(pending)
+                    return self._structure_cache
+                except Exception as e:
+                    logger.error(f"Error patching structure, reloading: {e}", exc_info=True)
 
         logger.info("Loading full structure from database...")
 
-        try:
-            # Get all categories
-            categories = self.db.get_categories()
-
-            structure = {'categories': []}
-
-            for category in categories:
-                # Get items for this category
-                items = self.db.get_items_by_category(category['id'])
-
-                category_data = {
-                    'id': category['id'],
-                    'name': category['name'],
-                    'icon': category.get('icon', '📁'),
-                    'tags': self._parse_tags(category.get('tags', '')),
-                    'is_predefined': category.get('is_predefined', False),
-                    'is_active': category.get('is_active', 1),  # Agregar campo is_active
-                    'items': []
-                }
+        # Everything pending is covered by the full load
+        self._changes.take()
 
-                # Process each item
-                for item in items:
-                    item_data = {
-                        'id': item['id'],
-                        'label': item['label'],
-                        'content': item['content'],
-                        'type': item['type'],
-                        'tags': self._parse_tags(item.get('tags', '')),
-                        'is_favorite': bool(item.get('is_favorite', 0)),
-                        'is_sensitive': bool(item.get('is_sensitive', 0)),
-                        'description': item.get('description', ''),
-                        'is_list': bool(item.get('is_list', 0)),
-                        'list_group': item.get('list_group', None),
-                        'is_active': item.get('is_active', 1),  # Agregar campo is_active
-                        'is_archived': bool(item.get('is_archived', 0))  # Agregar campo is_archived
-                    }
-                    category_data['items'].append(item_data)
+        try:
+            # Get all categories with their items (single bulk query)
+            categories = self.db.get_categories_with_items()
 
-                structure['categories'].append(category_data)
+            structure = {'categories': [
+                self._build_category_entry(category, category['items']) for category in categories
+            ]}
 
             # Cache the structure
             self._structure_cache = structure
+            self._invalidate_derived_caches()
 
             logger.info(f"Loaded structure: {len(structure['categories'])} categories, "
                        f"{sum(len(c['items']) for c in structure['categories'])} total items")
@@ -116,6 +109,88 @@ class DashboardManager:
             logger.error(f"Error loading full structure: {e}", exc_info=True)
             return {'categories': []}
 
+    def _build_category_entry(self, category: Dict, items: List[Dict]) -> Dict:
+        """
+        Build the structure entry of a category
+
+        Args:
+            category: Category row
+            items: Item rows of the category
+
+        Returns:
+            Dict: Category entry with its 'items'
+        """
+        category_data = {
+            'id': category['id'],
+            'name': category['name'],
+            'icon': category.get('icon', '📁'),
+            'tags': self._parse_tags(category.get('tags', '')),
+            'is_predefined': category.get('is_predefined', False),
+            'is_active': category.get('is_active', 1),  # Agregar campo is_active
+            'items': []
+        }
+
+        # Process each item
+        for item in items:
+            item_data = {
+                'id': item['id'],
+                'label': item['label'],
+                'content': item['content'],
+                'type': item['type'],
+                'tags': self._parse_tags(item.get('tags', '')),
+                'is_favorite': bool(item.get('is_favorite', 0)),
+                'is_sensitive': bool(item.get('is_sensitive', 0)),
+                'description': item.get('description', ''),
+                'is_list': bool(item.get('is_list', 0)),
+                'list_group': item.get('list_group', None),
+                'is_active': item.get('is_active', 1),  # Agregar campo is_active
+                'is_archived': bool(item.get('is_archived', 0)),  # Agregar campo is_archived
+                'use_count': item.get('use_count') or 0,
+                'last_used': item.get('last_used')
+            }
+            category_data['items'].append(item_data)
+
+        return category_data
+
+    def _patch_structure(self, pending: PendingChanges) -> None:
+        """
+        Reload in the cached structure only the categories touched by pending changes
+
+        Args:
+            pending: Changes taken from the change tracker
+        """
+        categories = self._structure_cache['categories']
+        category_ids = set(pending.category_ids)
+        if pending.item_ids:
+            category_ids.update(
+                category['id'] for category in categories
+                if any(item['id'] in pending.item_ids for item in category['items'])
+            )
+        if not category_ids:
+            return
+
+        positions = {category['id']: index for index, category in enumerate(categories)}
+        for category_id in category_ids:
+            category = self.db.get_category(category_id)
+            index = positions.get(category_id)
+            if category and category.get('is_active'):
+                entry = self._build_category_entry(category, self.db.get_items_by_category(category_id))
+                if index is None:
+                    categories.append(entry)
+                else:
+                    categories[index] = entry
+            elif index is not None:
+                # Deleted or deactivated
+                categories[index] = None
+
+        # The entries don't keep order_index: take it from the (small) categories table
+        order_index = {row['id']: row['order_index'] for row in self.db.get_categories()}
+        categories[:] = sorted((category for category in categories if category is not None),
+                               key=lambda category: order_index.get(category['id'], 0))
+
+        self._invalidate_derived_caches()
+        logger.debug(f"Structure patched: {len(category_ids)} categories reloaded")
+
     def calculate_statistics(self, structure: Dict = None) -> Dict:
         """
         Calculate statistics from the structure
@@ -308,8 +383,107 @@ class DashboardManager:
         """Invalidate all caches to force data reload"""
         self._structure_cache = None
         self._statistics_cache = None
+        self._positions_cache = None
+        self._fuzzy_cache = None
         logger.info("Dashboard caches invalidated")
 
+    def apply_item_changes(self, item_ids: List[int], fields: Dict) -> List[Dict]:
+        """
+        Patch the cached structure after a bulk update of items
+
+        Args:
+            item_ids: Updated item IDs
+            fields: Field -> value written to the database
+
+        Returns:
+            List[Dict]: Item dicts that were patched
+        """
+        if not self._structure_cache:
+            return []
+
+        ids = set(item_ids)
+        values = {
+            field: bool(value) if field in STRUCTURE_BOOL_FIELDS else value
+            for field, value in fields.items()
+        }
+        patched = []
+        for category in self._structure_cache['categories']:
+            for item in category['items']:
+                if item['id'] in ids:
+                    item.update(values)
+                    patched.append(item)
+
+        self._invalidate_derived_caches()
+        return patched
+
+    def remove_items(self, item_ids: List[int]) -> None:
+        """
+        Remove deleted items from the cached structure
+
+        Args:
+            item_ids: Deleted item IDs
+        """
+        if not self._structure_cache:
+            return
+
+        ids = set(item_ids)
+        for category in self._structure_cache['categories']:
+            category['items'] = [item for item in category['items'] if item['id'] not in ids]
+        self._invalidate_derived_caches()
+
+    def apply_category_changes(self, category_ids: List[int], fields: Dict) -> List[Dict]:
+        """
+        Patch the cached structure after updating categories
+
+        Deactivated categories are dropped, like a reload would do
+        (the structure only holds active categories).
+
+        Args:
+            category_ids: Updated category IDs
+            fields: Field -> value written to the database
+
+        Returns:
+            List[Dict]: Category dicts still in the structure that were patched
+        """
+        if not self._structure_cache:
+            return []
+
+        if 'is_active' in fields and not fields['is_active']:
+            self.remove_categories(category_ids)
+            return []
+
+        ids = set(category_ids)
+        patched = []
+        for category in self._structure_cache['categories']:
+            if category['id'] in ids:
+                category.update(fields)
+                patched.append(category)
+
+        self._invalidate_derived_caches()
+        return patched
+
+    def remove_categories(self, category_ids: List[int]) -> None:
+        """
+        Remove categories (and their items) from the cached structure
+
+        Args:
+            category_ids: Category IDs to drop
+        """
+        if not self._structure_cache:
+            return
+
+        ids = set(category_ids)
+        self._structure_cache['categories'] = [
+            category for category in self._structure_cache['categories'] if category['id'] not in ids
+        ]
+        self._invalidate_derived_caches()
+
+    def _invalidate_derived_caches(self):
+        """Drop caches computed from the structure (the structure itself stays)"""
+        self._statistics_cache = None
+        self._positions_cache = None
+        self._fuzzy_cache = None
+
     def refresh_data(self) -> Dict:
         """
         Refresh all data from database
@@ -331,7 +505,8 @@ class DashboardManager:
                     'categories': bool,
                     'items': bool,
                     'tags': bool,
-                    'content': bool
+                    'content': bool,
+                    'fuzzy': bool  # typo tolerant, ranked (optional)
                 }
             structure: Optional structure dict
 
@@ -348,6 +523,9 @@ class DashboardManager:
 
         logger.info(f"Searching for '{query}' with filters: {scope_filters}")
 
+        if scope_filters.get('fuzzy', False):
+            return self._search_fuzzy(query, scope_filters, structure)
+
         query_lower = query.lower()
         matches = []
 
@@ -400,9 +578,146 @@ class DashboardManager:
                             matches.append(('content', cat_idx, item_idx))
                             logger.debug(f"Content match in {item['label']}")
 
+        matches = self._rank_matches_fts(query, matches, structure)
         logger.info(f"Search found {len(matches)} matches")
         return matches
 
+    def _rank_matches_fts(self, query: str, matches: List[Tuple[str, int, int]],
+                          structure: Dict) -> List[Tuple[str, int, int]]:
+        """
+        Order search matches by full-text relevance
+
+        The substring search decides what matches; the FTS index (BM25) only
+        sorts them: category matches first, then item matches ranked by the
+        index, then the remaining item matches in structure order.
+
+        Args:
+            query: Search query string
+            matches: Matches of the substring search
+            structure: Structure the indices refer to
+
+        Returns:
+            List[Tuple[str, int, int]]: Same matches, best first
+        """
+        if not matches or not getattr(self.db, 'fts_enabled', False) or not self.db.build_fts_query(query):
+            return matches
+
+        categories = structure['categories']
+        ranks = {item_id: rank for rank, item_id in enumerate(self.db.search_item_ids(query))}
+        unranked = len(ranks)
+
+        def match_rank(match):
+            _, cat_idx, item_idx = match
+            if item_idx == -1:
+                return -1
+            return ranks.get(categories[cat_idx]['items'][item_idx]['id'], unranked)
+
+        # sorted() es estable: los empates conservan el orden de la estructura
+        return sorted(matches, key=match_rank)
+
+    def _search_fuzzy(self, query: str, scope_filters: Dict, structure: Dict,
+                      limit: int = DEFAULT_LIMIT) -> List[Tuple[str, int, int]]:
+        """
+        Typo tolerant search, best matches first
+
+        Categories are matched by name, items through a fuzzy index (label
+        fuzzy; tags, list, content and description literal). Only the top-k
+        items are returned, ordered by score.
+
+        Args:
+            query: Search query string
+            scope_filters: Dict with boolean values for each scope
+            structure: Structure the indices refer to
+            limit: Maximum item matches
+
+        Returns:
+            List[Tuple[str, int, int]]: Category matches, then ranked item matches
+        """
+        categories = structure['categories']
+        matches = []
+
+        if scope_filters.get('categories', True) and categories:
+            category_index = FuzzyIndex()
+            for cat_idx, category in enumerate(categories):
+                category_index.set(cat_idx, category['name'], category['tags'])
+            for cat_idx, _ in category_index.search(query, limit=len(categories)):
+                matches.append(('category', cat_idx, -1))
+
+        index, labels = self._get_fuzzy_index(structure, scope_filters)
+        if not len(index):
+            return matches
+
+        # Items whose label alone matches are reported as 'item' matches
+        label_ids = {item_id for item_id, _ in labels.search(query, limit=len(labels))}
+        positions = self._get_item_positions(structure)
+        for item_id, _ in index.search(query, limit=limit):
+            cat_idx, item_idx, _ = positions[item_id]
+            match_type = 'item' if item_id in label_ids else 'content'
+            matches.append((match_type, cat_idx, item_idx))
+
+        logger.info(f"Fuzzy search found {len(matches)} matches")
+        return matches
+
+    def _get_fuzzy_index(self, structure: Dict, scope_filters: Dict) -> Tuple[FuzzyIndex, FuzzyIndex]:
+        """
+        Fuzzy indexes over the items of a structure
+
+        Cached per structure object and enabled scopes, so every keystroke
+        reuses the folded texts (and the narrowing of the previous query).
+
+        Returns:
+            Tuple[FuzzyIndex, FuzzyIndex]: (index over the enabled scopes, label only index)
+        """
+        scope_key = tuple(
+            bool(scope_filters.get(scope, True)) for scope in ('items', 'lists', 'tags', 'content')
+        )
+        cached = self._fuzzy_cache
+        if cached and cached[0] is structure and cached[1] == scope_key:
+            return cached[2], cached[3]
+
+        search_labels, search_lists, search_tags, search_content = scope_key
+        index = FuzzyIndex()
+        labels = FuzzyIndex()
+        if any(scope_key):
+            for category in structure['categories']:
+                for item in category['items']:
+                    label = item['label'] if search_labels else ""
+                    texts = []
+                    if search_tags:
+                        texts.extend(item['tags'])
+                    if search_lists and item.get('is_list'):
+                        texts.append(item.get('list_group'))
+                    if search_content:
+                        if not item['is_sensitive']:
+                            texts.append(item['content'])
+                        texts.append(item.get('description'))
+                    index.set(item['id'], label, texts,
+                              item.get('use_count', 0), item.get('last_used'))
+                    if search_labels:
+                        labels.set(item['id'], label)
+
+        self._fuzzy_cache = (structure, scope_key, index, labels)
+        return index, labels
+
+    def _get_item_positions(self, structure: Dict) -> Dict[int, Tuple[int, int, int]]:
+        """
+        Map item id -> (category_index, item_index, item_id) for a structure
+
+        The map is cached per structure object so repeated searches over the
+        same structure don't walk every item again.
+        """
+        cached = self._positions_cache
+        if cached and cached[0] is structure:
+            return cached[1]
+
+        positions = {}
+        for cat_idx, category in enumerate(structure['categories']):
+            for item_idx, item in enumerate(category['items']):
+                positions[item['id']] = (cat_idx, item_idx, item['id'])
+
+        self._positions_cache = (structure, positions)
+        return positions
+
     def filter_and_sort_structure(
         self,
         structure: Dict = None,
@@ -420,48 +735,39 @@ class DashboardManager:
             sort_by: Sort order - 'name_asc', 'name_desc', 'items_desc', 'items_asc'
 
         Returns:
-            Dict: Filtered and sorted structure
+            Dict: Filtered and sorted view of the structure. Categories are
+                new dicts, item dicts are shared with the source structure
+                (treat them as read-only)
         """
         if structure is None:
             structure = self.get_full_structure()
 
         logger.info(f"Filtering structure - Types: {type_filters}, States: {state_filters}, Sort: {sort_by}")
 
-        # Deep copy to avoid modifying original
-        import copy
-        filtered_structure = copy.deepcopy(structure)
+        def matches(item: Dict) -> bool:
+            # Check type filter
+            if type_filters and not type_filters.get(item['type'], True):
+                return False
+
+            # Check state filter
+            if state_filters:
+                is_favorite = item['is_favorite']
+                is_sensitive = item['is_sensitive']
+                is_normal = not is_favorite and not is_sensitive
+
+                return (
+                    (state_filters.get('favorites', True) and is_favorite)
+                    or (state_filters.get('sensitive', True) and is_sensitive)
+                    or (state_filters.get('normal', True) and is_normal)
+                )
+
+            return True
 
         # Apply filters if provided
         if type_filters or state_filters:
-            for category in filtered_structure['categories']:
-                filtered_items = []
-
-                for item in category['items']:
-                    # Check type filter
-                    if type_filters:
-                        if not type_filters.get(item['type'], True):
-                            continue
-
-                    # Check state filter
-                    if state_filters:
-                        is_favorite = item['is_favorite']
-                        is_sensitive = item['is_sensitive']
-                        is_normal = not is_favorite and not is_sensitive
-
-                        include = False
-                        if state_filters.get('favorites', True) and is_favorite:
-                            include = True
-                        if state_filters.get('sensitive', True) and is_sensitive:
-                            include = True
-                        if state_filters.get('normal', True) and is_normal:
-                            include = True
-
-                        if not include:
-                            continue
-
-                    filtered_items.append(item)
-
-                category['items'] = filtered_items
+            filtered_structure = self.filter_structure_items(matches, structure)
+        else:
+            filtered_structure = {**structure, 'categories': list(structure['categories'])}
 
         # Sort categories
         if sort_by == 'name_asc':
@@ -475,3 +781,29 @@ class DashboardManager:
 
         logger.info(f"Filtering complete")
         return filtered_structure
+
+    def filter_structure_items(self, predicate: Callable[[Dict], bool],
+                               structure: Dict = None) -> Dict:
+        """
+        View of the structure keeping only the items that match a predicate
+
+        No copy of the items is made: every category becomes a shallow copy
+        pointing to the matching item dicts of the source structure.
+
+        Args:
+            predicate: Function item dict -> bool
+            structure: Optional structure dict
+
+        Returns:
+            Dict: Filtered structure (same categories, filtered 'items')
+        """
+        if structure is None:
+            structure = self.get_full_structure()
+
+        return {
+            **structure,
+            'categories': [
+                {**category, 'items': [item for item in category['items'] if predicate(item)]}
+                for category in structure['categories']
+            ]
+        }
@@ -5,13 +5,20 @@ Maneja el cifrado y descifrado de datos sensibles usando AES-256 (Fernet)
 
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional
 from cryptography.fernet import Fernet, InvalidToken
-from dotenv import load_dotenv, set_key
+from dotenv import load_dotenv, set_key, dotenv_values
+
+from core import services
 
 logger = logging.getLogger(__name__)
 
+# Minimo de valores para que decrypt_many reparta el trabajo en hilos
+PARALLEL_DECRYPT_THRESHOLD = 64
+
 
 class EncryptionManager:
     """
@@ -28,8 +35,48 @@ class EncryptionManager:
         """
         self.env_file = Path(env_file)
         self.cipher_suite: Optional[Fernet] = None
+        self._key: Optional[str] = None
+        self._env_mtime: Optional[int] = None
+        # Protege la comprobación de rotación y el cambio de cifrador
+        self._lock = threading.Lock()
         self._initialize()
 
+    @classmethod
+    def get_shared(cls, env_file: str = ".env") -> "EncryptionManager":
+        """
+        Get the process-wide encryption manager for an env file
+
+        The cipher is built lazily on first use and reused by every caller.
+        If the .env file changes on disk and holds a different key, the
+        cipher is rebuilt transparently.
+
+        Args:
+            env_file: Path to .env file
+
+        Returns:
+            EncryptionManager: Shared instance
+        """
+        key = services.path_key(env_file)
+        instance = services.find_shared(cls, key)
+        if instance is not None:
+            instance._refresh_if_rotated()
+            return instance
+        return services.get_shared(cls, key, factory=lambda: cls(env_file))
+
+    @classmethod
+    def invalidate_shared(cls, env_file: Optional[str] = None):
+        """
+        Drop cached shared instances (e.g. after rotating the key)
+
+        Args:
+            env_file: Only drop the instance for this .env file (None = all)
+        """
+        if env_file is None:
+            services.remove_shared(cls, all_keys=True)
+        else:
+            services.remove_shared(cls, services.path_key(env_file))
+        logger.debug("Shared encryption managers invalidated")
+
     def _initialize(self):
         """Initialize encryption key from .env or create new one"""
         # Load .env file
@@ -48,11 +95,40 @@ class EncryptionManager:
         # Initialize cipher suite
         try:
             self.cipher_suite = Fernet(encryption_key.encode())
+            self._key = encryption_key
+            self._env_mtime = self._get_env_mtime()
             logger.info("Encryption manager initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing encryption: {e}")
             raise
 
+    def _get_env_mtime(self) -> Optional[int]:
+        """Get .env modification time (None if the file doesn't exist)"""
+        try:
+            return self.env_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_if_rotated(self):
+        """Rebuild the cipher if the key stored in .env has changed"""
+        with self._lock:
+            mtime = self._get_env_mtime()
+            if mtime == self._env_mtime:
+                return
+
+            self._env_mtime = mtime
+            new_key = dotenv_values(self.env_file).get("ENCRYPTION_KEY") if mtime else None
+            if not new_key or new_key == self._key:
+                return
+
+            try:
+                self.cipher_suite = Fernet(new_key.encode())
+                self._key = new_key
+                os.environ["ENCRYPTION_KEY"] = new_key
+                logger.info("Encryption key changed on disk - cipher reloaded")
+            except Exception as e:
+                logger.error(f"Error reloading rotated encryption key: {e}")
+
     def _generate_key(self) -> str:
         """
         Generate a new Fernet encryption key
@@ -91,7 +167,9 @@ class EncryptionManager:
             with open(gitignore, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            if ".env" not in content:
+            # Lineas completas: ".venv/" no ignora .env
+            ignored = {line.strip() for line in content.splitlines()}
+            if not ignored & {".env", "/.env"}:
                 with open(gitignore, "a", encoding="utf-8") as f:
                     f.write("\n# Environment variables (contains encryption key)\n")
                     f.write(".env\n")
@@ -146,6 +224,79 @@ class EncryptionManager:
             logger.error(f"Decryption error: {e}")
             raise
 
+    def encrypt_many(self, plaintexts: Iterable[str]) -> List[str]:
+        """
+        Encrypt a batch of texts in one pass
+
+        Args:
+            plaintexts: Texts to encrypt
+
+        Returns:
+            List[str]: Encrypted texts, in the same order as the input
+        """
+        plaintexts = list(plaintexts)
+        if not plaintexts:
+            return []
+
+        if not self.cipher_suite:
+            raise RuntimeError("Encryption manager not initialized")
+
+        cipher_suite = self.cipher_suite
+        try:
+            results = [
+                cipher_suite.encrypt(plaintext.encode()).decode() if plaintext else ""
+                for plaintext in plaintexts
+            ]
+        except Exception as e:
+            logger.error(f"Batch encryption error: {e}")
+            raise
+
+        logger.debug(f"Batch encrypted {len(results)} values")
+        return results
+
+    def decrypt_many(self, encrypted_texts: Iterable[str], max_workers: int = 1,
+                     error_value: Optional[str] = None) -> List[str]:
+        """
+        Decrypt a batch of encrypted texts in one pass
+
+        Args:
+            encrypted_texts: Encrypted texts (base64-encoded)
+            max_workers: Threads to use for large batches (1 = sequential)
+            error_value: Value returned for entries that fail to decrypt.
+                If None, the first failure raises ValueError.
+
+        Returns:
+            List[str]: Decrypted plaintexts, in the same order as the input
+        """
+        encrypted_texts = list(encrypted_texts)
+        if not encrypted_texts:
+            return []
+
+        if not self.cipher_suite:
+            raise RuntimeError("Encryption manager not initialized")
+
+        cipher_suite = self.cipher_suite
+
+        def _decrypt_one(encrypted_text: str) -> str:
+            if not encrypted_text:
+                return ""
+            try:
+                return cipher_suite.decrypt(encrypted_text.encode()).decode()
+            except Exception as e:
+                if error_value is None:
+                    logger.error(f"Batch decryption error: {e}")
+                    raise ValueError("Failed to decrypt: Invalid encryption key")
+                return error_value
+
+        if max_workers > 1 and len(encrypted_texts) >= PARALLEL_DECRYPT_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_decrypt_one, encrypted_texts))
+        else:
+            results = [_decrypt_one(text) for text in encrypted_texts]
+
+        logger.debug(f"Batch decrypted {len(results)} values (workers: {max_workers})")
+        return results
+
     def is_encrypted(self, text: str) -> bool:
         """
         Check if text appears to be encrypted
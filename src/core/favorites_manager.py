@@ -9,6 +9,10 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from database.change_events import ChangeBus, ChangeType
+from database.connection_pool import ConnectionPool
+from core import services
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,11 +27,29 @@ class FavoritesManager:
             logger.error(f"Database not found: {self.db_path}")
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
+    @classmethod
+    def get_shared(cls, db_path: str = "widget_sidebar.db") -> "FavoritesManager":
+        """
+        Obtener el manager compartido del proceso para una base de datos
+
+        Los botones de favorito de todos los paneles usan esta instancia.
+
+        Args:
+            db_path: Ruta de la base de datos
+
+        Returns:
+            FavoritesManager: Instancia compartida
+        """
+        return services.get_shared(cls, services.path_key(db_path), factory=lambda: cls(db_path))
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Obtener conexión del pool compartido (close() la devuelve al pool)"""
+        return ConnectionPool.get_shared(str(self.db_path)).acquire()
+
+    def _publish_change(self, change_type: ChangeType, item_ids: List[int], fields) -> None:
+        """Publicar el cambio para que las caches de items se actualicen"""
+        if item_ids:
+            ChangeBus.get_shared(str(self.db_path)).publish(change_type, item_ids=item_ids, fields=fields)
 
     # ==================== CRUD Básico ====================
 
@@ -51,6 +73,7 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            self._publish_change(ChangeType.FAVORITE_TOGGLED, [item_id], ('is_favorite', 'favorite_order'))
 
             logger.info(f"Item {item_id} marked as favorite with order {order}")
             return True
@@ -75,6 +98,7 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            self._publish_change(ChangeType.FAVORITE_TOGGLED, [item_id], ('is_favorite', 'favorite_order'))
 
             logger.info(f"Item {item_id} unmarked as favorite")
             return True
@@ -370,8 +394,9 @@ class FavoritesManager:
             cursor = conn.cursor()
 
             # Contar antes de limpiar
-            cursor.execute("SELECT COUNT(*) as count FROM items WHERE is_favorite = 1")
-            count = cursor.fetchone()['count']
+            cursor.execute("SELECT id FROM items WHERE is_favorite = 1")
+            item_ids = [row['id'] for row in cursor.fetchall()]
+            count = len(item_ids)
 
             # Limpiar
             cursor.execute("""
@@ -384,6 +409,7 @@ class FavoritesManager:
 
             conn.commit()
             conn.close()
+            self._publish_change(ChangeType.FAVORITE_TOGGLED, item_ids, ('is_favorite', 'favorite_order'))
 
             logger.info(f"Cleared {count} favorites")
             return count
@@ -0,0 +1,455 @@
+"""
+Fuzzy Matcher for Widget Sidebar
+Typo-tolerant, ranked search (fzf-style subsequence scoring)
+"""
+
+import heapq
+import math
+import time
+import unicodedata
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+# Puntuacion por caracter coincidente y bonificaciones (estilo fzf)
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+BONUS_CONSECUTIVE = 6
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+MAX_GAP_PENALTY = 12
+
+# Peso de una coincidencia en el label frente al resto de campos
+LABEL_WEIGHT = 2.0
+
+# Puntuacion por caracter de una coincidencia literal en contenido/descripcion
+SCORE_TEXT_MATCH = 12
+
+# Bonificaciones por uso frecuente y reciente
+USAGE_WEIGHT = 4.0
+RECENCY_WEIGHT = 12.0
+RECENCY_HALF_LIFE_DAYS = 7.0
+
+# Resultados devueltos por defecto
+DEFAULT_LIMIT = 50
+
+# Caracteres tras los que empieza una "palabra"
+WORD_SEPARATORS = frozenset(" _-./\\:()[]{}<>,;'\"|@#=+*\x00\n\t")
+
+
+def fold_text(text: Optional[str]) -> str:
+    """
+    Lowercase text and strip accents ("Configuración" -> "configuracion")
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        str: Folded text
+    """
+    if not text:
+        return ""
+    text = text.lower()
+    if text.isascii():
+        return text
+    normalized = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+
+
+def char_mask(text: str) -> int:
+    """
+    Bitmask of the characters in a text (used to reject non-matches fast)
+
+    Args:
+        text: Folded text
+
+    Returns:
+        int: 64-bit mask (characters hashed into buckets)
+    """
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+def fuzzy_score(pattern: str, text: str) -> Optional[int]:
+    """
+    Score how well pattern matches text as a subsequence
+
+    The shortest window containing the pattern is located with a forward
+    and a backward pass, then scored: every matched character scores,
+    consecutive characters and characters at word boundaries get bonuses,
+    gaps between matched characters are penalized.
+
+    Args:
+        pattern: Folded pattern (single term, no spaces)
+        text: Folded text
+
+    Returns:
+        Optional[int]: Score, or None if pattern is not a subsequence of text
+    """
+    # Forward pass: end of the first subsequence match
+    pos = -1
+    for ch in pattern:
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+    end = pos
+
+    # Backward pass: shortest window ending at 'end'
+    start = end + 1
+    for ch in reversed(pattern):
+        start = text.rfind(ch, 0, start)
+
+    # Score the window
+    score = 0
+    prev = -1
+    pos = start - 1
+    for index, ch in enumerate(pattern):
+        pos = text.find(ch, pos + 1)
+        char_score = SCORE_MATCH
+
+        if pos == 0 or text[pos - 1] in WORD_SEPARATORS:
+            bonus = BONUS_BOUNDARY
+            if index == 0:
+                bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+            char_score += bonus
+
+        if prev >= 0:
+            gap = pos - prev - 1
+            if gap == 0:
+                char_score += BONUS_CONSECUTIVE
+            else:
+                char_score -= min(
+                    PENALTY_GAP_START + PENALTY_GAP_EXTENSION * (gap - 1),
+                    MAX_GAP_PENALTY
+                )
+
+        score += char_score
+        prev = pos
+
+    return score
+
+
+def _usage_bonus(use_count: int, last_used: Any) -> float:
+    """Bonus for frequently and recently used entries"""
+    bonus = USAGE_WEIGHT * math.log1p(max(use_count or 0, 0))
+
+    if last_used:
+        try:
+            if isinstance(last_used, datetime):
+                last_used_ts = last_used.timestamp()
+            else:
+                last_used_ts = datetime.strptime(str(last_used)[:19], "%Y-%m-%d %H:%M:%S").timestamp()
+            age_days = max(time.time() - last_used_ts, 0) / 86400
+            bonus += RECENCY_WEIGHT * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        except (ValueError, OSError, OverflowError):
+            pass
+
+    return bonus
+
+
+def _term_bounds(term: str) -> Tuple[float, float]:
+    """
+    Upper bounds of the score of a term on any record
+
+    Returns:
+        Tuple[float, float]: (bound, bound when no word of the label starts
+            with the first character of the term)
+    """
+    label_score = SCORE_MATCH
+    for prev, _ in zip(term, term[1:]):
+        # Un caracter seguido solo empieza palabra si el anterior es separador
+        consecutive = BONUS_CONSECUTIVE + (BONUS_BOUNDARY if prev in WORD_SEPARATORS else 0)
+        label_score += SCORE_MATCH + max(consecutive, BONUS_BOUNDARY - PENALTY_GAP_START)
+    text_score = SCORE_TEXT_MATCH * len(term)
+    first_char_bonus = BONUS_BOUNDARY * BONUS_FIRST_CHAR_MULTIPLIER
+    return (max((label_score + first_char_bonus) * LABEL_WEIGHT, text_score),
+            max(label_score * LABEL_WEIGHT, text_score))
+
+
+def _word_initials(text: str) -> Set[str]:
+    """Characters that start a word of a text"""
+    return {ch for index, ch in enumerate(text) if index == 0 or text[index - 1] in WORD_SEPARATORS}
+
+
+def _text_grams(text: str) -> Set[str]:
+    """Characters and trigrams of a text (postings of the literal match)"""
+    grams = set(text)
+    grams.update(text[i:i + 3] for i in range(len(text) - 2))
+    return grams
+
+
+def _intersect(postings: Dict[str, Set[Hashable]], grams: Iterable[str]) -> Set[Hashable]:
+    """Keys present in the postings of every gram"""
+    sets = []
+    for gram in grams:
+        keys = postings.get(gram)
+        if not keys:
+            return set()
+        sets.append(keys)
+    sets.sort(key=len)
+    return sets[0].intersection(*sets[1:])
+
+
+class FuzzyIndex:
+    """
+    Precomputed folded forms of a set of records for fuzzy, ranked search
+
+    Every record has a label (label and tags) and secondary texts (content,
+    description...). Queries are split into terms; every term must match
+    the label as a subsequence (typo tolerant) or appear literally in the
+    secondary text. Long texts are not matched as subsequences: almost any
+    short pattern is a scattered subsequence of a long snippet, which
+    adds noise and makes every keystroke score the whole library.
+    Results are ranked by match quality (label matches weigh more), usage
+    count and recency, and only the top-k are kept through a bounded heap.
+
+    Candidates come from postings built when records are set: a term can
+    only match records whose label has all its characters or whose texts
+    have all its trigrams, so a query scores those records and not the
+    whole library. When a short query still leaves many candidates, they
+    are visited by usage bonus (records with a word starting like the
+    term first, they are the only ones that can get the best scores) and
+    the scan stops once no remaining record can enter the top-k. While
+    the user keeps typing (each query extends the previous one) only the
+    previous matches are re-scored.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        # key -> (label, otros textos, mascara de caracteres, bonificacion de uso)
+        self._entries: Dict[Hashable, Tuple[str, str, int, float]] = {}
+        # Orden de insercion (desempate entre puntuaciones iguales)
+        self._order: Dict[Hashable, int] = {}
+        self._next_order = 0
+        # caracter -> claves cuyo label lo contiene / tiene una palabra que empieza por el
+        self._label_postings: Dict[str, Set[Hashable]] = {}
+        self._initial_postings: Dict[str, Set[Hashable]] = {}
+        # caracter o trigrama -> claves cuyos textos lo contienen
+        self._text_postings: Dict[str, Set[Hashable]] = {}
+        # Claves por bonificacion de uso descendente (se calcula al buscar)
+        self._ranked_keys: Optional[List[Hashable]] = None
+        self._rank: Dict[Hashable, int] = {}
+        self._last_pattern: Optional[str] = None
+        self._last_matches: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def set(self, key: Hashable, label: str, texts: Iterable[Optional[str]] = (),
+            use_count: int = 0, last_used: Any = None) -> None:
+        """
+        Add or replace a record
+
+        Args:
+            key: Record key (e.g. item id)
+            label: Main text, fuzzy matched (matches here weigh more)
+            texts: Secondary texts (content, description...), literal match
+            use_count: Times the record was used
+            last_used: Last use (datetime or 'YYYY-MM-DD HH:MM:SS')
+        """
+        folded_label = fold_text(label)
+        folded_texts = "\x00".join(fold_text(text) for text in texts if text)
+        old_entry = self._entries.get(key)
+        if old_entry is None:
+            self._order[key] = self._next_order
+            self._next_order += 1
+            old_label, old_texts = "", ""
+        else:
+            old_label, old_texts = old_entry[0], old_entry[1]
+
+        self._entries[key] = (
+            folded_label,
+            folded_texts,
+            char_mask(folded_label) | char_mask(folded_texts),
+            _usage_bonus(use_count, last_used)
+        )
+        if old_label != folded_label or old_entry is None:
+            self._update_postings(self._label_postings, key, set(old_label), set(folded_label))
+            self._update_postings(self._initial_postings, key,
+                                  _word_initials(old_label), _word_initials(folded_label))
+        if old_texts != folded_texts or old_entry is None:
+            self._update_postings(self._text_postings, key,
+                                  _text_grams(old_texts), _text_grams(folded_texts))
+        self._ranked_keys = None
+        self._last_pattern = None
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a record
+
+        Args:
+            key: Record key
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            del self._order[key]
+            self._update_postings(self._label_postings, key, set(entry[0]), set())
+            self._update_postings(self._initial_postings, key, _word_initials(entry[0]), set())
+            self._update_postings(self._text_postings, key, _text_grams(entry[1]), set())
+            self._ranked_keys = None
+            self._last_pattern = None
+
+    def clear(self) -> None:
+        """Remove every record"""
+        self._entries.clear()
+        self._order.clear()
+        self._label_postings.clear()
+        self._initial_postings.clear()
+        self._text_postings.clear()
+        self._ranked_keys = None
+        self._last_pattern = None
+        self._last_matches = []
+
+    @staticmethod
+    def _update_postings(postings: Dict[str, Set[Hashable]], key: Hashable,
+                         old_grams: Set[str], new_grams: Set[str]) -> None:
+        """Move a key between postings after its text changed"""
+        for gram in old_grams - new_grams:
+            keys = postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del postings[gram]
+        for gram in new_grams - old_grams:
+            postings.setdefault(gram, set()).add(key)
+
+    def _candidates(self, terms: List[str]) -> Optional[Set[Hashable]]:
+        """
+        Keys that can match every term (from the postings)
+
+        Returns:
+            Optional[Set]: Candidate keys, or None when most of the library
+                can match (building the set would cost more than it saves)
+        """
+        label_postings = self._label_postings
+        text_postings = self._text_postings
+        term_grams = []
+        for term in sorted(set(terms), key=len, reverse=True):
+            trigrams = {term[i:i + 3] for i in range(len(term) - 2)}
+            term_grams.append((set(term), trigrams or set(term)))
+
+        # Estimacion por el n-grama menos frecuente de cada termino
+        estimate = min(
+            min(len(label_postings.get(ch, ())) for ch in chars)
+            + min(len(text_postings.get(gram, ())) for gram in grams)
+            for chars, grams in term_grams
+        )
+        if estimate * 2 > len(self._entries):
+            return None
+
+        candidates = None
+        for chars, grams in term_grams:
+            term_keys = _intersect(label_postings, chars) | _intersect(text_postings, grams)
+            candidates = term_keys if candidates is None else candidates & term_keys
+            if not candidates:
+                break
+        return candidates
+
+    def _by_usage(self, keys: Optional[Set[Hashable]] = None,
+                  exclude: Set[Hashable] = frozenset()) -> List[Hashable]:
+        """Keys (all if None) by usage bonus, highest first (ties in insertion order)"""
+        if self._ranked_keys is None:
+            entries = self._entries
+            self._ranked_keys = sorted(entries, key=lambda key: -entries[key][3])
+            self._rank = {key: rank for rank, key in enumerate(self._ranked_keys)}
+        if keys is None:
+            return [key for key in self._ranked_keys if key not in exclude]
+        if len(keys) * 8 > len(self._ranked_keys):
+            return [key for key in self._ranked_keys if key in keys]
+        return sorted(keys, key=self._rank.__getitem__)
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT,
+               keys: Optional[Set[Hashable]] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Fuzzy search
+
+        Args:
+            query: Raw user input
+            limit: Maximum results (top-k by score)
+            keys: Only return these keys (optional)
+
+        Returns:
+            List[Tuple[key, score]]: Best matches first
+        """
+        pattern = " ".join(fold_text(query).split())
+        if not pattern or limit <= 0:
+            return []
+        terms = pattern.split(" ")
+        query_mask = char_mask(pattern.replace(" ", ""))
+
+        # Tramos de claves a puntuar, cada uno con la puntuacion maxima posible
+        if self._last_pattern and pattern.startswith(self._last_pattern):
+            # Reusar las coincidencias anteriores si la consulta solo se alargo
+            batches = [(self._last_matches, None)]
+        else:
+            candidates = self._candidates(terms)
+            if candidates is not None and len(candidates) <= limit:
+                batches = [(candidates, None)]
+            else:
+                bounds = [_term_bounds(term) for term in terms]
+                best = sum(bound for bound, _ in bounds)
+                initials = _intersect(self._initial_postings, {term[0] for term in terms})
+                if candidates is None:
+                    rest = self._by_usage(exclude=initials)
+                else:
+                    initials &= candidates
+                    rest = self._by_usage(candidates - initials)
+                batches = [
+                    (self._by_usage(initials), best),
+                    (rest, best - min(bound - no_initial for bound, no_initial in bounds))
+                ]
+
+        entries = self._entries
+        order = self._order
+        matches = []
+        heap: List[Tuple[float, int, Hashable]] = []
+        complete = True
+
+        for batch, max_score in batches:
+            for key in batch:
+                entry = entries.get(key)
+                if entry is None:
+                    continue
+                label, texts, mask, usage_bonus = entry
+                # Ninguna clave restante del tramo puede entrar en el top-k
+                if (max_score is not None and len(heap) == limit
+                        and (max_score + usage_bonus, -order[key]) < heap[0][:2]):
+                    complete = False
+                    break
+                if query_mask & ~mask:
+                    continue
+
+                total = 0.0
+                for term in terms:
+                    label_score = fuzzy_score(term, label)
+                    if label_score is not None:
+                        total += label_score * LABEL_WEIGHT
+                    elif term in texts:
+                        total += SCORE_TEXT_MATCH * len(term)
+                    else:
+                        total = None
+                        break
+                if total is None:
+                    continue
+
+                matches.append(key)
+                if keys is not None and key not in keys:
+                    continue
+
+                candidate = (total + usage_bonus, -order[key], key)
+                if len(heap) < limit:
+                    heapq.heappush(heap, candidate)
+                elif candidate[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, candidate)
+
+        # Un recorrido cortado no tiene todas las coincidencias
+        self._last_pattern = pattern if complete else None
+        self._last_matches = matches
+
+        return [(key, score) for score, _, key in sorted(heap, reverse=True)]
@@ -1,26 +1,60 @@
 """
 Hotkey Manager for Widget Sidebar
 Manages global keyboard shortcuts using pynput
+
+Los atajos registrados se compilan en un dict indexado por frozenset de
+teclas, así cada evento de teclado se resuelve con una sola búsqueda en el
+hilo del listener de pynput. Los callbacks no se ejecutan en ese hilo: se
+envían por una señal Qt encolada al hilo de la interfaz (pueden tocar
+widgets) y se mide la latencia tecla -> acción.
 """
 
-from pynput import keyboard
-from typing import Callable, Dict, Optional
-import threading
+import time
+from collections import deque
+from typing import Callable, Dict, FrozenSet, Optional
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+# Variantes izquierda/derecha de los modificadores de pynput
+MODIFIER_ALIASES = {
+    'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
+    'shift_l': 'shift', 'shift_r': 'shift',
+    'alt_l': 'alt', 'alt_r': 'alt', 'alt_gr': 'alt',
+    'cmd_l': 'cmd', 'cmd_r': 'cmd',
+}
+
+# Latencias recientes guardadas para las métricas
+LATENCY_SAMPLES = 100
+
+
+class _HotkeyDispatcher(QObject):
+    """Puente al hilo de la interfaz (vive en el hilo que crea el HotkeyManager)"""
+
+    # (callback, perf_counter de la pulsación)
+    triggered = pyqtSignal(object, float)
 
 
 class HotkeyManager:
     """
     Manages global hotkeys for the application
-    Runs keyboard listener in a separate thread
+    Runs keyboard listener in a separate thread; callbacks run in the Qt GUI thread
     """
 
     def __init__(self):
-        """Initialize hotkey manager"""
+        """Initialize hotkey manager (from the GUI thread)"""
         self.hotkeys: Dict[str, Callable] = {}
-        self.listener: Optional[keyboard.Listener] = None
+        # Tabla compilada: frozenset de teclas -> callback (se reemplaza entera)
+        self._lookup: Dict[FrozenSet[str], Callable] = {}
+        self.listener = None
         self.is_running = False
         self.current_keys = set()
 
+        self._dispatcher = _HotkeyDispatcher()
+        self._dispatcher.triggered.connect(self._run_callback, Qt.ConnectionType.QueuedConnection)
+        self._metrics = {'key_events': 0, 'matches': 0, 'dispatched': 0, 'callback_errors': 0}
+        self._latencies_ms = deque(maxlen=LATENCY_SAMPLES)
+        self._max_latency_ms = 0.0
+
     def register_hotkey(self, key_combination: str, callback: Callable):
         """
         Register a global hotkey
@@ -32,6 +66,7 @@ class HotkeyManager:
         # Normalize key combination to lowercase
         normalized_key = key_combination.lower().replace(" ", "")
         self.hotkeys[normalized_key] = callback
+        self._compile()
         print(f"Registered hotkey: {normalized_key}")
 
     def unregister_hotkey(self, key_combination: str):
@@ -44,19 +79,32 @@ class HotkeyManager:
         normalized_key = key_combination.lower().replace(" ", "")
         if normalized_key in self.hotkeys:
             del self.hotkeys[normalized_key]
+            self._compile()
             print(f"Unregistered hotkey: {normalized_key}")
 
     def unregister_all(self):
         """Unregister all hotkeys"""
         self.hotkeys.clear()
+        self._compile()
         print("All hotkeys unregistered")
 
+    def _compile(self):
+        """Rebuild the frozenset lookup table from the registered hotkeys"""
+        # Se construye aparte y se asigna de una vez (el listener lee sin lock)
+        self._lookup = {
+            frozenset(MODIFIER_ALIASES.get(key, key) for key in hotkey.split("+")): callback
+            for hotkey, callback in self.hotkeys.items()
+        }
+
     def start(self):
         """Start listening for global hotkeys"""
         if self.is_running:
             print("HotkeyManager already running")
             return
 
+        # pynput necesita el servidor gráfico: se importa al arrancar el listener
+        from pynput import keyboard
+
         print("Starting HotkeyManager...")
         self.is_running = True
 
@@ -85,7 +133,7 @@ class HotkeyManager:
 
     def _on_press(self, key):
         """
-        Handle key press event
+        Handle key press event (listener thread)
 
         Args:
             key: Pressed key from pynput
@@ -101,7 +149,7 @@ class HotkeyManager:
 
     def _on_release(self, key):
         """
-        Handle key release event
+        Handle key release event (listener thread)
 
         Args:
             key: Released key from pynput
@@ -111,7 +159,7 @@ class HotkeyManager:
 
         # Normalize the key
         key_str = self._normalize_key(key)
-        if key_str and key_str in self.current_keys:
+        if key_str:
             self.current_keys.discard(key_str)
 
     def _normalize_key(self, key) -> Optional[str]:
@@ -125,56 +173,62 @@ class HotkeyManager:
             Normalized key string or None
         """
         try:
-            # Handle special keys
-            if hasattr(key, 'name'):
-                return key.name.lower()
+            # Handle special keys (left/right modifiers count as the same key)
+            name = getattr(key, 'name', None)
+            if name:
+                name = name.lower()
+                return MODIFIER_ALIASES.get(name, name)
 
             # Handle character keys
-            if hasattr(key, 'char') and key.char:
-                return key.char.lower()
+            char = getattr(key, 'char', None)
+            if char:
+                # Con Ctrl pulsado algunas plataformas dan el carácter de control (Ctrl+V -> '\x16')
+                if len(char) == 1 and 1 <= ord(char) <= 26:
+                    return chr(ord(char) + 96)
+                return char.lower()
 
             return None
-        except AttributeError:
+        except (AttributeError, TypeError):
             return None
 
     def _check_hotkeys(self):
-        """Check if current key combination matches any registered hotkeys"""
-        if not self.current_keys:
-            return
+        """Dispatch the callback of the current key combination, if registered"""
+        callback = self._lookup.get(frozenset(self.current_keys))
+        self._metrics['key_events'] += 1
+        if callback is not None:
+            self._metrics['matches'] += 1
+            # Al hilo de la interfaz (conexión encolada, sin crear hilos)
+            self._dispatcher.triggered.emit(callback, time.perf_counter())
+
+    def _run_callback(self, callback: Callable, pressed_at: float):
+        """Run a hotkey callback in the GUI thread and record its latency"""
+        latency_ms = (time.perf_counter() - pressed_at) * 1000
+        self._metrics['dispatched'] += 1
+        self._latencies_ms.append(latency_ms)
+        self._max_latency_ms = max(self._max_latency_ms, latency_ms)
+        try:
+            callback()
+        except Exception as e:
+            self._metrics['callback_errors'] += 1
+            print(f"Error executing hotkey callback: {e}")
 
-        # Build current combination string
-        # Sort to ensure consistent ordering
-        sorted_keys = sorted(self.current_keys)
-        current_combination = "+".join(sorted_keys)
-
-        # Check if it matches any registered hotkey
-        for hotkey, callback in self.hotkeys.items():
-            if self._matches_hotkey(current_combination, hotkey):
-                try:
-                    # Execute callback in a separate thread to avoid blocking
-                    thread = threading.Thread(target=callback)
-                    thread.daemon = True
-                    thread.start()
-                except Exception as e:
-                    print(f"Error executing hotkey callback: {e}")
-
-    def _matches_hotkey(self, current: str, registered: str) -> bool:
+    def get_metrics(self) -> Dict:
         """
-        Check if current key combination matches registered hotkey
-
-        Args:
-            current: Current pressed keys as string
-            registered: Registered hotkey pattern
+        Hotkey dispatch metrics
 
         Returns:
-            True if matches
+            Dict: key_events, matches, dispatched, callback_errors,
+                registered, and key press -> callback latency
+                (last_latency_ms, avg_latency_ms over the last
+                LATENCY_SAMPLES, max_latency_ms)
         """
-        # Normalize both combinations
-        current_set = set(current.split("+"))
-        registered_set = set(registered.split("+"))
-
-        # Must match exactly
-        return current_set == registered_set
+        latencies = list(self._latencies_ms)
+        metrics = dict(self._metrics)
+        metrics['registered'] = len(self._lookup)
+        metrics['last_latency_ms'] = round(latencies[-1], 2) if latencies else 0.0
+        metrics['avg_latency_ms'] = round(sum(latencies) / len(latencies), 2) if latencies else 0.0
+        metrics['max_latency_ms'] = round(self._max_latency_ms, 2)
+        return metrics
 
     def is_active(self) -> bool:
         """
@@ -5,238 +5,255 @@ Fecha: 2025-01-23
 """
 
 import sqlite3
-from typing import List, Dict, Optional
+import time
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import logging
 
+from database.connection_pool import ConnectionPool
+from database.change_events import ChangeBus
+from database.usage_rollups import WINDOW_START_HOUR
+
 logger = logging.getLogger(__name__)
 
+# Umbrales de las reglas de notificación
+FAVORITE_MIN_USE_COUNT = 10          # usos totales (más de)
+FAVORITE_MIN_RECENT_USES = 5         # usos en RECENT_DAYS (más de)
+RECENT_DAYS = 30
+NEVER_USED_MIN_ITEMS = 5             # items sin usar para avisar (más de)
+ABANDONED_DAYS = 60
+ABANDONED_MIN_USE_COUNT = 3
+ABANDONED_MIN_ITEMS = 3              # items abandonados para avisar (más de)
+FAILING_MIN_EXECUTIONS = 10
+FAILING_MIN_ERROR_RATE = 30.0        # %
+SLOW_MIN_EXECUTIONS = 10
+SLOW_MIN_AVG_SECONDS = 5.0
+
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+
 
 class NotificationManager:
-    """Gestor de notificaciones y sugerencias inteligentes"""
+    """
+    Gestor de notificaciones y sugerencias inteligentes
+
+    Las cinco reglas activas se evalúan en memoria sobre una sola consulta de
+    métricas por item (leída de los rollups de uso, no del historial crudo);
+    la de atajos sigue desactivada hasta que los items tengan atajo. El
+    resultado queda en caché hasta el siguiente cambio publicado en el
+    ChangeBus de la base de datos (usos escritos, items editados, favoritos)
+    o hasta el cambio de hora, ya que las ventanas de RECENT_DAYS y
+    ABANDONED_DAYS avanzan por horas aunque no haya escrituras.
+    """
 
     def __init__(self, db_path: str = "widget_sidebar.db"):
         """Inicializar manager"""
         self.db_path = db_path
+        # ((generación del ChangeBus, hora UTC), notificaciones)
+        self._cache: Optional[Tuple[Tuple[int, str], List[Dict]]] = None
+        self._metrics = {'evaluations': 0, 'cache_hits': 0}
 
-    def get_pending_notifications(self) -> List[Dict]:
-        """Obtener notificaciones pendientes"""
-        notifications = []
+    def _get_connection(self) -> sqlite3.Connection:
+        """Obtener conexión del pool compartido (close() la devuelve al pool)"""
+        return ConnectionPool.get_shared(str(self.db_path)).acquire()
 
+    def get_pending_notifications(self) -> List[Dict]:
+        """Obtener notificaciones pendientes (ordenadas por prioridad)"""
         try:
-            # Importar managers
-            from core.stats_manager import StatsManager
-            from core.favorites_manager import FavoritesManager
-
-            stats_manager = StatsManager(self.db_path)
-            favorites_manager = FavoritesManager(self.db_path)
-
-            # 1. Sugerencia de favoritos
-            suggested_favs = stats_manager.suggest_favorites(limit=3)
-            if suggested_favs:
-                notifications.append({
-                    'type': 'suggestion',
-                    'category': 'favorites',
-                    'title': '💡 Sugerencia de Favoritos',
-                    'message': f"Tienes {len(suggested_favs)} items muy usados que podrían ser favoritos",
-                    'action': 'show_favorite_suggestions',
-                    'priority': 'medium',
-                    'data': suggested_favs
-                })
-
-            # 2. Items nunca usados
-            never_used = stats_manager.get_never_used_items()
-            if len(never_used) > 5:
-                notifications.append({
-                    'type': 'alert',
-                    'category': 'cleanup',
-                    'title': '🧹 Items sin Usar',
-                    'message': f"Tienes {len(never_used)} items que nunca has usado. ¿Eliminarlos?",
-                    'action': 'show_cleanup_suggestions',
-                    'priority': 'low',
-                    'data': never_used
-                })
-
-            # 3. Items abandonados
-            abandoned = stats_manager.get_abandoned_items(days_threshold=60, min_use_count=3)
-            if len(abandoned) > 3:
-                notifications.append({
-                    'type': 'info',
-                    'category': 'abandoned',
-                    'title': '📦 Items Abandonados',
-                    'message': f"{len(abandoned)} items que antes usabas ya no los ejecutas",
-                    'action': 'show_abandoned_items',
-                    'priority': 'low',
-                    'data': abandoned
-                })
-
-            # 4. Items con errores frecuentes
-            failing_items = self._get_failing_items(min_executions=10, min_error_rate=30)
-            if failing_items:
-                notifications.append({
-                    'type': 'warning',
-                    'category': 'errors',
-                    'title': '⚠️ Items con Errores',
-                    'message': f"{len(failing_items)} items fallan frecuentemente. ¿Revisarlos?",
-                    'action': 'show_failing_items',
-                    'priority': 'high',
-                    'data': failing_items
-                })
-
-            # 5. Items lentos
-            slow_items = self._get_slow_items(min_executions=10, min_avg_time_seconds=5)
-            if slow_items:
-                avg_time = sum(i['avg_time_seconds'] for i in slow_items) / len(slow_items)
-                notifications.append({
-                    'type': 'info',
-                    'category': 'performance',
-                    'title': '🐌 Items Lentos',
-                    'message': f"{len(slow_items)} items tardan más de 5 segundos en ejecutar",
-                    'action': 'show_slow_items',
-                    'priority': 'medium',
-                    'data': slow_items
-                })
-
-            # 6. Items populares sin atajos
-            popular_no_shortcuts = self._get_popular_items_without_shortcuts(min_use_count=30)
-            if popular_no_shortcuts:
-                notifications.append({
-                    'type': 'suggestion',
-                    'category': 'shortcuts',
-                    'title': '⌨️ Asignar Atajos',
-                    'message': f"{len(popular_no_shortcuts)} items populares sin atajos de teclado",
-                    'action': 'show_shortcut_suggestions',
-                    'priority': 'low',
-                    'data': popular_no_shortcuts
-                })
-
-            # Ordenar por prioridad
-            priority_order = {'high': 0, 'medium': 1, 'low': 2}
-            notifications.sort(key=lambda x: priority_order.get(x['priority'], 3))
+            from core.usage_tracker import UsageTracker
+
+            # Los usos aun en cola cuentan (escribirlos publica el cambio)
+            UsageTracker.flush_shared(str(self.db_path))
+            bus = ChangeBus.get_shared(str(self.db_path))
+            cache_key = (bus.generation, self._cache_period())
+
+            if self._cache is not None and self._cache[0] == cache_key:
+                self._metrics['cache_hits'] += 1
+                return list(self._cache[1])
+
+            notifications = self.evaluate_rules(self._load_item_metrics())
+            self._metrics['evaluations'] += 1
+            self._cache = (cache_key, notifications)
 
             logger.info(f"Generated {len(notifications)} notifications")
-            return notifications
+            return list(notifications)
 
         except Exception as e:
             logger.error(f"Error getting pending notifications: {e}")
             return []
 
-    def _get_failing_items(self, min_executions: int = 10, min_error_rate: int = 30) -> List[Dict]:
-        """Obtener items con alta tasa de error"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+    def _cache_period(self) -> str:
+        """Hora UTC actual, la misma granularidad que WINDOW_START_HOUR"""
+        return time.strftime('%Y-%m-%d %H', time.gmtime())
 
-            cursor.execute("""
-                SELECT
-                    i.id,
-                    i.label,
-                    i.badge,
-                    COUNT(h.id) as total_executions,
-                    SUM(CASE WHEN h.success = 0 THEN 1 ELSE 0 END) as error_count,
-                    ROUND(100.0 * SUM(CASE WHEN h.success = 0 THEN 1 ELSE 0 END) / COUNT(h.id), 1) as error_rate
-                FROM items i
-                JOIN item_usage_history h ON i.id = h.item_id
-                GROUP BY i.id
-                HAVING total_executions >= ? AND error_rate >= ?
-                ORDER BY error_rate DESC
-                LIMIT 10
-            """, (min_executions, min_error_rate))
-
-            items = []
-            for row in cursor.fetchall():
-                items.append({
-                    'id': row['id'],
-                    'label': row['label'],
-                    'badge': row['badge'],
-                    'total_executions': row['total_executions'],
-                    'error_count': row['error_count'],
-                    'error_rate': row['error_rate']
-                })
+    def invalidate_cache(self):
+        """Forzar la reevaluación en la próxima consulta"""
+        self._cache = None
 
-            conn.close()
-            return items
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Cache metrics
 
-        except Exception as e:
-            logger.error(f"Error getting failing items: {e}")
-            return []
+        Returns:
+            Dict: 'evaluations' (metric queries run) and 'cache_hits'
+        """
+        return dict(self._metrics)
 
-    def _get_slow_items(self, min_executions: int = 10, min_avg_time_seconds: float = 5.0) -> List[Dict]:
-        """Obtener items con tiempo de ejecución lento"""
+    def _load_item_metrics(self) -> List[Dict]:
+        """
+        Métricas de todos los items en una sola consulta
+
+        Returns:
+            List[Dict]: Una fila por item con sus columnas y executions,
+                error_count, success_time_ms, recent_uses, days_old y
+                days_since_last_use
+        """
+        conn = self._get_connection()
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT
-                    i.id,
-                    i.label,
-                    i.badge,
-                    COUNT(h.id) as executions,
-                    ROUND(AVG(h.execution_time_ms) / 1000.0, 2) as avg_time_seconds
+                    i.id, i.label, i.badge, i.type, i.category_id, i.is_favorite,
+                    i.use_count, i.last_used, i.created_at,
+                    julianday('now') - julianday(i.created_at) as days_old,
+                    julianday('now') - julianday(i.last_used) as days_since_last_use,
+                    COALESCE(d.executions, 0) as executions,
+                    COALESCE(d.failed, 0) as error_count,
+                    COALESCE(d.success_time_ms, 0) as success_time_ms,
+                    COALESCE(r.recent_uses, 0) as recent_uses
                 FROM items i
-                JOIN item_usage_history h ON i.id = h.item_id
-                WHERE h.success = 1
-                GROUP BY i.id
-                HAVING executions >= ? AND avg_time_seconds >= ?
-                ORDER BY avg_time_seconds DESC
-                LIMIT 10
-            """, (min_executions, min_avg_time_seconds))
-
-            items = []
-            for row in cursor.fetchall():
-                items.append({
-                    'id': row['id'],
-                    'label': row['label'],
-                    'badge': row['badge'],
-                    'executions': row['executions'],
-                    'avg_time_seconds': row['avg_time_seconds']
-                })
-
+                LEFT JOIN (
+                    SELECT item_id, SUM(executions) as executions, SUM(failed) as failed,
+                           SUM(success_time_ms) as success_time_ms
+                    FROM item_usage_daily
+                    GROUP BY item_id
+                ) d ON i.id = d.item_id
+                LEFT JOIN (
+                    SELECT item_id, SUM(executions) as recent_uses
+                    FROM item_usage_hourly
+                    WHERE hour_start >= {WINDOW_START_HOUR}
+                    GROUP BY item_id
+                ) r ON i.id = r.item_id
+            """, (RECENT_DAYS,))
+            return [dict(row) for row in cursor.fetchall()]
+        finally:
             conn.close()
-            return items
 
-        except Exception as e:
-            logger.error(f"Error getting slow items: {e}")
-            return []
-
-    def _get_popular_items_without_shortcuts(self, min_use_count: int = 30) -> List[Dict]:
-        """Obtener items populares sin atajos asignados"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+    @staticmethod
+    def evaluate_rules(items: List[Dict]) -> List[Dict]:
+        """
+        Evaluar las reglas de notificación sobre las métricas de los items
 
-            cursor.execute("""
-                SELECT
-                    id,
-                    label,
-                    badge,
-                    use_count
-                FROM items
-                WHERE use_count >= ?
-                  AND (shortcut IS NULL OR shortcut = '')
-                ORDER BY use_count DESC
-                LIMIT 10
-            """, (min_use_count,))
-
-            items = []
-            for row in cursor.fetchall():
-                items.append({
-                    'id': row['id'],
-                    'label': row['label'],
-                    'badge': row['badge'],
-                    'use_count': row['use_count']
-                })
+        Args:
+            items: Rows from _load_item_metrics
 
-            conn.close()
-            return items
+        Returns:
+            List[Dict]: Notifications sorted by priority
+        """
+        notifications = []
 
-        except Exception as e:
-            logger.error(f"Error getting items without shortcuts: {e}")
-            return []
+        # 1. Sugerencia de favoritos
+        suggested_favs = sorted(
+            (i for i in items if not i['is_favorite'] and (i['use_count'] or 0) > FAVORITE_MIN_USE_COUNT
+             and i['recent_uses'] > FAVORITE_MIN_RECENT_USES),
+            key=lambda i: (i['recent_uses'], i['use_count']), reverse=True
+        )[:3]
+        if suggested_favs:
+            notifications.append({
+                'type': 'suggestion',
+                'category': 'favorites',
+                'title': '💡 Sugerencia de Favoritos',
+                'message': f"Tienes {len(suggested_favs)} items muy usados que podrían ser favoritos",
+                'action': 'show_favorite_suggestions',
+                'priority': 'medium',
+                'data': suggested_favs
+            })
+
+        # 2. Items nunca usados
+        never_used = sorted(
+            (i for i in items if not i['use_count'] or i['last_used'] is None),
+            key=lambda i: i['created_at'] or '', reverse=True
+        )
+        if len(never_used) > NEVER_USED_MIN_ITEMS:
+            notifications.append({
+                'type': 'alert',
+                'category': 'cleanup',
+                'title': '🧹 Items sin Usar',
+                'message': f"Tienes {len(never_used)} items que nunca has usado. ¿Eliminarlos?",
+                'action': 'show_cleanup_suggestions',
+                'priority': 'low',
+                'data': never_used
+            })
+
+        # 3. Items abandonados
+        abandoned = sorted(
+            (i for i in items if (i['use_count'] or 0) >= ABANDONED_MIN_USE_COUNT
+             and i['days_since_last_use'] is not None and i['days_since_last_use'] > ABANDONED_DAYS),
+            key=lambda i: i['days_since_last_use'], reverse=True
+        )
+        if len(abandoned) > ABANDONED_MIN_ITEMS:
+            notifications.append({
+                'type': 'info',
+                'category': 'abandoned',
+                'title': '📦 Items Abandonados',
+                'message': f"{len(abandoned)} items que antes usabas ya no los ejecutas",
+                'action': 'show_abandoned_items',
+                'priority': 'low',
+                'data': abandoned
+            })
+
+        # 4. Items con errores frecuentes
+        failing_items = []
+        for i in items:
+            if i['executions'] >= FAILING_MIN_EXECUTIONS:
+                error_rate = round(100.0 * i['error_count'] / i['executions'], 1)
+                if error_rate >= FAILING_MIN_ERROR_RATE:
+                    failing_items.append({
+                        'id': i['id'], 'label': i['label'], 'badge': i['badge'],
+                        'total_executions': i['executions'], 'error_count': i['error_count'],
+                        'error_rate': error_rate
+                    })
+        failing_items = sorted(failing_items, key=lambda i: i['error_rate'], reverse=True)[:10]
+        if failing_items:
+            notifications.append({
+                'type': 'warning',
+                'category': 'errors',
+                'title': '⚠️ Items con Errores',
+                'message': f"{len(failing_items)} items fallan frecuentemente. ¿Revisarlos?",
+                'action': 'show_failing_items',
+                'priority': 'high',
+                'data': failing_items
+            })
+
+        # 5. Items lentos (promedio de las ejecuciones correctas)
+        slow_items = []
+        for i in items:
+            successful = i['executions'] - i['error_count']
+            if successful >= SLOW_MIN_EXECUTIONS:
+                avg_time_seconds = round(i['success_time_ms'] / successful / 1000.0, 2)
+                if avg_time_seconds >= SLOW_MIN_AVG_SECONDS:
+                    slow_items.append({
+                        'id': i['id'], 'label': i['label'], 'badge': i['badge'],
+                        'executions': successful, 'avg_time_seconds': avg_time_seconds
+                    })
+        slow_items = sorted(slow_items, key=lambda i: i['avg_time_seconds'], reverse=True)[:10]
+        if slow_items:
+            notifications.append({
+                'type': 'info',
+                'category': 'performance',
+                'title': '🐌 Items Lentos',
+                'message': f"{len(slow_items)} items tardan más de {SLOW_MIN_AVG_SECONDS:g} segundos en ejecutar",
+                'action': 'show_slow_items',
+                'priority': 'medium',
+                'data': slow_items
+            })
+
+        # 6. Items populares sin atajos: desactivada hasta que los items tengan
+        # campo de atajo (sin él todos los items populares la disparaban y la
+        # acción 'show_shortcut_suggestions' aún no está implementada)
+
+        # Ordenar por prioridad
+        notifications.sort(key=lambda x: PRIORITY_ORDER.get(x['priority'], 3))
+        return notifications
 
     def should_show_notification(self, category: str, days_since_last: int = 7) -> bool:
         """
@@ -277,7 +294,8 @@ class NotificationManager:
         # TODO: Implementar sistema de configuración de notificaciones
         return {
             'enabled': True,
-            'enabled_categories': ['favorites', 'cleanup', 'abandoned', 'errors', 'performance', 'shortcuts'],
+            # 'shortcuts' vuelve cuando los items tengan campo de atajo
+            'enabled_categories': ['favorites', 'cleanup', 'abandoned', 'errors', 'performance'],
             'min_days_between': 7,
             'max_notifications_per_session': 2
         }
@@ -197,6 +197,19 @@ class PinnedPanelsManager:
         except Exception as e:
             logger.error(f"Failed to mark panel as opened: {e}")
 
+    def mark_panels_opened(self, panel_ids: List[int]):
+        """
+        Update statistics of several opened panels with a single write
+
+        Args:
+            panel_ids: Panel IDs in database
+        """
+        try:
+            self.db.update_panels_last_opened(panel_ids)
+            logger.debug(f"Panels {panel_ids} marked as opened")
+        except Exception as e:
+            logger.error(f"Failed to mark panels as opened: {e}")
+
     def get_recent_history(self, limit: int = 10) -> List[Dict]:
         """
         Get recently used panels for history dropdown
@@ -3,69 +3,384 @@ Search Engine for Widget Sidebar
 Provides filtering and searching functionality for items across categories
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 import re
+import threading
 from models.item import Item
 from models.category import Category
+from core.fuzzy_matcher import FuzzyIndex, DEFAULT_LIMIT
+from database.change_events import ChangeType
+
+
+# Tamaño maximo de los n-gramas del indice invertido (se indexan de 1 a NGRAM_SIZE)
+NGRAM_SIZE = 3
+
+# Separador entre campos: ningun n-grama indexado lo contiene, asi una
+# busqueda nunca coincide "a caballo" entre label, contenido y tags
+FIELD_SEPARATOR = "\x00"
 
 
 class SearchEngine:
     """
     Search engine for filtering items across categories
     Performs case-insensitive search on item labels and content
+
+    Items are tokenized once into an inverted index of 1- to 3-grams keyed
+    by item id. A query of up to 3 characters is a single posting list;
+    longer ones intersect the postings of their trigrams and verify the
+    (small) candidate set. Results are built from the postings in the order
+    of the indexed items, so the per-keystroke cost depends on the number of
+    matches instead of the library size.
+
+    The indexed items are the search scope (set_items, or the categories
+    passed to search/search_in_category). With a change_bus the index
+    follows DBManager.changes: edited items are re-tokenized and deleted
+    ones dropped before the next query.
+
+    A fuzzy mode (fuzzy=True / search_fuzzy) ranks typo-tolerant matches
+    using precomputed folded forms (see core.fuzzy_matcher).
     """
 
-    def __init__(self):
-        """Initialize search engine"""
-        pass
+    def __init__(self, change_bus=None, include_description: bool = False):
+        """
+        Initialize search engine
 
-    def search(self, query: str, categories: List[Category]) -> List[Item]:
+        Args:
+            change_bus: ChangeBus of the database the items come from (optional)
+            include_description: Also match item descriptions
         """
-        Search for items matching the query across all categories
+        self._include_description = include_description
+        # n-grama -> ids de items que lo contienen
+        self._postings: Dict[str, Set[str]] = {}
+        # id -> item indexado, su texto normalizado y su posicion en el alcance
+        self._items: Dict[str, Item] = {}
+        self._texts: Dict[str, str] = {}
+        self._positions: Dict[str, int] = {}
+        # Formas normalizadas para la busqueda difusa
+        self._fuzzy_index = FuzzyIndex()
+
+        # Listas indexadas como alcance por search/search_in_category
+        self._scope_key: Optional[Tuple] = None
+        self._scope_lists: List[Sequence[Item]] = []
+
+        # Cambios publicados por DBManager (pueden llegar desde otro hilo)
+        self._changes_lock = threading.Lock()
+        self._has_changes = False
+        self._changed_ids: Set[str] = set()
+        self._deleted_ids: Set[str] = set()
+        self._reindex_all = False
+        if change_bus is not None:
+            change_bus.subscribe(self._on_change)
+
+    # ========== INDEX MAINTENANCE ==========
+
+    def set_items(self, items: Iterable[Item]) -> None:
+        """
+        Make these items the search scope (in this order)
+
+        Items already indexed with the same object are not re-tokenized;
+        items outside the new scope are dropped.
+
+        Args:
+            items: Items to search in
+        """
+        items = list(items)
+        new_ids = {item.id for item in items}
+        for item_id in [item_id for item_id in self._items if item_id not in new_ids]:
+            self.delete_item(item_id)
+
+        self._positions = {}
+        for position, item in enumerate(items):
+            self._positions[item.id] = position
+            if self._items.get(item.id) is not item:
+                self.update_item(item)
+
+        self._scope_key = None
+        self._scope_lists = []
+
+    def index_items(self, items: Iterable[Item]) -> None:
+        """
+        Index (or re-index) a batch of items
+
+        Args:
+            items: Items to index
+        """
+        for item in items:
+            self.update_item(item)
+
+    def add_item(self, item: Item) -> None:
+        """
+        Add an item to the index
+
+        Args:
+            item: Item to index
+        """
+        self.update_item(item)
+
+    def update_item(self, item: Item) -> None:
+        """
+        Re-index an item after its label, content or tags changed
+
+        Args:
+            item: Item to (re)index
+        """
+        item_id = item.id
+        text = self._get_searchable_text(item)
+        old_text = self._texts.get(item_id)
+
+        self._items[item_id] = item
+        if item_id not in self._positions:
+            self._positions[item_id] = len(self._positions)
+        self._fuzzy_index.set(
+            item_id,
+            " ".join([item.label or ""] + list(item.tags or [])),
+            [None if item.is_sensitive else item.content, item.description],
+            use_count=getattr(item, 'use_count', 0),
+            last_used=getattr(item, 'last_used', None)
+        )
+        if old_text == text:
+            return
+
+        old_grams = self._get_ngrams(old_text) if old_text is not None else set()
+        new_grams = self._get_ngrams(text)
+
+        for gram in old_grams - new_grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(item_id)
+                if not postings:
+                    del self._postings[gram]
+
+        for gram in new_grams - old_grams:
+            self._postings.setdefault(gram, set()).add(item_id)
+
+        self._texts[item_id] = text
+
+    def delete_item(self, item_id: str) -> None:
+        """
+        Remove an item from the index
+
+        Args:
+            item_id: ID of the item to remove
+        """
+        text = self._texts.pop(item_id, None)
+        self._items.pop(item_id, None)
+        self._positions.pop(item_id, None)
+        self._fuzzy_index.remove(item_id)
+        if text is None:
+            return
+
+        for gram in self._get_ngrams(text):
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(item_id)
+                if not postings:
+                    del self._postings[gram]
+
+    def clear_index(self) -> None:
+        """Remove every item from the index"""
+        self._postings.clear()
+        self._items.clear()
+        self._texts.clear()
+        self._positions.clear()
+        self._fuzzy_index.clear()
+        self._scope_key = None
+        self._scope_lists = []
+
+    def _use_scope(self, item_lists: List[Sequence[Item]]) -> None:
+        """Index the given lists as the scope unless they already are"""
+        # Las listas se guardan: sus id() no se pueden reutilizar mientras tanto
+        key = tuple((id(items), len(items)) for items in item_lists)
+        if key != self._scope_key:
+            self.set_items(item for items in item_lists for item in items)
+            self._scope_key = key
+            self._scope_lists = list(item_lists)
+
+    def _on_change(self, event) -> None:
+        """Note items edited or deleted in the database (any thread)"""
+        if event.type not in (ChangeType.ITEM_ADDED, ChangeType.ITEM_UPDATED, ChangeType.ITEM_DELETED):
+            return
+        with self._changes_lock:
+            if not event.item_ids:
+                self._reindex_all = True
+            elif event.type == ChangeType.ITEM_DELETED:
+                self._deleted_ids.update(str(item_id) for item_id in event.item_ids)
+            else:
+                self._changed_ids.update(str(item_id) for item_id in event.item_ids)
+            self._has_changes = True
+
+    def _apply_changes(self) -> None:
+        """Re-tokenize edited items and drop deleted ones before a query"""
+        if not self._has_changes:
+            return
+        with self._changes_lock:
+            changed, self._changed_ids = self._changed_ids, set()
+            deleted, self._deleted_ids = self._deleted_ids, set()
+            reindex_all, self._reindex_all = self._reindex_all, False
+            self._has_changes = False
+
+        for item_id in deleted:
+            self.delete_item(item_id)
+        # Items editados en su sitio (mismo objeto): se vuelven a tokenizar
+        for item_id in (list(self._items) if reindex_all else changed):
+            item = self._items.get(item_id)
+            if item is not None:
+                self.update_item(item)
+
+    def _get_searchable_text(self, item: Item) -> str:
+        """Lowercased label, content and tags (sensitive content excluded)"""
+        parts = [item.label or ""]
+        if not item.is_sensitive and item.content:
+            parts.append(item.content)
+        if item.tags:
+            parts.extend(item.tags)
+        if self._include_description and item.description:
+            parts.append(item.description)
+        return FIELD_SEPARATOR.join(parts).lower()
+
+    def _get_ngrams(self, text: str) -> Set[str]:
+        """Distinct 1- to NGRAM_SIZE-grams of a text that don't cross field boundaries"""
+        grams = set()
+        for part in text.split(FIELD_SEPARATOR):
+            for size in range(1, NGRAM_SIZE + 1):
+                grams.update(part[i:i + size] for i in range(len(part) - size + 1))
+        return grams
+
+    # ========== QUERIES ==========
+
+    def find_matching_ids(self, query: str) -> Set[str]:
+        """
+        Get IDs of indexed items whose label, content or tags contain the query
 
         Args:
             query: Search query string (case-insensitive)
-            categories: List of categories to search through
 
         Returns:
-            List of items that match the query
+            Set of matching item IDs
+        """
+        self._apply_changes()
+        query = query.strip().lower()
+        if not query:
+            return set(self._items)
+        if FIELD_SEPARATOR in query:
+            return set()
+
+        # Consultas cortas: el propio n-grama es la respuesta exacta
+        if len(query) <= NGRAM_SIZE:
+            return set(self._postings.get(query, ()))
+
+        texts = self._texts
+        postings = []
+        for gram in {query[i:i + NGRAM_SIZE] for i in range(len(query) - NGRAM_SIZE + 1)}:
+            gram_postings = self._postings.get(gram)
+            if not gram_postings:
+                return set()
+            postings.append(gram_postings)
+
+        # Intersectar empezando por la lista mas corta
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for gram_postings in postings[1:]:
+            candidates &= gram_postings
+            if not candidates:
+                return candidates
+
+        # Los n-gramas pueden coincidir sin ser contiguos: verificar
+        return {item_id for item_id in candidates if query in texts[item_id]}
+
+    def search_items(self, query: str) -> List[Item]:
+        """
+        Indexed items whose label, content or tags contain the query
+
+        Args:
+            query: Search query string (case-insensitive)
+
+        Returns:
+            Matching items in scope order
+        """
+        positions = self._positions
+        matching_ids = sorted(self.find_matching_ids(query), key=positions.__getitem__)
+        return [self._items[item_id] for item_id in matching_ids]
+
+    def search_subset(self, query: str, items: List[Item], fuzzy: bool = False) -> List[Item]:
+        """
+        Search only among some of the indexed items (e.g. after other filters)
+
+        Args:
+            query: Search query string (case-insensitive)
+            items: Items of the indexed scope to keep, in display order
+            fuzzy: Use typo-tolerant ranked matching (best match first)
+
+        Returns:
+            Matching items, in the order of items (or best match first)
+        """
+        if fuzzy:
+            if not query or not query.strip():
+                return []
+            # Si el subconjunto es todo el alcance no hace falta restringir claves
+            keys = None if len(items) == len(self._positions) else {item.id for item in items}
+            return [item for item, _ in self._rank_fuzzy(query, keys)]
+        matching_ids = self.find_matching_ids(query)
+        return [item for item in items if item.id in matching_ids]
+
+    def search_fuzzy(self, query: str, items: Optional[Sequence[Item]] = None,
+                     limit: int = DEFAULT_LIMIT) -> List[Tuple[Item, float]]:
+        """
+        Typo-tolerant ranked search
+
+        Args:
+            query: Search query string
+            items: Items to search in (default: the indexed scope)
+            limit: Maximum results (top-k)
+
+        Returns:
+            List of (item, score) tuples, best match first
         """
         if not query or not query.strip():
-            # Return all items if query is empty
-            return self._get_all_items(categories)
+            return []
 
-        query = query.strip().lower()
-        matching_items = []
+        if items is not None:
+            self._use_scope([items])
+        return self._rank_fuzzy(query, None, limit)
 
-        for category in categories:
-            if not category.is_active:
-                continue
+    def _rank_fuzzy(self, query: str, keys: Optional[Set[str]],
+                    limit: int = DEFAULT_LIMIT) -> List[Tuple[Item, float]]:
+        """Fuzzy top-k among the indexed items (or only the given ids)"""
+        self._apply_changes()
+        results = self._fuzzy_index.search(query, limit=limit, keys=keys)
+        return [(self._items[item_id], score) for item_id, score in results]
 
-            for item in category.items:
-                # Search in label, content, and tags
-                label_match = query in item.label.lower()
-                content_match = query in item.content.lower()
+    def search(self, query: str, categories: List[Category],
+               fuzzy: bool = False) -> List[Item]:
+        """
+        Search for items matching the query across all categories
 
-                # Search in tags
-                tags_match = False
-                if item.tags:
-                    for tag in item.tags:
-                        if query in tag.lower():
-                            tags_match = True
-                            break
+        Args:
+            query: Search query string (case-insensitive)
+            categories: List of categories to search through
+            fuzzy: Use typo-tolerant ranked matching (best match first)
 
-                if label_match or content_match or tags_match:
-                    matching_items.append(item)
+        Returns:
+            List of items that match the query
+        """
+        if not query or not query.strip():
+            # Return all items if query is empty
+            return self._get_all_items(categories)
 
-        return matching_items
+        self._use_scope([category.items for category in categories if category.is_active])
+        if fuzzy:
+            return [item for item, _ in self.search_fuzzy(query)]
+        return self.search_items(query)
 
-    def search_in_category(self, query: str, category: Category) -> List[Item]:
+    def search_in_category(self, query: str, category: Category,
+                           fuzzy: bool = False) -> List[Item]:
         """
         Search for items matching the query within a specific category
 
         Args:
             query: Search query string (case-insensitive)
             category: Category to search in
+            fuzzy: Use typo-tolerant ranked matching (best match first)
 
         Returns:
             List of items that match the query in the category
@@ -73,26 +388,10 @@ class SearchEngine:
         if not query or not query.strip():
             return category.items
 
-        query = query.strip().lower()
-        matching_items = []
-
-        for item in category.items:
-            # Search in label, content, and tags
-            label_match = query in item.label.lower()
-            content_match = query in item.content.lower()
-
-            # Search in tags
-            tags_match = False
-            if item.tags:
-                for tag in item.tags:
-                    if query in tag.lower():
-                        tags_match = True
-                        break
-
-            if label_match or content_match or tags_match:
-                matching_items.append(item)
-
-        return matching_items
+        self._use_scope([category.items])
+        if fuzzy:
+            return [item for item, _ in self.search_fuzzy(query)]
+        return self.search_items(query)
 
     def highlight_matches(self, text: str, query: str) -> str:
         """
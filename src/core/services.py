@@ -0,0 +1,76 @@
+"""
+Services
+Registro de las instancias compartidas del proceso
+
+Los servicios que deben existir una sola vez (por proceso, o por base de
+datos / fichero .env) se registran aquí por (clase, clave) en lugar de que
+cada módulo guarde su propio diccionario y lock. Las clases exponen su
+get_shared() apoyándose en este registro.
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+_instances: Dict[Tuple[type, Hashable], object] = {}
+# Reentrante: crear un servicio puede pedir otro (p. ej. un manager y su pool)
+_lock = threading.RLock()
+
+
+def path_key(path) -> str:
+    """Registry key of a file (the same file always gets the same key)"""
+    return str(Path(path).resolve())
+
+
+def get_shared(cls: Type[T], key: Hashable = None, factory: Optional[Callable[[], T]] = None,
+               is_valid: Optional[Callable[[T], bool]] = None) -> T:
+    """
+    Get the shared instance of a service, creating it on first use
+
+    Args:
+        cls: Service class
+        key: Instance key within the class (None = one instance per process)
+        factory: Builds the instance (default: cls())
+        is_valid: Returns False for an instance that must be replaced
+            (e.g. a closed pool or a timer deleted by Qt)
+
+    Returns:
+        Shared instance
+    """
+    with _lock:
+        instance = _instances.get((cls, key))
+        if instance is None or (is_valid is not None and not is_valid(instance)):
+            instance = factory() if factory is not None else cls()
+            _instances[(cls, key)] = instance
+        return instance
+
+
+def find_shared(cls: Type[T], key: Hashable = None) -> Optional[T]:
+    """Shared instance of a service if it exists (never creates it)"""
+    with _lock:
+        return _instances.get((cls, key))
+
+
+def all_shared(cls: type) -> List:
+    """Every shared instance of a service class"""
+    with _lock:
+        return [instance for (owner, _), instance in _instances.items() if owner is cls]
+
+
+def remove_shared(cls: type, key: Hashable = None, all_keys: bool = False) -> List:
+    """
+    Forget shared instances (the next get_shared() creates a new one)
+
+    Args:
+        cls: Service class
+        key: Key of the instance to drop
+        all_keys: Drop every instance of the class instead
+
+    Returns:
+        List: Dropped instances (e.g. to close them)
+    """
+    with _lock:
+        keys = [entry for entry in _instances if entry[0] is cls and (all_keys or entry[1] == key)]
+        return [_instances.pop(entry) for entry in keys]
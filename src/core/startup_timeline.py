@@ -0,0 +1,200 @@
+"""
+Startup Timeline
+Linea de tiempo del arranque: tiempo de importacion por modulo y fases hasta
+el primer pintado del sidebar
+
+main.py importa este modulo antes que el resto de la aplicacion, instala el
+medidor de imports, marca las fases del arranque y, cuando el sidebar se
+pinta por primera vez, escribe el informe en el log. Si la variable de
+entorno WIDGET_SIDEBAR_STARTUP_REPORT tiene una ruta, el informe tambien se
+guarda ahi en JSON (para comparar arranques y detectar regresiones).
+"""
+
+import builtins
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Ruta opcional del informe JSON
+REPORT_ENV_VAR = "WIDGET_SIDEBAR_STARTUP_REPORT"
+
+# Modulos mostrados en el informe del log
+REPORT_TOP_IMPORTS = 15
+
+_builtin_import = builtins.__import__
+
+
+class StartupTimeline:
+    """Mide el arranque de la aplicacion (imports y fases)"""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._excluded = 0.0  # tiempo esperando al usuario (login)
+        self._phases: List[Dict] = []
+        self._imports: List[Dict] = []
+        self._import_stack: List[float] = []
+        self._original_import = None
+        self._import_thread = None
+        self._paint_filter = None
+        self.finished = False
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the timeline started, without excluded waits"""
+        return round((time.perf_counter() - self._start - self._excluded) * 1000, 2)
+
+    # ==================== Imports ====================
+
+    def install_import_timer(self) -> None:
+        """Time every module imported from now on by the current thread"""
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        self._import_thread = threading.get_ident()
+        builtins.__import__ = self._timed_import
+
+    def uninstall_import_timer(self) -> None:
+        """Restore the regular import"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or _builtin_import
+        # Solo imports absolutos que aun no estan cargados (como -X importtime)
+        if level or name in sys.modules or threading.get_ident() != self._import_thread:
+            return original(name, globals, locals, fromlist, level)
+
+        self._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            self._imports.append({
+                'module': name,
+                'total_ms': round(elapsed * 1000, 2),
+                'self_ms': round((elapsed - children) * 1000, 2),
+            })
+
+    # ==================== Fases ====================
+
+    def mark(self, label: str) -> None:
+        """
+        Record that a startup phase finished
+
+        Args:
+            label: Phase name
+        """
+        at_ms = self.elapsed_ms()
+        self._phases.append({'label': label, 'at_ms': at_ms})
+        logger.debug(f"[STARTUP] {label}: {at_ms} ms")
+
+    @contextmanager
+    def exclude(self, label: str):
+        """
+        Leave a block out of the startup time (e.g. waiting for the login)
+
+        Args:
+            label: Name recorded for the excluded block
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            waited = time.perf_counter() - start
+            self._excluded += waited
+            self._phases.append({'label': f"{label} (excluded)", 'at_ms': self.elapsed_ms(),
+                                 'excluded_ms': round(waited * 1000, 2)})
+
+    def watch_first_paint(self, widget) -> None:
+        """
+        Finish the timeline when a widget is painted for the first time
+
+        Args:
+            widget: QWidget to watch (the sidebar)
+        """
+        from PyQt6.QtCore import QObject, QEvent
+
+        timeline = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint:
+                    obj.removeEventFilter(self)
+                    timeline.mark("first sidebar paint")
+                    timeline.finish()
+                return False
+
+        self._paint_filter = FirstPaintFilter(widget)
+        widget.installEventFilter(self._paint_filter)
+
+    # ==================== Informe ====================
+
+    def get_report(self) -> Dict:
+        """
+        Startup report
+
+        Returns:
+            Dict: 'total_ms', 'phases' (label, at_ms) and 'imports'
+                (module, total_ms, self_ms) sorted by self time
+        """
+        return {
+            'total_ms': self._phases[-1]['at_ms'] if self._phases else self.elapsed_ms(),
+            'phases': list(self._phases),
+            'imports': sorted(self._imports, key=lambda entry: entry['self_ms'], reverse=True),
+        }
+
+    def format_report(self, top_imports: int = REPORT_TOP_IMPORTS) -> str:
+        """
+        Startup report as text
+
+        Args:
+            top_imports: Number of slowest modules to list
+
+        Returns:
+            str: Report lines
+        """
+        report = self.get_report()
+        lines = [f"Startup timeline ({report['total_ms']} ms):"]
+        for phase in report['phases']:
+            lines.append(f"  {phase['at_ms']:>9.1f} ms  {phase['label']}")
+        lines.append(f"Slowest imports (self / total ms, {len(report['imports'])} modules):")
+        for entry in report['imports'][:top_imports]:
+            lines.append(f"  {entry['self_ms']:>8.1f} / {entry['total_ms']:>8.1f}  {entry['module']}")
+        return "\n".join(lines)
+
+    def finish(self, report_path: Optional[str] = None) -> None:
+        """
+        Stop measuring and log the report (once)
+
+        Args:
+            report_path: JSON output path (default: $WIDGET_SIDEBAR_STARTUP_REPORT)
+        """
+        if self.finished:
+            return
+        self.finished = True
+        self.uninstall_import_timer()
+        logger.info(self.format_report())
+
+        report_path = report_path or os.environ.get(REPORT_ENV_VAR)
+        if report_path:
+            try:
+                with open(report_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.get_report(), f, indent=2)
+                logger.info(f"Startup report saved to {report_path}")
+            except OSError as e:
+                logger.error(f"Error saving startup report: {e}")
+
+
+# Linea de tiempo del proceso (empieza al importar este modulo)
+timeline = StartupTimeline()
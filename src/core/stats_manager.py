@@ -9,6 +9,10 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 
+from database.connection_pool import ConnectionPool
+from core.usage_tracker import UsageTracker
+from database.usage_rollups import WINDOW_START_HOUR
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,10 +28,10 @@ class StatsManager:
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Obtener conexión del pool compartido (close() la devuelve al pool)"""
+        # Las estadisticas deben incluir los usos que el tracker aun no escribio
+        UsageTracker.flush_shared(str(self.db_path))
+        return ConnectionPool.get_shared(str(self.db_path)).acquire()
 
     # ==================== Items Populares ====================
 
@@ -55,12 +59,15 @@ class StatsManager:
 
             if days:
                 # Uso reciente
-                cursor.execute("""
-                    SELECT i.*, COUNT(h.id) as recent_uses
+                cursor.execute(f"""
+                    SELECT i.*, COALESCE(r.recent_uses, 0) as recent_uses
                     FROM items i
-                    LEFT JOIN item_usage_history h ON i.id = h.item_id
-                        AND h.used_at >= datetime('now', '-' || ? || ' days')
-                    GROUP BY i.id
+                    LEFT JOIN (
+                        SELECT item_id, SUM(executions) as recent_uses
+                        FROM item_usage_hourly
+                        WHERE hour_start >= {WINDOW_START_HOUR}
+                        GROUP BY item_id
+                    ) r ON i.id = r.item_id
                     ORDER BY recent_uses DESC, i.use_count DESC
                     LIMIT ?
                 """, (days, limit))
@@ -89,20 +96,18 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT i.*,
-                       COUNT(h.id) as recent_uses,
-                       CASE
-                           WHEN i.use_count > 0
-                           THEN ROUND(100.0 * COUNT(h.id) / i.use_count, 2)
-                           ELSE 0
-                       END as trend_percentage
+                       r.recent_uses,
+                       ROUND(100.0 * r.recent_uses / i.use_count, 2) as trend_percentage
                 FROM items i
-                LEFT JOIN item_usage_history h ON i.id = h.item_id
-                    AND h.used_at >= datetime('now', '-' || ? || ' days')
+                JOIN (
+                    SELECT item_id, SUM(executions) as recent_uses
+                    FROM item_usage_hourly
+                    WHERE hour_start >= {WINDOW_START_HOUR}
+                    GROUP BY item_id
+                ) r ON i.id = r.item_id
                 WHERE i.use_count > 0
-                GROUP BY i.id
-                HAVING recent_uses > 0
                 ORDER BY trend_percentage DESC, recent_uses DESC
                 LIMIT ?
             """, (days, limit))
@@ -222,18 +227,21 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT i.*, COUNT(h.id) as uses_last_30_days
+            cursor.execute(f"""
+                SELECT i.*, r.uses_last_30_days
                 FROM items i
-                LEFT JOIN item_usage_history h ON i.id = h.item_id
-                    AND h.used_at >= datetime('now', '-30 days')
+                JOIN (
+                    SELECT item_id, SUM(executions) as uses_last_30_days
+                    FROM item_usage_hourly
+                    WHERE hour_start >= {WINDOW_START_HOUR}
+                    GROUP BY item_id
+                ) r ON i.id = r.item_id
                 WHERE i.is_favorite = 0
                   AND i.use_count > 10
-                GROUP BY i.id
-                HAVING uses_last_30_days > 5
+                  AND r.uses_last_30_days > 5
                 ORDER BY uses_last_30_days DESC, i.use_count DESC
                 LIMIT ?
-            """, (limit,))
+            """, (30, limit))
 
             results = cursor.fetchall()
             conn.close()
@@ -307,21 +315,21 @@ class StatsManager:
             total_items = cursor.fetchone()['total']
 
             # Total ejecuciones
-            cursor.execute("SELECT COUNT(*) as total FROM item_usage_history")
+            cursor.execute("SELECT COALESCE(SUM(executions), 0) as total FROM usage_daily_totals")
             total_executions = cursor.fetchone()['total']
 
             # Ejecuciones hoy
             cursor.execute("""
-                SELECT COUNT(*) as total FROM item_usage_history
-                WHERE date(used_at) = date('now')
+                SELECT COALESCE(SUM(executions), 0) as total FROM usage_daily_totals
+                WHERE day = date('now')
             """)
             executions_today = cursor.fetchone()['total']
 
             # Ejecuciones esta semana
-            cursor.execute("""
-                SELECT COUNT(*) as total FROM item_usage_history
-                WHERE used_at >= datetime('now', '-7 days')
-            """)
+            cursor.execute(f"""
+                SELECT COALESCE(SUM(executions), 0) as total FROM usage_hourly_totals
+                WHERE hour_start >= {WINDOW_START_HOUR}
+            """, (7,))
             executions_week = cursor.fetchone()['total']
 
             # Favoritos
@@ -331,9 +339,9 @@ class StatsManager:
             # Tasa de éxito
             cursor.execute("""
                 SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful
-                FROM item_usage_history
+                    COALESCE(SUM(executions), 0) as total,
+                    SUM(successful) as successful
+                FROM usage_daily_totals
             """)
             result = cursor.fetchone()
             success_rate = 100.0
@@ -368,34 +376,23 @@ class StatsManager:
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            # Días con actividad
-            cursor.execute("""
-                SELECT COUNT(DISTINCT date(used_at)) as active_days
-                FROM item_usage_history
-                WHERE used_at >= datetime('now', '-' || ? || ' days')
-            """, (days,))
-            active_days = cursor.fetchone()['active_days']
-
-            # Total ejecuciones
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM item_usage_history
-                WHERE used_at >= datetime('now', '-' || ? || ' days')
+            # Días con actividad, ejecuciones y tiempo total (en segundos)
+            cursor.execute(f"""
+                SELECT
+                    COUNT(DISTINCT substr(hour_start, 1, 10)) as active_days,
+                    COALESCE(SUM(executions), 0) as total,
+                    SUM(total_time_ms) / 1000.0 as total_time
+                FROM usage_hourly_totals
+                WHERE hour_start >= {WINDOW_START_HOUR}
             """, (days,))
-            total_executions = cursor.fetchone()['total']
+            result = cursor.fetchone()
+            active_days = result['active_days']
+            total_executions = result['total']
+            total_time = result['total_time'] if result['total_time'] else 0
 
             # Promedio por día
             avg_per_day = round(total_executions / days, 2) if days > 0 else 0
 
-            # Tiempo total ahorrado (estimado en segundos)
-            cursor.execute("""
-                SELECT SUM(execution_time_ms) / 1000.0 as total_time
-                FROM item_usage_history
-                WHERE used_at >= datetime('now', '-' || ? || ' days')
-            """, (days,))
-            result = cursor.fetchone()
-            total_time = result['total_time'] if result['total_time'] else 0
-
             conn.close()
 
             return {
@@ -442,6 +439,39 @@ class StatsManager:
             logger.error(f"Error getting usage by category: {e}")
             return []
 
+    def get_usage_by_hour(self, days: int = 7) -> List[Dict]:
+        """Uso por hora del día (últimos X días)"""
+        return UsageTracker.get_shared(str(self.db_path)).get_usage_by_hour(days)
+
+    def get_usage_by_day(self, days: int = 30) -> List[Dict]:
+        """Uso por día (últimos X días)"""
+        return UsageTracker.get_shared(str(self.db_path)).get_usage_by_day(days)
+
+    def get_usage_heatmap(self, days: int = 28) -> List[Dict]:
+        """Uso por día de la semana (0 = domingo) y hora (últimos X días, UTC)"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(f"""
+                SELECT
+                    CAST(strftime('%w', hour_start) AS INTEGER) as weekday,
+                    CAST(substr(hour_start, 12, 2) AS INTEGER) as hour,
+                    SUM(executions) as executions
+                FROM usage_hourly_totals
+                WHERE hour_start >= {WINDOW_START_HOUR}
+                GROUP BY weekday, hour
+            """, (days,))
+
+            results = cursor.fetchall()
+            conn.close()
+
+            return [dict(row) for row in results]
+
+        except Exception as e:
+            logger.error(f"Error getting usage heatmap: {e}")
+            return []
+
     # ==================== Análisis de Rendimiento ====================
 
     def get_slowest_items(self, limit: int = 10, min_executions: int = 5) -> List[Dict]:
@@ -523,22 +553,16 @@ class StatsManager:
             cursor.execute("SELECT COUNT(*) as favs FROM items WHERE is_favorite = 1")
             favorites = cursor.fetchone()['favs']
 
-            # Ejecuciones hoy
-            cursor.execute("""
-                SELECT COUNT(*) as total FROM item_usage_history
-                WHERE date(used_at) = date('now')
-            """)
-            executions_today = cursor.fetchone()['total']
-
-            # Tasa de éxito hoy
+            # Ejecuciones y tasa de éxito hoy
             cursor.execute("""
                 SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful
-                FROM item_usage_history
-                WHERE date(used_at) = date('now')
+                    COALESCE(SUM(executions), 0) as total,
+                    SUM(successful) as successful
+                FROM usage_daily_totals
+                WHERE day = date('now')
             """)
             result = cursor.fetchone()
+            executions_today = result['total']
             success_rate_today = 100.0
             if result['total'] > 0:
                 success_rate_today = (result['successful'] / result['total']) * 100
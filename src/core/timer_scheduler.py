@@ -0,0 +1,302 @@
+"""
+Timer Scheduler
+Plazos (deadlines) de toda la interfaz con un solo QTimer
+
+Los widgets programan aquí sus callbacks (ocultar contenido revelado,
+limpiar el portapapeles, animaciones de los efectos, refrescos periódicos)
+en lugar de crear un QTimer cada uno. Las entradas se guardan en una rueda
+de tiempo (timing wheel): cada tick solo visita su ranura, así programar,
+cancelar y disparar cuestan O(1) aunque haya miles de widgets.
+
+- Las entradas con owner (QObject) se cancelan solas al destruirse el owner.
+- suspend() congela las entradas suspendable (animaciones, sondeos) mientras
+  la aplicación está oculta o en la bandeja; los plazos normales siguen
+  corriendo. El QTimer se detiene si no queda nada que vigilar.
+"""
+
+import logging
+import math
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Set
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QTimer, Qt
+
+from core import services
+
+logger = logging.getLogger(__name__)
+
+# Resolución de la rueda (ms por tick, ~60 FPS)
+TICK_MS = 16
+
+# Ranuras de la rueda (plazos más largos que TICK_MS * WHEEL_SLOTS dan varias vueltas)
+WHEEL_SLOTS = 512
+
+
+class _TimerEntry:
+    """Un callback programado"""
+
+    __slots__ = ('handle', 'callback', 'interval_ticks', 'due_tick', 'repeat',
+                 'owner_key', 'suspendable', 'cancelled')
+
+    def __init__(self, handle: int, callback: Callable, interval_ticks: int, repeat: bool,
+                 owner_key: Optional[int], suspendable: bool):
+        self.handle = handle
+        self.callback = callback
+        self.interval_ticks = interval_ticks
+        self.due_tick = 0
+        self.repeat = repeat
+        self.owner_key = owner_key
+        self.suspendable = suspendable
+        self.cancelled = False
+
+
+class TimerScheduler(QObject):
+    """
+    Timing-wheel scheduler driven by a single QTimer
+
+    Only usable from the GUI thread (like the QTimers it replaces).
+    """
+
+    def __init__(self, tick_ms: int = TICK_MS, slots: int = WHEEL_SLOTS, parent=None):
+        """
+        Initialize the scheduler
+
+        Args:
+            tick_ms: Wheel resolution in milliseconds
+            slots: Number of wheel slots
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.tick_ms = tick_ms
+        self.slots = slots
+        self._wheel: List[List[_TimerEntry]] = [[] for _ in range(slots)]
+        self._entries: Dict[int, _TimerEntry] = {}
+        self._owners: Dict[int, Set[int]] = {}  # id(owner) -> handles
+        self._deferred: List[_TimerEntry] = []  # suspendable entries due while suspended
+        self._next_handle = 1
+        self._origin = time.monotonic()
+        self._current_tick = 0  # último tick procesado
+        self._suspended = False
+        self._metrics = {'scheduled': 0, 'fired': 0, 'cancelled': 0, 'deferred': 0,
+                         'ticks': 0, 'errors': 0}
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_tick)
+
+    @classmethod
+    def get_shared(cls) -> "TimerScheduler":
+        """Shared scheduler of the application"""
+        # Se vuelve a crear si Qt lo destruyó (p. ej. con su QApplication)
+        return services.get_shared(cls, is_valid=lambda scheduler: not sip.isdeleted(scheduler._timer))
+
+    # ----- Programar / cancelar -----
+
+    def schedule(self, delay_ms: int, callback: Callable, owner: Optional[QObject] = None,
+                 repeat: bool = False, suspendable: bool = False) -> int:
+        """
+        Schedule a callback
+
+        Args:
+            delay_ms: Delay (and interval if repeat) in milliseconds, rounded up to ticks
+            callback: Function without arguments
+            owner: QObject whose destruction cancels the callback
+            repeat: Run every delay_ms until cancelled
+            suspendable: Hold it while the scheduler is suspended (app hidden)
+
+        Returns:
+            int: Handle for cancel()
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+
+        owner_key = None
+        if owner is not None:
+            owner_key = id(owner)
+            if owner_key not in self._owners:
+                self._owners[owner_key] = set()
+                # Referencia débil: el owner puede sobrevivir al scheduler
+                scheduler_ref = weakref.ref(self)
+                owner.destroyed.connect(
+                    lambda *_, key=owner_key: scheduler_ref() is not None
+                    and scheduler_ref()._on_owner_destroyed(key)
+                )
+            self._owners[owner_key].add(handle)
+
+        interval_ticks = max(1, math.ceil(delay_ms / self.tick_ms))
+        entry = _TimerEntry(handle, callback, interval_ticks, repeat, owner_key, suspendable)
+        self._entries[handle] = entry
+        self._insert(entry, self._now_tick())
+        self._metrics['scheduled'] += 1
+        self._update_timer()
+        return handle
+
+    def cancel(self, handle: Optional[int]) -> bool:
+        """
+        Cancel a scheduled callback
+
+        Args:
+            handle: Handle returned by schedule() (None is ignored)
+
+        Returns:
+            bool: True if it was still pending
+        """
+        entry = self._entries.pop(handle, None) if handle is not None else None
+        if entry is None:
+            return False
+        self._discard(entry)
+        self._metrics['cancelled'] += 1
+        self._update_timer()
+        return True
+
+    def cancel_owner(self, owner: QObject) -> int:
+        """
+        Cancel every callback of an owner
+
+        Returns:
+            int: Number of callbacks cancelled
+        """
+        handles = self._owners.get(id(owner), set())
+        return sum(self.cancel(handle) for handle in list(handles))
+
+    def is_pending(self, handle: Optional[int]) -> bool:
+        """Whether a handle is still scheduled"""
+        return handle in self._entries
+
+    def pending_count(self) -> int:
+        """Number of scheduled callbacks"""
+        return len(self._entries)
+
+    # ----- Suspension -----
+
+    def suspend(self):
+        """Hold suspendable callbacks (app hidden or in the tray)"""
+        if not self._suspended:
+            self._suspended = True
+            logger.debug("Timer scheduler suspended")
+
+    def resume(self):
+        """Run again the suspendable callbacks held while suspended"""
+        if not self._suspended:
+            return
+        self._suspended = False
+        now = self._now_tick()
+        deferred, self._deferred = self._deferred, []
+        for entry in deferred:
+            if not entry.cancelled:
+                # Repetitivas: retoman su ritmo; únicas: se disparan en el siguiente tick
+                entry.due_tick = now + (entry.interval_ticks if entry.repeat else 1)
+                self._wheel[entry.due_tick % self.slots].append(entry)
+        logger.debug(f"Timer scheduler resumed ({len(deferred)} deferred callbacks)")
+        self._update_timer()
+
+    def is_suspended(self) -> bool:
+        """Whether suspendable callbacks are on hold"""
+        return self._suspended
+
+    def get_metrics(self) -> Dict:
+        """
+        Scheduler metrics
+
+        Returns:
+            Dict: scheduled, fired, cancelled, deferred, errors, ticks (timer
+                wake-ups), pending, held (deferred right now), suspended and
+                timer_active
+        """
+        metrics = dict(self._metrics)
+        metrics['pending'] = len(self._entries)
+        metrics['held'] = len(self._deferred)
+        metrics['suspended'] = self._suspended
+        metrics['timer_active'] = self._timer.isActive()
+        return metrics
+
+    # ----- Rueda -----
+
+    def _now_tick(self) -> int:
+        return int((time.monotonic() - self._origin) * 1000 // self.tick_ms)
+
+    def _insert(self, entry: _TimerEntry, now: int):
+        entry.due_tick = max(now, self._current_tick) + entry.interval_ticks
+        self._wheel[entry.due_tick % self.slots].append(entry)
+
+    def _discard(self, entry: _TimerEntry):
+        """Forget an entry (its wheel slot drops it lazily)"""
+        entry.cancelled = True
+        if self._deferred and entry in self._deferred:
+            self._deferred.remove(entry)
+        if entry.owner_key is not None:
+            handles = self._owners.get(entry.owner_key)
+            if handles is not None:
+                handles.discard(entry.handle)
+
+    def _on_owner_destroyed(self, owner_key: int):
+        if sip.isdeleted(self._timer):
+            # Cierre de la aplicación: el scheduler ya no existe en Qt
+            return
+        for handle in self._owners.pop(owner_key, set()):
+            entry = self._entries.pop(handle, None)
+            if entry is not None:
+                entry.owner_key = None
+                self._discard(entry)
+                self._metrics['cancelled'] += 1
+        self._update_timer()
+
+    def _update_timer(self):
+        """Run the QTimer only while some callback can come due"""
+        live = len(self._entries) - len(self._deferred)
+        if live > 0 and not self._timer.isActive():
+            # Ticks perdidos mientras estaba parado no se recorren
+            self._current_tick = max(self._current_tick, self._now_tick() - 1)
+            self._timer.start(self.tick_ms)
+        elif live <= 0 and self._timer.isActive():
+            self._timer.stop()
+            if not self._entries:
+                self._wheel = [[] for _ in range(self.slots)]
+
+    def _on_tick(self):
+        """Fire the callbacks due since the last tick"""
+        self._metrics['ticks'] += 1
+        now = self._now_tick()
+        first = max(self._current_tick + 1, now - self.slots + 1)
+
+        due: List[_TimerEntry] = []
+        for tick in range(first, now + 1):
+            index = tick % self.slots
+            bucket = self._wheel[index]
+            if not bucket:
+                continue
+            keep = []
+            for entry in bucket:
+                if entry.cancelled:
+                    continue
+                if entry.due_tick <= now:
+                    due.append(entry)
+                else:
+                    keep.append(entry)
+            self._wheel[index] = keep
+        self._current_tick = now
+
+        due.sort(key=lambda entry: entry.due_tick)
+        for entry in due:
+            # Un callback anterior pudo cancelarla
+            if entry.cancelled:
+                continue
+            if self._suspended and entry.suspendable:
+                self._deferred.append(entry)
+                self._metrics['deferred'] += 1
+                continue
+            if entry.repeat:
+                self._insert(entry, now)
+            else:
+                self._entries.pop(entry.handle, None)
+                self._discard(entry)
+            self._metrics['fired'] += 1
+            try:
+                entry.callback()
+            except Exception as e:
+                self._metrics['errors'] += 1
+                logger.error(f"Error in scheduled callback: {e}", exc_info=True)
+
+        self._update_timer()
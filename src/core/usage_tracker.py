@@ -5,67 +5,295 @@ Fecha: 2025-01-23
 """
 
 import sqlite3
+import atexit
 import logging
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+
+from database.connection_pool import ConnectionPool
+from database import usage_rollups
+from database.usage_rollups import WINDOW_START_HOUR
+from database.change_events import ChangeBus, ChangeType
+from core import services
 
 logger = logging.getLogger(__name__)
 
+# Write-behind: los usos se escriben en lote cada FLUSH_INTERVAL_MS
+# o al acumular FLUSH_MAX_EVENTS eventos
+FLUSH_INTERVAL_MS = 500
+FLUSH_MAX_EVENTS = 64
+
+# Intentos de escritura de un lote antes de descartarlo
+MAX_FLUSH_ATTEMPTS = 3
+
+# (item_id, used_at, execution_time_ms, success, error_message)
+UsageEvent = Tuple[int, str, int, int, Optional[str]]
+
 
 class UsageTracker:
     """Gestor de tracking de uso de items"""
 
-    def __init__(self, db_path: str = "widget_sidebar.db"):
-        """Inicializar tracker"""
+    def __init__(self, db_path: str = "widget_sidebar.db", write_behind: bool = True,
+                 flush_interval_ms: int = FLUSH_INTERVAL_MS,
+                 flush_max_events: int = FLUSH_MAX_EVENTS):
+        """
+        Inicializar tracker
+
+        Args:
+            db_path: Ruta de la base de datos
+            write_behind: Encolar los usos y escribirlos en lote desde un hilo
+                en segundo plano (False = escribir en cada track_usage)
+            flush_interval_ms: Espera maxima de un uso antes de escribirse
+            flush_max_events: Eventos que fuerzan la escritura inmediata
+        """
         self.db_path = Path(db_path)
 
         if not self.db_path.exists():
             logger.error(f"Database not found: {self.db_path}")
             raise FileNotFoundError(f"Database not found: {self.db_path}")
 
+        self.write_behind = write_behind
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_max_events = flush_max_events
+
+        # Eventos aun no escritos; _in_flight es el lote que se esta escribiendo
+        self._pending: List[UsageEvent] = []
+        self._in_flight: List[UsageEvent] = []
+        self._failed_attempts = 0
+        self._pending_cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._stopping = False
+        self._metrics = {'queued': 0, 'flushes': 0, 'flushed_events': 0, 'failed_flushes': 0}
+
+    @classmethod
+    def get_shared(cls, db_path: str = "widget_sidebar.db") -> "UsageTracker":
+        """
+        Obtener el tracker compartido del proceso para una base de datos
+
+        Un solo tracker por base de datos agrupa los usos de todos los
+        widgets en el mismo lote de escritura.
+
+        Args:
+            db_path: Ruta de la base de datos
+
+        Returns:
+            UsageTracker: Instancia compartida
+        """
+        return services.get_shared(cls, services.path_key(db_path), factory=lambda: cls(db_path))
+
+    @classmethod
+    def flush_shared(cls, db_path: Optional[str] = None):
+        """
+        Escribir los usos pendientes de los trackers compartidos
+
+        Args:
+            db_path: Solo el tracker de esta base de datos (None = todos)
+        """
+        for tracker in cls._shared_trackers(db_path):
+            tracker.flush()
+
+    @classmethod
+    def shutdown_shared(cls):
+        """Detener los hilos de escritura compartidos escribiendo lo pendiente"""
+        for tracker in cls._shared_trackers(None):
+            tracker.shutdown()
+
+    @classmethod
+    def _shared_trackers(cls, db_path: Optional[str]) -> List["UsageTracker"]:
+        """Trackers compartidos existentes (no crea ninguno)"""
+        if db_path is None:
+            return services.all_shared(cls)
+        tracker = services.find_shared(cls, services.path_key(db_path))
+        return [tracker] if tracker else []
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Obtener conexión a la base de datos"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Obtener conexión del pool compartido (close() la devuelve al pool)"""
+        return ConnectionPool.get_shared(str(self.db_path)).acquire()
 
     # ==================== Registro de Uso ====================
 
     def track_usage(self, item_id: int, execution_time_ms: int = 0,
                     success: bool = True, error_message: Optional[str] = None) -> bool:
-        """Registrar uso de un item"""
-        try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # 1. Incrementar use_count y actualizar last_used en items
-            cursor.execute("""
-                UPDATE items
-                SET use_count = use_count + 1,
-                    last_used = datetime('now'),
-                    updated_at = datetime('now')
-                WHERE id = ?
-            """, (item_id,))
-
-            # 2. Insertar registro en item_usage_history
-            cursor.execute("""
-                INSERT INTO item_usage_history
-                (item_id, used_at, execution_time_ms, success, error_message)
-                VALUES (?, datetime('now'), ?, ?, ?)
-            """, (item_id, execution_time_ms, 1 if success else 0, error_message))
-
-            conn.commit()
-            conn.close()
+        """
+        Registrar uso de un item
+
+        Con write-behind el uso solo se encola (no toca la base de datos en el
+        hilo de la UI); las lecturas de este tracker ya lo tienen en cuenta.
+        """
+        # Mismo formato que datetime('now') de SQLite (UTC)
+        used_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        event = (item_id, used_at, execution_time_ms, 1 if success else 0, error_message)
+
+        if not self.write_behind:
+            written = self._write_events([event])
+            if written:
+                logger.info(f"Tracked usage for item {item_id}: success={success}, time={execution_time_ms}ms")
+            return written
+
+        with self._pending_cond:
+            self._pending.append(event)
+            self._metrics['queued'] += 1
+            self._ensure_writer()
+            if len(self._pending) >= self.flush_max_events:
+                self._pending_cond.notify()
+
+        logger.debug(f"Queued usage for item {item_id}: success={success}, time={execution_time_ms}ms")
+        return True
+
+    def _ensure_writer(self):
+        """Arrancar el hilo de escritura (llamar con _pending_cond adquirido)"""
+        if self._writer is None or not self._writer.is_alive():
+            self._stopping = False
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="UsageTrackerWriter", daemon=True
+            )
+            self._writer.start()
+
+    def _writer_loop(self):
+        """Esperar eventos y escribirlos en lote"""
+        while True:
+            with self._pending_cond:
+                while not self._pending and not self._stopping:
+                    self._pending_cond.wait()
+                if self._stopping:
+                    return
+
+                # Acumular hasta completar el lote o agotar el intervalo
+                deadline = time.monotonic() + self.flush_interval_ms / 1000.0
+                while len(self._pending) < self.flush_max_events and not self._stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._pending_cond.wait(remaining)
+
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Escribir ahora los usos pendientes en una sola transaccion
+
+        Returns:
+            int: Eventos escritos
+        """
+        with self._flush_lock:
+            with self._pending_cond:
+                if not self._pending:
+                    return 0
+                events, self._pending = self._pending, []
+                self._in_flight = events
+
+            written = self._write_events(events)
+
+            with self._pending_cond:
+                self._in_flight = []
+                if written:
+                    self._failed_attempts = 0
+                    self._metrics['flushes'] += 1
+                    self._metrics['flushed_events'] += len(events)
+                else:
+                    self._failed_attempts += 1
+                    self._metrics['failed_flushes'] += 1
+                    if self._failed_attempts < MAX_FLUSH_ATTEMPTS:
+                        # Reintentar en el proximo flush
+                        self._pending[:0] = events
+                    else:
+                        logger.error(f"Discarding {len(events)} usage events after {self._failed_attempts} failed writes")
+                        self._failed_attempts = 0
+
+        return len(events) if written else 0
+
+    def shutdown(self):
+        """Detener el hilo de escritura y escribir lo pendiente"""
+        with self._pending_cond:
+            self._stopping = True
+            self._pending_cond.notify_all()
+            writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join()
+        self._writer = None
+        self.flush()
+
+    def _write_events(self, events: List[UsageEvent]) -> bool:
+        """
+        Escribir un lote de usos (historial + contadores de items)
+
+        Args:
+            events: Eventos a escribir
+
+        Returns:
+            bool: True si la transaccion se confirmo
+        """
+        # Un UPDATE por item con el total de usos del lote
+        per_item: Dict[int, Tuple[int, str]] = {}
+        for item_id, used_at, _, _, _ in events:
+            count, last_used = per_item.get(item_id, (0, used_at))
+            per_item[item_id] = (count + 1, max(last_used, used_at))
 
-            logger.info(f"Tracked usage for item {item_id}: success={success}, time={execution_time_ms}ms")
-            return True
+        try:
+            with ConnectionPool.get_shared(str(self.db_path)).write() as conn:
+                conn.executemany("""
+                    UPDATE items
+                    SET use_count = use_count + ?,
+                        last_used = ?,
+                        updated_at = datetime('now')
+                    WHERE id = ?
+                """, [(count, last_used, item_id) for item_id, (count, last_used) in per_item.items()])
+
+                # Los usos de items ya eliminados no rompen el lote
+                conn.executemany("""
+                    INSERT INTO item_usage_history
+                    (item_id, used_at, execution_time_ms, success, error_message)
+                    SELECT ?, ?, ?, ?, ?
+                    WHERE EXISTS (SELECT 1 FROM items WHERE id = ?)
+                """, [event + (event[0],) for event in events])
+
+                # Rollups por hora/dia en la misma transaccion
+                usage_rollups.apply_events(conn, events)
+
+            logger.debug(f"Wrote {len(events)} usage events for {len(per_item)} items")
 
         except Exception as e:
-            logger.error(f"Error tracking usage for item {item_id}: {e}")
+            logger.error(f"Error writing {len(events)} usage events: {e}")
             return False
 
+        ChangeBus.get_shared(str(self.db_path)).publish(ChangeType.USAGE_RECORDED, item_ids=per_item)
+        return True
+
+    def pending_events(self, item_id: Optional[int] = None) -> List[Dict]:
+        """
+        Usos registrados que aun no estan en la base de datos (el mas reciente primero)
+
+        Args:
+            item_id: Solo los de este item (None = todos)
+
+        Returns:
+            List[Dict]: Mismas claves que las filas de item_usage_history
+        """
+        with self._pending_cond:
+            events = self._in_flight + self._pending
+        return [
+            {'item_id': event[0], 'used_at': event[1], 'execution_time_ms': event[2],
+             'success': event[3], 'error_message': event[4]}
+            for event in reversed(events)
+            if item_id is None or str(event[0]) == str(item_id)
+        ]
+
+    def get_queue_metrics(self) -> Dict:
+        """
+        Metricas de la cola de escritura
+
+        Returns:
+            Dict: queued, flushes, flushed_events, failed_flushes, pending
+        """
+        with self._pending_cond:
+            metrics = dict(self._metrics)
+            metrics['pending'] = len(self._pending) + len(self._in_flight)
+        return metrics
+
     def track_execution_start(self, item_id: int) -> int:
         """Iniciar tracking de ejecución (retorna timestamp en ms)"""
         return int(time.time() * 1000)
@@ -81,27 +309,34 @@ class UsageTracker:
     # ==================== Consultas Básicas ====================
 
     def get_use_count(self, item_id: int) -> int:
-        """Obtener contador de usos de un item"""
+        """Obtener contador de usos de un item (incluye usos pendientes)"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            # Sin flush en curso: los pendientes no estan aun en la base de datos
+            with self._flush_lock:
+                pending = self.pending_events(item_id)
+                conn = self._get_connection()
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT use_count FROM items WHERE id = ?
-            """, (item_id,))
+                cursor.execute("""
+                    SELECT use_count FROM items WHERE id = ?
+                """, (item_id,))
 
-            result = cursor.fetchone()
-            conn.close()
+                result = cursor.fetchone()
+                conn.close()
 
-            return result['use_count'] if result else 0
+            return result['use_count'] + len(pending) if result else 0
 
         except Exception as e:
             logger.error(f"Error getting use count for item {item_id}: {e}")
             return 0
 
     def get_last_used(self, item_id: int) -> Optional[str]:
-        """Obtener fecha de último uso"""
+        """Obtener fecha de último uso (incluye usos pendientes)"""
         try:
+            pending = self.pending_events(item_id)
+            if pending:
+                return pending[0]['used_at']
+
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -121,22 +356,24 @@ class UsageTracker:
     # ==================== Historial ====================
 
     def get_usage_history(self, item_id: int, limit: int = 50) -> List[Dict]:
-        """Obtener historial de uso de un item"""
+        """Obtener historial de uso de un item (incluye usos pendientes)"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT * FROM item_usage_history
-                WHERE item_id = ?
-                ORDER BY used_at DESC
-                LIMIT ?
-            """, (item_id, limit))
-
-            results = cursor.fetchall()
-            conn.close()
-
-            history = [dict(row) for row in results]
+            with self._flush_lock:
+                pending = self.pending_events(item_id)[:limit]
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                cursor.execute("""
+                    SELECT * FROM item_usage_history
+                    WHERE item_id = ?
+                    ORDER BY used_at DESC
+                    LIMIT ?
+                """, (item_id, limit - len(pending)))
+
+                results = cursor.fetchall()
+                conn.close()
+
+            history = pending + [dict(row) for row in results]
             return history
 
         except Exception as e:
@@ -146,6 +383,7 @@ class UsageTracker:
     def get_recent_history(self, days: int = 7, limit: int = 100) -> List[Dict]:
         """Obtener historial reciente de todos los items"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -171,6 +409,7 @@ class UsageTracker:
     def get_today_usage(self) -> List[Dict]:
         """Obtener items usados hoy"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -197,17 +436,19 @@ class UsageTracker:
     def get_total_executions(self) -> int:
         """Total de ejecuciones registradas"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._flush_lock:
+                pending = self.pending_events()
+                conn = self._get_connection()
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT COUNT(*) as total FROM item_usage_history
-            """)
+                cursor.execute("""
+                    SELECT COALESCE(SUM(executions), 0) as total FROM usage_daily_totals
+                """)
 
-            result = cursor.fetchone()
-            conn.close()
+                result = cursor.fetchone()
+                conn.close()
 
-            return result['total'] if result else 0
+            return (result['total'] if result else 0) + len(pending)
 
         except Exception as e:
             logger.error(f"Error getting total executions: {e}")
@@ -216,19 +457,21 @@ class UsageTracker:
     def get_total_executions_today(self) -> int:
         """Total de ejecuciones hoy"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._flush_lock:
+                pending = self.pending_events()
+                conn = self._get_connection()
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM item_usage_history
-                WHERE date(used_at) = date('now')
-            """)
+                cursor.execute("""
+                    SELECT COALESCE(SUM(executions), 0) as total
+                    FROM usage_daily_totals
+                    WHERE day = date('now')
+                """)
 
-            result = cursor.fetchone()
-            conn.close()
+                result = cursor.fetchone()
+                conn.close()
 
-            return result['total'] if result else 0
+            return (result['total'] if result else 0) + len(pending)
 
         except Exception as e:
             logger.error(f"Error getting today executions: {e}")
@@ -237,19 +480,21 @@ class UsageTracker:
     def get_total_executions_week(self) -> int:
         """Total de ejecuciones esta semana"""
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            with self._flush_lock:
+                pending = self.pending_events()
+                conn = self._get_connection()
+                cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT COUNT(*) as total
-                FROM item_usage_history
-                WHERE used_at >= datetime('now', '-7 days')
-            """)
+                cursor.execute(f"""
+                    SELECT COALESCE(SUM(executions), 0) as total
+                    FROM usage_hourly_totals
+                    WHERE hour_start >= {WINDOW_START_HOUR}
+                """, (7,))
 
-            result = cursor.fetchone()
-            conn.close()
+                result = cursor.fetchone()
+                conn.close()
 
-            return result['total'] if result else 0
+            return (result['total'] if result else 0) + len(pending)
 
         except Exception as e:
             logger.error(f"Error getting week executions: {e}")
@@ -258,6 +503,7 @@ class UsageTracker:
     def get_average_execution_time(self, item_id: int) -> float:
         """Tiempo promedio de ejecución de un item (en segundos)"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -281,6 +527,7 @@ class UsageTracker:
     def get_success_rate(self, item_id: int) -> float:
         """Tasa de éxito de un item (0-100%)"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -306,6 +553,7 @@ class UsageTracker:
     def get_error_count(self, item_id: int) -> int:
         """Cantidad de errores de un item"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -327,6 +575,7 @@ class UsageTracker:
     def get_last_error(self, item_id: int) -> Optional[Dict]:
         """Último error registrado de un item"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -351,16 +600,17 @@ class UsageTracker:
     def get_usage_by_hour(self, days: int = 7) -> List[Dict]:
         """Uso por hora del día"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT
-                    strftime('%H', used_at) as hour,
-                    COUNT(*) as executions,
-                    ROUND(AVG(execution_time_ms) / 1000.0, 2) as avg_time_seconds
-                FROM item_usage_history
-                WHERE used_at >= datetime('now', '-' || ? || ' days')
+                    substr(hour_start, 12, 2) as hour,
+                    SUM(executions) as executions,
+                    ROUND(SUM(total_time_ms) / 1000.0 / SUM(executions), 2) as avg_time_seconds
+                FROM usage_hourly_totals
+                WHERE hour_start >= {WINDOW_START_HOUR}
                 GROUP BY hour
                 ORDER BY hour
             """, (days,))
@@ -377,20 +627,20 @@ class UsageTracker:
     def get_usage_by_day(self, days: int = 30) -> List[Dict]:
         """Uso por día"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
             cursor.execute("""
                 SELECT
-                    date(used_at) as day,
-                    COUNT(*) as executions,
-                    COUNT(DISTINCT item_id) as unique_items,
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
-                    SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failed
-                FROM item_usage_history
-                WHERE used_at >= datetime('now', '-' || ? || ' days')
-                GROUP BY day
-                ORDER BY day DESC
+                    t.day,
+                    t.executions,
+                    (SELECT COUNT(*) FROM item_usage_daily d WHERE d.day = t.day) as unique_items,
+                    t.successful,
+                    t.failed
+                FROM usage_daily_totals t
+                WHERE t.day >= date('now', '-' || ? || ' days')
+                ORDER BY t.day DESC
             """, (days,))
 
             results = cursor.fetchall()
@@ -407,6 +657,7 @@ class UsageTracker:
     def cleanup_old_history(self, days: int = 90) -> int:
         """Limpiar historial antiguo (retorna registros eliminados)"""
         try:
+            self.flush()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -450,3 +701,7 @@ class UsageTracker:
         except Exception as e:
             logger.error(f"Error getting item stats for {item_id}: {e}")
             return {}
+
+
+# Escribir los usos pendientes aunque la app no pase por quit_application
+atexit.register(UsageTracker.shutdown_shared)
@@ -0,0 +1,226 @@
+"""
+Change Events
+Bus de eventos de cambio de datos (items, categorias y usos) con numero de generacion
+
+DBManager publica un evento por cada escritura de items/categorias; las
+caches (ConfigManager, DashboardManager, CategoryFilterEngine) se suscriben
+y actualizan o descartan solo las entradas afectadas en lugar de recargar
+todo. Cada evento lleva una generacion creciente: una cache que recuerda
+la generacion que refleja sabe si esta al dia sin consultar la base de datos.
+
+Los eventos escritos dentro de DBManager.transaction() se publican al
+confirmar la transaccion (y se descartan si se deshace). UsageTracker
+publica USAGE_RECORDED al escribir cada lote de usos.
+"""
+
+import threading
+import weakref
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from core import services
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeType(Enum):
+    """Tipos de cambio publicados por DBManager (y UsageTracker)"""
+    ITEM_ADDED = "item_added"
+    ITEM_UPDATED = "item_updated"
+    ITEM_DELETED = "item_deleted"
+    FAVORITE_TOGGLED = "favorite_toggled"
+    CATEGORY_ADDED = "category_added"
+    CATEGORY_UPDATED = "category_updated"
+    CATEGORY_DELETED = "category_deleted"
+    CATEGORIES_REORDERED = "categories_reordered"
+    # Usos escritos (use_count, last_used, historial y rollups)
+    USAGE_RECORDED = "usage_recorded"
+
+
+# Cambios que alteran que items hay en una categoria (no solo sus valores)
+MEMBERSHIP_CHANGES = frozenset({
+    ChangeType.ITEM_ADDED, ChangeType.ITEM_DELETED,
+    ChangeType.CATEGORY_ADDED, ChangeType.CATEGORY_UPDATED,
+    ChangeType.CATEGORY_DELETED, ChangeType.CATEGORIES_REORDERED,
+})
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    Un cambio confirmado en la base de datos
+
+    item_ids puede estar vacio en cambios de items si no se conocen los ids
+    (p.ej. al borrar una lista completa); category_ids indica entonces las
+    categorias afectadas.
+    """
+    type: ChangeType
+    generation: int
+    item_ids: Tuple[int, ...] = ()
+    category_ids: Tuple[int, ...] = ()
+    fields: FrozenSet[str] = frozenset()
+
+    @property
+    def changes_membership(self) -> bool:
+        """True if categories or the set of items in them changed (not just item values)"""
+        return self.type in MEMBERSHIP_CHANGES
+
+
+ChangeCallback = Callable[[ChangeEvent], None]
+
+
+class ChangeBus:
+    """Publica ChangeEvent a los suscriptores de una base de datos"""
+
+    def __init__(self):
+        self._generation = 0
+        self._subscribers: List[Callable[[], Optional[ChangeCallback]]] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls, db_path: str) -> "ChangeBus":
+        """
+        Get the process-wide bus of a database file
+
+        Args:
+            db_path: Database path
+
+        Returns:
+            ChangeBus: Shared instance
+        """
+        return services.get_shared(cls, services.path_key(db_path))
+
+    @property
+    def generation(self) -> int:
+        """Generation of the last published change (0 = no changes yet)"""
+        return self._generation
+
+    def subscribe(self, callback: ChangeCallback) -> None:
+        """
+        Register a callback for every change
+
+        Bound methods are held weakly, so a subscribed manager can still be
+        garbage collected. Callbacks run in the thread that committed the
+        change and must be quick (mark entries dirty, don't reload here).
+
+        Args:
+            callback: Function receiving the ChangeEvent
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731 - referencia fuerte
+        with self._lock:
+            self._subscribers.append(ref)
+
+    def unsubscribe(self, callback: ChangeCallback) -> None:
+        """
+        Remove a callback registered with subscribe()
+
+        Args:
+            callback: Function to remove
+        """
+        with self._lock:
+            self._subscribers = [ref for ref in self._subscribers if ref() not in (None, callback)]
+
+    def publish(self, change_type: ChangeType, item_ids: Iterable[int] = (),
+                category_ids: Iterable[int] = (), fields: Iterable[str] = ()) -> ChangeEvent:
+        """
+        Publish a committed change
+
+        Args:
+            change_type: Kind of change
+            item_ids: Affected item IDs
+            category_ids: Affected category IDs
+            fields: Changed fields (updates)
+
+        Returns:
+            ChangeEvent: Published event
+        """
+        with self._lock:
+            self._generation += 1
+            event = ChangeEvent(
+                type=change_type,
+                generation=self._generation,
+                item_ids=tuple(item_ids),
+                category_ids=tuple(category_ids),
+                fields=frozenset(fields),
+            )
+            self._subscribers = [ref for ref in self._subscribers if ref() is not None]
+            callbacks = [ref() for ref in self._subscribers]
+
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Change subscriber failed for {event.type.value}: {e}", exc_info=True)
+
+        logger.debug(f"Change published: {event.type.value} (generation {event.generation})")
+        return event
+
+
+class PendingChanges(NamedTuple):
+    """Cambios acumulados por un ChangeTracker desde la ultima lectura"""
+    reload_all: bool
+    category_ids: FrozenSet[int]
+    item_ids: FrozenSet[int]
+
+
+class ChangeTracker:
+    """
+    Acumula los cambios de un ChangeBus para una cache que se actualiza al leerse
+
+    Los eventos pueden llegar desde cualquier hilo (p.ej. BulkActionWorker):
+    el tracker solo anota que categorias/items cambiaron y la cache los
+    recarga la proxima vez que se consulta, en su propio hilo.
+    """
+
+    def __init__(self, bus: ChangeBus):
+        """
+        Args:
+            bus: Bus of the database the cache reads from
+        """
+        self._bus = bus
+        self._lock = threading.Lock()
+        self._reload_all = False
+        self._category_ids = set()
+        self._item_ids = set()
+        self._seen_generation = bus.generation
+        # Generacion que refleja la cache
+        self.generation = bus.generation
+        bus.subscribe(self._on_change)
+
+    def is_current(self) -> bool:
+        """True if no change was published since the last take()"""
+        return self._bus.generation == self.generation
+
+    def take(self) -> PendingChanges:
+        """
+        Get and clear the pending changes (the cache is current afterwards)
+
+        Returns:
+            PendingChanges: reload_all is set when the changes can't be
+                applied per entry (reorders, events without ids)
+        """
+        with self._lock:
+            pending = PendingChanges(self._reload_all, frozenset(self._category_ids), frozenset(self._item_ids))
+            self._reload_all = False
+            self._category_ids.clear()
+            self._item_ids.clear()
+            self.generation = self._seen_generation
+        return pending
+
+    def _on_change(self, event: ChangeEvent) -> None:
+        with self._lock:
+            self._seen_generation = max(self._seen_generation, event.generation)
+            # Los contadores de uso no forman parte de las caches de estructura
+            if event.type == ChangeType.USAGE_RECORDED:
+                return
+            if event.type == ChangeType.CATEGORIES_REORDERED or not (event.category_ids or event.item_ids):
+                self._reload_all = True
+            self._category_ids.update(event.category_ids)
+            self._item_ids.update(event.item_ids)
@@ -0,0 +1,487 @@
+"""
+Connection Pool
+Conexiones SQLite compartidas por todos los managers: una conexion por hilo
+(tomada de un pool de tamano limitado), PRAGMAs de rendimiento aplicadas al
+abrir, serializacion de escrituras y metricas de uso del pool.
+"""
+
+import sqlite3
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core import services
+
+logger = logging.getLogger(__name__)
+
+# Conexiones maximas por base de datos
+DEFAULT_POOL_SIZE = 4
+
+# Segundos de espera por una conexion libre o por el bloqueo de escritura
+DEFAULT_TIMEOUT = 10.0
+
+# PRAGMAs aplicadas a cada conexion nueva (orden de aplicacion)
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 268435456,  # 256 MB
+    'cache_size': -16000,  # 16 MB (negativo = KiB)
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON',
+}
+
+# Sentencias que escriben (toman el bloqueo de escritura)
+WRITE_STATEMENTS = frozenset({
+    'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'CREATE', 'DROP', 'ALTER',
+    'BEGIN', 'VACUUM', 'ANALYZE', 'REINDEX',
+})
+
+
+def _is_write_statement(sql: str) -> bool:
+    """True si la sentencia SQL escribe en la base de datos"""
+    words = sql.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in WRITE_STATEMENTS
+
+
+class PooledCursor:
+    """Cursor que toma el bloqueo de escritura del pool antes de escribir"""
+
+    def __init__(self, connection: "PooledConnection", cursor: sqlite3.Cursor):
+        self._connection = connection
+        self._cursor = cursor
+
+    def execute(self, sql: str, parameters=()):
+        self._connection._before_statement(sql)
+        try:
+            self._cursor.execute(sql, parameters)
+        finally:
+            self._connection._after_statement()
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters):
+        self._connection._before_statement(sql)
+        try:
+            self._cursor.executemany(sql, seq_of_parameters)
+        finally:
+            self._connection._after_statement()
+        return self
+
+    def executescript(self, sql_script: str):
+        self._connection._before_statement("BEGIN")
+        try:
+            self._cursor.executescript(sql_script)
+        finally:
+            self._connection._after_statement()
+        return self
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class PooledConnection:
+    """
+    Conexion prestada por el pool
+
+    Se usa igual que sqlite3.Connection; close() la devuelve al pool en
+    lugar de cerrarla. Las sentencias de escritura toman el bloqueo de
+    escritura del pool hasta commit()/rollback().
+    """
+
+    def __init__(self, pool: "ConnectionPool", raw: sqlite3.Connection):
+        object.__setattr__(self, '_pool', pool)
+        object.__setattr__(self, '_raw', raw)
+        object.__setattr__(self, '_holds_write_lock', False)
+
+    # ----- Bloqueo de escritura -----
+
+    def _before_statement(self, sql: str):
+        if not self._holds_write_lock and _is_write_statement(sql):
+            self._pool._acquire_write_lock()
+            object.__setattr__(self, '_holds_write_lock', True)
+
+    def _after_statement(self):
+        # Sin transaccion abierta (autocommit, error, script) no hay nada que proteger
+        if self._holds_write_lock and not self._raw.in_transaction:
+            self._release_write_lock()
+
+    def _release_write_lock(self):
+        if self._holds_write_lock:
+            object.__setattr__(self, '_holds_write_lock', False)
+            self._pool._release_write_lock()
+
+    # ----- API de sqlite3.Connection -----
+
+    def cursor(self) -> PooledCursor:
+        return PooledCursor(self, self._raw.cursor())
+
+    def execute(self, sql: str, parameters=()) -> PooledCursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters) -> PooledCursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str) -> PooledCursor:
+        return self.cursor().executescript(sql_script)
+
+    def commit(self):
+        try:
+            self._raw.commit()
+        finally:
+            self._release_write_lock()
+
+    def rollback(self):
+        try:
+            self._raw.rollback()
+        finally:
+            self._release_write_lock()
+
+    def close(self):
+        """Devolver la conexion al pool (no la cierra)"""
+        self._pool.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __setattr__(self, name, value):
+        # row_factory, isolation_level... se aplican a la conexion real
+        setattr(self._raw, name, value)
+
+
+class _ThreadLease:
+    """Devuelve al pool la conexion de un hilo que termina sin liberarla"""
+
+    def __init__(self, pool: "ConnectionPool", conn: PooledConnection):
+        self.pool = pool
+        self.conn = conn
+
+    def __del__(self):
+        # threading.local descarta sus valores al terminar el hilo
+        if self.conn is not None:
+            self.pool._reclaim(self.conn)
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones SQLite con afinidad por hilo
+
+    Cada hilo usa siempre la misma conexion mientras la tenga prestada
+    (acquire() es reentrante); al liberarla vuelve al pool y otro hilo puede
+    reutilizarla. Si todas las conexiones estan en uso, acquire() espera.
+    """
+
+    def __init__(self, db_path: str, pool_size: int = DEFAULT_POOL_SIZE,
+                 pragmas: Optional[Dict] = None, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Initialize the pool (connections are opened on demand)
+
+        Args:
+            db_path: Path to the SQLite database (":memory:" = single shared connection)
+            pool_size: Maximum open connections
+            pragmas: PRAGMAs applied to every new connection (default DEFAULT_PRAGMAS)
+            timeout: Seconds to wait for a free connection or the write lock
+        """
+        self.db_path = str(db_path)
+        self.is_memory = self.db_path == ":memory:"
+        # Una base en memoria solo existe dentro de su conexion
+        self.pool_size = 1 if self.is_memory else max(1, pool_size)
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self.timeout = timeout
+
+        self._condition = threading.Condition()
+        self._idle: List[PooledConnection] = []
+        self._all: List[PooledConnection] = []
+        self._local = threading.local()
+        # Semáforo (no RLock): cualquier hilo puede liberarlo, también _reclaim()
+        # cuando el hilo que escribía terminó sin commit/rollback
+        self._write_lock = threading.Semaphore(1)
+        self._closed = False
+
+        self._metrics = {
+            'acquisitions': 0,
+            'hits': 0,
+            'misses': 0,
+            'waits': 0,
+            'wait_time_ms': 0.0,
+            'max_wait_ms': 0.0,
+            'timeouts': 0,
+            'write_locks': 0,
+            'write_lock_waits': 0,
+            'write_lock_wait_ms': 0.0,
+        }
+
+    @classmethod
+    def get_shared(cls, db_path: str, pool_size: Optional[int] = None) -> "ConnectionPool":
+        """
+        Get the process-wide pool for a database file
+
+        Args:
+            db_path: Path to the SQLite database
+            pool_size: Pool size (only used when the pool is created)
+
+        Returns:
+            ConnectionPool: Shared pool
+        """
+        return services.get_shared(
+            cls, services.path_key(db_path),
+            factory=lambda: cls(db_path, pool_size or DEFAULT_POOL_SIZE),
+            is_valid=lambda pool: not pool._closed
+        )
+
+    @classmethod
+    def close_shared(cls, db_path: Optional[str] = None):
+        """
+        Close shared pools (e.g. when the database file is recreated)
+
+        Args:
+            db_path: Only close the pool of this database (None = all)
+        """
+        if db_path is None:
+            pools = services.remove_shared(cls, all_keys=True)
+        else:
+            pools = services.remove_shared(cls, services.path_key(db_path))
+        for pool in pools:
+            pool.close()
+
+    # ----- Prestamo de conexiones -----
+
+    def _open_connection(self) -> PooledConnection:
+        """Abrir una conexion nueva y aplicar las PRAGMAs"""
+        raw = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False
+        )
+        raw.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            if self.is_memory and name in ('journal_mode', 'mmap_size'):
+                continue
+            raw.execute(f"PRAGMA {name} = {value}")
+        return PooledConnection(self, raw)
+
+    def acquire(self) -> PooledConnection:
+        """
+        Borrow a connection for the current thread
+
+        Returns:
+            PooledConnection: The thread's connection (call close() to return it)
+
+        Raises:
+            sqlite3.OperationalError: No connection got free within the timeout
+        """
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is not None:
+            local.depth += 1
+            with self._condition:
+                self._metrics['acquisitions'] += 1
+                self._metrics['hits'] += 1
+            return conn
+
+        with self._condition:
+            if self._closed:
+                raise sqlite3.ProgrammingError(f"Connection pool closed: {self.db_path}")
+            self._metrics['acquisitions'] += 1
+
+            if self.is_memory and self._all:
+                # Base en memoria: todos los hilos comparten la unica conexion
+                conn = self._all[0]
+                self._metrics['hits'] += 1
+            elif self._idle:
+                conn = self._idle.pop()
+                self._metrics['hits'] += 1
+            elif len(self._all) < self.pool_size:
+                conn = self._open_connection()
+                self._all.append(conn)
+                self._metrics['misses'] += 1
+            else:
+                start = time.perf_counter()
+                self._metrics['waits'] += 1
+                if not self._condition.wait_for(lambda: self._idle or self._closed, self.timeout):
+                    self._metrics['timeouts'] += 1
+                    raise sqlite3.OperationalError(
+                        f"No free database connection after {self.timeout}s "
+                        f"(pool size {self.pool_size})"
+                    )
+                if self._closed:
+                    raise sqlite3.ProgrammingError(f"Connection pool closed: {self.db_path}")
+                waited_ms = (time.perf_counter() - start) * 1000
+                self._metrics['wait_time_ms'] += waited_ms
+                self._metrics['max_wait_ms'] = max(self._metrics['max_wait_ms'], waited_ms)
+                conn = self._idle.pop()
+                self._metrics['hits'] += 1
+
+        local.conn = conn
+        local.depth = 1
+        local.lease = _ThreadLease(self, conn)
+        return conn
+
+    def release(self, conn: PooledConnection):
+        """
+        Return a connection borrowed with acquire()
+
+        Uncommitted changes are rolled back when the thread's last borrow
+        ends, as closing a plain sqlite3 connection would do.
+        """
+        local = self._local
+        if getattr(local, 'conn', None) is not conn:
+            return
+        local.depth -= 1
+        if local.depth > 0:
+            return
+
+        local.conn = None
+        local.lease.conn = None
+        local.lease = None
+        if conn._raw.in_transaction or conn._holds_write_lock:
+            try:
+                conn.rollback()
+            except sqlite3.Error as e:
+                logger.warning(f"Rollback on release failed: {e}")
+
+        self._return_to_pool(conn)
+
+    def _reclaim(self, conn: PooledConnection):
+        """Recuperar la conexion de un hilo terminado"""
+        logger.debug(f"Reclaiming connection of a finished thread ({self.db_path})")
+        if conn._holds_write_lock:
+            logger.warning("Thread finished inside a write transaction")
+        try:
+            if conn._raw.in_transaction:
+                conn._raw.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"Rollback on reclaim failed: {e}")
+        finally:
+            # Tras el rollback, el bloqueo de escritura del hilo terminado vuelve a quedar libre
+            conn._release_write_lock()
+        self._return_to_pool(conn)
+
+    def _return_to_pool(self, conn: PooledConnection):
+        with self._condition:
+            if self._closed:
+                conn._raw.close()
+                return
+            if not self.is_memory:
+                self._idle.append(conn)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow the thread's connection for a block
+
+        Usage:
+            with pool.connection() as conn:
+                conn.execute(...)
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def write(self):
+        """
+        Serialized write transaction (commit on success, rollback on error)
+
+        Usage:
+            with pool.write() as conn:
+                conn.execute("UPDATE ...")
+        """
+        conn = self.acquire()
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # ----- Bloqueo de escritura -----
+
+    def _acquire_write_lock(self):
+        """Serializar escritores del proceso (SQLite admite uno a la vez)"""
+        if self._write_lock.acquire(blocking=False):
+            waited_ms = 0.0
+        else:
+            start = time.perf_counter()
+            if not self._write_lock.acquire(timeout=self.timeout):
+                raise sqlite3.OperationalError(
+                    f"Timed out after {self.timeout}s waiting for the database write lock"
+                )
+            waited_ms = (time.perf_counter() - start) * 1000
+
+        with self._condition:
+            self._metrics['write_locks'] += 1
+            if waited_ms:
+                self._metrics['write_lock_waits'] += 1
+                self._metrics['write_lock_wait_ms'] += waited_ms
+
+    def _release_write_lock(self):
+        self._write_lock.release()
+
+    # ----- Metricas y cierre -----
+
+    def get_metrics(self) -> Dict:
+        """
+        Pool usage metrics
+
+        Returns:
+            Dict: acquisitions, hits, misses (connections opened), waits,
+                wait_time_ms, max_wait_ms, timeouts, write_locks,
+                write_lock_waits, write_lock_wait_ms, hit_rate,
+                open_connections, idle_connections, pool_size
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics['open_connections'] = len(self._all)
+            metrics['idle_connections'] = len(self._idle)
+            metrics['pool_size'] = self.pool_size
+        acquisitions = metrics['acquisitions']
+        metrics['hit_rate'] = round(metrics['hits'] / acquisitions, 3) if acquisitions else 0.0
+        metrics['wait_time_ms'] = round(metrics['wait_time_ms'], 2)
+        metrics['max_wait_ms'] = round(metrics['max_wait_ms'], 2)
+        metrics['write_lock_wait_ms'] = round(metrics['write_lock_wait_ms'], 2)
+        return metrics
+
+    def close_idle(self):
+        """Close connections nobody is using (they are reopened on demand)"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+            for conn in idle:
+                self._all.remove(conn)
+        for conn in idle:
+            conn._raw.close()
+
+    def close(self):
+        """Close the pool; borrowed connections are closed when released"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            if self.is_memory:
+                idle = list(self._all)
+            for conn in idle:
+                if conn in self._all:
+                    self._all.remove(conn)
+            self._condition.notify_all()
+        for conn in idle:
+            conn._raw.close()
@@ -6,30 +6,69 @@ Manages SQLite database operations for settings, categories, items, and clipboar
 import sqlite3
 import json
 import logging
+import re
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from contextlib import contextmanager
 
+from database.change_events import ChangeBus, ChangeType
+from database.connection_pool import ConnectionPool, DEFAULT_POOL_SIZE
+from database.schema_migrations import run_migrations
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Texto mostrado cuando un item sensible no se puede descifrar
+DECRYPTION_ERROR = "[DECRYPTION ERROR]"
+
+# Hilos usados para descifrar lotes grandes de items sensibles
+DECRYPT_WORKERS = 4
+
+# Columnas del indice de texto completo y su peso en el ranking BM25
+FTS_COLUMNS = ('label', 'content', 'tags', 'description', 'list_group')
+FTS_WEIGHTS = (10.0, 1.0, 5.0, 2.0, 3.0)
+
+# Campos de items que se pueden actualizar (update_item / update_items_bulk)
+ITEM_UPDATE_FIELDS = ('label', 'content', 'type', 'icon', 'is_sensitive', 'is_favorite', 'tags',
+                      'description', 'working_dir', 'color', 'is_active', 'is_archived',
+                      'is_list', 'list_group', 'orden_lista')
+
+# Parametros por consulta "WHERE id IN (...)" (SQLite admite 999 en versiones antiguas)
+SQL_IN_CHUNK_SIZE = 500
+
 
 class DBManager:
     """Gestor de base de datos SQLite para Widget Sidebar"""
 
-    def __init__(self, db_path: str = "widget_sidebar.db"):
+    def __init__(self, db_path: str = "widget_sidebar.db", pool_size: int = DEFAULT_POOL_SIZE):
         """
         Initialize database manager
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Maximum connections of the shared pool for this database
         """
         self.db_path = Path(db_path)
-        self.connection = None
+        self._local = threading.local()  # conexion de cada hilo
+        if str(self.db_path) == ":memory:":
+            # Una base en memoria es privada de este manager
+            self._pool = ConnectionPool(":memory:")
+            self.changes = ChangeBus()
+        else:
+            if not self.db_path.exists():
+                # Descartar conexiones a un archivo anterior con la misma ruta
+                ConnectionPool.close_shared(str(self.db_path))
+            self._pool = ConnectionPool.get_shared(str(self.db_path), pool_size)
+            # Eventos de cambio compartidos por todos los managers de este archivo
+            self.changes = ChangeBus.get_shared(str(self.db_path))
+        self.fts_enabled = False
         self._ensure_database()
+        self.applied_migrations = run_migrations(self.connect())
+        self._ensure_fts_index()
         logger.info(f"Database initialized at: {self.db_path}")
 
     def _ensure_database(self):
@@ -44,46 +83,125 @@ class DBManager:
 
     def connect(self) -> sqlite3.Connection:
         """
-        Establish connection to the database
+        Get the connection of the current thread
+
+        Every thread gets its own connection from the shared pool (WAL,
+        foreign keys and cache PRAGMAs already applied) and keeps it until
+        close() or until the thread ends.
 
         Returns:
-            sqlite3.Connection: Database connection
+            sqlite3.Connection: Database connection (pooled)
         """
-        if self.connection is None:
-            self.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False
-            )
-            self.connection.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self.connection.execute("PRAGMA foreign_keys = ON")
-        return self.connection
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._pool.acquire()
+            self._local.conn = conn
+        return conn
+
+    def release_connection(self):
+        """Return the current thread's connection to the pool (worker threads)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
 
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
-            logger.info("Database connection closed")
+        """Close database connection (returns it to the pool)"""
+        self.release_connection()
+        if self._pool.is_memory:
+            self._pool.close()
+        else:
+            self._pool.close_idle()
+        logger.info("Database connection closed")
+
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        Connection pool metrics (hits, waits, write lock contention...)
+
+        Returns:
+            Dict: See ConnectionPool.get_metrics()
+        """
+        return self._pool.get_metrics()
 
     @contextmanager
     def transaction(self):
         """
         Context manager for database transactions
 
+        Everything inside the block (including execute_update() and the
+        bulk methods) is committed once at the end or rolled back on error.
+        A nested transaction() becomes a SAVEPOINT of the outer one.
+        Change events of the writes inside the block are published after
+        the outermost commit (and dropped on rollback).
+
         Usage:
             with db.transaction() as conn:
                 conn.execute(...)
         """
         conn = self.connect()
+        depth = getattr(self._local, 'tx_depth', 0)
+        savepoint = f"sp_{depth}"
+
+        if depth == 0:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            self._local.pending_changes = []
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        pending_mark = len(self._local.pending_changes)
+
+        self._local.tx_depth = depth + 1
         try:
             yield conn
-            conn.commit()
         except Exception as e:
-            conn.rollback()
-            logger.error(f"Transaction failed: {e}")
+            self._local.tx_depth = depth
+            # Discard the events of the rolled back writes
+            del self._local.pending_changes[pending_mark:]
+            if depth == 0:
+                conn.rollback()
+                logger.error(f"Transaction failed: {e}")
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
             raise
 
+        self._local.tx_depth = depth
+        if depth == 0:
+            conn.commit()
+            pending, self._local.pending_changes = self._local.pending_changes, []
+            for change_type, change in pending:
+                self.changes.publish(change_type, **change)
+        else:
+            conn.execute(f"RELEASE {savepoint}")
+
+    def _in_transaction(self) -> bool:
+        """True inside a transaction() block of the current thread"""
+        return getattr(self._local, 'tx_depth', 0) > 0
+
+    def _publish_change(self, change_type: ChangeType, item_ids=(), category_ids=(), fields=()) -> None:
+        """Publish a change event now, or at commit inside transaction()"""
+        change = {'item_ids': tuple(item_ids), 'category_ids': tuple(category_ids), 'fields': tuple(fields)}
+        if self._in_transaction():
+            self._local.pending_changes.append((change_type, change))
+        else:
+            self.changes.publish(change_type, **change)
+
+    def _item_category_ids(self, conn: sqlite3.Connection, item_ids: List[int]) -> List[int]:
+        """Distinct categories of some items (to address their change events)"""
+        category_ids = set()
+        for chunk in self._id_chunks(item_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT DISTINCT category_id FROM items WHERE id IN ({placeholders})", tuple(chunk)
+            ).fetchall()
+            category_ids.update(row[0] for row in rows)
+        return sorted(category_ids)
+
+    @staticmethod
+    def _item_change_type(fields) -> ChangeType:
+        """FAVORITE_TOGGLED when only is_favorite changes, ITEM_UPDATED otherwise"""
+        return ChangeType.FAVORITE_TOGGLED if set(fields) == {'is_favorite'} else ChangeType.ITEM_UPDATED
+
     def _create_database(self):
         """Create database schema with all tables and indices"""
         # Use self.connect() to ensure we use the same connection (important for :memory:)
@@ -242,9 +360,87 @@ class DBManager:
         """)
 
         conn.commit()
-        # Don't close the connection - it's managed by self.connection
+        # Don't close the connection - it's kept by self.connect() for this thread
+        # Las tablas e indices posteriores los crean las migraciones (schema_migrations)
         logger.info("Database schema created successfully")
 
+    def _ensure_fts_index(self):
+        """
+        Create the FTS5 index over items (and its sync triggers) if missing
+
+        The index mirrors label, content, tags, description and list_group.
+        Content of sensitive items is never indexed. When the index is
+        created on an existing database it is backfilled from the items table.
+        """
+        conn = self.connect()
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+            ).fetchone()
+
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+                    label, content, tags, description, list_group,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS items_fts_insert AFTER INSERT ON items BEGIN
+                    INSERT INTO items_fts (rowid, label, content, tags, description, list_group)
+                    VALUES (new.id, new.label,
+                            CASE WHEN new.is_sensitive THEN '' ELSE new.content END,
+                            new.tags, new.description, new.list_group);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items BEGIN
+                    DELETE FROM items_fts WHERE rowid = old.id;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS items_fts_update
+                AFTER UPDATE OF label, content, is_sensitive, tags, description, list_group ON items
+                BEGIN
+                    DELETE FROM items_fts WHERE rowid = old.id;
+                    INSERT INTO items_fts (rowid, label, content, tags, description, list_group)
+                    VALUES (new.id, new.label,
+                            CASE WHEN new.is_sensitive THEN '' ELSE new.content END,
+                            new.tags, new.description, new.list_group);
+                END;
+            """)
+
+            if not exists:
+                self._backfill_fts_index(conn)
+
+            conn.commit()
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            # SQLite compilado sin FTS5: se usa la busqueda LIKE
+            logger.warning(f"FTS5 not available, falling back to LIKE search: {e}")
+            self.fts_enabled = False
+
+    def _backfill_fts_index(self, conn: sqlite3.Connection) -> None:
+        """
+        Fill the FTS index from the items table
+
+        Args:
+            conn: Open connection (caller commits)
+        """
+        conn.execute("DELETE FROM items_fts")
+        cursor = conn.execute("""
+            INSERT INTO items_fts (rowid, label, content, tags, description, list_group)
+            SELECT id, label,
+                   CASE WHEN is_sensitive THEN '' ELSE content END,
+                   tags, description, list_group
+            FROM items
+        """)
+        logger.info(f"FTS index backfilled: {cursor.rowcount} items")
+
+    def rebuild_fts_index(self) -> None:
+        """Rebuild the full-text index from scratch"""
+        if not self.fts_enabled:
+            return
+        with self.transaction() as conn:
+            self._backfill_fts_index(conn)
+
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict]:
         """
         Execute SELECT query and return results as list of dictionaries
@@ -279,13 +475,17 @@ class DBManager:
         Returns:
             int: Last row ID for INSERT, or number of affected rows
         """
+        conn = self.connect()
         try:
-            conn = self.connect()
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
+            # Inside transaction() the outer block commits
+            if not self._in_transaction():
+                conn.commit()
             return cursor.lastrowid
         except sqlite3.Error as e:
+            if not self._in_transaction():
+                conn.rollback()
             logger.error(f"Update execution failed: {e}")
             logger.error(f"Query: {query}")
             logger.error(f"Params: {params}")
@@ -426,6 +626,7 @@ class DBManager:
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
         """
         category_id = self.execute_update(query, (name, icon, order_index, is_predefined))
+        self._publish_change(ChangeType.CATEGORY_ADDED, category_ids=(category_id,))
         logger.info(f"Category added: {name} (ID: {category_id}, order_index: {order_index})")
         return category_id
 
@@ -463,6 +664,8 @@ class DBManager:
             params.append(category_id)
             query = f"UPDATE categories SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            fields = [update.split(" = ")[0] for update in updates[:-1]]
+            self._publish_change(ChangeType.CATEGORY_UPDATED, category_ids=(category_id,), fields=fields)
             logger.info(f"Category updated: ID {category_id}")
 
     def delete_category(self, category_id: int) -> None:
@@ -474,6 +677,7 @@ class DBManager:
         """
         query = "DELETE FROM categories WHERE id = ?"
         self.execute_update(query, (category_id,))
+        self._publish_change(ChangeType.CATEGORY_DELETED, category_ids=(category_id,))
         logger.info(f"Category deleted: ID {category_id}")
 
     def reorder_categories(self, category_ids: List[int]) -> None:
@@ -486,16 +690,82 @@ class DBManager:
         updates = [(i, cat_id) for i, cat_id in enumerate(category_ids)]
         query = "UPDATE categories SET order_index = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
         self.execute_many(query, updates)
+        self._publish_change(ChangeType.CATEGORIES_REORDERED, category_ids=category_ids, fields=('order_index',))
         logger.info(f"Categories reordered: {len(category_ids)} items")
 
+    # ========== ENCRYPTION HELPERS ==========
+
+    def _get_encryption_manager(self):
+        """
+        Get the shared encryption manager (cipher built once per process)
+
+        Returns:
+            EncryptionManager: Shared encryption manager
+        """
+        from core.encryption_manager import EncryptionManager
+        return EncryptionManager.get_shared()
+
+    def _decrypt_sensitive_items(self, items: List[Dict]) -> None:
+        """
+        Decrypt the content of all sensitive items in place, in one batch
+
+        Args:
+            items: Item dictionaries as returned by execute_query
+        """
+        sensitive = [item for item in items
+                     if item.get('is_sensitive') and item.get('content')]
+        if not sensitive:
+            return
+
+        encryption_manager = self._get_encryption_manager()
+        decrypted = encryption_manager.decrypt_many(
+            [item['content'] for item in sensitive],
+            max_workers=DECRYPT_WORKERS,
+            error_value=DECRYPTION_ERROR
+        )
+        for item, content in zip(sensitive, decrypted):
+            if content == DECRYPTION_ERROR:
+                logger.error(f"Failed to decrypt item {item['id']}")
+            item['content'] = content
+        logger.debug(f"Content decrypted for {len(sensitive)} sensitive items")
+
+    def _mark_encrypted_items(self, items: List[Dict]) -> None:
+        """
+        Flag sensitive items whose content is still encrypted
+
+        Args:
+            items: Item dictionaries as returned by execute_query
+        """
+        for item in items:
+            if item.get('is_sensitive') and item.get('content'):
+                item['content_encrypted'] = True
+
+    def decrypt_content(self, encrypted_text: str) -> str:
+        """
+        Decrypt the content of a single sensitive item (used for lazy decryption)
+
+        Args:
+            encrypted_text: Encrypted content as stored in the database
+
+        Returns:
+            str: Decrypted content, or DECRYPTION_ERROR if it fails
+        """
+        try:
+            return self._get_encryption_manager().decrypt(encrypted_text)
+        except Exception as e:
+            logger.error(f"Failed to decrypt content on demand: {e}")
+            return DECRYPTION_ERROR
+
     # ========== ITEMS ==========
 
-    def get_items_by_category(self, category_id: int) -> List[Dict]:
+    def get_items_by_category(self, category_id: int, decrypt: bool = True) -> List[Dict]:
         """
         Get all items for a specific category
 
         Args:
             category_id: Category ID
+            decrypt: Decrypt sensitive content. If False, sensitive items keep
+                their ciphertext and are flagged with 'content_encrypted'
 
         Returns:
             List[Dict]: List of item dictionaries (content decrypted if sensitive)
@@ -507,37 +777,84 @@ class DBManager:
         """
         results = self.execute_query(query, (category_id,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
-
-        # Parse tags and decrypt sensitive content
+        # Parse tags
         for item in results:
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+            self._parse_item_tags(item)
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+        # Decrypt sensitive content in a single batch (or defer it)
+        if decrypt:
+            self._decrypt_sensitive_items(results)
+        else:
+            self._mark_encrypted_items(results)
 
         return results
 
+    def get_categories_with_items(self, include_inactive: bool = False,
+                                  decrypt: bool = True) -> List[Dict]:
+        """
+        Get all categories with their items, without a query per category
+
+        Items come from a single query joined with categories and ordered
+        like get_categories() + get_items_by_category(); rows are streamed
+        straight into their category.
+
+        Args:
+            include_inactive: Include inactive categories
+            decrypt: Decrypt sensitive content (see get_items_by_category)
+
+        Returns:
+            List[Dict]: Category dictionaries, each with an 'items' list
+        """
+        categories = self.get_categories(include_inactive)
+        items_by_category = {}
+        for category in categories:
+            category['items'] = items_by_category[category['id']] = []
+
+        query = """
+            SELECT i.* FROM items i
+            JOIN categories c ON c.id = i.category_id
+            WHERE c.is_active = 1 OR ? = 1
+            ORDER BY c.order_index, i.category_id, i.created_at
+        """
+        all_items = []
+        try:
+            cursor = self.connect().execute(query, (include_inactive,))
+            for row in cursor:
+                item = dict(row)
+                bucket = items_by_category.get(item['category_id'])
+                if bucket is None:
+                    continue
+                self._parse_item_tags(item)
+                bucket.append(item)
+                all_items.append(item)
+        except sqlite3.Error as e:
+            logger.error(f"Bulk structure query failed: {e}")
+            raise
+
+        # Decrypt sensitive content in a single batch (or defer it)
+        if decrypt:
+            self._decrypt_sensitive_items(all_items)
+        else:
+            self._mark_encrypted_items(all_items)
+
+        return categories
+
+    @staticmethod
+    def _parse_item_tags(item: Dict) -> None:
+        """Parse item['tags'] in place from JSON or CSV format (legacy)"""
+        if item['tags']:
+            try:
+                # Try to parse as JSON first
+                item['tags'] = json.loads(item['tags'])
+            except json.JSONDecodeError:
+                # If JSON parsing fails, try CSV format (legacy)
+                if isinstance(item['tags'], str):
+                    item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
+                else:
+                    item['tags'] = []
+        else:
+            item['tags'] = []
+
     def get_item(self, item_id: int) -> Optional[Dict]:
         """
         Get item by ID
@@ -552,30 +869,10 @@ class DBManager:
         result = self.execute_query(query, (item_id,))
         if result:
             item = result[0]
-            # Parse tags from JSON or CSV format
-            if item['tags']:
-                try:
-                    # Try to parse as JSON first
-                    item['tags'] = json.loads(item['tags'])
-                except json.JSONDecodeError:
-                    # If JSON parsing fails, try CSV format (legacy)
-                    if isinstance(item['tags'], str):
-                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
-                    else:
-                        item['tags'] = []
-            else:
-                item['tags'] = []
+            self._parse_item_tags(item)
 
             # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                from core.encryption_manager import EncryptionManager
-                encryption_manager = EncryptionManager()
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item_id}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item_id}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+            self._decrypt_sensitive_items([item])
 
             return item
         return None
@@ -614,9 +911,7 @@ class DBManager:
         """
         # Encrypt content if sensitive
         if is_sensitive and content:
-            from core.encryption_manager import EncryptionManager
-            encryption_manager = EncryptionManager()
-            content = encryption_manager.encrypt(content)
+            content = self._get_encryption_manager().encrypt(content)
             logger.info(f"Content encrypted for sensitive item: {label}")
 
         tags_json = json.dumps(tags or [])
@@ -629,6 +924,7 @@ class DBManager:
             query,
             (category_id, label, content, item_type, icon, is_sensitive, is_favorite, tags_json, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista)
         )
+        self._publish_change(ChangeType.ITEM_ADDED, item_ids=(item_id,), category_ids=(category_id,))
         list_info = f", List: {list_group}[{orden_lista}]" if is_list else ""
         logger.info(f"Item added: {label} (ID: {item_id}, Sensitive: {is_sensitive}, Favorite: {is_favorite}, Active: {is_active}, Archived: {is_archived}{list_info})")
         return item_id
@@ -641,18 +937,19 @@ class DBManager:
             item_id: Item ID to update
             **kwargs: Fields to update (label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, is_active, is_archived, is_list, list_group, orden_lista)
         """
-        allowed_fields = ['label', 'content', 'type', 'icon', 'is_sensitive', 'is_favorite', 'tags', 'description', 'working_dir', 'color', 'is_active', 'is_archived', 'is_list', 'list_group', 'orden_lista']
+        allowed_fields = ITEM_UPDATE_FIELDS
         updates = []
         params = []
+        fields = []
 
-        # Get current item to check if it's sensitive
-        current_item = self.get_item(item_id)
+        # Check the item exists and whether it's sensitive (no need to decrypt it)
+        current_item = self.execute_query("SELECT is_sensitive, category_id FROM items WHERE id = ?", (item_id,))
         if not current_item:
             logger.warning(f"Item not found for update: ID {item_id}")
             return
 
         # Check if item is being marked as sensitive or if it's already sensitive
-        is_currently_sensitive = current_item.get('is_sensitive', False)
+        is_currently_sensitive = current_item[0].get('is_sensitive', False)
         will_be_sensitive = kwargs.get('is_sensitive', is_currently_sensitive)
 
         for field, value in kwargs.items():
@@ -662,8 +959,7 @@ class DBManager:
                     value = json.dumps(value)
                 # Handle content encryption for sensitive items
                 elif field == 'content' and will_be_sensitive and value:
-                    from core.encryption_manager import EncryptionManager
-                    encryption_manager = EncryptionManager()
+                    encryption_manager = self._get_encryption_manager()
                     # Only encrypt if not already encrypted
                     if not encryption_manager.is_encrypted(value):
                         value = encryption_manager.encrypt(value)
@@ -671,12 +967,15 @@ class DBManager:
 
                 updates.append(f"{field} = ?")
                 params.append(value)
+                fields.append(field)
 
         if updates:
             updates.append("updated_at = CURRENT_TIMESTAMP")
             params.append(item_id)
             query = f"UPDATE items SET {', '.join(updates)} WHERE id = ?"
             self.execute_update(query, tuple(params))
+            self._publish_change(self._item_change_type(fields), item_ids=(item_id,),
+                                 category_ids=(current_item[0]['category_id'],), fields=fields)
             logger.info(f"Item updated: ID {item_id}")
 
     def delete_item(self, item_id: int) -> None:
@@ -686,10 +985,221 @@ class DBManager:
         Args:
             item_id: Item ID to delete
         """
-        query = "DELETE FROM items WHERE id = ?"
-        self.execute_update(query, (item_id,))
+        with self.transaction() as conn:
+            category_ids = self._item_category_ids(conn, [item_id])
+            conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+            if category_ids:
+                self._publish_change(ChangeType.ITEM_DELETED, item_ids=(item_id,), category_ids=category_ids)
         logger.info(f"Item deleted: ID {item_id}")
 
+    def add_items_bulk(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Add many items in a single transaction
+
+        Sensitive content is encrypted in one batch and every row is written
+        with one executemany; if any row fails nothing is inserted.
+
+        Args:
+            items: Dicts with the add_item arguments ('category_id', 'label',
+                'content' and optionally 'type', 'icon', 'is_sensitive',
+                'is_favorite', 'tags', 'description', 'working_dir', 'color',
+                'is_active', 'is_archived', 'is_list', 'list_group', 'orden_lista')
+
+        Returns:
+            List[int]: New item IDs, in the same order as the input
+        """
+        if not items:
+            return []
+
+        rows = [
+            [
+                item['category_id'], item['label'], item.get('content') or '',
+                item.get('type') or item.get('item_type') or 'TEXT', item.get('icon'),
+                bool(item.get('is_sensitive', False)), bool(item.get('is_favorite', False)),
+                json.dumps(item.get('tags') or []), item.get('description'),
+                item.get('working_dir'), item.get('color'),
+                item.get('is_active', True), item.get('is_archived', False),
+                item.get('is_list', False), item.get('list_group'), item.get('orden_lista', 0)
+            ]
+            for item in items
+        ]
+
+        # Encrypt sensitive content in a single batch
+        sensitive_rows = [row for row in rows if row[5] and row[2]]
+        if sensitive_rows:
+            encrypted = self._get_encryption_manager().encrypt_many(row[2] for row in sensitive_rows)
+            for row, content in zip(sensitive_rows, encrypted):
+                row[2] = content
+
+        query = """
+            INSERT INTO items
+            (category_id, label, content, type, icon, is_sensitive, is_favorite, tags, description, working_dir, color, is_active, is_archived, is_list, list_group, orden_lista, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """
+        with self.transaction() as conn:
+            conn.executemany(query, rows)
+            # Writes are serialized, so the new ids are consecutive
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            item_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+            self._publish_change(ChangeType.ITEM_ADDED, item_ids=item_ids,
+                                 category_ids=sorted({row[0] for row in rows}))
+
+        logger.info(f"Items added in bulk: {len(item_ids)} (Sensitive: {len(sensitive_rows)})")
+        return item_ids
+
+    def update_items_bulk(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Update many items in a single transaction
+
+        Rows changing the same fields are written together with executemany.
+        New content of sensitive items is encrypted in one batch.
+
+        Args:
+            updates: Dicts with the item 'id' plus the fields to update
+                (same fields as update_item)
+
+        Returns:
+            int: Number of items updated
+        """
+        # Items whose content changes without saying whether they're sensitive
+        content_ids = [int(update['id']) for update in updates
+                       if 'content' in update and 'is_sensitive' not in update]
+        sensitive_ids = set()
+        for chunk in self._id_chunks(content_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.execute_query(
+                f"SELECT id FROM items WHERE is_sensitive = 1 AND id IN ({placeholders})", tuple(chunk)
+            )
+            sensitive_ids.update(row['id'] for row in rows)
+
+        # Group rows by the set of fields they update
+        groups: Dict[tuple, List[list]] = {}
+        to_encrypt = []
+        encryption_manager = None
+        for update in updates:
+            fields = tuple(field for field in ITEM_UPDATE_FIELDS if field in update)
+            if not fields:
+                continue
+            item_id = int(update['id'])
+            row = [json.dumps(update[field]) if field == 'tags' else update[field] for field in fields]
+            row.append(item_id)
+
+            content = update.get('content')
+            if content and update.get('is_sensitive', item_id in sensitive_ids):
+                encryption_manager = encryption_manager or self._get_encryption_manager()
+                # Only encrypt if not already encrypted
+                if not encryption_manager.is_encrypted(content):
+                    to_encrypt.append((row, fields.index('content')))
+
+            groups.setdefault(fields, []).append(row)
+
+        if to_encrypt:
+            encrypted = encryption_manager.encrypt_many(row[index] for row, index in to_encrypt)
+            for (row, index), content in zip(to_encrypt, encrypted):
+                row[index] = content
+
+        if not groups:
+            return 0
+
+        updated = 0
+        with self.transaction() as conn:
+            for fields, rows in groups.items():
+                assignments = ", ".join(f"{field} = ?" for field in fields)
+                cursor = conn.executemany(
+                    f"UPDATE items SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = ?", rows
+                )
+                updated += cursor.rowcount
+
+            item_ids = [row[-1] for rows in groups.values() for row in rows]
+            changed_fields = {field for fields in groups for field in fields}
+            self._publish_change(self._item_change_type(changed_fields), item_ids=item_ids,
+                                 category_ids=self._item_category_ids(conn, item_ids), fields=changed_fields)
+
+        logger.info(f"Items updated in bulk: {updated} (Encrypted: {len(to_encrypt)})")
+        return updated
+
+    def update_items_by_ids(self, item_ids: List[int], fields: Dict[str, Any],
+                            progress_callback: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Set the same field values on many items (set-based, single transaction)
+
+        Runs one "UPDATE ... WHERE id IN (...)" per chunk of SQL_IN_CHUNK_SIZE
+        ids. Content can't be changed here (it may need encryption per item,
+        use update_items_bulk).
+
+        Args:
+            item_ids: Item IDs to update
+            fields: Field -> value (fields from ITEM_UPDATE_FIELDS except 'content')
+            progress_callback: Called with the number of ids of every chunk written
+
+        Returns:
+            int: Number of items updated
+        """
+        invalid = [field for field in fields if field not in ITEM_UPDATE_FIELDS or field == 'content']
+        if invalid:
+            raise ValueError(f"Fields can't be set in bulk: {invalid}")
+        if not item_ids or not fields:
+            return 0
+
+        columns = list(fields)
+        values = [json.dumps(fields[field]) if field == 'tags' else fields[field] for field in columns]
+        assignments = ", ".join(f"{field} = ?" for field in columns)
+
+        updated = 0
+        with self.transaction() as conn:
+            for chunk in self._id_chunks(item_ids):
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"UPDATE items SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id IN ({placeholders})",
+                    (*values, *chunk)
+                )
+                updated += cursor.rowcount
+                if progress_callback:
+                    progress_callback(len(chunk))
+
+            self._publish_change(self._item_change_type(columns), item_ids=item_ids,
+                                 category_ids=self._item_category_ids(conn, item_ids), fields=columns)
+
+        logger.info(f"Items updated by id: {updated} ({', '.join(columns)})")
+        return updated
+
+    def delete_items_bulk(self, item_ids: List[int],
+                          progress_callback: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Delete many items in a single transaction
+
+        Args:
+            item_ids: Item IDs to delete
+            progress_callback: Called with the number of ids of every chunk deleted
+
+        Returns:
+            int: Number of items deleted
+        """
+        if not item_ids:
+            return 0
+
+        deleted = 0
+        with self.transaction() as conn:
+            category_ids = self._item_category_ids(conn, item_ids)
+            for chunk in self._id_chunks(item_ids):
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(f"DELETE FROM items WHERE id IN ({placeholders})", tuple(chunk))
+                deleted += cursor.rowcount
+                if progress_callback:
+                    progress_callback(len(chunk))
+
+            if deleted:
+                self._publish_change(ChangeType.ITEM_DELETED, item_ids=item_ids, category_ids=category_ids)
+
+        logger.info(f"Items deleted in bulk: {deleted}")
+        return deleted
+
+    @staticmethod
+    def _id_chunks(ids: List[int]) -> List[List[int]]:
+        """Split ids into chunks that fit in one "IN (...)" clause"""
+        ids = list(ids)
+        return [ids[start:start + SQL_IN_CHUNK_SIZE] for start in range(0, len(ids), SQL_IN_CHUNK_SIZE)]
+
     def update_last_used(self, item_id: int) -> None:
         """
         Update item's last_used timestamp
@@ -701,12 +1211,14 @@ class DBManager:
         self.execute_update(query, (item_id,))
         logger.debug(f"Last used updated: ID {item_id}")
 
-    def get_all_items(self, include_inactive: bool = False) -> List[Dict]:
+    def get_all_items(self, include_inactive: bool = False, decrypt: bool = True) -> List[Dict]:
         """
         Get ALL items from ALL categories with category info
 
         Args:
             include_inactive: Include items from inactive categories
+            decrypt: Decrypt sensitive content. If False, sensitive items keep
+                their ciphertext and are flagged with 'content_encrypted'
 
         Returns:
             List[Dict]: List of all items with category_name, category_icon, category_color
@@ -725,11 +1237,7 @@ class DBManager:
         """
         results = self.execute_query(query, (include_inactive,))
 
-        # Initialize encryption manager for decrypting sensitive items
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
-
-        # Parse tags and decrypt sensitive content
+        # Parse tags
         for item in results:
             # Parse tags from JSON or CSV format
             if item['tags']:
@@ -745,14 +1253,11 @@ class DBManager:
             else:
                 item['tags'] = []
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+        # Decrypt sensitive content in a single batch (or defer it)
+        if decrypt:
+            self._decrypt_sensitive_items(results)
+        else:
+            self._mark_encrypted_items(results)
 
         return results
 
@@ -760,6 +1265,9 @@ class DBManager:
         """
         Search items by label or content
 
+        Substring match (LIKE). For ranked, token-prefix search through the
+        full-text index use search_items_fts.
+
         Args:
             search_query: Search text
             limit: Maximum results
@@ -798,6 +1306,100 @@ class DBManager:
 
         return results
 
+    # ========== FULL-TEXT SEARCH ==========
+
+    @staticmethod
+    def build_fts_query(search_query: str, columns: Optional[List[str]] = None) -> str:
+        """
+        Build an FTS5 MATCH expression with prefix matching on every term
+
+        Args:
+            search_query: Raw user input
+            columns: Restrict the match to these index columns (optional)
+
+        Returns:
+            str: MATCH expression, or empty string if the input has no terms
+        """
+        terms = re.findall(r"\w+", search_query or "")
+        if not terms:
+            return ""
+
+        expression = " ".join(f'"{term}"*' for term in terms)
+        if columns:
+            expression = f"{{{' '.join(columns)}}} : ({expression})"
+        return expression
+
+    def search_item_ids(self, search_query: str, limit: Optional[int] = None,
+                        columns: Optional[List[str]] = None) -> List[int]:
+        """
+        Get IDs of items matching the query, best match first (BM25)
+
+        Args:
+            search_query: Search text
+            limit: Maximum results (None = all)
+            columns: Restrict the match to these index columns (optional)
+
+        Returns:
+            List[int]: Ranked item IDs
+        """
+        match_expr = self.build_fts_query(search_query, columns)
+        if not match_expr or not self.fts_enabled:
+            return []
+
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        query = f"""
+            SELECT rowid AS id FROM items_fts
+            WHERE items_fts MATCH ?
+            ORDER BY bm25(items_fts, {weights})
+            LIMIT ?
+        """
+        rows = self.execute_query(query, (match_expr, -1 if limit is None else limit))
+        return [row['id'] for row in rows]
+
+    def search_items_fts(self, search_query: str, limit: int = 50,
+                         columns: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Ranked full-text search over items
+
+        Args:
+            search_query: Search text (every term is matched as a prefix)
+            limit: Maximum results
+            columns: Restrict the match to these index columns (optional)
+
+        Returns:
+            List[Dict]: Matching items with category name and 'rank' (lower is better)
+        """
+        match_expr = self.build_fts_query(search_query, columns)
+        if not match_expr or not self.fts_enabled:
+            return []
+
+        weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+        query = f"""
+            SELECT i.*, c.name as category_name, bm25(items_fts, {weights}) as rank
+            FROM items_fts
+            JOIN items i ON i.id = items_fts.rowid
+            JOIN categories c ON i.category_id = c.id
+            WHERE items_fts MATCH ?
+            ORDER BY rank
+            LIMIT ?
+        """
+        results = self.execute_query(query, (match_expr, limit))
+
+        # Parse tags
+        for item in results:
+            if item['tags']:
+                try:
+                    item['tags'] = json.loads(item['tags'])
+                except json.JSONDecodeError:
+                    if isinstance(item['tags'], str):
+                        item['tags'] = [tag.strip() for tag in item['tags'].split(',') if tag.strip()]
+                    else:
+                        item['tags'] = []
+            else:
+                item['tags'] = []
+
+        return results
+
     # ========== LISTAS AVANZADAS ==========
 
     def create_list(self, category_id: int, list_name: str, items_data: List[Dict[str, Any]]) -> List[int]:
@@ -823,32 +1425,29 @@ class DBManager:
         if not self.is_list_name_unique(category_id, list_name):
             raise ValueError(f"El nombre de lista '{list_name}' ya existe en esta categoría")
 
-        item_ids = []
-
         try:
-            with self.transaction() as conn:
-                for orden, item_data in enumerate(items_data, start=1):
-                    # Agregar item con campos de lista
-                    item_id = self.add_item(
-                        category_id=category_id,
-                        label=item_data.get('label', f'Paso {orden}'),
-                        content=item_data.get('content', ''),
-                        item_type=item_data.get('type', 'TEXT'),
-                        icon=item_data.get('icon'),
-                        is_sensitive=item_data.get('is_sensitive', False),
-                        tags=item_data.get('tags'),
-                        description=item_data.get('description'),
-                        working_dir=item_data.get('working_dir'),
-                        color=item_data.get('color'),
-                        # Campos de lista
-                        is_list=True,
-                        list_group=list_name,
-                        orden_lista=orden
-                    )
-                    item_ids.append(item_id)
-
-                logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
+            # Todos los pasos en un solo INSERT por lotes (una transaccion)
+            item_ids = self.add_items_bulk([
+                {
+                    'category_id': category_id,
+                    'label': item_data.get('label', f'Paso {orden}'),
+                    'content': item_data.get('content', ''),
+                    'type': item_data.get('type', 'TEXT'),
+                    'icon': item_data.get('icon'),
+                    'is_sensitive': item_data.get('is_sensitive', False),
+                    'tags': item_data.get('tags'),
+                    'description': item_data.get('description'),
+                    'working_dir': item_data.get('working_dir'),
+                    'color': item_data.get('color'),
+                    # Campos de lista
+                    'is_list': True,
+                    'list_group': list_name,
+                    'orden_lista': orden
+                }
+                for orden, item_data in enumerate(items_data, start=1)
+            ])
 
+            logger.info(f"Lista creada: '{list_name}' con {len(item_ids)} items en categoría {category_id}")
             return item_ids
 
         except Exception as e:
@@ -913,10 +1512,7 @@ class DBManager:
         """
         results = self.execute_query(query, (category_id, list_group))
 
-        # Desencriptar y parsear tags (mismo proceso que en get_items_by_category)
-        from core.encryption_manager import EncryptionManager
-        encryption_manager = EncryptionManager()
-
+        # Parsear tags (mismo proceso que en get_items_by_category)
         for item in results:
             # Parse tags
             if item['tags']:
@@ -930,14 +1526,8 @@ class DBManager:
             else:
                 item['tags'] = []
 
-            # Decrypt sensitive content
-            if item.get('is_sensitive') and item.get('content'):
-                try:
-                    item['content'] = encryption_manager.decrypt(item['content'])
-                    logger.debug(f"Content decrypted for item ID: {item['id']}")
-                except Exception as e:
-                    logger.error(f"Failed to decrypt item {item['id']}: {e}")
-                    item['content'] = "[DECRYPTION ERROR]"
+        # Desencriptar contenido sensible en un solo lote
+        self._decrypt_sensitive_items(results)
 
         logger.debug(f"Obtenidos {len(results)} items de lista '{list_group}'")
         return results
@@ -1003,6 +1593,9 @@ class DBManager:
                     WHERE id = ?
                 """, (new_orden, item_id))
 
+                # Cambian varios items de la lista: se indica solo la categoria
+                self._publish_change(ChangeType.ITEM_UPDATED, category_ids=(category_id,), fields=('orden_lista',))
+
                 logger.info(f"Item {item_id} reordenado de posición {old_orden} a {new_orden} en lista '{list_group}'")
                 return True
 
@@ -1032,6 +1625,8 @@ class DBManager:
                 cursor = conn.cursor()
                 cursor.execute(query, (category_id, list_group))
                 deleted_count = cursor.rowcount
+                if deleted_count:
+                    self._publish_change(ChangeType.ITEM_DELETED, category_ids=(category_id,))
 
                 logger.info(f"Lista '{list_group}' eliminada ({deleted_count} items) de categoría {category_id}")
                 return True
@@ -1074,6 +1669,7 @@ class DBManager:
                         AND list_group = ?
                         AND is_list = 1
                     """, (new_list_group, category_id, old_list_group))
+                    self._publish_change(ChangeType.ITEM_UPDATED, category_ids=(category_id,), fields=('list_group',))
 
                     logger.info(f"Lista renombrada: '{old_list_group}' → '{new_list_group}'")
 
@@ -1336,6 +1932,24 @@ class DBManager:
         self.execute_update(query, (panel_id,))
         logger.debug(f"Panel {panel_id} opened - statistics updated")
 
+    def update_panels_last_opened(self, panel_ids: List[int]) -> None:
+        """
+        Update last_opened and open_count of several panels in one transaction
+
+        Args:
+            panel_ids: Panel IDs
+        """
+        if not panel_ids:
+            return
+        query = """
+            UPDATE pinned_panels
+            SET last_opened = CURRENT_TIMESTAMP,
+                open_count = open_count + 1
+            WHERE id = ?
+        """
+        self.execute_many(query, [(panel_id,) for panel_id in panel_ids])
+        logger.debug(f"{len(panel_ids)} panels opened - statistics updated")
+
     def delete_pinned_panel(self, panel_id: int) -> bool:
         """
         Remove a pinned panel from database
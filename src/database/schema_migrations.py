@@ -0,0 +1,287 @@
+"""
+Schema Migrations
+Migraciones versionadas del esquema SQLite (PRAGMA user_version)
+
+Cada migracion se aplica una sola vez, en orden, dentro de su propia
+transaccion junto con el nuevo user_version. DBManager las ejecuta al
+abrir la base de datos. Sustituyen a los scripts sueltos migrate_*.py.
+
+Para cambiar el esquema se agrega una migracion al final de MIGRATIONS
+(nunca se modifica una ya publicada).
+"""
+
+import sqlite3
+import time
+import logging
+from typing import Callable, Dict, List, NamedTuple
+
+from database.usage_rollups import ROLLUP_SCHEMA, rebuild_rollups
+
+logger = logging.getLogger(__name__)
+
+
+class Migration(NamedTuple):
+    """Una version del esquema"""
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def _execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Run a multi-statement script inside the current transaction (executescript commits)"""
+    for statement in script.split(";"):
+        code = "\n".join(line for line in statement.splitlines() if not line.strip().startswith("--"))
+        if code.strip():
+            conn.execute(code)
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _add_columns(conn: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
+    """Add the columns that a table doesn't have yet (skips missing tables)"""
+    if not _table_exists(conn, table):
+        return
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    for column, declaration in columns.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+            logger.info(f"Column {table}.{column} added")
+
+
+# ==================== Migraciones ====================
+
+def _m001_legacy_columns(conn: sqlite3.Connection) -> None:
+    """Columnas que antes agregaban los scripts migrate_*.py"""
+    _add_columns(conn, 'items', {
+        'is_favorite': "BOOLEAN DEFAULT 0",
+        'favorite_order': "INTEGER DEFAULT 0",
+        'use_count': "INTEGER DEFAULT 0",
+        'badge': "TEXT",
+        'working_dir': "TEXT",
+        'color': "TEXT",
+        'description': "TEXT",
+        'is_active': "BOOLEAN DEFAULT 1",
+        'is_archived': "BOOLEAN DEFAULT 0",
+        'last_used': "TIMESTAMP",
+        'is_list': "BOOLEAN DEFAULT 0",
+        'list_group': "TEXT DEFAULT NULL",
+        'orden_lista': "INTEGER DEFAULT 0",
+    })
+    _add_columns(conn, 'pinned_panels', {
+        'filter_config': "TEXT",
+        'keyboard_shortcut': "TEXT",
+    })
+
+
+def _m002_browser_tables(conn: sqlite3.Connection) -> None:
+    """Sesiones y perfiles del navegador embebido"""
+    _execute_script(conn, """
+        CREATE TABLE IF NOT EXISTS browser_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            is_auto_save BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE TABLE IF NOT EXISTS session_tabs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            title TEXT DEFAULT 'Nueva pestaña',
+            position INTEGER DEFAULT 0,
+            is_active BOOLEAN DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (session_id) REFERENCES browser_sessions(id) ON DELETE CASCADE
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_session_tabs_session_id ON session_tabs(session_id);
+        CREATE INDEX IF NOT EXISTS idx_session_tabs_position ON session_tabs(position)
+    """)
+
+    if not _table_exists(conn, 'browser_profiles'):
+        conn.execute("""
+            CREATE TABLE browser_profiles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                storage_path TEXT NOT NULL,
+                is_default BOOLEAN DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("""
+            INSERT INTO browser_profiles (name, storage_path, is_default)
+            VALUES ('Default', 'browser_data/default', 1)
+        """)
+
+
+def _m003_usage_history(conn: sqlite3.Connection) -> None:
+    """Historial de uso (UsageTracker) con los indices de las consultas de estadisticas"""
+    _execute_script(conn, """
+        CREATE TABLE IF NOT EXISTS item_usage_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_id INTEGER NOT NULL,
+            used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            execution_time_ms INTEGER DEFAULT 0,
+            success BOOLEAN DEFAULT 1,
+            error_message TEXT,
+            FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_usage_history_item ON item_usage_history(item_id, used_at);
+        CREATE INDEX IF NOT EXISTS idx_usage_history_date ON item_usage_history(used_at)
+    """)
+
+
+def _m004_item_indexes(conn: sqlite3.Connection) -> None:
+    """Indices de favoritos y de items mas usados"""
+    _execute_script(conn, """
+        CREATE INDEX IF NOT EXISTS idx_items_favorite ON items(is_favorite, favorite_order);
+        CREATE INDEX IF NOT EXISTS idx_items_use_count ON items(use_count)
+    """)
+
+
+def _m005_usage_rollups(conn: sqlite3.Connection) -> None:
+    """Rollups de uso por hora/dia, rellenados desde el historial existente"""
+    _execute_script(conn, ROLLUP_SCHEMA)
+    if conn.execute("SELECT 1 FROM item_usage_history LIMIT 1").fetchone():
+        rebuild_rollups(conn)
+
+
+def _m006_rollup_success_time(conn: sqlite3.Connection) -> None:
+    """Tiempo de las ejecuciones correctas en los rollups (promedio sin fallos)"""
+    for table in ('item_usage_hourly', 'item_usage_daily', 'usage_hourly_totals', 'usage_daily_totals'):
+        _add_columns(conn, table, {'success_time_ms': "INTEGER NOT NULL DEFAULT 0"})
+    if conn.execute("SELECT 1 FROM item_usage_history LIMIT 1").fetchone():
+        rebuild_rollups(conn)
+
+
+# Accesos rapidos con los que empieza una tabla speed_dials vacia
+DEFAULT_SPEED_DIALS = [
+    ("Google", "https://www.google.com", "🔍", "#4285f4"),
+    ("YouTube", "https://www.youtube.com", "📺", "#ff0000"),
+    ("GitHub", "https://www.github.com", "💻", "#24292e"),
+]
+
+
+def _m007_bookmarks_and_speed_dials(conn: sqlite3.Connection) -> None:
+    """Marcadores y speed dials (antes migrate_add_bookmarks.py / migrate_add_speed_dials.py)"""
+    _execute_script(conn, """
+        CREATE TABLE IF NOT EXISTS bookmarks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            folder TEXT DEFAULT NULL,
+            icon TEXT DEFAULT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            order_index INTEGER DEFAULT 0
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_bookmarks_order ON bookmarks(order_index);
+        CREATE INDEX IF NOT EXISTS idx_bookmarks_url ON bookmarks(url);
+
+        CREATE TABLE IF NOT EXISTS speed_dials (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            thumbnail_path TEXT DEFAULT NULL,
+            background_color TEXT DEFAULT '#16213e',
+            icon TEXT DEFAULT '🌐',
+            position INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_speed_dials_position ON speed_dials(position)
+    """)
+
+    if not conn.execute("SELECT 1 FROM speed_dials LIMIT 1").fetchone():
+        conn.executemany(
+            "INSERT INTO speed_dials (title, url, icon, background_color, position) VALUES (?, ?, ?, ?, ?)",
+            [(title, url, icon, color, position)
+             for position, (title, url, icon, color) in enumerate(DEFAULT_SPEED_DIALS)]
+        )
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "legacy item and pinned panel columns", _m001_legacy_columns),
+    Migration(2, "browser sessions and profiles", _m002_browser_tables),
+    Migration(3, "item usage history and indexes", _m003_usage_history),
+    Migration(4, "favorite and use count indexes", _m004_item_indexes),
+    Migration(5, "usage rollup tables", _m005_usage_rollups),
+    Migration(6, "successful execution time in usage rollups", _m006_rollup_success_time),
+    Migration(7, "bookmarks and speed dials", _m007_bookmarks_and_speed_dials),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# ==================== Runner ====================
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """
+    Get the schema version stored in the database
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        int: PRAGMA user_version (0 = never migrated)
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection, migrations: List[Migration] = None) -> List[Dict]:
+    """
+    Apply the pending migrations in order
+
+    Each migration runs in its own transaction together with the new
+    user_version, so a failure leaves the database at the last good version.
+
+    Args:
+        conn: Database connection
+        migrations: Migrations to consider (default: MIGRATIONS)
+
+    Returns:
+        List[Dict]: Applied migrations ('version', 'description', 'duration_ms')
+
+    Raises:
+        sqlite3.Error: If a migration fails (it is rolled back)
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    current = get_schema_version(conn)
+    applied = []
+
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+
+        start = time.perf_counter()
+        conn.execute("BEGIN")
+        try:
+            migration.apply(conn)
+            # PRAGMA no admite parametros; version es un int de MIGRATIONS
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Migration {migration.version} ({migration.description}) failed: {e}")
+            raise
+
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        current = migration.version
+        applied.append({
+            'version': migration.version,
+            'description': migration.description,
+            'duration_ms': duration_ms,
+        })
+        logger.info(f"Migration {migration.version} ({migration.description}) applied in {duration_ms} ms")
+
+    if applied:
+        logger.info(f"Database schema migrated to version {current}")
+    return applied
@@ -0,0 +1,168 @@
+"""
+Usage Rollups
+Tablas pre-agregadas de uso (por hora y por dia, por item y globales)
+
+El historial crudo (item_usage_history) crece sin limite; las consultas de
+estadisticas leen estas tablas, cuyo tamaño depende de la ventana pedida
+y no de los años de historial guardados. Se crean en una migracion del
+esquema (schema_migrations) y se actualizan en la misma transaccion que
+escribe el historial (UsageTracker._write_events).
+"""
+
+import sqlite3
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Columnas de contadores de todas las tablas de rollup
+# (success_time_ms: tiempo de las ejecuciones correctas, para promedios sin fallos)
+ROLLUP_COUNTERS = ('executions', 'successful', 'failed', 'total_time_ms', 'success_time_ms')
+
+ROLLUP_SCHEMA = """
+    -- Uso por item y hora (hour_start: 'YYYY-MM-DD HH:00:00' UTC)
+    CREATE TABLE IF NOT EXISTS item_usage_hourly (
+        hour_start TEXT NOT NULL,
+        item_id INTEGER NOT NULL,
+        executions INTEGER NOT NULL DEFAULT 0,
+        successful INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        total_time_ms INTEGER NOT NULL DEFAULT 0,
+        success_time_ms INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (hour_start, item_id),
+        FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+
+    -- Uso por item y dia (day: 'YYYY-MM-DD' UTC)
+    CREATE TABLE IF NOT EXISTS item_usage_daily (
+        day TEXT NOT NULL,
+        item_id INTEGER NOT NULL,
+        executions INTEGER NOT NULL DEFAULT 0,
+        successful INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        total_time_ms INTEGER NOT NULL DEFAULT 0,
+        success_time_ms INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, item_id),
+        FOREIGN KEY (item_id) REFERENCES items(id) ON DELETE CASCADE
+    ) WITHOUT ROWID;
+
+    -- Uso global por hora y por dia (no baja al eliminar items)
+    CREATE TABLE IF NOT EXISTS usage_hourly_totals (
+        hour_start TEXT PRIMARY KEY,
+        executions INTEGER NOT NULL DEFAULT 0,
+        successful INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        total_time_ms INTEGER NOT NULL DEFAULT 0,
+        success_time_ms INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS usage_daily_totals (
+        day TEXT PRIMARY KEY,
+        executions INTEGER NOT NULL DEFAULT 0,
+        successful INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        total_time_ms INTEGER NOT NULL DEFAULT 0,
+        success_time_ms INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+
+    -- ON DELETE CASCADE de items busca por item_id
+    CREATE INDEX IF NOT EXISTS idx_usage_hourly_item ON item_usage_hourly(item_id);
+    CREATE INDEX IF NOT EXISTS idx_usage_daily_item ON item_usage_daily(item_id);
+"""
+
+# (item_id, used_at, execution_time_ms, success, error_message)
+UsageEvent = Tuple[int, str, int, int, Optional[str]]
+
+# Primera hora de una ventana de los ultimos N dias (parametro: N)
+WINDOW_START_HOUR = "strftime('%Y-%m-%d %H:00:00', 'now', '-' || ? || ' days')"
+
+_COUNTER_UPDATES = ", ".join(f"{column} = {column} + excluded.{column}" for column in ROLLUP_COUNTERS)
+_COUNTER_COLUMNS = ", ".join(ROLLUP_COUNTERS)
+_COUNTER_PLACEHOLDERS = ", ".join("?" for _ in ROLLUP_COUNTERS)
+
+
+def _aggregate(events: Iterable[UsageEvent]) -> Tuple[Dict, Dict, Dict, Dict]:
+    """Sum events into (item hourly, item daily, hourly totals, daily totals) buckets"""
+    item_hourly, item_daily, hourly, daily = {}, {}, {}, {}
+    for item_id, used_at, execution_time_ms, success, _ in events:
+        day = used_at[:10]
+        hour_start = f"{used_at[:13]}:00:00"
+        execution_time_ms = execution_time_ms or 0
+        delta = (1, 1 if success else 0, 0 if success else 1, execution_time_ms,
+                 execution_time_ms if success else 0)
+        for buckets, key in ((item_hourly, (hour_start, item_id)), (item_daily, (day, item_id)),
+                             (hourly, hour_start), (daily, day)):
+            current = buckets.get(key)
+            buckets[key] = delta if current is None else tuple(a + b for a, b in zip(current, delta))
+    return item_hourly, item_daily, hourly, daily
+
+
+def apply_events(conn: sqlite3.Connection, events: List[UsageEvent]) -> None:
+    """
+    Add a batch of usage events to the rollups (call inside the write transaction)
+
+    Per-item rows are only written for items that still exist, like the
+    history rows.
+
+    Args:
+        conn: Database connection with an open write transaction
+        events: Usage events
+    """
+    item_hourly, item_daily, hourly, daily = _aggregate(events)
+
+    for table, period, buckets in (('item_usage_hourly', 'hour_start', item_hourly),
+                                   ('item_usage_daily', 'day', item_daily)):
+        conn.executemany(f"""
+            INSERT INTO {table} ({period}, item_id, {_COUNTER_COLUMNS})
+            SELECT ?, ?, {_COUNTER_PLACEHOLDERS}
+            WHERE EXISTS (SELECT 1 FROM items WHERE id = ?)
+            ON CONFLICT ({period}, item_id) DO UPDATE SET {_COUNTER_UPDATES}
+        """, [(key[0], key[1], *counters, key[1]) for key, counters in buckets.items()])
+
+    for table, period, buckets in (('usage_hourly_totals', 'hour_start', hourly),
+                                   ('usage_daily_totals', 'day', daily)):
+        conn.executemany(f"""
+            INSERT INTO {table} ({period}, {_COUNTER_COLUMNS})
+            VALUES (?, {_COUNTER_PLACEHOLDERS})
+            ON CONFLICT ({period}) DO UPDATE SET {_COUNTER_UPDATES}
+        """, [(key, *counters) for key, counters in buckets.items()])
+
+
+def rebuild_rollups(conn: sqlite3.Connection) -> None:
+    """
+    Recompute every rollup table from item_usage_history
+
+    Args:
+        conn: Database connection (the caller commits)
+    """
+    counters = """
+        COUNT(*),
+        SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END),
+        SUM(CASE WHEN success = 1 THEN 0 ELSE 1 END),
+        COALESCE(SUM(execution_time_ms), 0),
+        COALESCE(SUM(CASE WHEN success = 1 THEN execution_time_ms ELSE 0 END), 0)
+    """
+    hour_expr = "strftime('%Y-%m-%d %H:00:00', used_at)"
+    day_expr = "date(used_at)"
+
+    for table in ('item_usage_hourly', 'item_usage_daily', 'usage_hourly_totals', 'usage_daily_totals'):
+        conn.execute(f"DELETE FROM {table}")
+
+    conn.execute(f"""
+        INSERT INTO item_usage_hourly (hour_start, item_id, {_COUNTER_COLUMNS})
+        SELECT {hour_expr}, item_id, {counters} FROM item_usage_history GROUP BY 1, 2
+    """)
+    conn.execute(f"""
+        INSERT INTO item_usage_daily (day, item_id, {_COUNTER_COLUMNS})
+        SELECT {day_expr}, item_id, {counters} FROM item_usage_history GROUP BY 1, 2
+    """)
+    conn.execute(f"""
+        INSERT INTO usage_hourly_totals (hour_start, {_COUNTER_COLUMNS})
+        SELECT {hour_expr}, {counters} FROM item_usage_history GROUP BY 1
+    """)
+    conn.execute(f"""
+        INSERT INTO usage_daily_totals (day, {_COUNTER_COLUMNS})
+        SELECT {day_expr}, {counters} FROM item_usage_history GROUP BY 1
+    """)
+    logger.info("Usage rollups rebuilt from history")
+
@@ -44,6 +44,14 @@ class Category:
         if item not in self.items:
             self.items.append(item)
 
+    def add_items(self, items: List[Item]) -> None:
+        """Add several items, skipping duplicates (one pass instead of add_item per item)"""
+        seen = {item.id for item in self.items}
+        for item in items:
+            if item.id not in seen:
+                seen.add(item.id)
+                self.items.append(item)
+
     def remove_item(self, item_id: str) -> bool:
         """Remove an item by ID. Returns True if found and removed."""
         for i, item in enumerate(self.items):
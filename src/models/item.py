@@ -1,11 +1,17 @@
 """
 Item Model
 """
-from typing import Dict, Any, Optional
+import time
+import weakref
+from typing import Dict, Any, Optional, Callable, Union
 from datetime import datetime
 from enum import Enum
 
 
+# Segundos que el texto plano de un item sensible permanece en memoria
+SENSITIVE_CONTENT_TTL = 30
+
+
 class ItemType(Enum):
     """Enum for different types of items"""
     TEXT = "text"
@@ -14,6 +20,91 @@ class ItemType(Enum):
     PATH = "path"
 
 
+class SensitiveContent:
+    """
+    Contenido cifrado de un item sensible que se descifra bajo demanda
+
+    Mantiene el texto cifrado y solo lo descifra cuando se accede al
+    contenido (copiar, revelar, ejecutar). El texto plano se guarda en
+    cache durante una ventana limitada y luego se descarta: con la
+    aplicacion Qt en marcha un plazo del TimerScheduler lo borra al
+    expirar, aunque nadie vuelva a acceder al contenido.
+    """
+
+    def __init__(self, ciphertext: str, decrypt_func: Callable[[str], str],
+                 ttl: float = SENSITIVE_CONTENT_TTL):
+        """
+        Args:
+            ciphertext: Contenido cifrado (formato Fernet)
+            decrypt_func: Funcion que descifra el texto cifrado
+            ttl: Segundos que se conserva el texto plano en cache
+        """
+        self.ciphertext = ciphertext
+        self._decrypt_func = decrypt_func
+        self._ttl = ttl
+        self._plaintext: Optional[str] = None
+        self._decrypted_at = 0.0
+        self._release_handle: Optional[int] = None
+
+    def get(self) -> str:
+        """Retorna el texto plano, descifrando si no esta en cache o expiro"""
+        if not self.is_decrypted():
+            self._plaintext = self._decrypt_func(self.ciphertext)
+            self._decrypted_at = time.monotonic()
+            self._schedule_release()
+        return self._plaintext
+
+    def release(self) -> None:
+        """Descarta el texto plano en cache"""
+        self._plaintext = None
+        self._decrypted_at = 0.0
+        if self._release_handle is not None:
+            scheduler = self._get_scheduler()
+            if scheduler is not None:
+                scheduler.cancel(self._release_handle)
+            self._release_handle = None
+
+    def is_decrypted(self) -> bool:
+        """Retorna True si hay texto plano vigente en cache (el expirado se descarta)"""
+        if self._plaintext is None:
+            return False
+        if time.monotonic() - self._decrypted_at > self._ttl:
+            self.release()
+            return False
+        return True
+
+    def _schedule_release(self) -> None:
+        """Programa el descarte del texto plano al acabar la ventana"""
+        scheduler = self._get_scheduler()
+        if scheduler is None:
+            return
+        if self._release_handle is not None:
+            scheduler.cancel(self._release_handle)
+        # Referencia debil: el plazo no mantiene vivo el contenido
+        content_ref = weakref.ref(self)
+        self._release_handle = scheduler.schedule(
+            int(self._ttl * 1000), lambda: content_ref() is not None and content_ref()._expire()
+        )
+
+    def _expire(self) -> None:
+        """Callback del plazo: descarta el texto plano expirado"""
+        self._release_handle = None
+        self.release()
+
+    @staticmethod
+    def _get_scheduler():
+        """TimerScheduler compartido, o None fuera del hilo de la aplicacion Qt"""
+        try:
+            from PyQt6.QtCore import QCoreApplication, QThread
+        except ImportError:
+            return None
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() is not app.thread():
+            return None
+        from core.timer_scheduler import TimerScheduler
+        return TimerScheduler.get_shared()
+
+
 class Item:
     """Model representing a clipboard item"""
 
@@ -21,7 +112,7 @@ class Item:
         self,
         item_id: str,
         label: str,
-        content: str,
+        content: Union[str, SensitiveContent],
         item_type: ItemType = ItemType.TEXT,
         icon: Optional[str] = None,
         is_sensitive: bool = False,
@@ -57,6 +148,31 @@ class Item:
         self.created_at = datetime.now()
         self.last_used = datetime.now()
 
+    @property
+    def content(self) -> str:
+        """Contenido del item (los items sensibles se descifran bajo demanda)"""
+        if self._sensitive_content is not None:
+            return self._sensitive_content.get()
+        return self._content
+
+    @content.setter
+    def content(self, value: Union[str, SensitiveContent]) -> None:
+        if isinstance(value, SensitiveContent):
+            self._sensitive_content = value
+            self._content = None
+        else:
+            self._sensitive_content = None
+            self._content = value
+
+    def is_content_lazy(self) -> bool:
+        """Retorna True si el contenido se mantiene cifrado hasta su uso"""
+        return self._sensitive_content is not None
+
+    def release_content(self) -> None:
+        """Descarta el texto plano descifrado en cache (si lo hay)"""
+        if self._sensitive_content is not None:
+            self._sensitive_content.release()
+
     def update_last_used(self) -> None:
         """Update the last used timestamp"""
         self.last_used = datetime.now()
@@ -1,70 +1,163 @@
 """
 Effects - Sistema de efectos visuales especiales futuristas
+
+Los efectos animan sus frames en el TimerScheduler compartido y solo trabajan
+mientras se ven: se saltan los frames con el widget oculto o la ventana
+minimizada. El modo de efectos (ajuste "visual_effects") los deja completos,
+congelados en un frame estático (ahorro de energía) o desactivados.
 """
+from PyQt6 import sip
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QTimer, QPointF, QRectF, Qt, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor, QPen, QLinearGradient, QRadialGradient, QPainterPath
+from PyQt6.QtCore import QPoint, QPointF, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QPen, QPixmap, QLinearGradient, QRadialGradient, QPainterPath
+import logging
 import random
 import math
-from typing import List, Tuple
+import sys
+import time
+import weakref
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # Sin NumPy no hay partículas (el resto de efectos sigue igual)
+    np = None
 
-class Particle:
-    """Clase para representar una partícula flotante"""
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.timer_scheduler import TimerScheduler
 
-    def __init__(self, x: float, y: float, size: float, speed: float, color: QColor):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.speed = speed
-        self.color = color
-        self.opacity = random.uniform(0.3, 0.8)
-        self.direction = random.uniform(0, 360)  # Dirección en grados
-        self.lifetime = random.randint(100, 300)  # Frames de vida
-        self.age = 0
-
-    def update(self, width: int, height: int):
-        """Actualizar posición de la partícula"""
-        # Mover partícula
-        self.x += math.cos(math.radians(self.direction)) * self.speed
-        self.y += math.sin(math.radians(self.direction)) * self.speed
-
-        # Wrapping en los bordes
-        if self.x < 0:
-            self.x = width
-        elif self.x > width:
-            self.x = 0
-
-        if self.y < 0:
-            self.y = height
-        elif self.y > height:
-            self.y = 0
-
-        # Incrementar edad
-        self.age += 1
-
-        # Ajustar opacidad según edad
-        if self.age > self.lifetime * 0.8:
-            fade_factor = 1 - ((self.age - self.lifetime * 0.8) / (self.lifetime * 0.2))
-            self.opacity = min(0.8, self.opacity * fade_factor)
-
-    def is_dead(self) -> bool:
-        """Verificar si la partícula debe ser eliminada"""
-        return self.age >= self.lifetime
+logger = logging.getLogger(__name__)
+
+# Modos de efectos (ajuste "visual_effects")
+EFFECTS_FULL = "full"                  # Animados
+EFFECTS_POWER_SAVING = "power_saving"  # Frame estático, sin animación
+EFFECTS_OFF = "off"                    # Ocultos
+EFFECTS_MODES = (EFFECTS_FULL, EFFECTS_POWER_SAVING, EFFECTS_OFF)
+
+_effects_mode = EFFECTS_FULL
+_animated_widgets = weakref.WeakSet()
+
+
+def get_effects_mode() -> str:
+    """Current effects mode"""
+    return _effects_mode
+
+
+def set_effects_mode(mode: str):
+    """
+    Apply an effects mode to every animated effect
+
+    Args:
+        mode: EFFECTS_FULL, EFFECTS_POWER_SAVING or EFFECTS_OFF (unknown
+            values fall back to EFFECTS_FULL)
+    """
+    global _effects_mode
+    if mode not in EFFECTS_MODES:
+        logger.warning(f"Unknown effects mode '{mode}', using '{EFFECTS_FULL}'")
+        mode = EFFECTS_FULL
+    if mode == _effects_mode:
+        return
+    _effects_mode = mode
+
+    scheduler = TimerScheduler.get_shared()
+    for widget in list(_animated_widgets):
+        if sip.isdeleted(widget):
+            continue
+        # Fuera del modo completo no queda ningún frame programado
+        scheduler.cancel(widget.timer_handle)
+        widget.timer_handle = _start_frames(widget)
+        widget.setVisible(mode != EFFECTS_OFF)
+    logger.info(f"Effects mode: {mode}")
+
+
+def schedule_animation(widget: QWidget, interval_ms: int, callback: Callable) -> Optional[int]:
+    """
+    Animation frames of an effect in the shared TimerScheduler
+
+    Frames are skipped while the widget is hidden or its window minimized,
+    held while the scheduler is suspended (app in the tray) and cancelled
+    when the widget is destroyed. The widget follows the effects mode.
+
+    Returns:
+        Optional[int]: Scheduler handle (None if effects are not animated)
+    """
+    widget._animation = (interval_ms, callback)
+    _animated_widgets.add(widget)
+    if _effects_mode == EFFECTS_OFF:
+        widget.hide()
+    return _start_frames(widget)
+
+
+def set_animation_interval(widget: QWidget, interval_ms: int):
+    """
+    Change the frame interval of an animated effect
+
+    Args:
+        widget: Widget animated with schedule_animation()
+        interval_ms: New interval in milliseconds
+    """
+    _, callback = widget._animation
+    TimerScheduler.get_shared().cancel(widget.timer_handle)
+    widget._animation = (interval_ms, callback)
+    widget.timer_handle = _start_frames(widget)
+
+
+def _start_frames(widget: QWidget) -> Optional[int]:
+    if _effects_mode != EFFECTS_FULL:
+        return None
+    interval_ms, callback = widget._animation
+
+    def frame():
+        if widget.isVisible() and not widget.window().isMinimized():
+            callback()
+    return TimerScheduler.get_shared().schedule(interval_ms, frame, owner=widget,
+                                                repeat=True, suspendable=True)
 
 
 class ParticleEffect(QWidget):
-    """Widget con efecto de partículas flotantes"""
+    """
+    Widget con efecto de partículas flotantes
+
+    Las partículas viven en arrays de NumPy (posición, velocidad, opacidad,
+    edad) y se actualizan en un solo paso vectorizado. Se dibujan en lote con
+    drawPixmapFragments sobre un sprite precalculado (un círculo por color).
+    Si los frames se pasan de FRAME_BUDGET_MS, el intervalo sube por
+    FRAME_INTERVALS_MS; cuando vuelven a sobrar, baja de nuevo.
+    """
+
+    # Intervalos de animación, de ~30 FPS a ~10 FPS
+    FRAME_INTERVALS_MS = (33, 66, 100)
+
+    # Presupuesto por frame (actualizar + pintar), en ms
+    FRAME_BUDGET_MS = 4.0
+
+    # Frames seguidos fuera (o holgadamente dentro) del presupuesto para cambiar de intervalo
+    SLOW_FRAMES_TO_THROTTLE = 5
+    FAST_FRAMES_TO_RECOVER = 90
+
+    # Radio del círculo en el sprite (px); las partículas miden 1-3 px de radio
+    SPRITE_RADIUS = 6
+
+    _sprite_cache: Dict[Tuple, QPixmap] = {}
 
     def __init__(self, parent=None, particle_count: int = 50):
         super().__init__(parent)
-        self.particles: List[Particle] = []
+        if np is None:
+            logger.warning("NumPy not available: particle effect disabled")
+            particle_count = 0
         self.particle_count = particle_count
         self.particle_colors = [
             QColor(0, 217, 255, 100),  # Cyan
             QColor(189, 0, 255, 100),  # Púrpura
             QColor(255, 0, 110, 100),  # Rosa magenta
         ]
+        self._sprite = self._get_sprite(self.particle_colors)
+        self._interval_level = 0
+        self._slow_frames = 0
+        self._fast_frames = 0
+        self._last_paint_ms = 0.0
+        self._metrics = {'frames': 0, 'frame_ms_total': 0.0, 'throttled': 0, 'recovered': 0}
 
         # Hacer el widget transparente
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -73,63 +166,189 @@ class ParticleEffect(QWidget):
         # Inicializar partículas
         self._init_particles()
 
-        # Timer para animación
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_particles)
-        self.timer.start(33)  # ~30 FPS
+        # Timer para animación (scheduler compartido)
+        self.timer_handle = schedule_animation(self, self.frame_interval_ms, self.update_particles)
+
+    @property
+    def frame_interval_ms(self) -> int:
+        """Current animation interval"""
+        return self.FRAME_INTERVALS_MS[self._interval_level]
 
     def _init_particles(self):
         """Inicializar partículas"""
-        for _ in range(self.particle_count):
-            x = random.uniform(0, self.width())
-            y = random.uniform(0, self.height())
-            size = random.uniform(1, 3)
-            speed = random.uniform(0.2, 0.8)
-            color = random.choice(self.particle_colors)
-            self.particles.append(Particle(x, y, size, speed, color))
+        count = self.particle_count
+        self._rng = np.random.default_rng() if np is not None else None
+        if self._rng is None:
+            return
+        self.positions = np.zeros((count, 2))
+        self.velocities = np.zeros((count, 2))
+        self.sizes = np.zeros(count)
+        self.base_opacities = np.zeros(count)
+        self.opacities = np.zeros(count)
+        self.ages = np.zeros(count)
+        self.lifetimes = np.ones(count)
+        self.color_indexes = np.zeros(count, dtype=np.intp)
+        self._spawn(np.arange(count))
+        self._layout_bounds = self._bounds()
+
+    def _bounds(self) -> "np.ndarray":
+        return np.array([max(1, self.width()), max(1, self.height())], dtype=float)
+
+    def _spawn(self, indexes: "np.ndarray"):
+        """(Re)generar las partículas indicadas"""
+        count = len(indexes)
+        if count == 0:
+            return
+        rng = self._rng
+        self.positions[indexes] = rng.random((count, 2)) * self._bounds()
+        direction = np.radians(rng.uniform(0, 360, count))
+        speed = rng.uniform(0.2, 0.8, count)
+        self.velocities[indexes, 0] = np.cos(direction) * speed
+        self.velocities[indexes, 1] = np.sin(direction) * speed
+        self.sizes[indexes] = rng.uniform(1, 3, count)
+        self.base_opacities[indexes] = rng.uniform(0.3, 0.8, count)
+        self.opacities[indexes] = self.base_opacities[indexes]
+        self.ages[indexes] = 0
+        self.lifetimes[indexes] = rng.integers(100, 301, count)  # Frames de vida
+        self.color_indexes[indexes] = rng.integers(0, len(self.particle_colors), count)
+
+    def step(self, frames: float = 1.0):
+        """
+        Advance every particle at once
+
+        Args:
+            frames: Elapsed time in ~30 FPS frames (more than 1 when throttled)
+        """
+        if not self.particle_count:
+            return
+        # Mover, con wrapping en los bordes
+        self.positions += self.velocities * frames
+        np.mod(self.positions, self._bounds(), out=self.positions)
+
+        # Edad y desvanecimiento en el último 20% de la vida
+        self.ages += frames
+        fade_start = self.lifetimes * 0.8
+        fade = np.clip(1 - (self.ages - fade_start) / (self.lifetimes * 0.2), 0, 1)
+        np.copyto(self.opacities, np.minimum(0.8, self.base_opacities * fade),
+                  where=self.ages > fade_start)
+
+        # Reemplazar las muertas en su sitio
+        self._spawn(np.flatnonzero(self.ages >= self.lifetimes))
 
     def update_particles(self):
         """Actualizar y redibujar partículas"""
-        # Actualizar partículas existentes
-        for particle in self.particles[:]:
-            particle.update(self.width(), self.height())
-            if particle.is_dead():
-                self.particles.remove(particle)
-
-        # Agregar nuevas partículas si hay menos del límite
-        while len(self.particles) < self.particle_count:
-            x = random.uniform(0, self.width())
-            y = random.uniform(0, self.height())
-            size = random.uniform(1, 3)
-            speed = random.uniform(0.2, 0.8)
-            color = random.choice(self.particle_colors)
-            self.particles.append(Particle(x, y, size, speed, color))
-
+        start = time.perf_counter()
+        self.step(self.frame_interval_ms / self.FRAME_INTERVALS_MS[0])
         self.update()
+        # El pintado del frame anterior cuenta en el coste del frame
+        self._adapt_frame_rate((time.perf_counter() - start) * 1000 + self._last_paint_ms)
+
+    def _adapt_frame_rate(self, frame_ms: float):
+        """Bajar (o recuperar) la frecuencia según el coste de los frames"""
+        self._metrics['frames'] += 1
+        self._metrics['frame_ms_total'] += frame_ms
+
+        if frame_ms > self.FRAME_BUDGET_MS:
+            self._slow_frames += 1
+            self._fast_frames = 0
+        elif frame_ms < self.FRAME_BUDGET_MS / 2:
+            self._fast_frames += 1
+            self._slow_frames = 0
+        else:
+            self._slow_frames = self._fast_frames = 0
+
+        level = self._interval_level
+        if self._slow_frames >= self.SLOW_FRAMES_TO_THROTTLE and level < len(self.FRAME_INTERVALS_MS) - 1:
+            level += 1
+            self._metrics['throttled'] += 1
+        elif self._fast_frames >= self.FAST_FRAMES_TO_RECOVER and level > 0:
+            level -= 1
+            self._metrics['recovered'] += 1
+        else:
+            return
+
+        self._interval_level = level
+        self._slow_frames = self._fast_frames = 0
+        logger.debug(f"Particle effect interval: {self.frame_interval_ms} ms")
+        set_animation_interval(self, self.frame_interval_ms)
+
+    def get_metrics(self) -> Dict:
+        """
+        Animation metrics
+
+        Returns:
+            Dict: frames, avg_frame_ms, interval_ms, throttled and recovered
+        """
+        frames = self._metrics['frames']
+        return {
+            'frames': frames,
+            'avg_frame_ms': round(self._metrics['frame_ms_total'] / frames, 3) if frames else 0.0,
+            'interval_ms': self.frame_interval_ms,
+            'throttled': self._metrics['throttled'],
+            'recovered': self._metrics['recovered'],
+        }
+
+    @classmethod
+    def _get_sprite(cls, colors: List[QColor]) -> QPixmap:
+        """Sprite con un círculo opaco por color, en celdas contiguas"""
+        key = tuple(color.rgb() for color in colors)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            cell = cls.SPRITE_RADIUS * 2
+            sprite = QPixmap(cell * len(colors), cell)
+            sprite.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            for index, color in enumerate(colors):
+                # La opacidad de cada partícula la pone su fragmento
+                painter.setBrush(QColor(color.red(), color.green(), color.blue()))
+                painter.drawEllipse(QPointF(index * cell + cls.SPRITE_RADIUS, cls.SPRITE_RADIUS),
+                                    cls.SPRITE_RADIUS, cls.SPRITE_RADIUS)
+            painter.end()
+            cls._sprite_cache[key] = sprite
+        return sprite
+
+    def resizeEvent(self, event):
+        """Reescalar las posiciones al nuevo tamaño"""
+        super().resizeEvent(event)
+        if self.particle_count:
+            # Respecto al último tamaño conocido (el primer resize llega sin oldSize)
+            bounds = self._bounds()
+            self.positions *= bounds / self._layout_bounds
+            self._layout_bounds = bounds
 
     def paintEvent(self, event):
         """Dibujar partículas"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if not self.particle_count:
+            return
+        start = time.perf_counter()
+        cell = self.SPRITE_RADIUS * 2
+        sources = [QRectF(index * cell, 0, cell, cell) for index in range(len(self.particle_colors))]
+        scales = (self.sizes / self.SPRITE_RADIUS).tolist()
+
+        fragments = [
+            QPainter.PixmapFragment.create(QPointF(x, y), sources[color], scale, scale, 0, opacity)
+            for (x, y), color, scale, opacity in zip(
+                self.positions.tolist(), self.color_indexes.tolist(), scales, self.opacities.tolist())
+        ]
 
-        for particle in self.particles:
-            # Configurar color con opacidad
-            color = QColor(particle.color)
-            color.setAlphaF(particle.opacity)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.drawPixmapFragments(fragments, self._sprite)
+        painter.end()
+        self._last_paint_ms = (time.perf_counter() - start) * 1000
 
-            painter.setBrush(color)
-            painter.setPen(Qt.PenStyle.NoPen)
 
-            # Dibujar partícula
-            painter.drawEllipse(
-                QPointF(particle.x, particle.y),
-                particle.size,
-                particle.size
-            )
+class ScanLineEffect(QWidget):
+    """
+    Widget con efecto de líneas de escaneo
 
+    Las líneas se pintan una vez en un tile que se repite con drawTiledPixmap;
+    solo se repinta cuando el desplazamiento cambia de píxel.
+    """
 
-class ScanLineEffect(QWidget):
-    """Widget con efecto de líneas de escaneo"""
+    TILE_WIDTH = 64
 
     def __init__(self, parent=None, line_spacing: int = 4, speed: float = 2.0):
         super().__init__(parent)
@@ -137,36 +356,38 @@ class ScanLineEffect(QWidget):
         self.speed = speed
         self.offset = 0
 
+        # Tile: una línea cyan muy sutil cada line_spacing * 2 px
+        self._tile = QPixmap(self.TILE_WIDTH, line_spacing * 2)
+        self._tile.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self._tile)
+        painter.fillRect(0, 0, self.TILE_WIDTH, 1, QColor(0, 217, 255, 10))
+        painter.end()
+
         # Hacer el widget semi-transparente
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
-        # Timer para animación
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(33)  # ~30 FPS
+        # Timer para animación (scheduler compartido)
+        self.timer_handle = schedule_animation(self, 33, self.animate)  # ~30 FPS
+
+    def _tile_offset(self) -> int:
+        # Primera línea en y = offset - line_spacing (como el dibujo línea a línea)
+        return int(self.line_spacing - self.offset) % (self.line_spacing * 2)
 
     def animate(self):
         """Animar líneas de escaneo"""
+        previous = self._tile_offset()
         self.offset += self.speed
         if self.offset >= self.line_spacing * 2:
             self.offset = 0
-        self.update()
+        if self._tile_offset() != previous:
+            self.update()
 
     def paintEvent(self, event):
         """Dibujar líneas de escaneo"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Color de las líneas
-        line_color = QColor(0, 217, 255, 10)  # Cyan muy sutil
-        painter.setPen(QPen(line_color, 1))
-
-        # Dibujar líneas horizontales
-        y = -self.line_spacing + self.offset
-        while y < self.height():
-            painter.drawLine(0, int(y), self.width(), int(y))
-            y += self.line_spacing * 2
+        painter.drawTiledPixmap(self.rect(), self._tile, QPoint(0, self._tile_offset()))
+        painter.end()
 
 
 class AuroraEffect(QWidget):
@@ -185,10 +406,8 @@ class AuroraEffect(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
-        # Timer para animación
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(50)  # ~20 FPS
+        # Timer para animación (scheduler compartido)
+        self.timer_handle = schedule_animation(self, 50, self.animate)  # ~20 FPS
 
     def animate(self):
         """Animar efecto aurora"""
@@ -242,10 +461,8 @@ class HolographicShimmer(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
-        # Timer para animación
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate)
-        self.timer.start(40)  # ~25 FPS
+        # Timer para animación (scheduler compartido)
+        self.timer_handle = schedule_animation(self, 40, self.animate)  # ~25 FPS
 
     def animate(self):
         """Animar shimmer"""
@@ -296,10 +513,8 @@ class GlitchEffect(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
-        # Timer para chequear glitch
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.check_glitch)
-        self.timer.start(100)  # Chequear cada 100ms
+        # Timer para chequear glitch (scheduler compartido)
+        self.timer_handle = schedule_animation(self, 100, self.check_glitch)  # Chequear cada 100ms
 
     def check_glitch(self):
         """Verificar si debe ocurrir un glitch"""
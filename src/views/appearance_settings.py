@@ -135,6 +135,14 @@ class AppearanceSettings(QWidget):
         self.animation_speed_spin.valueChanged.connect(self.settings_changed)
         animation_layout.addRow("Velocidad:", self.animation_speed_spin)
 
+        # Visual effects (particles, scan lines)
+        self.visual_effects_combo = QComboBox()
+        self.visual_effects_combo.addItem("Completos", "full")
+        self.visual_effects_combo.addItem("Ahorro de energía (estáticos)", "power_saving")
+        self.visual_effects_combo.addItem("Desactivados", "off")
+        self.visual_effects_combo.currentIndexChanged.connect(self.settings_changed)
+        animation_layout.addRow("Efectos:", self.visual_effects_combo)
+
         animation_group.setLayout(animation_layout)
         main_layout.addWidget(animation_group)
 
@@ -212,6 +220,12 @@ class AppearanceSettings(QWidget):
         animation_speed = self.config_manager.get_setting("animation_speed", 250)
         self.animation_speed_spin.setValue(animation_speed)
 
+        # Load visual effects mode
+        visual_effects = self.config_manager.get_setting("visual_effects", "full")
+        index = self.visual_effects_combo.findData(visual_effects)
+        if index >= 0:
+            self.visual_effects_combo.setCurrentIndex(index)
+
     def get_settings(self) -> dict:
         """
         Get current settings
@@ -224,5 +238,6 @@ class AppearanceSettings(QWidget):
             "opacity": self.opacity_slider.value() / 100.0,
             "sidebar_width": self.sidebar_width_spin.value(),
             "panel_width": self.panel_width_spin.value(),
-            "animation_speed": self.animation_speed_spin.value()
+            "animation_speed": self.animation_speed_spin.value(),
+            "visual_effects": self.visual_effects_combo.currentData()
         }
@@ -1,6 +1,7 @@
 """
 Command Output Dialog
 Dialog para mostrar el resultado de la ejecución de comandos
+(o su salida en vivo mientras se ejecutan, ver for_execution)
 """
 import sys
 from pathlib import Path
@@ -9,28 +10,57 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QTextEdit, QWidget
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-import pyperclip
+from PyQt6.QtGui import QFont, QTextCursor
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from core.clipboard_manager import ClipboardManager
 
 
 class CommandOutputDialog(QDialog):
     """Dialog para mostrar el output de comandos ejecutados"""
 
-    def __init__(self, command: str, output: str, error: str = None, return_code: int = 0, parent=None):
+    def __init__(self, command: str, output: str, error: str = None, return_code: int = 0,
+                 parent=None, execution=None):
         super().__init__(parent)
         self.command = command
         self.output = output
         self.error = error
         self.return_code = return_code
+        self.execution = execution
+        self._stderr_started = False
         self.init_ui()
 
+    @classmethod
+    def for_execution(cls, execution, parent=None) -> "CommandOutputDialog":
+        """
+        Dialog that streams the output of a running CommandExecution
+
+        It is not modal (several commands can run at once) and offers a
+        cancel button until the command ends.
+
+        Args:
+            execution: CommandExecution (running, queued or finished)
+            parent: Parent widget
+
+        Returns:
+            CommandOutputDialog: Dialog (call show())
+        """
+        if execution.result is not None:
+            result = execution.result
+            return cls(result['command'], result['output'], result['error'],
+                       result['return_code'], parent=parent)
+
+        dialog = cls(execution.command, "", None, 0, parent=parent, execution=execution)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        execution.output_received.connect(dialog.append_output)
+        execution.finished.connect(dialog.on_execution_finished)
+        return dialog
+
     def init_ui(self):
         """Initialize UI"""
         self.setWindowTitle("Resultado de Ejecución")
         self.setMinimumSize(700, 500)
-        self.setModal(True)
+        self.setModal(self.execution is None)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -40,22 +70,22 @@ class CommandOutputDialog(QDialog):
         # Header con icono de éxito/error
         header_layout = QHBoxLayout()
 
-        if self.return_code == 0 and not self.error:
-            status_icon = QLabel("✅")
-            status_text = QLabel("Comando ejecutado exitosamente")
-            status_text.setStyleSheet("color: #00ff00; font-weight: bold;")
+        self.status_icon = QLabel()
+        self.status_text = QLabel()
+        if self.execution is not None:
+            self.status_icon.setText("⏳")
+            self.status_text.setText("Ejecutando comando...")
+            self.status_text.setStyleSheet("color: #ffff00; font-weight: bold;")
         else:
-            status_icon = QLabel("❌")
-            status_text = QLabel("Error al ejecutar comando")
-            status_text.setStyleSheet("color: #ff0000; font-weight: bold;")
+            self._set_status(self.return_code == 0 and not self.error)
 
-        status_icon.setStyleSheet("font-size: 20pt;")
+        self.status_icon.setStyleSheet("font-size: 20pt;")
         status_text_font = QFont()
         status_text_font.setPointSize(12)
-        status_text.setFont(status_text_font)
+        self.status_text.setFont(status_text_font)
 
-        header_layout.addWidget(status_icon)
-        header_layout.addWidget(status_text)
+        header_layout.addWidget(self.status_icon)
+        header_layout.addWidget(self.status_text)
         header_layout.addStretch()
         main_layout.addLayout(header_layout)
 
@@ -106,19 +136,17 @@ class CommandOutputDialog(QDialog):
                 full_output += "\n\n--- STDERR ---\n"
             full_output += self.error
 
-        if not full_output:
+        if not full_output and self.execution is None:
             full_output = "(Sin salida)"
 
         self.output_text.setPlainText(full_output)
         main_layout.addWidget(self.output_text)
 
         # Return code
-        return_code_label = QLabel(f"Código de salida: {self.return_code}")
-        if self.return_code == 0:
-            return_code_label.setStyleSheet("color: #00ff00; font-size: 9pt;")
-        else:
-            return_code_label.setStyleSheet("color: #ff0000; font-size: 9pt;")
-        main_layout.addWidget(return_code_label)
+        self.return_code_label = QLabel()
+        if self.execution is None:
+            self._set_return_code(self.return_code)
+        main_layout.addWidget(self.return_code_label)
 
         # Buttons
         buttons_layout = QHBoxLayout()
@@ -148,6 +176,26 @@ class CommandOutputDialog(QDialog):
 
         buttons_layout.addStretch()
 
+        # Cancel button (solo mientras se ejecuta)
+        self.cancel_btn = QPushButton("⏹ Cancelar")
+        self.cancel_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #a1260d;
+                color: #ffffff;
+                border: none;
+                border-radius: 5px;
+                padding: 10px 20px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #c72e0f;
+            }
+        """)
+        self.cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.cancel_btn.clicked.connect(self.cancel_execution)
+        self.cancel_btn.setVisible(self.execution is not None)
+        buttons_layout.addWidget(self.cancel_btn)
+
         # Close button
         close_btn = QPushButton("Cerrar")
         close_btn.setStyleSheet("""
@@ -182,11 +230,61 @@ class CommandOutputDialog(QDialog):
             }
         """)
 
+    def _set_status(self, success: bool):
+        """Mostrar el estado final (éxito/error) en la cabecera"""
+        if success:
+            self.status_icon.setText("✅")
+            self.status_text.setText("Comando ejecutado exitosamente")
+            self.status_text.setStyleSheet("color: #00ff00; font-weight: bold;")
+        else:
+            self.status_icon.setText("❌")
+            self.status_text.setText("Error al ejecutar comando")
+            self.status_text.setStyleSheet("color: #ff0000; font-weight: bold;")
+
+    def _set_return_code(self, return_code: int):
+        self.return_code_label.setText(f"Código de salida: {return_code}")
+        if return_code == 0:
+            self.return_code_label.setStyleSheet("color: #00ff00; font-size: 9pt;")
+        else:
+            self.return_code_label.setStyleSheet("color: #ff0000; font-size: 9pt;")
+
+    def append_output(self, stream: str, text: str):
+        """Agregar salida recibida de la ejecución en curso"""
+        if stream == 'stderr' and not self._stderr_started:
+            self._stderr_started = True
+            text = "\n--- STDERR ---\n" + text
+        cursor = self.output_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.output_text.setTextCursor(cursor)
+        self.output_text.ensureCursorVisible()
+
+    def on_execution_finished(self, result: dict):
+        """Mostrar el resultado final de la ejecución"""
+        self.return_code = result['return_code']
+        self.cancel_btn.setVisible(False)
+        self._set_status(result['success'])
+        self._set_return_code(result['return_code'])
+        if not result['success'] and result['error']:
+            # Motivo del fallo (cancelado, tiempo agotado...) al final de la salida
+            message = result['error'].rsplit("\n", 1)[-1]
+            if message and message not in self.output_text.toPlainText():
+                self.append_output('stderr', message)
+        if not self.output_text.toPlainText():
+            self.output_text.setPlainText("(Sin salida)")
+
+    def cancel_execution(self):
+        """Cancelar el comando en curso"""
+        if self.execution is not None:
+            self.cancel_btn.setEnabled(False)
+            self.execution.cancel()
+
     def copy_output(self):
         """Copiar output al portapapeles"""
         try:
             full_output = self.output_text.toPlainText()
-            pyperclip.copy(full_output)
+            if not ClipboardManager.get_shared().copy_text(full_output):
+                return
 
             # Visual feedback
             original_text = self.sender().text()
@@ -40,8 +40,11 @@ class ContentPanel(QWidget):
             self.target_width = 500  # Ancho más amplio para el contenedor
 
         self.collapsed_width = 0
-        self.search_engine = SearchEngine()
+        # El índice de búsqueda sigue los cambios de items de la base de datos
+        db = getattr(config_manager, 'db', None)
+        self.search_engine = SearchEngine(change_bus=getattr(db, 'changes', None))
         self.all_items = []  # Store all items before filtering
+        self.fuzzy_search = False  # Búsqueda difusa (tolerante a errores)
 
         self.init_ui()
 
@@ -132,6 +135,10 @@ class ContentPanel(QWidget):
         self.current_category = category
         self.all_items = category.items.copy()
 
+        # Modo de búsqueda (exacta o difusa)
+        if self.config_manager:
+            self.fuzzy_search = bool(self.config_manager.get_setting('fuzzy_search', False))
+
         # Update header
         self.header_label.setText(category.name)
         logger.debug(f"Header updated to: {category.name}")
@@ -220,5 +227,7 @@ class ContentPanel(QWidget):
             self.display_items(self.all_items)
         else:
             # Filter items using search engine
-            filtered_items = self.search_engine.search_in_category(query, self.current_category)
+            filtered_items = self.search_engine.search_in_category(
+                query, self.current_category, fuzzy=self.fuzzy_search
+            )
             self.display_items(filtered_items)
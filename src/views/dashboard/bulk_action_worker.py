@@ -0,0 +1,85 @@
+"""
+Bulk Action Worker
+Runs a Structure Dashboard bulk action (update/delete of many items and
+categories) in a background thread, in a single transaction
+"""
+
+from typing import Dict, List, Optional
+import logging
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class BulkActionWorker(QThread):
+    """Background worker for set-based bulk updates and deletes"""
+
+    # (processed, total) elements
+    progress = pyqtSignal(int, int)
+    # Result dict: {'items': int, 'categories': int}
+    completed = pyqtSignal(dict)
+    # Error message (the transaction was rolled back)
+    failed = pyqtSignal(str)
+
+    def __init__(self, db_manager, item_ids: List[int], category_ids: List[int] = None,
+                 item_fields: Optional[Dict] = None, category_fields: Optional[Dict] = None,
+                 delete: bool = False, parent=None):
+        """
+        Initialize the worker
+
+        Args:
+            db_manager: DBManager instance
+            item_ids: Item IDs to update/delete
+            category_ids: Category IDs to update/delete
+            item_fields: Field -> value set on every item (ignored if delete)
+            category_fields: Field -> value set on every category (ignored if delete)
+            delete: Delete the elements instead of updating them
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.db = db_manager
+        self.item_ids = list(item_ids)
+        self.category_ids = list(category_ids or [])
+        self.item_fields = item_fields or {}
+        self.category_fields = category_fields or {}
+        self.delete = delete
+        self._done = 0
+
+    def total(self) -> int:
+        """Number of elements the action processes"""
+        return len(self.item_ids) + len(self.category_ids)
+
+    def run(self):
+        """Execute the action (worker thread)"""
+        self._done = 0
+        try:
+            with self.db.transaction():
+                for category_id in self.category_ids:
+                    if self.delete:
+                        self.db.delete_category(category_id)
+                    else:
+                        self.db.update_category(category_id, **self.category_fields)
+                    self._advance(1)
+
+                if self.delete:
+                    items = self.db.delete_items_bulk(self.item_ids, progress_callback=self._advance)
+                else:
+                    items = self.db.update_items_by_ids(
+                        self.item_ids, self.item_fields, progress_callback=self._advance
+                    )
+
+            self.completed.emit({'items': items, 'categories': len(self.category_ids)})
+
+        except Exception as e:
+            logger.error(f"Bulk action failed: {e}", exc_info=True)
+            self.failed.emit(str(e))
+
+        finally:
+            # La conexion de este hilo vuelve al pool
+            self.db.release_connection()
+
+    def _advance(self, count: int):
+        """Report progress of count more elements"""
+        self._done += count
+        self.progress.emit(self._done, self.total())
@@ -196,6 +196,15 @@ class SearchBarWidget(QWidget):
             self.scope_checkboxes[scope_id] = checkbox
             filters_row.addWidget(checkbox)
 
+        # Fuzzy mode toggle (sent along with the scope filters)
+        fuzzy_checkbox = QCheckBox("Difusa")
+        fuzzy_checkbox.setChecked(False)
+        fuzzy_checkbox.setToolTip("Búsqueda tolerante a errores, ordenada por relevancia")
+        fuzzy_checkbox.setStyleSheet(checkbox.styleSheet())
+        fuzzy_checkbox.stateChanged.connect(self._on_filter_changed)
+        self.scope_checkboxes['fuzzy'] = fuzzy_checkbox
+        filters_row.addWidget(fuzzy_checkbox)
+
         filters_row.addStretch()
 
         # Results counter
@@ -16,6 +16,7 @@ from views.dashboard.search_bar_widget import SearchBarWidget
 from views.dashboard.highlight_delegate import HighlightDelegate
 from views.dashboard.action_bar_widget import ActionBarWidget
 from views.dashboard.selection_utils_widget import SelectionUtilsWidget
+from views.dashboard.bulk_action_worker import BulkActionWorker
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,11 @@ class StructureDashboard(QDialog):
         self.active_filter = None  # 'favorites', 'inactive', 'archived', None
         self.filter_buttons = {}  # Referencias a los botones de filtro
 
+        # Acción en bloque en curso y nodos del árbol por id
+        self._bulk_worker = None
+        self._category_widgets = {}
+        self._item_widgets = {}
+
         self.init_ui()
         self.setup_shortcuts()
         self.load_data()
@@ -492,6 +498,10 @@ class StructureDashboard(QDialog):
 
         logger.info(f"Populating tree with {len(categories)} categories...")
 
+        # Widgets por id, para actualizar solo los nodos afectados
+        self._category_widgets = {}
+        self._item_widgets = {}
+
         for category in categories:
             # Create category item (Level 1)
             category_item = QTreeWidgetItem(self.tree_widget)
@@ -500,56 +510,8 @@ class StructureDashboard(QDialog):
             category_item.setFlags(category_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             category_item.setCheckState(0, Qt.CheckState.Unchecked)
 
-            # Column 1: Name with icon and item count
-            status_indicator = ""
-            if not category.get('is_active', 1):  # Si is_active es 0 o False
-                status_indicator = "🚫 "  # Icono que coincide con el botón Desactivar
-            category_name = f"{status_indicator}{category['icon']} {category['name']} ({len(category['items'])} items)"
-            category_item.setText(1, category_name)
-            category_item.setFont(1, self.get_bold_font())
-
-            # Aplicar estilo visual adicional para categorías desactivadas
-            if not category.get('is_active', 1):
-                # Cambiar el color del texto para categorías desactivadas
-                for col in range(4):
-                    category_item.setForeground(col, QBrush(QColor('#888888')))  # Texto gris
-
-            # Column 2: Type
-            category_item.setText(2, "Categoría")
-
-            # Column 3: Tags
-            if category['tags']:
-                tags_str = ", ".join([f"#{tag}" for tag in category['tags']])
-                category_item.setText(3, tags_str)
-
-            # Build tooltip for category
-            category_tooltip_parts = []
-            category_tooltip_parts.append(f"<b>{category['name']}</b>")
-            category_tooltip_parts.append(f"<b>Items:</b> {len(category['items'])}")
-
-            # Mostrar estado de categoría
-            if not category.get('is_active', 1):
-                category_tooltip_parts.append("🚫 <b><span style='color: #f44336;'>CATEGORÍA DESACTIVADA</span></b>")
-
-            if category['tags']:
-                tags_str = ", ".join([f"#{tag}" for tag in category['tags']])
-                category_tooltip_parts.append(f"<b>Tags:</b> {tags_str}")
-
-            if category.get('is_predefined'):
-                category_tooltip_parts.append("📌 <b>Categoría predefinida</b>")
-
-            category_tooltip_parts.append("<br><i>Click para expandir/colapsar | Click derecho para opciones</i>")
-
-            category_tooltip_html = "<br>".join(category_tooltip_parts)
-            category_item.setToolTip(1, category_tooltip_html)
-            category_item.setToolTip(2, category_tooltip_html)
-            category_item.setToolTip(3, category_tooltip_html)
-
-            # Store category ID in user data (column 0 for identification)
-            category_item.setData(0, Qt.ItemDataRole.UserRole, {
-                'type': 'category',
-                'id': category['id']
-            })
+            self._fill_category_widget(category_item, category)
+            self._category_widgets[category['id']] = category_item
 
             # Add items under this category (Level 2)
             for item in category['items']:
@@ -559,112 +521,182 @@ class StructureDashboard(QDialog):
                 item_widget.setFlags(item_widget.flags() | Qt.ItemFlag.ItemIsUserCheckable)
                 item_widget.setCheckState(0, Qt.CheckState.Unchecked)
 
-                # Column 1: Item name with indicators
-                indicators = ""
-                # Estado de archivo/activo (primero para mayor visibilidad)
-                if item.get('is_archived'):
-                    indicators += "📦 "  # Icono que coincide con el botón Archivar
-                if not item.get('is_active', 1):  # Si is_active es 0 o False
-                    indicators += "🚫 "  # Icono que coincide con el botón Desactivar
-                # Otros indicadores
-                if item.get('is_list'):
-                    indicators += "📝 "
-                if item['is_favorite']:
-                    indicators += "⭐ "
-                if item['is_sensitive']:
-                    indicators += "🔒 "
-
-                item_name = f"{indicators}{item['label']}"
-                item_widget.setText(1, item_name)
-
-                # Aplicar estilo visual adicional para items desactivados o archivados
-                if item.get('is_archived') or not item.get('is_active', 1):
-                    # Cambiar el color del texto para items desactivados/archivados
-                    for col in range(4):
-                        item_widget.setForeground(col, QBrush(QColor('#888888')))  # Texto gris
-
-                # Column 2: Item type
-                type_icons = {
-                    'CODE': '💻',
-                    'URL': '🔗',
-                    'PATH': '📂',
-                    'TEXT': '📝'
-                }
-                type_icon = type_icons.get(item['type'], '📄')
-                item_widget.setText(2, f"{type_icon} {item['type']}")
-
-                # Column 3: Tags + list_group + preview
-                info_parts = []
-
-                # List group (if is_list)
-                if item.get('is_list') and item.get('list_group'):
-                    info_parts.append(f"📝 Lista: {item['list_group']}")
-
-                # Tags
-                if item['tags']:
-                    tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
-                    info_parts.append(tags_str)
-
-                # Content preview (first 50 chars)
-                if not item['is_sensitive'] and item['content']:
-                    preview = item['content'][:50]
-                    if len(item['content']) > 50:
-                        preview += "..."
-                    info_parts.append(f"Preview: {preview}")
-
-                item_widget.setText(3, " | ".join(info_parts))
-
-                # Build tooltip with detailed information
-                tooltip_parts = []
-                tooltip_parts.append(f"<b>{item['label']}</b>")
-                tooltip_parts.append(f"<b>Tipo:</b> {item['type']}")
-
-                # Mostrar estado de archivo/activo
-                if item.get('is_archived'):
-                    tooltip_parts.append("📦 <b><span style='color: #ff9800;'>ARCHIVADO</span></b>")
-                if not item.get('is_active', 1):
-                    tooltip_parts.append("🚫 <b><span style='color: #f44336;'>DESACTIVADO</span></b>")
-
-                if item['description']:
-                    tooltip_parts.append(f"<b>Descripción:</b> {item['description']}")
-
-                if item.get('is_list') and item.get('list_group'):
-                    tooltip_parts.append(f"📝 <b>Pertenece a la lista:</b> {item['list_group']}")
-
-                if item['tags']:
-                    tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
-                    tooltip_parts.append(f"<b>Tags:</b> {tags_str}")
-
-                if item['is_favorite']:
-                    tooltip_parts.append("⭐ <b>Favorito</b>")
-
-                if item['is_sensitive']:
-                    tooltip_parts.append("🔒 <b>Contenido sensible (encriptado)</b>")
-                else:
-                    # Show content preview for non-sensitive items
-                    if item['content']:
-                        content_preview = item['content'][:100]
-                        if len(item['content']) > 100:
-                            content_preview += "..."
-                        tooltip_parts.append(f"<b>Contenido:</b><br><code>{content_preview}</code>")
-
-                tooltip_parts.append("<br><i>Doble click para copiar | Click derecho para más opciones</i>")
-
-                tooltip_html = "<br>".join(tooltip_parts)
-                item_widget.setToolTip(1, tooltip_html)
-                item_widget.setToolTip(2, tooltip_html)
-                item_widget.setToolTip(3, tooltip_html)
-
-                # Store item data (column 0 for identification)
-                item_widget.setData(0, Qt.ItemDataRole.UserRole, {
-                    'type': 'item',
-                    'id': item['id'],
-                    'content': item['content'],
-                    'item_type': item['type']
-                })
+                self._fill_item_widget(item_widget, item)
+                self._item_widgets[item['id']] = item_widget
 
         logger.info("Tree populated successfully")
 
+    def _fill_category_widget(self, category_item: QTreeWidgetItem, category: dict):
+        """
+        Set texts, style, tooltip and data of a category node
+
+        Args:
+            category_item: Tree node of the category
+            category: Category dict from the structure
+        """
+        # Column 1: Name with icon and item count
+        status_indicator = ""
+        if not category.get('is_active', 1):  # Si is_active es 0 o False
+            status_indicator = "🚫 "  # Icono que coincide con el botón Desactivar
+        category_name = f"{status_indicator}{category['icon']} {category['name']} ({len(category['items'])} items)"
+        category_item.setText(1, category_name)
+        category_item.setFont(1, self.get_bold_font())
+
+        # Aplicar estilo visual adicional para categorías desactivadas
+        self._set_dimmed(category_item, not category.get('is_active', 1))
+
+        # Column 2: Type
+        category_item.setText(2, "Categoría")
+
+        # Column 3: Tags
+        category_item.setText(3, ", ".join([f"#{tag}" for tag in category['tags']]))
+
+        # Build tooltip for category
+        category_tooltip_parts = []
+        category_tooltip_parts.append(f"<b>{category['name']}</b>")
+        category_tooltip_parts.append(f"<b>Items:</b> {len(category['items'])}")
+
+        # Mostrar estado de categoría
+        if not category.get('is_active', 1):
+            category_tooltip_parts.append("🚫 <b><span style='color: #f44336;'>CATEGORÍA DESACTIVADA</span></b>")
+
+        if category['tags']:
+            tags_str = ", ".join([f"#{tag}" for tag in category['tags']])
+            category_tooltip_parts.append(f"<b>Tags:</b> {tags_str}")
+
+        if category.get('is_predefined'):
+            category_tooltip_parts.append("📌 <b>Categoría predefinida</b>")
+
+        category_tooltip_parts.append("<br><i>Click para expandir/colapsar | Click derecho para opciones</i>")
+
+        category_tooltip_html = "<br>".join(category_tooltip_parts)
+        category_item.setToolTip(1, category_tooltip_html)
+        category_item.setToolTip(2, category_tooltip_html)
+        category_item.setToolTip(3, category_tooltip_html)
+
+        # Store category ID in user data (column 0 for identification)
+        category_item.setData(0, Qt.ItemDataRole.UserRole, {
+            'type': 'category',
+            'id': category['id']
+        })
+
+    def _fill_item_widget(self, item_widget: QTreeWidgetItem, item: dict):
+        """
+        Set texts, style, tooltip and data of an item node
+
+        Args:
+            item_widget: Tree node of the item
+            item: Item dict from the structure
+        """
+        # Column 1: Item name with indicators
+        indicators = ""
+        # Estado de archivo/activo (primero para mayor visibilidad)
+        if item.get('is_archived'):
+            indicators += "📦 "  # Icono que coincide con el botón Archivar
+        if not item.get('is_active', 1):  # Si is_active es 0 o False
+            indicators += "🚫 "  # Icono que coincide con el botón Desactivar
+        # Otros indicadores
+        if item.get('is_list'):
+            indicators += "📝 "
+        if item['is_favorite']:
+            indicators += "⭐ "
+        if item['is_sensitive']:
+            indicators += "🔒 "
+
+        item_name = f"{indicators}{item['label']}"
+        item_widget.setText(1, item_name)
+
+        # Aplicar estilo visual adicional para items desactivados o archivados
+        self._set_dimmed(item_widget, item.get('is_archived') or not item.get('is_active', 1))
+
+        # Column 2: Item type
+        type_icons = {
+            'CODE': '💻',
+            'URL': '🔗',
+            'PATH': '📂',
+            'TEXT': '📝'
+        }
+        type_icon = type_icons.get(item['type'], '📄')
+        item_widget.setText(2, f"{type_icon} {item['type']}")
+
+        # Column 3: Tags + list_group + preview
+        info_parts = []
+
+        # List group (if is_list)
+        if item.get('is_list') and item.get('list_group'):
+            info_parts.append(f"📝 Lista: {item['list_group']}")
+
+        # Tags
+        if item['tags']:
+            tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
+            info_parts.append(tags_str)
+
+        # Content preview (first 50 chars)
+        if not item['is_sensitive'] and item['content']:
+            preview = item['content'][:50]
+            if len(item['content']) > 50:
+                preview += "..."
+            info_parts.append(f"Preview: {preview}")
+
+        item_widget.setText(3, " | ".join(info_parts))
+
+        # Build tooltip with detailed information
+        tooltip_parts = []
+        tooltip_parts.append(f"<b>{item['label']}</b>")
+        tooltip_parts.append(f"<b>Tipo:</b> {item['type']}")
+
+        # Mostrar estado de archivo/activo
+        if item.get('is_archived'):
+            tooltip_parts.append("📦 <b><span style='color: #ff9800;'>ARCHIVADO</span></b>")
+        if not item.get('is_active', 1):
+            tooltip_parts.append("🚫 <b><span style='color: #f44336;'>DESACTIVADO</span></b>")
+
+        if item['description']:
+            tooltip_parts.append(f"<b>Descripción:</b> {item['description']}")
+
+        if item.get('is_list') and item.get('list_group'):
+            tooltip_parts.append(f"📝 <b>Pertenece a la lista:</b> {item['list_group']}")
+
+        if item['tags']:
+            tags_str = ", ".join([f"#{tag}" for tag in item['tags']])
+            tooltip_parts.append(f"<b>Tags:</b> {tags_str}")
+
+        if item['is_favorite']:
+            tooltip_parts.append("⭐ <b>Favorito</b>")
+
+        if item['is_sensitive']:
+            tooltip_parts.append("🔒 <b>Contenido sensible (encriptado)</b>")
+        else:
+            # Show content preview for non-sensitive items
+            if item['content']:
+                content_preview = item['content'][:100]
+                if len(item['content']) > 100:
+                    content_preview += "..."
+                tooltip_parts.append(f"<b>Contenido:</b><br><code>{content_preview}</code>")
+
+        tooltip_parts.append("<br><i>Doble click para copiar | Click derecho para más opciones</i>")
+
+        tooltip_html = "<br>".join(tooltip_parts)
+        item_widget.setToolTip(1, tooltip_html)
+        item_widget.setToolTip(2, tooltip_html)
+        item_widget.setToolTip(3, tooltip_html)
+
+        # Store item data (column 0 for identification)
+        item_widget.setData(0, Qt.ItemDataRole.UserRole, {
+            'type': 'item',
+            'id': item['id'],
+            'content': item['content'],
+            'item_type': item['type']
+        })
+
+    def _set_dimmed(self, tree_item: QTreeWidgetItem, dimmed: bool):
+        """Show a node in grey (inactive/archived) or with the default colors"""
+        for col in range(4):
+            if dimmed:
+                tree_item.setForeground(col, QBrush(QColor('#888888')))  # Texto gris
+            else:
+                tree_item.setData(col, Qt.ItemDataRole.ForegroundRole, None)
+
     def update_statistics(self):
         """Update statistics label"""
         if not self.structure:
@@ -1029,48 +1061,12 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Update each item in database
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.update_item(item_id, is_favorite=1)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} marked as favorite")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error marking item {item_id} as favorite: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} item{'s' if success_count != 1 else ''} marcado{'s' if success_count != 1 else ''} como favorito{'s' if success_count != 1 else ''}"
-                    )
-                    logger.info(f"Successfully marked {success_count} items as favorites")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} item{'s' if success_count != 1 else ''} actualizado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Marked {success_count} items as favorites with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_set_favorite: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al marcar favoritos:\n{str(e)}"
-                )
+            self._run_bulk_action(
+                "Marcando favoritos",
+                item_fields={'is_favorite': 1},
+                done_message=lambda n: f"✅ {n} item{'s' if n != 1 else ''} marcado{'s' if n != 1 else ''} como favorito{'s' if n != 1 else ''}",
+                error_text="❌ Error al marcar favoritos"
+            )
 
     def bulk_unset_favorite(self):
         """Remove selected items from favorites"""
@@ -1089,48 +1085,12 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Update each item in database
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.update_item(item_id, is_favorite=0)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} unmarked as favorite")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error unmarking item {item_id} as favorite: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} item{'s' if success_count != 1 else ''} actualizado{'s' if success_count != 1 else ''}"
-                    )
-                    logger.info(f"Successfully unmarked {success_count} items as favorites")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} item{'s' if success_count != 1 else ''} actualizado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Unmarked {success_count} items as favorites with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_unset_favorite: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al quitar favoritos:\n{str(e)}"
-                )
+            self._run_bulk_action(
+                "Quitando favoritos",
+                item_fields={'is_favorite': 0},
+                done_message=lambda n: f"✅ {n} item{'s' if n != 1 else ''} actualizado{'s' if n != 1 else ''}",
+                error_text="❌ Error al quitar favoritos"
+            )
 
     def bulk_activate(self):
         """Activate selected categories and items"""
@@ -1156,58 +1116,13 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Activate categories
-                for category_id in self.selected_items['categories']:
-                    try:
-                        self.db.update_category(category_id, is_active=1)
-                        success_count += 1
-                        logger.debug(f"Category {category_id} activated")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error activating category {category_id}: {e}")
-
-                # Activate items (and unarchive them)
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.update_item(item_id, is_active=1, is_archived=0)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} activated")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error activating item {item_id}: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} activado{'s' if success_count != 1 else ''}"
-                    )
-                    logger.info(f"Successfully activated {success_count} elements")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} activado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Activated {success_count} elements with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_activate: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al activar elementos:\n{str(e)}"
-                )
+            self._run_bulk_action(
+                "Activando",
+                item_fields={'is_active': 1, 'is_archived': 0},
+                category_fields={'is_active': 1},
+                done_message=lambda n: f"✅ {n} elemento{'s' if n != 1 else ''} activado{'s' if n != 1 else ''}",
+                error_text="❌ Error al activar elementos"
+            )
 
     def bulk_archive(self):
         """Archive selected categories and items"""
@@ -1233,58 +1148,14 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Archive categories (deactivate them)
-                for category_id in self.selected_items['categories']:
-                    try:
-                        self.db.update_category(category_id, is_active=0)
-                        success_count += 1
-                        logger.debug(f"Category {category_id} archived (deactivated)")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error archiving category {category_id}: {e}")
-
-                # Archive items
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.update_item(item_id, is_archived=1)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} archived")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error archiving item {item_id}: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} archivado{'s' if success_count != 1 else ''}"
-                    )
-                    logger.info(f"Successfully archived {success_count} elements")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} archivado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Archived {success_count} elements with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_archive: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al archivar elementos:\n{str(e)}"
-                )
+            # Las categorías archivadas se desactivan
+            self._run_bulk_action(
+                "Archivando",
+                item_fields={'is_archived': 1},
+                category_fields={'is_active': 0},
+                done_message=lambda n: f"✅ {n} elemento{'s' if n != 1 else ''} archivado{'s' if n != 1 else ''}",
+                error_text="❌ Error al archivar elementos"
+            )
 
     def bulk_deactivate(self):
         """Deactivate selected categories and items"""
@@ -1310,58 +1181,13 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Deactivate categories
-                for category_id in self.selected_items['categories']:
-                    try:
-                        self.db.update_category(category_id, is_active=0)
-                        success_count += 1
-                        logger.debug(f"Category {category_id} deactivated")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error deactivating category {category_id}: {e}")
-
-                # Deactivate items
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.update_item(item_id, is_active=0)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} deactivated")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error deactivating item {item_id}: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} desactivado{'s' if success_count != 1 else ''}"
-                    )
-                    logger.info(f"Successfully deactivated {success_count} elements")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} desactivado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Deactivated {success_count} elements with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_deactivate: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al desactivar elementos:\n{str(e)}"
-                )
+            self._run_bulk_action(
+                "Desactivando",
+                item_fields={'is_active': 0},
+                category_fields={'is_active': 0},
+                done_message=lambda n: f"✅ {n} elemento{'s' if n != 1 else ''} desactivado{'s' if n != 1 else ''}",
+                error_text="❌ Error al desactivar elementos"
+            )
 
     def bulk_unarchive(self):
         """Unarchive selected items"""
@@ -1391,48 +1217,13 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Unarchive items
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.update_item(item_id, is_archived=0)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} unarchived")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error unarchiving item {item_id}: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} item{'s' if success_count != 1 else ''} desarchivado{'s' if success_count != 1 else ''}"
-                    )
-                    logger.info(f"Successfully unarchived {success_count} items")
-                else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} item{'s' if success_count != 1 else ''} desarchivado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Unarchived {success_count} items with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_unarchive: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al desarchivar items:\n{str(e)}"
-                )
+            # Las categorías no tienen estado de archivo
+            self._run_bulk_action(
+                "Desarchivando",
+                item_fields={'is_archived': 0},
+                done_message=lambda n: f"✅ {n} item{'s' if n != 1 else ''} desarchivado{'s' if n != 1 else ''}",
+                error_text="❌ Error al desarchivar items"
+            )
 
     def bulk_delete(self):
         """Delete selected categories and items"""
@@ -1468,58 +1259,146 @@ class StructureDashboard(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success_count = 0
-            error_count = 0
-
-            try:
-                # Delete categories (this also deletes their items via CASCADE)
-                for category_id in self.selected_items['categories']:
-                    try:
-                        self.db.delete_category(category_id)
-                        success_count += 1
-                        logger.debug(f"Category {category_id} deleted (with all its items)")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error deleting category {category_id}: {e}")
-
-                # Delete items
-                for category_id, item_id in self.selected_items['items']:
-                    try:
-                        self.db.delete_item(item_id)
-                        success_count += 1
-                        logger.debug(f"Item {item_id} deleted")
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error deleting item {item_id}: {e}")
-
-                # Clear selection and reload
-                self.clear_selection()
-                self.load_data()
-
-                # Show result
-                if error_count == 0:
-                    QMessageBox.information(
-                        self,
-                        "Operación Exitosa",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} eliminado{'s' if success_count != 1 else ''} permanentemente"
-                    )
-                    logger.info(f"Successfully deleted {success_count} elements")
+            # Las categorías eliminan también sus items (CASCADE)
+            self._run_bulk_action(
+                "Eliminando",
+                delete=True,
+                done_message=lambda n: f"✅ {n} elemento{'s' if n != 1 else ''} eliminado{'s' if n != 1 else ''} permanentemente",
+                error_text="❌ Error al eliminar elementos"
+            )
+
+    def _run_bulk_action(self, label: str, item_fields: dict = None, category_fields: dict = None,
+                         delete: bool = False, done_message=None, error_text: str = "❌ Error"):
+        """
+        Run a bulk action on the current selection in a background worker
+
+        All rows are written in a single transaction with set-based statements;
+        on success only the affected tree nodes are updated (no full reload).
+
+        Args:
+            label: Progress text shown in the footer
+            item_fields: Field -> value set on the selected items
+            category_fields: Field -> value set on the selected categories
+                (None = the action doesn't touch categories)
+            delete: Delete the selected elements instead of updating them
+            done_message: Function (processed count) -> result message
+            error_text: Message shown if the action fails
+        """
+        if self._bulk_worker is not None and self._bulk_worker.isRunning():
+            logger.warning("A bulk action is already running")
+            return
+
+        item_ids = [item_id for _, item_id in self.selected_items['items']]
+        category_ids = list(self.selected_items['categories']) if (delete or category_fields) else []
+
+        worker = BulkActionWorker(
+            self.db, item_ids, category_ids,
+            item_fields=item_fields, category_fields=category_fields,
+            delete=delete, parent=self
+        )
+        worker.progress.connect(
+            lambda done, total: self.stats_label.setText(f"⏳ {label}... {done}/{total}")
+        )
+        worker.completed.connect(lambda result: self._on_bulk_action_completed(worker, result, done_message))
+        worker.failed.connect(lambda error: self._on_bulk_action_failed(error, error_text))
+        worker.finished.connect(lambda: self.action_bar.setEnabled(True))
+
+        self._bulk_worker = worker
+        self.action_bar.setEnabled(False)
+        self.stats_label.setText(f"⏳ {label}... 0/{worker.total()}")
+        logger.info(f"Bulk action started: {label} ({len(category_ids)} categories, {len(item_ids)} items)")
+        worker.start()
+
+    def _on_bulk_action_completed(self, worker: BulkActionWorker, result: dict, done_message=None):
+        """
+        Apply a finished bulk action to the cached structure and the tree
+
+        Args:
+            worker: Worker that ran the action
+            result: {'items': int, 'categories': int} rows processed
+            done_message: Function (processed count) -> result message
+        """
+        manager = self.dashboard_manager
+        needs_reload = False
+
+        if worker.delete:
+            manager.remove_categories(worker.category_ids)
+            manager.remove_items(worker.item_ids)
+            self._remove_tree_widgets(worker.category_ids, worker.item_ids)
+        else:
+            patched_items = manager.apply_item_changes(worker.item_ids, worker.item_fields)
+            if worker.category_ids:
+                patched_categories = manager.apply_category_changes(worker.category_ids, worker.category_fields)
+                if worker.category_fields.get('is_active', 1):
+                    # Categorías activadas que no estaban en la estructura
+                    needs_reload = len(patched_categories) < len(worker.category_ids)
                 else:
-                    QMessageBox.warning(
-                        self,
-                        "Operación Completada con Errores",
-                        f"✅ {success_count} elemento{'s' if success_count != 1 else ''} eliminado{'s' if success_count != 1 else ''}\n"
-                        f"❌ {error_count} error{'es' if error_count != 1 else ''}"
-                    )
-                    logger.warning(f"Deleted {success_count} elements with {error_count} errors")
-
-            except Exception as e:
-                logger.error(f"Critical error in bulk_delete: {e}", exc_info=True)
-                QMessageBox.critical(
-                    self,
-                    "Error Crítico",
-                    f"❌ Error al eliminar elementos:\n{str(e)}"
-                )
+                    self._remove_tree_widgets(worker.category_ids, [])
+            for item in patched_items:
+                item_widget = self._item_widgets.get(item['id'])
+                if item_widget is not None:
+                    self._fill_item_widget(item_widget, item)
+
+        self.clear_selection()
+        if needs_reload:
+            manager.get_full_structure(force_refresh=True)
+            self.load_data()
+        elif self.active_filter:
+            # Reaplicar el filtro activo sobre la estructura actualizada
+            {'favorites': self.filter_favorites,
+             'inactive': self.filter_inactive,
+             'archived': self.filter_archived}[self.active_filter]()
+        else:
+            self._refresh_category_widgets()
+            self.update_statistics()
+
+        processed = result['items'] + result['categories']
+        message = done_message(processed) if done_message else f"✅ {processed}"
+        logger.info(f"Bulk action completed: {result}")
+        QMessageBox.information(self, "Operación Exitosa", message)
+
+    def _on_bulk_action_failed(self, error: str, error_text: str):
+        """Report a failed bulk action (nothing was written, the transaction was rolled back)"""
+        self.update_statistics()
+        QMessageBox.critical(
+            self,
+            "Error Crítico",
+            f"{error_text}:\n{error}\n\nNo se ha modificado ningún elemento."
+        )
+
+    def _remove_tree_widgets(self, category_ids: list, item_ids: list):
+        """
+        Remove the nodes of deleted categories/items from the tree
+
+        Args:
+            category_ids: Category IDs whose nodes are removed (with their items)
+            item_ids: Item IDs whose nodes are removed
+        """
+        for item_id in item_ids:
+            item_widget = self._item_widgets.pop(item_id, None)
+            if item_widget is not None and item_widget.parent() is not None:
+                item_widget.parent().removeChild(item_widget)
+
+        for category_id in category_ids:
+            category_item = self._category_widgets.pop(category_id, None)
+            if category_item is None:
+                continue
+            for index in range(category_item.childCount()):
+                data = category_item.child(index).data(0, Qt.ItemDataRole.UserRole)
+                if data:
+                    self._item_widgets.pop(data['id'], None)
+            index = self.tree_widget.indexOfTopLevelItem(category_item)
+            if index >= 0:
+                self.tree_widget.takeTopLevelItem(index)
+
+    def _refresh_category_widgets(self):
+        """Update category nodes (names and item counts) from the structure"""
+        if not self.structure:
+            return
+        for category in self.structure['categories']:
+            category_item = self._category_widgets.get(category['id'])
+            if category_item is not None:
+                self._fill_category_widget(category_item, category)
 
     # ========== FILTERS AND SORTING ==========
 
@@ -1547,17 +1426,11 @@ class StructureDashboard(QDialog):
         # Actualizar estado de filtro
         self.set_active_filter('inactive')
 
-        # Filtrar estructura manualmente
-        import copy
-        filtered_structure = copy.deepcopy(self.structure)
-
-        # Filtrar categorías y items inactivos
-        for category in filtered_structure['categories']:
-            # Filtrar items inactivos en esta categoría
-            category['items'] = [
-                item for item in category['items']
-                if not item.get('is_active', 1)  # Solo items con is_active=0
-            ]
+        # Filtrar items inactivos (solo items con is_active=0)
+        filtered_structure = self.dashboard_manager.filter_structure_items(
+            lambda item: not item.get('is_active', 1),
+            structure=self.structure
+        )
 
         self.tree_widget.clear()
         self.populate_tree(filtered_structure)
@@ -1570,16 +1443,11 @@ class StructureDashboard(QDialog):
         # Actualizar estado de filtro
         self.set_active_filter('archived')
 
-        # Filtrar estructura manualmente
-        import copy
-        filtered_structure = copy.deepcopy(self.structure)
-
-        # Filtrar items archivados
-        for category in filtered_structure['categories']:
-            category['items'] = [
-                item for item in category['items']
-                if item.get('is_archived', False)  # Solo items con is_archived=True
-            ]
+        # Filtrar items archivados (solo items con is_archived=True)
+        filtered_structure = self.dashboard_manager.filter_structure_items(
+            lambda item: item.get('is_archived', False),
+            structure=self.structure
+        )
 
         self.tree_widget.clear()
         self.populate_tree(filtered_structure)
@@ -2025,5 +1893,8 @@ class StructureDashboard(QDialog):
 
     def closeEvent(self, event):
         """Handle window close"""
+        if self._bulk_worker is not None and self._bulk_worker.isRunning():
+            # Terminar la transacción en curso antes de cerrar
+            self._bulk_worker.wait()
         logger.info("Structure Dashboard closed")
         event.accept()
@@ -291,8 +291,8 @@ class ForgottenItemsDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             # Eliminar items de la base de datos
             try:
-                import sqlite3
-                conn = sqlite3.connect("widget_sidebar.db")
+                from database.connection_pool import ConnectionPool
+                conn = ConnectionPool.get_shared("widget_sidebar.db").acquire()
                 cursor = conn.cursor()
 
                 for item_id in selected_ids:
@@ -304,6 +304,10 @@ class ForgottenItemsDialog(QDialog):
                 conn.commit()
                 conn.close()
 
+                # Las caches de categorias/items descartan los items eliminados
+                from database.change_events import ChangeBus, ChangeType
+                ChangeBus.get_shared("widget_sidebar.db").publish(ChangeType.ITEM_DELETED, item_ids=selected_ids)
+
                 logger.info(f"Deleted {len(selected_ids)} items")
 
                 QMessageBox.information(
@@ -8,37 +8,69 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                               QPushButton, QTabWidget, QWidget, QFrame,
                               QTableWidget, QTableWidgetItem, QMessageBox,
                               QFileDialog, QTextEdit, QComboBox, QGroupBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
 from PyQt6.QtGui import QFont
 import sys
 from pathlib import Path
-from datetime import datetime
-
-# Matplotlib imports
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+from datetime import datetime, timedelta
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.stats_manager import StatsManager
 from core.favorites_manager import FavoritesManager
+from views.dialogs.stats_loader import SECTIONS, StatsSectionTask
+from views.widgets.charts import BarChartWidget, LineChartWidget, PieChartWidget, HeatmapWidget
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Configurar estilo de matplotlib
-plt.style.use('dark_background')
+# Filas del mapa de calor (strftime('%w'): 0 = domingo)
+WEEKDAY_LABELS = ["Lun", "Mar", "Mié", "Jue", "Vie", "Sáb", "Dom"]
+
+# Hilos del dialog para las consultas (el pool de conexiones tiene 4)
+LOADER_THREADS = 2
 
 
 class StatsDashboard(QDialog):
-    """Dashboard completo de estadísticas con gráficos"""
+    """
+    Dashboard completo de estadísticas con gráficos
+
+    Se abre al instante con marcadores "Cargando...": las consultas corren en
+    un QThreadPool, cada pestaña se construye la primera vez que se visita y
+    se pinta cuando llegan sus datos.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.stats_manager = StatsManager()
-        self.favorites_manager = FavoritesManager()
+        self.favorites_manager = FavoritesManager.get_shared()
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(LOADER_THREADS)
+        self._request_counter = 0
+        self._section_requests = {}  # section -> request_id vigente
+        self._pending_tasks = {}  # section -> StatsSectionTask en curso
+        self._section_data = {}  # section -> datos cargados
+        self._built_tabs = {}  # section -> contenido de la pestaña
+        self._tab_placeholders = {}  # section -> QLabel "Cargando..."
+        self._tab_builders = {
+            'summary': self.create_summary_tab,
+            'usage': self.create_usage_tab,
+            'categories': self.create_categories_tab,
+            'performance': self.create_performance_tab,
+            'health': self.create_health_tab,
+        }
+        self._renderers = {
+            'summary': self.render_summary_data,
+            'usage': self.render_usage_data,
+            'categories': self.render_categories_data,
+            'performance': self.render_performance_data,
+            'health': self.render_health_data,
+        }
+
         self.init_ui()
         self.load_data()
+        # Construir la pestaña visible despues de mostrar el dialog
+        QTimer.singleShot(0, lambda: self._on_tab_changed(self.tabs.currentIndex()))
 
     def init_ui(self):
         """Inicializar UI"""
@@ -55,29 +87,29 @@ class StatsDashboard(QDialog):
         header.setFont(header_font)
         layout.addWidget(header)
 
-        # Tabs principales
+        # Tabs principales (contenido construido en la primera visita)
         self.tabs = QTabWidget()
-
-        # Tab 1: Resumen
-        self.summary_tab = self.create_summary_tab()
-        self.tabs.addTab(self.summary_tab, "📋 Resumen")
-
-        # Tab 2: Uso en el Tiempo
-        self.usage_tab = self.create_usage_tab()
-        self.tabs.addTab(self.usage_tab, "📈 Uso en el Tiempo")
-
-        # Tab 3: Categorías
-        self.categories_tab = self.create_categories_tab()
-        self.tabs.addTab(self.categories_tab, "📁 Por Categoría")
-
-        # Tab 4: Rendimiento
-        self.performance_tab = self.create_performance_tab()
-        self.tabs.addTab(self.performance_tab, "⚡ Rendimiento")
-
-        # Tab 5: Salud del Widget
-        self.health_tab = self.create_health_tab()
-        self.tabs.addTab(self.health_tab, "🏥 Salud del Widget")
-
+        titles = {
+            'summary': "📋 Resumen",
+            'usage': "📈 Uso en el Tiempo",
+            'categories': "📁 Por Categoría",
+            'performance': "⚡ Rendimiento",
+            'health': "🏥 Salud del Widget",
+        }
+        for section in SECTIONS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+
+            placeholder = QLabel("⏳ Cargando datos...")
+            placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            placeholder.setStyleSheet("color: #858585; font-size: 12pt;")
+            page_layout.addWidget(placeholder)
+            self._tab_placeholders[section] = placeholder
+
+            self.tabs.addTab(page, titles[section])
+
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
 
         # Botones
@@ -197,9 +229,8 @@ class StatsDashboard(QDialog):
         layout.addLayout(metrics_layout)
 
         # Top 10 más usados (gráfico de barras horizontal)
-        self.top_items_figure = Figure(figsize=(10, 5), facecolor='#252526')
-        self.top_items_canvas = FigureCanvas(self.top_items_figure)
-        layout.addWidget(self.top_items_canvas)
+        self.top_items_chart = BarChartWidget("Top 10 Items Más Usados", horizontal=True)
+        layout.addWidget(self.top_items_chart)
 
         return widget
 
@@ -221,14 +252,17 @@ class StatsDashboard(QDialog):
         layout.addLayout(period_layout)
 
         # Gráfico de línea: Uso por día
-        self.usage_timeline_figure = Figure(figsize=(10, 4), facecolor='#252526')
-        self.usage_timeline_canvas = FigureCanvas(self.usage_timeline_figure)
-        layout.addWidget(self.usage_timeline_canvas)
+        self.usage_timeline_chart = LineChartWidget()
+        layout.addWidget(self.usage_timeline_chart)
 
         # Gráfico de barras: Uso por hora del día
-        self.usage_by_hour_figure = Figure(figsize=(10, 3), facecolor='#252526')
-        self.usage_by_hour_canvas = FigureCanvas(self.usage_by_hour_figure)
-        layout.addWidget(self.usage_by_hour_canvas)
+        self.usage_by_hour_chart = BarChartWidget("Uso por Hora del Día (Últimos 7 Días)",
+                                                  color='#4EC9B0')
+        layout.addWidget(self.usage_by_hour_chart)
+
+        # Mapa de calor: Uso por día de la semana y hora
+        self.usage_heatmap = HeatmapWidget("Uso por Día y Hora (Últimas 4 Semanas)")
+        layout.addWidget(self.usage_heatmap)
 
         return widget
 
@@ -238,9 +272,8 @@ class StatsDashboard(QDialog):
         layout = QVBoxLayout(widget)
 
         # Gráfico de torta: Uso por categoría
-        self.categories_pie_figure = Figure(figsize=(8, 6), facecolor='#252526')
-        self.categories_pie_canvas = FigureCanvas(self.categories_pie_figure)
-        layout.addWidget(self.categories_pie_canvas)
+        self.categories_pie_chart = PieChartWidget("Uso por Categoría")
+        layout.addWidget(self.categories_pie_chart)
 
         # Tabla con detalle de categorías
         self.categories_table = QTableWidget()
@@ -370,76 +403,119 @@ class StatsDashboard(QDialog):
         return card
 
     def load_data(self):
-        """Cargar todos los datos"""
-        try:
-            logger.info("Loading dashboard data...")
-            self.load_summary_data()
-            self.load_usage_data()
-            self.load_categories_data()
-            self.load_performance_data()
-            self.load_health_data()
+        """Cargar todos los datos en segundo plano (la pestaña visible primero)"""
+        logger.info("Loading dashboard data...")
+        # Descartar consultas en cola de una carga anterior
+        self.thread_pool.clear()
+        current = SECTIONS[max(self.tabs.currentIndex(), 0)]
+        self.load_section(current, priority=1)
+        for section in SECTIONS:
+            if section != current:
+                self.load_section(section)
+
+    def load_section(self, section: str, priority: int = 0):
+        """
+        Cargar una sección en el QThreadPool
+
+        Args:
+            section: One of SECTIONS
+            priority: QThreadPool priority (higher runs first)
+        """
+        self._request_counter += 1
+        request_id = self._request_counter
+        self._section_requests[section] = request_id
+
+        task = StatsSectionTask(self.stats_manager, section, request_id,
+                                days=self._selected_days())
+        task.signals.loaded.connect(self._on_section_loaded)
+        task.signals.failed.connect(self._on_section_failed)
+        self._pending_tasks[section] = task
+        self.thread_pool.start(task, priority)
+
+    def _on_section_loaded(self, section: str, request_id: int, data: dict):
+        """Datos de una sección listos (hilo de la interfaz)"""
+        if self._section_requests.get(section) != request_id:
+            return  # resultado de una carga reemplazada
+        self._pending_tasks.pop(section, None)
+        self._section_data[section] = data
+        if section in self._built_tabs:
+            self._render_section(section)
+        if not self._pending_tasks:
             logger.info("Dashboard data loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading dashboard data: {e}")
-            QMessageBox.critical(self, "Error", f"Error al cargar datos:\n{str(e)}")
 
-    def load_summary_data(self):
-        """Cargar datos del resumen"""
-        try:
-            stats = self.stats_manager.get_dashboard_stats()
+    def _on_section_failed(self, section: str, request_id: int, error: str):
+        if self._section_requests.get(section) != request_id:
+            return
+        self._pending_tasks.pop(section, None)
+        placeholder = self._tab_placeholders[section]
+        placeholder.setText(f"❌ Error al cargar datos:\n{error}")
+        placeholder.show()
+
+    def _on_tab_changed(self, index: int):
+        """Construir la pestaña en su primera visita"""
+        if index < 0:
+            return
+        section = SECTIONS[index]
+        if section in self._built_tabs:
+            return
 
-            # Actualizar cards
-            self.update_metric_card(self.total_executions_card, str(stats.get('total_executions', 0)))
-            self.update_metric_card(self.week_executions_card, str(stats.get('executions_week', 0)))
-            self.update_metric_card(self.today_executions_card, str(stats.get('executions_today', 0)))
-            self.update_metric_card(self.success_rate_card, f"{stats.get('success_rate', 0):.1f}%")
+        content = self._tab_builders[section]()
+        content.setVisible(section in self._section_data)
+        self.tabs.widget(index).layout().addWidget(content)
+        self._built_tabs[section] = content
+        setattr(self, f"{section}_tab", content)
 
-            # Gráfico top 10
-            most_used = self.stats_manager.get_most_used_items(limit=10)
-            self.plot_top_items(most_used)
+        if section in self._section_data:
+            self._render_section(section)
 
+    def _render_section(self, section: str):
+        """Pintar una pestaña construida con sus datos"""
+        try:
+            self._renderers[section](self._section_data[section])
         except Exception as e:
-            logger.error(f"Error loading summary data: {e}")
+            logger.error(f"Error rendering {section} data: {e}")
+        self._tab_placeholders[section].hide()
+        self._built_tabs[section].show()
+
+    def _selected_days(self) -> int:
+        """Días del selector de período (7 si la pestaña no se construyó)"""
+        if not hasattr(self, 'period_combo'):
+            return 7
+        period_text = self.period_combo.currentText()
+        if "7" in period_text:
+            return 7
+        elif "30" in period_text:
+            return 30
+        return 90
+
+    def done(self, result: int):
+        """Descartar las consultas en cola al cerrar"""
+        self.thread_pool.clear()
+        self._section_requests.clear()
+        super().done(result)
+
+    def render_summary_data(self, data: dict):
+        """Pintar datos del resumen"""
+        stats = data['stats']
+
+        # Actualizar cards
+        self.update_metric_card(self.total_executions_card, str(stats.get('total_executions', 0)))
+        self.update_metric_card(self.week_executions_card, str(stats.get('executions_week', 0)))
+        self.update_metric_card(self.today_executions_card, str(stats.get('executions_today', 0)))
+        self.update_metric_card(self.success_rate_card, f"{stats.get('success_rate', 0):.1f}%")
+
+        # Gráfico top 10
+        self.plot_top_items(data['most_used'])
 
     def plot_top_items(self, items: list):
         """Graficar top items"""
-        self.top_items_figure.clear()
-        ax = self.top_items_figure.add_subplot(111)
-
-        if not items:
-            ax.text(0.5, 0.5, 'No hay datos disponibles',
-                   ha='center', va='center', fontsize=14, color='#858585')
-            self.top_items_canvas.draw()
-            return
-
         labels = []
         values = []
         for item in items:
             badge = item.get('badge', '')
-            label = f"{badge} {item['label']}" if badge else item['label']
-            # Truncar labels largos
-            if len(label) > 30:
-                label = label[:27] + "..."
-            labels.append(label)
+            labels.append(f"{badge} {item['label']}" if badge else item['label'])
             values.append(item.get('use_count', 0))
-
-        # Crear gráfico de barras horizontal
-        bars = ax.barh(labels, values, color='#007acc', edgecolor='#005a9e')
-        ax.set_xlabel('Cantidad de Usos', color='#cccccc')
-        ax.set_title('Top 10 Items Más Usados', fontsize=14, fontweight='bold', color='#cccccc', pad=15)
-        ax.invert_yaxis()  # Mayor uso arriba
-        ax.tick_params(colors='#cccccc')
-        ax.set_facecolor('#252526')
-
-        # Agregar valores en las barras
-        for bar in bars:
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2,
-                   f' {int(width)}',
-                   ha='left', va='center', color='#cccccc', fontsize=9)
-
-        self.top_items_figure.tight_layout()
-        self.top_items_canvas.draw()
+        self.top_items_chart.set_data(labels, values)
 
     def update_metric_card(self, card: QFrame, value: str):
         """Actualizar valor de card"""
@@ -447,130 +523,60 @@ class StatsDashboard(QDialog):
         if value_label:
             value_label.setText(value)
 
-    def load_usage_data(self):
-        """Cargar datos de uso en el tiempo"""
-        try:
-            # Obtener días según selector
-            period_text = self.period_combo.currentText()
-            if "7" in period_text:
-                days = 7
-            elif "30" in period_text:
-                days = 30
-            else:
-                days = 90
-
-            # Uso por día
-            usage_by_day = self.stats_manager.get_usage_by_day(days=days)
-            self.plot_usage_timeline(usage_by_day, days)
-
-            # Uso por hora
-            usage_by_hour = self.stats_manager.get_usage_by_hour(days=7)
-            self.plot_usage_by_hour(usage_by_hour)
-
-        except Exception as e:
-            logger.error(f"Error loading usage data: {e}")
+    def render_usage_data(self, data: dict):
+        """Pintar datos de uso en el tiempo"""
+        self.plot_usage_timeline(data['by_day'], data['days'])
+        self.plot_usage_by_hour(data['by_hour'])
+        self.plot_usage_heatmap(data['heatmap'])
 
     def plot_usage_timeline(self, data: list, days: int):
-        """Graficar línea de tiempo de uso"""
-        self.usage_timeline_figure.clear()
-        ax = self.usage_timeline_figure.add_subplot(111)
-
+        """Graficar línea de tiempo de uso (días sin uso en 0)"""
+        self.usage_timeline_chart.set_title(f"Uso en los Últimos {days} Días")
         if not data:
-            ax.text(0.5, 0.5, 'No hay datos disponibles',
-                   ha='center', va='center', fontsize=12, color='#858585')
-            self.usage_timeline_canvas.draw()
+            self.usage_timeline_chart.set_data([], [])
             return
 
-        dates = [item['date'] for item in data]
-        counts = [item['count'] for item in data]
-
-        ax.plot(dates, counts, marker='o', color='#007acc', linewidth=2, markersize=6)
-        ax.fill_between(dates, counts, alpha=0.3, color='#007acc')
-        ax.set_xlabel('Fecha', color='#cccccc')
-        ax.set_ylabel('Ejecuciones', color='#cccccc')
-        ax.set_title(f'Uso en los Últimos {days} Días', fontsize=12, fontweight='bold', color='#cccccc')
-        ax.tick_params(colors='#cccccc')
-        ax.set_facecolor('#252526')
-        ax.grid(True, alpha=0.2, color='#3e3e42')
-
-        # Rotar labels de fecha
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-
-        self.usage_timeline_figure.tight_layout()
-        self.usage_timeline_canvas.draw()
+        by_day = {item['day']: item['executions'] for item in data}
+        today = datetime.utcnow().date()
+        dates = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+        self.usage_timeline_chart.set_data(
+            [date.strftime("%d/%m") for date in dates],
+            [by_day.get(date.isoformat(), 0) for date in dates]
+        )
 
     def plot_usage_by_hour(self, data: list):
         """Graficar uso por hora del día"""
-        self.usage_by_hour_figure.clear()
-        ax = self.usage_by_hour_figure.add_subplot(111)
-
         if not data:
-            ax.text(0.5, 0.5, 'No hay datos disponibles',
-                   ha='center', va='center', fontsize=12, color='#858585')
-            self.usage_by_hour_canvas.draw()
+            self.usage_by_hour_chart.set_data([], [])
             return
 
-        hours = [item['hour'] for item in data]
-        counts = [item['count'] for item in data]
-
-        bars = ax.bar(hours, counts, color='#4EC9B0', edgecolor='#3a9b87')
-        ax.set_xlabel('Hora del Día', color='#cccccc')
-        ax.set_ylabel('Ejecuciones', color='#cccccc')
-        ax.set_title('Uso por Hora del Día (Últimos 7 Días)', fontsize=12, fontweight='bold', color='#cccccc')
-        ax.tick_params(colors='#cccccc')
-        ax.set_facecolor('#252526')
-        ax.set_xticks(range(0, 24))
-        ax.grid(True, alpha=0.2, color='#3e3e42', axis='y')
+        by_hour = {int(item['hour']): item['executions'] for item in data}
+        self.usage_by_hour_chart.set_data([str(hour) for hour in range(24)],
+                                          [by_hour.get(hour, 0) for hour in range(24)])
 
-        self.usage_by_hour_figure.tight_layout()
-        self.usage_by_hour_canvas.draw()
+    def plot_usage_heatmap(self, data: list):
+        """Graficar mapa de calor día de la semana x hora"""
+        matrix = [[0] * 24 for _ in WEEKDAY_LABELS]
+        for item in data:
+            # Lunes primero
+            matrix[(item['weekday'] - 1) % 7][item['hour']] = item['executions']
+        self.usage_heatmap.set_data(WEEKDAY_LABELS, [str(hour) for hour in range(24)], matrix)
 
     def update_usage_chart(self):
         """Actualizar gráfico de uso al cambiar período"""
-        self.load_usage_data()
+        self.load_section('usage', priority=1)
 
-    def load_categories_data(self):
-        """Cargar datos de categorías"""
-        try:
-            usage_by_category = self.stats_manager.get_usage_by_category()
-            self.plot_categories_pie(usage_by_category)
-            self.populate_categories_table(usage_by_category)
-
-        except Exception as e:
-            logger.error(f"Error loading categories data: {e}")
+    def render_categories_data(self, data: dict):
+        """Pintar datos de categorías"""
+        self.plot_categories_pie(data['by_category'])
+        self.populate_categories_table(data['by_category'])
 
     def plot_categories_pie(self, data: list):
         """Graficar torta de categorías"""
-        self.categories_pie_figure.clear()
-        ax = self.categories_pie_figure.add_subplot(111)
-
-        if not data or len(data) == 0:
-            ax.text(0.5, 0.5, 'No hay datos disponibles',
-                   ha='center', va='center', fontsize=12, color='#858585')
-            self.categories_pie_canvas.draw()
-            return
-
-        labels = [item['category_name'] for item in data]
-        sizes = [item['total_uses'] for item in data]
-
-        # Colores
-        colors = ['#007acc', '#4EC9B0', '#cc7a00', '#c42b1c', '#00897b',
-                 '#9e5e00', '#0e639c', '#F39C12', '#8e44ad', '#27ae60']
-
-        wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                          startangle=90, colors=colors[:len(labels)],
-                                          textprops={'color': '#cccccc'})
-
-        # Mejorar texto
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-
-        ax.set_title('Uso por Categoría', fontsize=12, fontweight='bold', color='#cccccc', pad=15)
-        ax.set_facecolor('#252526')
-
-        self.categories_pie_figure.tight_layout()
-        self.categories_pie_canvas.draw()
+        # Categorias sin usos no aparecen en la torta
+        data = [item for item in data if item['total_uses']]
+        self.categories_pie_chart.set_data([item['category'] for item in data],
+                                           [item['total_uses'] for item in data])
 
     def populate_categories_table(self, data: list):
         """Poblar tabla de categorías"""
@@ -579,37 +585,28 @@ class StatsDashboard(QDialog):
         if not data:
             return
 
-        total_uses = sum(item['total_uses'] for item in data)
+        total_uses = sum(item['total_uses'] or 0 for item in data)
 
         for row, item in enumerate(data):
             self.categories_table.insertRow(row)
 
             # Categoría
-            self.categories_table.setItem(row, 0, QTableWidgetItem(item['category_name']))
+            self.categories_table.setItem(row, 0, QTableWidgetItem(item['category']))
 
             # Items
             self.categories_table.setItem(row, 1, QTableWidgetItem(str(item['item_count'])))
 
             # Ejecuciones
-            self.categories_table.setItem(row, 2, QTableWidgetItem(str(item['total_uses'])))
+            self.categories_table.setItem(row, 2, QTableWidgetItem(str(item['total_uses'] or 0)))
 
             # Porcentaje
-            percentage = (item['total_uses'] / total_uses * 100) if total_uses > 0 else 0
+            percentage = ((item['total_uses'] or 0) / total_uses * 100) if total_uses > 0 else 0
             self.categories_table.setItem(row, 3, QTableWidgetItem(f"{percentage:.1f}%"))
 
-    def load_performance_data(self):
-        """Cargar datos de rendimiento"""
-        try:
-            # Items lentos
-            slow_items = self.stats_manager.get_slowest_items(limit=10, min_executions=5)
-            self.populate_slow_items_table(slow_items)
-
-            # Items con errores
-            failing_items = self.stats_manager.get_most_failing_items(limit=10, min_executions=5)
-            self.populate_error_items_table(failing_items)
-
-        except Exception as e:
-            logger.error(f"Error loading performance data: {e}")
+    def render_performance_data(self, data: dict):
+        """Pintar datos de rendimiento"""
+        self.populate_slow_items_table(data['slow_items'])
+        self.populate_error_items_table(data['failing_items'])
 
     def populate_slow_items_table(self, items: list):
         """Poblar tabla de items lentos"""
@@ -652,14 +649,9 @@ class StatsDashboard(QDialog):
             error_rate = item.get('error_rate', 0)
             self.error_items_table.setItem(row, 3, QTableWidgetItem(f"{error_rate:.1f}%"))
 
-    def load_health_data(self):
-        """Cargar datos de salud"""
-        try:
-            health_report = self.stats_manager.get_health_report()
-            self.display_health_report(health_report)
-
-        except Exception as e:
-            logger.error(f"Error loading health data: {e}")
+    def render_health_data(self, data: dict):
+        """Pintar datos de salud"""
+        self.display_health_report(data['report'])
 
     def display_health_report(self, report: dict):
         """Mostrar reporte de salud"""
@@ -722,8 +714,8 @@ class StatsDashboard(QDialog):
     def optimize_database(self):
         """Optimizar base de datos"""
         try:
-            import sqlite3
-            conn = sqlite3.connect("widget_sidebar.db")
+            from database.connection_pool import ConnectionPool
+            conn = ConnectionPool.get_shared("widget_sidebar.db").acquire()
             cursor = conn.cursor()
 
             # VACUUM para optimizar
@@ -0,0 +1,95 @@
+"""
+Stats Loader
+Consultas del StatsDashboard fuera del hilo de la interfaz
+
+Cada seccion del dashboard (resumen, uso, categorias, rendimiento, salud) se
+carga en un QRunnable del QThreadPool del dialog; el resultado llega por
+señal al hilo de la interfaz para que el dashboard pinte esa pestaña en
+cuanto tiene sus datos.
+"""
+
+from typing import Dict
+import logging
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+# Secciones del dashboard (una por pestaña, en orden)
+SECTIONS = ('summary', 'usage', 'categories', 'performance', 'health')
+
+
+def load_section(stats_manager, section: str, days: int = 7) -> Dict:
+    """
+    Run the queries of one dashboard section
+
+    Args:
+        stats_manager: StatsManager instance
+        section: One of SECTIONS
+        days: Period of the usage timeline (only 'usage')
+
+    Returns:
+        Dict: Data the dashboard renders for the section
+    """
+    if section == 'summary':
+        return {
+            'stats': stats_manager.get_dashboard_stats(),
+            'most_used': stats_manager.get_most_used_items(limit=10),
+        }
+    if section == 'usage':
+        return {
+            'days': days,
+            'by_day': stats_manager.get_usage_by_day(days=days),
+            'by_hour': stats_manager.get_usage_by_hour(days=7),
+            'heatmap': stats_manager.get_usage_heatmap(days=28),
+        }
+    if section == 'categories':
+        return {'by_category': stats_manager.get_usage_by_category()}
+    if section == 'performance':
+        return {
+            'slow_items': stats_manager.get_slowest_items(limit=10, min_executions=5),
+            'failing_items': stats_manager.get_most_failing_items(limit=10, min_executions=5),
+        }
+    if section == 'health':
+        return {'report': stats_manager.get_health_report()}
+    raise ValueError(f"Unknown stats section: {section}")
+
+
+class StatsLoadSignals(QObject):
+    """Señales de un StatsSectionTask (QRunnable no es QObject)"""
+
+    # (section, request_id, data)
+    loaded = pyqtSignal(str, int, object)
+    # (section, request_id, error message)
+    failed = pyqtSignal(str, int, str)
+
+
+class StatsSectionTask(QRunnable):
+    """Carga una seccion del dashboard en el QThreadPool"""
+
+    def __init__(self, stats_manager, section: str, request_id: int, days: int = 7):
+        """
+        Initialize the task
+
+        Args:
+            stats_manager: StatsManager instance
+            section: One of SECTIONS
+            request_id: Id echoed back so stale results can be ignored
+            days: Period of the usage timeline (only 'usage')
+        """
+        super().__init__()
+        self.stats_manager = stats_manager
+        self.section = section
+        self.request_id = request_id
+        self.days = days
+        self.signals = StatsLoadSignals()
+
+    def run(self):
+        """Run the queries (worker thread)"""
+        try:
+            data = load_section(self.stats_manager, self.section, days=self.days)
+        except Exception as e:
+            logger.error(f"Error loading stats section '{self.section}': {e}")
+            self.signals.failed.emit(self.section, self.request_id, str(e))
+            return
+        self.signals.loaded.emit(self.section, self.request_id, data)
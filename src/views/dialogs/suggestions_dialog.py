@@ -25,7 +25,7 @@ class FavoriteSuggestionsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.stats_manager = StatsManager()
-        self.favorites_manager = FavoritesManager()
+        self.favorites_manager = FavoritesManager.get_shared()
         self.init_ui()
         self.load_suggestions()
 
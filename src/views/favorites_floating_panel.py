@@ -29,7 +29,7 @@ class FavoritesFloatingPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.favorites_manager = FavoritesManager()
+        self.favorites_manager = FavoritesManager.get_shared()
         self.theme = get_theme()  # Tema futurista
         self.animation_system = AnimationSystem()  # Sistema de animaciones
 
@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.category import Category
 from models.item import Item
-from views.widgets.item_widget import ItemButton
+from views.widgets.item_list_view import ItemListView
 from views.widgets.list_widget import ListWidget
 from views.widgets.search_bar import SearchBar
 from views.advanced_filters_window import AdvancedFiltersWindow
@@ -47,17 +47,22 @@ class FloatingPanel(QWidget):
         self.current_category = None
         self.config_manager = config_manager
         self.list_controller = list_controller  # Controlador de listas
-        self.search_engine = SearchEngine()
+        # El índice de búsqueda sigue los cambios de items de la base de datos
+        db = getattr(config_manager, 'db', None)
+        self.search_engine = SearchEngine(change_bus=getattr(db, 'changes', None))
         self.filter_engine = AdvancedFilterEngine()  # Motor de filtrado avanzado
         self.all_items = []  # Store all items before filtering
         self.all_lists = []  # Store all lists before filtering
+        self._lists_count = 0  # Lists currently displayed
         self.current_filters = {}  # Filtros activos actuales
         self.current_state_filter = "normal"  # Filtro de estado actual: normal, archived, inactive, all
+        self.fuzzy_search = False  # Búsqueda difusa (tolerante a errores)
         self.is_pinned = False  # Estado de anclaje del panel
         self.is_minimized = False  # Estado de minimizado (solo para paneles anclados)
         self.normal_height = None  # Altura normal antes de minimizar
         self.normal_width = None  # Ancho normal antes de minimizar
         self.normal_position = None  # Posición normal antes de minimizar
+        self._content_pending = False  # Items sin cargar todavía (panel restaurado minimizado/fuera de pantalla)
 
         # Panel persistence attributes
         self.panel_id = panel_id  # ID del panel en la base de datos (None si no está guardado)
@@ -360,7 +365,56 @@ class FloatingPanel(QWidget):
         self.search_bar.search_changed.connect(self.on_search_changed)
         main_layout.addWidget(self.search_bar)
 
-        # Scroll area for items
+        # Content area: items section (virtualized list) + lists section
+        self.content_widget = QWidget()
+        self.content_widget.setStyleSheet(f"""
+            QWidget {{
+                background-color: {self.theme.get_color('background_deep')};
+                border-radius: 0 0 10px 10px;
+            }}
+        """)
+        content_layout = QVBoxLayout(self.content_widget)
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(0)
+
+        section_header_style = """
+            QLabel {
+                color: #888888;
+                font-size: 10pt;
+                font-weight: bold;
+                padding: 8px;
+                background-color: transparent;
+            }
+        """
+
+        # Items section header
+        self.items_header = QLabel()
+        self.items_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.items_header.setStyleSheet(section_header_style)
+        self.items_header.hide()
+        content_layout.addWidget(self.items_header)
+
+        # Virtualized item list (only visible rows are painted)
+        self.item_list = ItemListView()
+        self.item_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.item_list.setStyleSheet(f"""
+            QListView {{
+                border: none;
+                background-color: transparent;
+            }}
+            {self.theme.get_scrollbar_style()}
+        """)
+        self.item_list.item_clicked.connect(self.on_item_clicked)
+        content_layout.addWidget(self.item_list, 3)
+
+        # Lists section header
+        self.lists_header = QLabel()
+        self.lists_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.lists_header.setStyleSheet(section_header_style)
+        self.lists_header.hide()
+        content_layout.addWidget(self.lists_header)
+
+        # Scroll area for lists
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -374,7 +428,7 @@ class FloatingPanel(QWidget):
             {self.theme.get_scrollbar_style()}
         """)
 
-        # Container for items
+        # Container for lists
         self.items_container = QWidget()
         self.items_layout = QVBoxLayout(self.items_container)
         self.items_layout.setContentsMargins(0, 0, 0, 0)
@@ -382,7 +436,10 @@ class FloatingPanel(QWidget):
         self.items_layout.addStretch()
 
         self.scroll_area.setWidget(self.items_container)
-        main_layout.addWidget(self.scroll_area)
+        self.scroll_area.hide()
+        content_layout.addWidget(self.scroll_area, 2)
+
+        main_layout.addWidget(self.content_widget)
 
         # Aplicar efectos visuales futuristas
         # Partículas flotantes (muy sutiles)
@@ -415,9 +472,77 @@ class FloatingPanel(QWidget):
         logger.info(f"Loading category: {category.name} with {len(category.items)} items")
 
         self.current_category = category
+        self._content_pending = False
+        self._load_category_data(category)
+
+        # Update header
+        self.header_label.setText(category.name)
+        logger.debug(f"Header updated to: {category.name}")
+
+        # Clear search bar
+        self.search_bar.clear_search()
+
+        # Display items and lists
+        self.display_items_and_lists(self.all_items, self.all_lists)
+
+        # Show the window
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def restore_category(self, category: Category, filter_config: dict = None,
+                         materialize: bool = True):
+        """Set up a restored pinned panel with its category and saved filters
+
+        The filters are applied to the panel state right away (so saving the
+        panel keeps them), but items and lists are only loaded and rendered
+        once, by ensure_content(). With materialize=False only the frame is
+        built until the panel is first expanded or moved on screen.
+
+        Args:
+            category: Category of the panel
+            filter_config: Saved filter configuration (optional)
+            materialize: Load the items now
+        """
+        self.current_category = category
+        self.header_label.setText(category.name)
+        if filter_config:
+            self._set_filter_state(filter_config)
+
+        self._content_pending = True
+        if materialize:
+            self.ensure_content()
+
+    def ensure_content(self):
+        """Load and render the items of a restored panel if still pending"""
+        if not self._content_pending or not self.current_category:
+            return
+        self._content_pending = False
+
+        logger.info(f"Materializing panel content: {self.current_category.name}")
+        self._load_category_data(self.current_category)
+
+        if self.current_filters or self.current_state_filter != "normal" or self.search_bar.search_input.text():
+            # Render once, already filtered
+            self.item_list.set_items(self.all_items)
+            self.on_search_changed(self.search_bar.search_input.text())
+        else:
+            self.display_items_and_lists(self.all_items, self.all_lists)
+
+    def is_on_screen(self) -> bool:
+        """Whether the center of the panel is on some screen"""
+        from PyQt6.QtWidgets import QApplication
+        return QApplication.screenAt(self.frameGeometry().center()) is not None
+
+    def _load_category_data(self, category: Category):
+        """Load items, lists and filter tags of a category (without rendering)"""
+        # Modo de búsqueda (exacta o difusa)
+        if self.config_manager:
+            self.fuzzy_search = bool(self.config_manager.get_setting('fuzzy_search', False))
 
         # Separar items normales de items de listas
         self.all_items = [item for item in category.items if not item.is_list_item()]
+        self.search_engine.set_items(self.all_items)
 
         # Obtener listas si tenemos ListController
         self.all_lists = []
@@ -428,145 +553,105 @@ class FloatingPanel(QWidget):
             except Exception as e:
                 logger.error(f"Error loading lists: {e}", exc_info=True)
 
-        # Update header
-        self.header_label.setText(category.name)
-        logger.debug(f"Header updated to: {category.name}")
-
         # Update available tags in filters window (Fase 4)
         self.filters_window.update_available_tags(self.all_items)
         logger.debug(f"Updated available tags from {len(self.all_items)} items")
 
-        # Clear search bar
-        self.search_bar.clear_search()
-
-        # Clear existing items
-        self.clear_items()
-        logger.debug("Previous items and lists cleared")
-
-        # Display items and lists
-        self.display_items_and_lists(self.all_items, self.all_lists)
-
         # Enable "Nueva Lista" button if we have a list controller
-        if self.list_controller and hasattr(category, 'id'):
-            self.new_list_button.setEnabled(True)
-        else:
-            self.new_list_button.setEnabled(False)
-
-        # Show the window
-        self.show()
-        self.raise_()
-        self.activateWindow()
+        self.new_list_button.setEnabled(bool(self.list_controller and hasattr(category, 'id')))
 
     def display_items(self, items):
         """Display a list of items (mantiene compatibilidad hacia atrás)"""
-        logger.info(f"Displaying {len(items)} items")
-
-        # Clear existing items
-        self.clear_items()
-
-        # Add items
-        for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
-            item_button = ItemButton(item)
-            item_button.item_clicked.connect(self.on_item_clicked)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
-
-        logger.info(f"Successfully added {len(items)} item buttons to layout")
+        self.display_items_and_lists(items, [])
 
     def display_items_and_lists(self, items, lists):
         """Display items and lists in separate sections
 
+        Loads the items into the list model (no widget per item); searches
+        and filters then only narrow it down through filter_items_and_lists().
+
         Args:
             items: List of Item objects (solo items normales, no items de listas)
             lists: List of list metadata dicts from ListController.get_lists()
         """
         logger.info(f"Displaying {len(items)} items and {len(lists)} lists")
 
-        # Clear existing content
-        self.clear_items()
+        self.item_list.set_items(items)
+        self.display_lists(lists)
+        self._update_sections()
 
-        # === SECCIÓN DE ITEMS ===
-        if items:
-            # Section header
-            items_header = QLabel(f"━━━ Items ({len(items)}) ━━━")
-            items_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            items_header.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10pt;
-                    font-weight: bold;
-                    padding: 8px;
-                    background-color: transparent;
-                }
-            """)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, items_header)
-
-            # Add items
-            for idx, item in enumerate(items):
-                logger.debug(f"Creating item button {idx+1}/{len(items)}: {item.label}")
-                item_button = ItemButton(item)
-                item_button.item_clicked.connect(self.on_item_clicked)
-                self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
+    def filter_items_and_lists(self, items, lists):
+        """Show only these items (in this order) and lists
 
-        # === SECCIÓN DE LISTAS ===
-        if lists:
-            # Spacer entre secciones
-            if items:
-                spacer_label = QLabel("")
-                spacer_label.setFixedHeight(10)
-                spacer_label.setStyleSheet("background-color: transparent;")
-                self.items_layout.insertWidget(self.items_layout.count() - 1, spacer_label)
-
-            # Section header
-            lists_header = QLabel(f"━━━ Listas ({len(lists)}) ━━━")
-            lists_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            lists_header.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 10pt;
-                    font-weight: bold;
-                    padding: 8px;
-                    background-color: transparent;
-                }
-            """)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, lists_header)
-
-            # Add lists
-            for idx, list_data in enumerate(lists):
-                logger.debug(f"Creating list widget {idx+1}/{len(lists)}: {list_data.get('list_group')}")
-
-                # Obtener items de la lista
-                list_items = []
-                if self.list_controller and hasattr(self.current_category, 'id'):
-                    list_items = self.list_controller.get_list_items(
-                        self.current_category.id,
-                        list_data.get('list_group')
-                    )
-
-                # Crear ListWidget
-                list_widget = ListWidget(
-                    list_data=list_data,
-                    category_id=int(self.current_category.id) if hasattr(self.current_category, 'id') and self.current_category.id else None,
-                    list_items=list_items
+        Args:
+            items: Visible items, subset of the loaded ones (search ranking order)
+            lists: Visible list metadata dicts
+        """
+        self.item_list.filter_items(items)
+        self.display_lists(lists)
+        self._update_sections()
+
+    def display_lists(self, lists):
+        """Display the lists section (one ListWidget per list)"""
+        self.clear_lists()
+
+        for idx, list_data in enumerate(lists):
+            logger.debug(f"Creating list widget {idx+1}/{len(lists)}: {list_data.get('list_group')}")
+
+            # Obtener items de la lista
+            list_items = []
+            if self.list_controller and hasattr(self.current_category, 'id'):
+                list_items = self.list_controller.get_list_items(
+                    self.current_category.id,
+                    list_data.get('list_group')
                 )
 
-                # Conectar señales
-                list_widget.list_executed.connect(self.on_list_executed)
-                list_widget.list_edited.connect(self.on_list_edit_requested)
-                list_widget.list_deleted.connect(self.on_list_delete_requested)
-                list_widget.copy_all_requested.connect(self.on_list_copy_all_requested)
-                list_widget.item_copied.connect(self.on_list_item_copied)
+            # Crear ListWidget
+            list_widget = ListWidget(
+                list_data=list_data,
+                category_id=int(self.current_category.id) if hasattr(self.current_category, 'id') and self.current_category.id else None,
+                list_items=list_items
+            )
 
-                self.items_layout.insertWidget(self.items_layout.count() - 1, list_widget)
+            # Conectar señales
+            list_widget.list_executed.connect(self.on_list_executed)
+            list_widget.list_edited.connect(self.on_list_edit_requested)
+            list_widget.list_deleted.connect(self.on_list_delete_requested)
+            list_widget.copy_all_requested.connect(self.on_list_copy_all_requested)
+            list_widget.item_copied.connect(self.on_list_item_copied)
 
-        logger.info(f"Successfully displayed {len(items)} items and {len(lists)} lists")
+            self.items_layout.insertWidget(self.items_layout.count() - 1, list_widget)
+
+        self._lists_count = len(lists)
+
+    def _update_sections(self):
+        """Update section headers and visibility"""
+        items_count = self.item_list.visible_count()
+        lists_count = self._lists_count
+
+        # === SECCIÓN DE ITEMS ===
+        self.items_header.setText(f"━━━ Items ({items_count}) ━━━")
+        self.items_header.setVisible(items_count > 0)
+        self.item_list.setVisible(items_count > 0)
+
+        # === SECCIÓN DE LISTAS ===
+        self.lists_header.setText(f"━━━ Listas ({lists_count}) ━━━")
+        self.lists_header.setVisible(lists_count > 0)
+        self.scroll_area.setVisible(lists_count > 0)
 
     def clear_items(self):
-        """Clear all item buttons"""
+        """Clear all items and lists"""
+        self.item_list.set_items([])
+        self.clear_lists()
+        self._update_sections()
+
+    def clear_lists(self):
+        """Clear all list widgets"""
         while self.items_layout.count() > 1:  # Keep the stretch at the end
             item = self.items_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._lists_count = 0
 
     def on_item_clicked(self, item: Item):
         """Handle item click"""
@@ -764,29 +849,29 @@ class FloatingPanel(QWidget):
             return
 
         try:
-            # Obtener items actualizados desde DB
             if hasattr(self.current_category, 'id'):
                 category_id = int(self.current_category.id)
 
-                # Obtener items desde config_manager
-                if hasattr(self.config_manager, 'db'):
-                    all_items_from_db = self.config_manager.db.get_items_by_category(category_id)
+                # Categoria actualizada (cache compartida, al dia con los cambios);
+                # no se modifican los items del objeto cacheado
+                category = self.config_manager.get_category(category_id)
+                if not category:
+                    logger.warning(f"Cannot reload: category {category_id} not found")
+                    return
+                self.current_category = category
 
-                    # Actualizar items en la categoría
-                    from models.item import Item
-                    self.current_category.items = [Item.from_dict(item_dict) for item_dict in all_items_from_db]
+                # Separar items normales
+                self.all_items = [item for item in category.items if not item.is_list_item()]
+                self.search_engine.set_items(self.all_items)
 
-                    # Separar items normales
-                    self.all_items = [item for item in self.current_category.items if not item.is_list_item()]
+                # Recargar listas
+                if self.list_controller:
+                    self.all_lists = self.list_controller.get_lists(category_id)
 
-                    # Recargar listas
-                    if self.list_controller:
-                        self.all_lists = self.list_controller.get_lists(category_id)
+                # Re-renderizar
+                self.display_items_and_lists(self.all_items, self.all_lists)
 
-                    # Re-renderizar
-                    self.display_items_and_lists(self.all_items, self.all_lists)
-
-                    logger.info(f"Category reloaded successfully: {len(self.all_items)} items, {len(self.all_lists)} lists")
+                logger.info(f"Category reloaded successfully: {len(self.all_items)} items, {len(self.all_lists)} lists")
 
         except Exception as e:
             logger.error(f"Error reloading category: {e}", exc_info=True)
@@ -796,28 +881,30 @@ class FloatingPanel(QWidget):
         if not self.current_category:
             return
 
-        # Aplicar filtros avanzados primero a items
-        filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
+        has_query = bool(query and query.strip())
+
+        if has_query and not self.fuzzy_search and not self.current_filters:
+            # Sin filtros avanzados: los resultados salen de los postings del índice
+            # (el filtro de estado es por item, solo se aplica a las coincidencias)
+            filtered_items = self.filter_items_by_state(self.search_engine.search_items(query))
+        else:
+            # Aplicar filtros avanzados primero a items
+            filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
+
+            # Aplicar filtro de estado (is_active, is_archived)
+            filtered_items = self.filter_items_by_state(filtered_items)
 
-        # Aplicar filtro de estado (is_active, is_archived)
-        filtered_items = self.filter_items_by_state(filtered_items)
+            # Buscar entre los items filtrados (ordenar/top N van antes de buscar)
+            if has_query:
+                filtered_items = self.search_engine.search_subset(
+                    query, filtered_items, fuzzy=self.fuzzy_search
+                )
 
         # Filtrar listas (por ahora solo por nombre)
         filtered_lists = self.all_lists.copy()
 
         # Luego aplicar búsqueda si hay query
-        if query and query.strip():
-            # Buscar en items
-            from models.category import Category
-            temp_category = Category(
-                category_id="temp",
-                name="temp",
-                icon=""
-            )
-            # Asignar items después de crear la categoría
-            temp_category.items = filtered_items
-            filtered_items = self.search_engine.search_in_category(query, temp_category)
-
+        if has_query:
             # Buscar en nombres de listas
             query_lower = query.lower()
             filtered_lists = [
@@ -825,7 +912,7 @@ class FloatingPanel(QWidget):
                 if query_lower in list_data.get('list_group', '').lower()
             ]
 
-        self.display_items_and_lists(filtered_items, filtered_lists)
+        self.filter_items_and_lists(filtered_items, filtered_lists)
 
     def on_filters_changed(self, filters: dict):
         """Handle cuando cambian los filtros avanzados"""
@@ -906,38 +993,7 @@ class FloatingPanel(QWidget):
 
         try:
             logger.info(f"Applying filter configuration: {filter_config}")
-
-            # Apply advanced filters
-            if 'advanced_filters' in filter_config:
-                self.current_filters = filter_config['advanced_filters']
-                logger.debug(f"Applied advanced filters: {self.current_filters}")
-
-            # Apply state filter and update combo box
-            if 'state_filter' in filter_config:
-                state_filter = filter_config['state_filter']
-                self.current_state_filter = state_filter
-
-                # Update combo box to match (without triggering signal)
-                state_index_map = {
-                    'normal': 0,
-                    'archived': 1,
-                    'inactive': 2,
-                    'all': 3
-                }
-                if state_filter in state_index_map:
-                    self.state_filter_combo.blockSignals(True)
-                    self.state_filter_combo.setCurrentIndex(state_index_map[state_filter])
-                    self.state_filter_combo.blockSignals(False)
-                    logger.debug(f"Applied state filter: {state_filter}")
-
-            # Apply search text and update search bar
-            if 'search_text' in filter_config:
-                search_text = filter_config['search_text']
-                if search_text:
-                    self.search_bar.search_input.blockSignals(True)
-                    self.search_bar.search_input.setText(search_text)
-                    self.search_bar.search_input.blockSignals(False)
-                    logger.debug(f"Applied search text: {search_text}")
+            self._set_filter_state(filter_config)
 
             # Trigger filter application
             current_query = self.search_bar.search_input.text()
@@ -947,6 +1003,40 @@ class FloatingPanel(QWidget):
         except Exception as e:
             logger.error(f"Error applying filter config: {e}", exc_info=True)
 
+    def _set_filter_state(self, filter_config: dict):
+        """Set filters, state combo and search text from a saved configuration (no re-render)"""
+        # Apply advanced filters
+        if 'advanced_filters' in filter_config:
+            self.current_filters = filter_config['advanced_filters']
+            logger.debug(f"Applied advanced filters: {self.current_filters}")
+
+        # Apply state filter and update combo box
+        if 'state_filter' in filter_config:
+            state_filter = filter_config['state_filter']
+            self.current_state_filter = state_filter
+
+            # Update combo box to match (without triggering signal)
+            state_index_map = {
+                'normal': 0,
+                'archived': 1,
+                'inactive': 2,
+                'all': 3
+            }
+            if state_filter in state_index_map:
+                self.state_filter_combo.blockSignals(True)
+                self.state_filter_combo.setCurrentIndex(state_index_map[state_filter])
+                self.state_filter_combo.blockSignals(False)
+                logger.debug(f"Applied state filter: {state_filter}")
+
+        # Apply search text and update search bar
+        if 'search_text' in filter_config:
+            search_text = filter_config['search_text']
+            if search_text:
+                self.search_bar.search_input.blockSignals(True)
+                self.search_bar.search_input.setText(search_text)
+                self.search_bar.search_input.blockSignals(False)
+                logger.debug(f"Applied search text: {search_text}")
+
     def position_near_sidebar(self, sidebar_window):
         """Position the floating panel near the sidebar window"""
         # Get sidebar window geometry
@@ -1119,7 +1209,7 @@ class FloatingPanel(QWidget):
             # Hide content widgets
             self.filters_button_widget.setVisible(False)
             self.search_bar.setVisible(False)
-            self.scroll_area.setVisible(False)
+            self.content_widget.setVisible(False)
 
             # Reduce header margins for compact look
             self.header_layout.setContentsMargins(8, 3, 5, 3)
@@ -1149,10 +1239,13 @@ class FloatingPanel(QWidget):
             self.minimize_button.setToolTip("Maximizar panel")
             logger.info(f"Panel '{self.header_label.text()}' MINIMIZADO")
         else:
+            # Restored minimized: the items are loaded on first expand
+            self.ensure_content()
+
             # Restore content widgets
             self.filters_button_widget.setVisible(True)
             self.search_bar.setVisible(True)
-            self.scroll_area.setVisible(True)
+            self.content_widget.setVisible(True)
 
             # Restore header margins
             self.header_layout.setContentsMargins(15, 10, 10, 10)
@@ -1255,6 +1348,10 @@ class FloatingPanel(QWidget):
         """AUTO-UPDATE: Handle window move event - save position to database (debounced)"""
         super().moveEvent(event)
 
+        # Restored off-screen: the items are loaded once it is moved on screen
+        if self._content_pending and self.isVisible() and not self.is_minimized and self.is_on_screen():
+            self.ensure_content()
+
         # Only save if this is a pinned panel with a panel_id
         if self.is_pinned and self.panel_id and self.config_manager:
             # Restart the debounce timer
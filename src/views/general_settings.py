@@ -80,6 +80,12 @@ class GeneralSettings(QWidget):
         self.always_on_top_check.stateChanged.connect(self.settings_changed)
         behavior_layout.addWidget(self.always_on_top_check)
 
+        # Fuzzy search checkbox
+        self.fuzzy_search_check = QCheckBox("Búsqueda difusa (tolera errores de escritura)")
+        self.fuzzy_search_check.setChecked(False)
+        self.fuzzy_search_check.stateChanged.connect(self.settings_changed)
+        behavior_layout.addWidget(self.fuzzy_search_check)
+
         # Start with Windows checkbox
         self.start_windows_check = QCheckBox("Iniciar con Windows (próximamente)")
         self.start_windows_check.setChecked(False)
@@ -215,6 +221,10 @@ class GeneralSettings(QWidget):
         always_on_top = self.config_manager.get_setting("always_on_top", True)
         self.always_on_top_check.setChecked(always_on_top)
 
+        # Load fuzzy search
+        fuzzy_search = self.config_manager.get_setting("fuzzy_search", False)
+        self.fuzzy_search_check.setChecked(fuzzy_search)
+
         # Load start with windows
         start_windows = self.config_manager.get_setting("start_with_windows", False)
         self.start_windows_check.setChecked(start_windows)
@@ -333,6 +343,7 @@ class GeneralSettings(QWidget):
         return {
             "minimize_to_tray": self.minimize_tray_check.isChecked(),
             "always_on_top": self.always_on_top_check.isChecked(),
+            "fuzzy_search": self.fuzzy_search_check.isChecked(),
             "start_with_windows": self.start_windows_check.isChecked(),
             "max_history": self.max_history_spin.value()
         }
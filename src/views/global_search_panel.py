@@ -1,7 +1,7 @@
 """
 Global Search Panel Window - Independent window for searching all items across all categories
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QPushButton
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QEvent
 from PyQt6.QtGui import QFont, QCursor
 import sys
@@ -9,8 +9,8 @@ import logging
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from models.item import Item, ItemType
-from views.widgets.item_widget import ItemButton
+from models.item import Item, ItemType, SensitiveContent
+from views.widgets.item_list_view import ItemListView
 from views.widgets.search_bar import SearchBar
 from views.advanced_filters_window import AdvancedFiltersWindow
 from core.search_engine import SearchEngine
@@ -33,10 +33,12 @@ class GlobalSearchPanel(QWidget):
         super().__init__(parent)
         self.db_manager = db_manager
         self.config_manager = config_manager
-        self.search_engine = SearchEngine()
+        self.search_engine = SearchEngine(change_bus=getattr(db_manager, 'changes', None),
+                                          include_description=True)
         self.filter_engine = AdvancedFilterEngine()  # Motor de filtrado avanzado
         self.all_items = []  # Store all items before filtering
         self.current_filters = {}  # Filtros activos actuales
+        self.fuzzy_search = False  # Búsqueda difusa (tolerante a errores)
 
         # Get panel width from config
         if config_manager:
@@ -215,13 +217,11 @@ class GlobalSearchPanel(QWidget):
         self.search_bar.search_changed.connect(self.on_search_changed)
         main_layout.addWidget(self.search_bar)
 
-        # Scroll area for items
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
+        # Virtualized item list (only visible rows are painted)
+        self.item_list = ItemListView(show_category=True)  # show_category=True for global search
+        self.item_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.item_list.setStyleSheet("""
+            QListView {
                 border: none;
                 background-color: #252525;
                 border-radius: 0 0 6px 6px;
@@ -241,15 +241,8 @@ class GlobalSearchPanel(QWidget):
             }
         """)
 
-        # Container for items
-        self.items_container = QWidget()
-        self.items_layout = QVBoxLayout(self.items_container)
-        self.items_layout.setContentsMargins(0, 0, 0, 0)
-        self.items_layout.setSpacing(0)
-        self.items_layout.addStretch()
-
-        scroll_area.setWidget(self.items_container)
-        main_layout.addWidget(scroll_area)
+        self.item_list.item_clicked.connect(self.on_item_clicked)
+        main_layout.addWidget(self.item_list)
 
     def load_all_items(self):
         """Load and display ALL items from ALL categories"""
@@ -259,8 +252,8 @@ class GlobalSearchPanel(QWidget):
 
         logger.info("Loading all items for global search")
 
-        # Get all items from database
-        items_data = self.db_manager.get_all_items(include_inactive=False)
+        # Get all items from database (sensitive content is decrypted on demand)
+        items_data = self.db_manager.get_all_items(include_inactive=False, decrypt=False)
 
         # Convert dict items to Item objects
         self.all_items = []
@@ -270,10 +263,14 @@ class GlobalSearchPanel(QWidget):
                 type_str = item_dict['type'].lower() if item_dict['type'] else 'text'
                 item_type = ItemType(type_str)
 
+                content = item_dict['content']
+                if item_dict.get('content_encrypted'):
+                    content = SensitiveContent(content, self.db_manager.decrypt_content)
+
                 item = Item(
                     item_id=str(item_dict['id']),
                     label=item_dict['label'],
-                    content=item_dict['content'],
+                    content=content,
                     item_type=item_type,
                     icon=item_dict.get('icon'),
                     is_sensitive=bool(item_dict.get('is_sensitive', False)),
@@ -282,6 +279,11 @@ class GlobalSearchPanel(QWidget):
                     description=item_dict.get('description')
                 )
 
+                # Usage data (search ranking)
+                item.use_count = item_dict.get('use_count') or 0
+                if item_dict.get('last_used'):
+                    item.last_used = item_dict['last_used']
+
                 # Store category info for display
                 item.category_name = item_dict.get('category_name', '')
                 item.category_icon = item_dict.get('category_icon', '')
@@ -293,6 +295,11 @@ class GlobalSearchPanel(QWidget):
                 continue
 
         logger.info(f"Loaded {len(self.all_items)} items from database")
+        self.search_engine.set_items(self.all_items)
+
+        # Modo de búsqueda (exacta por índice FTS o difusa)
+        if self.config_manager:
+            self.fuzzy_search = bool(self.config_manager.get_setting('fuzzy_search', False))
 
         # Update available tags in filters window
         self.filters_window.update_available_tags(self.all_items)
@@ -301,8 +308,8 @@ class GlobalSearchPanel(QWidget):
         # Clear search bar
         self.search_bar.clear_search()
 
-        # Display all items initially
-        self.display_items(self.all_items)
+        # Display all items initially (the model is filled once, searches only filter it)
+        self.item_list.set_items(self.all_items)
 
         # Show the window
         self.show()
@@ -310,27 +317,17 @@ class GlobalSearchPanel(QWidget):
         self.activateWindow()
 
     def display_items(self, items):
-        """Display a list of items"""
+        """Display a list of items (filters the loaded items, in the given order)"""
         logger.info(f"Displaying {len(items)} items")
 
-        # Clear existing items
-        self.clear_items()
-
-        # Add items
-        for idx, item in enumerate(items):
-            logger.debug(f"Creating button {idx+1}/{len(items)}: {item.label}")
-            item_button = ItemButton(item, show_category=True)  # show_category=True for global search
-            item_button.item_clicked.connect(self.on_item_clicked)
-            self.items_layout.insertWidget(self.items_layout.count() - 1, item_button)
-
-        logger.info(f"Successfully added {len(items)} item buttons to layout")
+        if len(items) == len(self.all_items) and items == self.all_items:
+            self.item_list.filter_items(None)
+        else:
+            self.item_list.filter_items(items)
 
     def clear_items(self):
-        """Clear all item buttons"""
-        while self.items_layout.count() > 1:  # Keep the stretch at the end
-            item = self.items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Clear all items"""
+        self.item_list.set_items([])
 
     def on_item_clicked(self, item: Item):
         """Handle item click"""
@@ -343,36 +340,48 @@ class GlobalSearchPanel(QWidget):
         filtered_items = self.filter_engine.apply_filters(self.all_items, self.current_filters)
 
         # Luego aplicar búsqueda si hay query
-        if query and query.strip():
-            # Search in labels, content, and tags
-            search_results = []
-            query_lower = query.lower()
-
-            for item in filtered_items:
-                # Search in label
-                if query_lower in item.label.lower():
-                    search_results.append(item)
-                    continue
-
-                # Search in content (if not sensitive)
-                if not item.is_sensitive and query_lower in item.content.lower():
-                    search_results.append(item)
-                    continue
-
-                # Search in tags
-                if any(query_lower in tag.lower() for tag in item.tags):
-                    search_results.append(item)
-                    continue
-
-                # Search in description
-                if item.description and query_lower in item.description.lower():
-                    search_results.append(item)
-                    continue
-
-            filtered_items = search_results
+        if query and query.strip() and self.fuzzy_search:
+            # Búsqueda difusa: resultados ordenados por puntuación
+            filtered_items = self.search_engine.search_subset(query, filtered_items, fuzzy=True)
+        elif query and query.strip():
+            filtered_items = self.search_items(query, filtered_items)
 
         self.display_items(filtered_items)
 
+    def search_items(self, query: str, items):
+        """
+        Search items by label, content (if not sensitive), tags and description
+
+        The search engine's n-gram index decides which items are found
+        (substring match); the FTS index only ranks them: index hits come
+        first by relevance (BM25), then the remaining matches in their
+        original order. Without the FTS index (no db_manager, SQLite without
+        FTS5 or a query with no indexable terms) the matches keep their
+        original order.
+
+        Args:
+            query: Search text
+            items: Indexed items to search in (all_items or a filtered subset)
+
+        Returns:
+            List[Item]: Matching items
+        """
+        if items is self.all_items:
+            matches = self.search_engine.search_items(query)
+        else:
+            matches = self.search_engine.search_subset(query, items)
+        if (not matches or self.db_manager is None or not self.db_manager.fts_enabled
+                or not self.db_manager.build_fts_query(query)):
+            return matches
+
+        matches_by_id = {item.id: item for item in matches}
+        ranked = [
+            matches_by_id[str(item_id)] for item_id in self.db_manager.search_item_ids(query)
+            if str(item_id) in matches_by_id
+        ]
+        ranked_ids = {item.id for item in ranked}
+        return ranked + [item for item in matches if item.id not in ranked_ids]
+
     def on_filters_changed(self, filters: dict):
         """Handle cuando cambian los filtros avanzados"""
         logger.info(f"Filters changed: {filters}")
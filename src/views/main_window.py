@@ -2,11 +2,12 @@
 Main Window View
 """
 from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QMessageBox, QApplication
-from PyQt6.QtCore import Qt, QPoint, pyqtSignal
+from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal
 from PyQt6.QtGui import QScreen, QShortcut, QKeySequence
 import sys
 import logging
 import traceback
+from collections import deque
 from pathlib import Path
 import ctypes
 from ctypes import wintypes
@@ -14,26 +15,23 @@ from ctypes import wintypes
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from views.sidebar import Sidebar
 from views.floating_panel import FloatingPanel
-from views.global_search_panel import GlobalSearchPanel
-from views.favorites_floating_panel import FavoritesFloatingPanel
-from views.stats_floating_panel import StatsFloatingPanel
-from views.settings_window import SettingsWindow
-from views.pinned_panels_window import PinnedPanelsWindow
-from views.dialogs.popular_items_dialog import PopularItemsDialog
-from views.dialogs.forgotten_items_dialog import ForgottenItemsDialog
-from views.dialogs.suggestions_dialog import FavoriteSuggestionsDialog
-from views.dialogs.stats_dashboard import StatsDashboard
-from views.dialogs.panel_config_dialog import PanelConfigDialog
-from views.category_filter_window import CategoryFilterWindow
 from models.item import Item
 from core.hotkey_manager import HotkeyManager
 from core.tray_manager import TrayManager
 from core.session_manager import SessionManager
 from core.notification_manager import NotificationManager
+from core.usage_tracker import UsageTracker
+from core.timer_scheduler import TimerScheduler
+from styles.effects import set_effects_mode, EFFECTS_FULL
+# Los paneles y dialogos secundarios (estadisticas, ajustes, filtros...) se
+# importan al abrirlos por primera vez para no retrasar el arranque
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Pausa entre paneles anclados restaurados al arrancar (la UI atiende eventos entre medias)
+PANEL_RESTORE_INTERVAL_MS = 30
+
 # ===========================================================================
 # Windows AppBar API Constants and Structures
 # ===========================================================================
@@ -69,6 +67,9 @@ class MainWindow(QMainWindow):
         self.sidebar = None
         self.floating_panel = None  # Panel flotante activo (no anclado) - compatibility
         self.pinned_panels = []  # Lista de paneles anclados
+        self._panels_to_restore = deque()  # Paneles anclados pendientes de restaurar al arrancar
+        self._restored_panel_ids = []  # Restaurados (last_opened se escribe en lote al final)
+        self._panels_to_restore_total = 0
         self.pinned_panels_window = None  # Ventana de gestión de paneles anclados
         self.global_search_panel = None  # Ventana flotante para búsqueda global
         self.favorites_panel = None  # Ventana flotante para favoritos
@@ -93,6 +94,10 @@ class MainWindow(QMainWindow):
         # AppBar state (para reservar espacio en Windows)
         self.appbar_registered = False
 
+        # Modo de efectos visuales antes de crear los widgets que los usan
+        if self.config_manager:
+            set_effects_mode(self.config_manager.get_setting("visual_effects", EFFECTS_FULL))
+
         self.init_ui()
         self.position_window()
         self.register_appbar()  # Registrar como AppBar para reservar espacio
@@ -377,6 +382,7 @@ class MainWindow(QMainWindow):
             if not self.global_search_panel:
                 # Get db_manager from controller's config_manager
                 db_manager = self.config_manager.db if self.config_manager else None
+                from views.global_search_panel import GlobalSearchPanel
                 self.global_search_panel = GlobalSearchPanel(
                     db_manager=db_manager,
                     config_manager=self.config_manager
@@ -421,6 +427,7 @@ class MainWindow(QMainWindow):
 
             # Crear panel si no existe
             if not self.favorites_panel:
+                from views.favorites_floating_panel import FavoritesFloatingPanel
                 self.favorites_panel = FavoritesFloatingPanel()
                 self.favorites_panel.favorite_executed.connect(self.on_favorite_executed)
                 self.favorites_panel.window_closed.connect(self.on_favorites_panel_closed)
@@ -477,6 +484,7 @@ class MainWindow(QMainWindow):
 
             # Crear panel si no existe
             if not self.stats_panel:
+                from views.stats_floating_panel import StatsFloatingPanel
                 self.stats_panel = StatsFloatingPanel()
                 self.stats_panel.window_closed.connect(self.on_stats_panel_closed)
                 logger.debug("Stats panel created")
@@ -583,6 +591,7 @@ class MainWindow(QMainWindow):
 
             # Crear ventana si no existe
             if not self.category_filter_window:
+                from views.category_filter_window import CategoryFilterWindow
                 self.category_filter_window = CategoryFilterWindow(self)
                 self.category_filter_window.filters_changed.connect(self.on_category_filters_changed)
                 self.category_filter_window.filters_cleared.connect(self.on_category_filters_cleared)
@@ -803,9 +812,14 @@ class MainWindow(QMainWindow):
 
     def show_window(self):
         """Show the window"""
+        # Reanudar animaciones y sondeos retenidos mientras estaba en la bandeja
+        TimerScheduler.get_shared().resume()
         self.show()
         self.activateWindow()
         self.raise_()
+        self.is_visible = True
+        if self.tray_manager:
+            self.tray_manager.update_window_state(True)
 
     def minimize_window(self):
         """Toggle minimize/maximize sidebar height"""
@@ -853,6 +867,8 @@ class MainWindow(QMainWindow):
         """Hide the window"""
         self.hide()
         self.is_visible = False
+        # En la bandeja: retener animaciones y sondeos (los plazos como limpiar el portapapeles siguen)
+        TimerScheduler.get_shared().suspend()
         if self.tray_manager:
             self.tray_manager.update_window_state(False)
         print("Window hidden")
@@ -860,6 +876,7 @@ class MainWindow(QMainWindow):
     def open_settings(self):
         """Open settings window"""
         print("Opening settings window...")
+        from views.settings_window import SettingsWindow
         settings_window = SettingsWindow(controller=self.controller, parent=self)
         settings_window.settings_changed.connect(self.on_settings_changed)
 
@@ -883,6 +900,7 @@ class MainWindow(QMainWindow):
         if self.config_manager:
             opacity = self.config_manager.get_setting("opacity", 0.95)
             self.setWindowOpacity(opacity)
+            set_effects_mode(self.config_manager.get_setting("visual_effects", EFFECTS_FULL))
 
         print("Settings applied")
 
@@ -922,10 +940,16 @@ class MainWindow(QMainWindow):
         # Unregister AppBar
         self.unregister_appbar()
 
+        # Stop restoring pinned panels (if still in progress)
+        self._panels_to_restore.clear()
+
         # Stop hotkey manager
         if self.hotkey_manager:
             self.hotkey_manager.stop()
 
+        # Write pending usage events and stop the writer thread
+        UsageTracker.shutdown_shared()
+
         # Cleanup tray
         if self.tray_manager:
             self.tray_manager.cleanup()
@@ -1024,6 +1048,7 @@ class MainWindow(QMainWindow):
     def show_popular_items(self):
         """Mostrar diálogo de items populares"""
         try:
+            from views.dialogs.popular_items_dialog import PopularItemsDialog
             dialog = PopularItemsDialog(self)
             dialog.item_selected.connect(self.on_popular_item_selected)
             dialog.exec()
@@ -1034,6 +1059,7 @@ class MainWindow(QMainWindow):
     def show_forgotten_items(self):
         """Mostrar diálogo de items olvidados"""
         try:
+            from views.dialogs.forgotten_items_dialog import ForgottenItemsDialog
             dialog = ForgottenItemsDialog(self)
             if dialog.exec():
                 # Recargar categorías si se eliminaron items
@@ -1047,6 +1073,7 @@ class MainWindow(QMainWindow):
     def show_stats_dashboard(self):
         """Mostrar dashboard completo de estadísticas"""
         try:
+            from views.dialogs.stats_dashboard import StatsDashboard
             dialog = StatsDashboard(self)
             dialog.exec()
         except Exception as e:
@@ -1056,6 +1083,7 @@ class MainWindow(QMainWindow):
     def show_favorite_suggestions(self):
         """Mostrar diálogo de sugerencias de favoritos"""
         try:
+            from views.dialogs.suggestions_dialog import FavoriteSuggestionsDialog
             dialog = FavoriteSuggestionsDialog(self)
             if dialog.exec():
                 # Refrescar panel de favoritos si existe
@@ -1088,6 +1116,7 @@ class MainWindow(QMainWindow):
                 current_shortcut = panel_data.get('keyboard_shortcut', '')
 
         # Open config dialog
+        from views.dialogs.panel_config_dialog import PanelConfigDialog
         dialog = PanelConfigDialog(
             current_name=current_name,
             current_color=current_color,
@@ -1249,6 +1278,7 @@ class MainWindow(QMainWindow):
 
         # Create window if doesn't exist
         if not self.pinned_panels_window:
+            from views.pinned_panels_window import PinnedPanelsWindow
             self.pinned_panels_window = PinnedPanelsWindow(
                 panels_manager=self.controller.pinned_panels_manager,
                 parent=self
@@ -1266,7 +1296,13 @@ class MainWindow(QMainWindow):
         logger.info("Pinned panels window opened")
 
     def restore_pinned_panels_on_startup(self):
-        """AUTO-RESTORE: Restore active pinned panels from database on application startup"""
+        """AUTO-RESTORE: Restore active pinned panels from database on application startup
+
+        Panels are restored one per event loop turn (expanded ones first) so
+        the sidebar stays responsive; minimized or off-screen panels only get
+        their frame until first expanded. last_opened of all the restored
+        panels is written in a single batch at the end.
+        """
         if not self.controller:
             logger.warning("No controller available - skipping panel restoration")
             return
@@ -1279,87 +1315,120 @@ class MainWindow(QMainWindow):
                 logger.info("No active panels to restore")
                 return
 
-            logger.info(f"Restoring {len(active_panels)} active panels from database...")
+            logger.info(f"Scheduling restoration of {len(active_panels)} active panels...")
 
-            # Restore each panel
-            for panel_data in active_panels:
-                try:
-                    panel_id = panel_data['id']
-                    category_id = panel_data['category_id']
-
-                    # Get category
-                    category = self.controller.get_category(str(category_id))
-                    if not category:
-                        logger.warning(f"Category {category_id} not found for panel {panel_id} - skipping")
-                        continue
-
-                    # Create new floating panel with saved configuration
-                    restored_panel = FloatingPanel(
-                        config_manager=self.config_manager,
-                        list_controller=self.controller.list_controller if self.controller else None,
-                        panel_id=panel_id,
-                        custom_name=panel_data.get('custom_name'),
-                        custom_color=panel_data.get('custom_color')
-                    )
+            # Warm the shared categories cache once for every panel
+            if self.config_manager:
+                self.config_manager.get_categories()
 
-                    # Connect signals
-                    restored_panel.item_clicked.connect(self.on_item_clicked)
-                    restored_panel.window_closed.connect(self.on_floating_panel_closed)
-                    restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
-                    restored_panel.customization_requested.connect(self.on_panel_customization_requested)
+            # Expanded panels first (stable: keeps last_opened order)
+            self._panels_to_restore = deque(
+                sorted(active_panels, key=lambda panel_data: bool(panel_data.get('is_minimized')))
+            )
+            self._restored_panel_ids = []
+            self._panels_to_restore_total = len(active_panels)
+            QTimer.singleShot(0, self._restore_next_pinned_panel)
 
-                    # Load category
-                    restored_panel.load_category(category)
+        except Exception as e:
+            logger.error(f"Error during panel restoration on startup: {e}", exc_info=True)
 
-                    # Restore position and size
-                    restored_panel.move(panel_data['x_position'], panel_data['y_position'])
-                    restored_panel.resize(panel_data['width'], panel_data['height'])
+    def _restore_next_pinned_panel(self):
+        """Restore the next queued pinned panel and schedule the following one"""
+        if not self._panels_to_restore:
+            self._finish_pinned_panels_restore()
+            return
 
-                    # Apply custom styling
-                    restored_panel.apply_custom_styling()
+        panel_data = self._panels_to_restore.popleft()
+        try:
+            if self._restore_pinned_panel(panel_data):
+                self._restored_panel_ids.append(panel_data['id'])
+        except Exception as e:
+            logger.error(f"Error restoring panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
 
-                    # Set as pinned
-                    restored_panel.is_pinned = True
-                    restored_panel.pin_button.setText("📍")
-                    restored_panel.minimize_button.setVisible(True)
-                    restored_panel.config_button.setVisible(True)
+        QTimer.singleShot(PANEL_RESTORE_INTERVAL_MS, self._restore_next_pinned_panel)
 
-                    # Restore minimized state if needed
-                    if panel_data.get('is_minimized'):
-                        restored_panel.toggle_minimize()
+    def _finish_pinned_panels_restore(self):
+        """Write last_opened of the restored panels in one batch"""
+        if self._restored_panel_ids:
+            self.controller.pinned_panels_manager.mark_panels_opened(self._restored_panel_ids)
+        logger.info(f"Panel restoration complete: {len(self._restored_panel_ids)}/"
+                    f"{self._panels_to_restore_total} panels restored")
+        self._restored_panel_ids = []
 
-                    # Restore filter configuration if available
-                    if panel_data.get('filter_config'):
-                        filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
-                            panel_data['filter_config']
-                        )
-                        if filter_config:
-                            restored_panel.apply_filter_config(filter_config)
-                            logger.debug(f"Applied saved filters to panel {panel_id}")
+    def _restore_pinned_panel(self, panel_data: dict):
+        """
+        Create a pinned panel from its saved configuration
+
+        Args:
+            panel_data: Panel row from the database
+
+        Returns:
+            FloatingPanel or None if its category no longer exists
+        """
+        panel_id = panel_data['id']
+        category_id = panel_data['category_id']
+
+        # Get category (shared categories cache)
+        category = self.controller.get_category(str(category_id))
+        if not category:
+            logger.warning(f"Category {category_id} not found for panel {panel_id} - skipping")
+            return None
+
+        # Create new floating panel with saved configuration
+        restored_panel = FloatingPanel(
+            config_manager=self.config_manager,
+            list_controller=self.controller.list_controller if self.controller else None,
+            panel_id=panel_id,
+            custom_name=panel_data.get('custom_name'),
+            custom_color=panel_data.get('custom_color')
+        )
 
-                    # Add to pinned panels list
-                    self.pinned_panels.append(restored_panel)
+        # Connect signals
+        restored_panel.item_clicked.connect(self.on_item_clicked)
+        restored_panel.window_closed.connect(self.on_floating_panel_closed)
+        restored_panel.pin_state_changed.connect(self.on_panel_pin_changed)
+        restored_panel.customization_requested.connect(self.on_panel_customization_requested)
 
-                    # Update last_opened in database
-                    self.controller.pinned_panels_manager.mark_panel_opened(panel_id)
+        # Category and saved filters, without loading the items yet
+        filter_config = None
+        if panel_data.get('filter_config'):
+            filter_config = self.controller.pinned_panels_manager._deserialize_filter_config(
+                panel_data['filter_config']
+            )
+        restored_panel.restore_category(category, filter_config, materialize=False)
 
-                    # Register keyboard shortcut if one is assigned
-                    if panel_data.get('keyboard_shortcut'):
-                        self.register_panel_shortcut(restored_panel, panel_data['keyboard_shortcut'])
+        # Restore position and size
+        restored_panel.move(panel_data['x_position'], panel_data['y_position'])
+        restored_panel.resize(panel_data['width'], panel_data['height'])
 
-                    # Show panel
-                    restored_panel.show()
+        # Apply custom styling
+        restored_panel.apply_custom_styling()
 
-                    logger.info(f"Panel {panel_id} (Category: {category.name}) restored successfully")
+        # Set as pinned
+        restored_panel.is_pinned = True
+        restored_panel.pin_button.setText("📍")
+        restored_panel.minimize_button.setVisible(True)
+        restored_panel.config_button.setVisible(True)
 
-                except Exception as e:
-                    logger.error(f"Error restoring panel {panel_data.get('id', 'unknown')}: {e}", exc_info=True)
-                    continue
+        # Restore minimized state if needed
+        if panel_data.get('is_minimized'):
+            restored_panel.toggle_minimize()
+        elif restored_panel.is_on_screen():
+            restored_panel.ensure_content()
+
+        # Add to pinned panels list
+        self.pinned_panels.append(restored_panel)
 
-            logger.info(f"Panel restoration complete: {len(self.pinned_panels)}/{len(active_panels)} panels restored")
+        # Register keyboard shortcut if one is assigned
+        if panel_data.get('keyboard_shortcut'):
+            self.register_panel_shortcut(restored_panel, panel_data['keyboard_shortcut'])
 
-        except Exception as e:
-            logger.error(f"Error during panel restoration on startup: {e}", exc_info=True)
+        # Show panel
+        restored_panel.show()
+
+        logger.info(f"Panel {panel_id} (Category: {category.name}) restored "
+                    f"({'content loaded' if not restored_panel._content_pending else 'frame only'})")
+        return restored_panel
 
     def on_restore_panel_requested(self, panel_id: int):
         """Handle request to restore/open a saved panel"""
@@ -1472,6 +1541,9 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Override close event to minimize to tray instead of closing"""
+        # Persist pending usage events (the process may be ended while in the tray)
+        UsageTracker.flush_shared()
+
         # Minimize to tray instead of closing
         event.ignore()
         self.hide_window()
@@ -285,6 +285,7 @@ class SettingsWindow(QDialog):
             self.config_manager.set_setting("sidebar_width", appearance_settings["sidebar_width"])
             self.config_manager.set_setting("panel_width", appearance_settings["panel_width"])
             self.config_manager.set_setting("animation_speed", appearance_settings["animation_speed"])
+            self.config_manager.set_setting("visual_effects", appearance_settings["visual_effects"])
             logger.debug("Appearance settings saved")
 
             self.config_manager.set_setting("hotkey", hotkey_settings["hotkey"])
@@ -292,6 +293,7 @@ class SettingsWindow(QDialog):
 
             self.config_manager.set_setting("minimize_to_tray", general_settings["minimize_to_tray"])
             self.config_manager.set_setting("always_on_top", general_settings["always_on_top"])
+            self.config_manager.set_setting("fuzzy_search", general_settings["fuzzy_search"])
             self.config_manager.set_setting("start_with_windows", general_settings["start_with_windows"])
             self.config_manager.set_setting("max_history", general_settings["max_history"])
             logger.debug("General settings saved")
@@ -0,0 +1,522 @@
+"""
+Charts - Gráficos livianos dibujados con QPainter
+Barras, línea, torta y mapa de calor para las vistas de estadísticas
+
+Reemplazan a matplotlib (cientos de ms de import y decenas de MB para
+gráficos simples). Cada gráfico guarda sus datos y calcula su geometría
+solo cuando cambian los datos o el tamaño: set_data con los mismos datos
+no repinta, y update_value / update_cell repintan solo la barra o celda
+afectada mientras la escala no cambie.
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics, QPainterPath
+
+# Colores del tema oscuro de las estadísticas
+BACKGROUND_COLOR = QColor('#252526')
+TEXT_COLOR = QColor('#cccccc')
+MUTED_COLOR = QColor('#858585')
+GRID_COLOR = QColor('#3e3e42')
+DEFAULT_COLOR = '#007acc'
+
+PIE_COLORS = ['#007acc', '#4EC9B0', '#cc7a00', '#c42b1c', '#00897b',
+              '#9e5e00', '#0e639c', '#F39C12', '#8e44ad', '#27ae60']
+
+EMPTY_MESSAGE = "No hay datos disponibles"
+
+# Márgenes del área de dibujo (px)
+MARGIN = 12
+TITLE_HEIGHT = 28
+AXIS_LABEL_HEIGHT = 18
+
+# Porcentaje mínimo para escribir el valor dentro de una porción de la torta
+PIE_LABEL_MIN_PERCENT = 4.0
+
+
+def format_value(value: float) -> str:
+    """Valor para etiquetas: entero si no tiene decimales"""
+    return str(int(value)) if float(value).is_integer() else f"{value:.1f}"
+
+
+class ChartWidget(QWidget):
+    """
+    Base de los gráficos: fondo, título, mensaje sin datos y geometría
+    cacheada (las subclases implementan _compute_geometry y _paint_chart)
+    """
+
+    def __init__(self, title: str = "", parent=None):
+        super().__init__(parent)
+        self.title = title
+        self._geometry: Optional[Dict] = None
+        self.setMinimumHeight(180)
+
+    def set_title(self, title: str):
+        if title != self.title:
+            self.title = title
+            self.update()
+
+    def is_empty(self) -> bool:
+        raise NotImplementedError
+
+    def invalidate(self):
+        """Recalcular la geometría en el próximo pintado"""
+        self._geometry = None
+        self.update()
+
+    def geometry_cache(self) -> Dict:
+        """Geometría del gráfico para el tamaño actual (calculada una vez)"""
+        if self._geometry is None:
+            self._geometry = self._compute_geometry(self.plot_rect())
+        return self._geometry
+
+    def plot_rect(self) -> QRectF:
+        """Área de dibujo (sin márgenes ni título)"""
+        top = MARGIN + (TITLE_HEIGHT if self.title else 0)
+        return QRectF(MARGIN, top, max(self.width() - 2 * MARGIN, 1),
+                      max(self.height() - top - MARGIN, 1))
+
+    def resizeEvent(self, event):
+        self._geometry = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), BACKGROUND_COLOR)
+
+        if self.title:
+            font = QFont(self.font())
+            font.setPointSize(11)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(TEXT_COLOR)
+            painter.drawText(QRectF(0, MARGIN, self.width(), TITLE_HEIGHT),
+                             Qt.AlignmentFlag.AlignCenter, self.title)
+            painter.setFont(self.font())
+
+        if self.is_empty():
+            painter.setPen(MUTED_COLOR)
+            painter.drawText(self.plot_rect(), Qt.AlignmentFlag.AlignCenter, EMPTY_MESSAGE)
+        else:
+            self._paint_chart(painter, self.geometry_cache())
+        painter.end()
+
+    def _compute_geometry(self, rect: QRectF) -> Dict:
+        raise NotImplementedError
+
+    def _paint_chart(self, painter: QPainter, geometry: Dict):
+        raise NotImplementedError
+
+
+class BarChartWidget(ChartWidget):
+    """Gráfico de barras (vertical u horizontal, con valores opcionales)"""
+
+    def __init__(self, title: str = "", horizontal: bool = False, color: str = DEFAULT_COLOR,
+                 show_values: bool = True, parent=None):
+        """
+        Args:
+            title: Chart title
+            horizontal: Horizontal bars (first value on top)
+            color: Bar color
+            show_values: Write the value next to each bar
+            parent: Parent widget
+        """
+        super().__init__(title, parent)
+        self.horizontal = horizontal
+        self.color = QColor(color)
+        self.show_values = show_values
+        self.labels: List[str] = []
+        self.values: List[float] = []
+
+    def is_empty(self) -> bool:
+        return not self.values
+
+    def set_data(self, labels: Sequence[str], values: Sequence[float]):
+        """
+        Replace the bars (no repaint if nothing changed)
+
+        Args:
+            labels: Bar labels
+            values: Bar values (same length as labels)
+        """
+        labels, values = list(labels), [v or 0 for v in values]
+        if labels == self.labels and values == self.values:
+            return
+        self.labels, self.values = labels, values
+        self.invalidate()
+
+    def update_value(self, index: int, value: float):
+        """
+        Change one bar; only that bar is repainted if the scale does not change
+
+        Args:
+            index: Bar index
+            value: New value
+        """
+        value = value or 0
+        if self.values[index] == value:
+            return
+        scale_max = max(self.values)
+        self.values[index] = value
+        if self._geometry is None or max(self.values) != scale_max:
+            self.invalidate()
+            return
+
+        old_rect = self._geometry['value_areas'][index]
+        self._geometry = self._compute_geometry(self.plot_rect())
+        self.update(old_rect.united(self._geometry['value_areas'][index]).toAlignedRect())
+
+    def _compute_geometry(self, rect: QRectF) -> Dict:
+        metrics = QFontMetrics(self.font())
+        count = len(self.values)
+        scale_max = max(max(self.values), 1)
+        bars, value_areas, label_rects = [], [], []
+
+        if self.horizontal:
+            label_width = min(max(metrics.horizontalAdvance(label) for label in self.labels) + 8,
+                              rect.width() * 0.4)
+            value_width = metrics.horizontalAdvance(format_value(scale_max)) + 10 if self.show_values else 0
+            plot = QRectF(rect.left() + label_width, rect.top(),
+                          max(rect.width() - label_width - value_width, 1), rect.height())
+            slot = plot.height() / count
+            for i, value in enumerate(self.values):
+                top = plot.top() + i * slot + slot * 0.15
+                bars.append(QRectF(plot.left(), top, plot.width() * value / scale_max, slot * 0.7))
+                # Fila completa de la barra y su valor (repintado parcial)
+                value_areas.append(QRectF(plot.left(), plot.top() + i * slot,
+                                          plot.width() + value_width, slot))
+                label_rects.append(QRectF(rect.left(), top, label_width - 8, slot * 0.7))
+        else:
+            plot = QRectF(rect.left(), rect.top() + (metrics.height() if self.show_values else 0),
+                          rect.width(), max(rect.height() - AXIS_LABEL_HEIGHT
+                                            - (metrics.height() if self.show_values else 0), 1))
+            slot = plot.width() / count
+            for i, value in enumerate(self.values):
+                left = plot.left() + i * slot + slot * 0.15
+                height = plot.height() * value / scale_max
+                bars.append(QRectF(left, plot.bottom() - height, slot * 0.7, height))
+                value_areas.append(QRectF(plot.left() + i * slot, rect.top(), slot, plot.bottom() - rect.top()))
+                label_rects.append(QRectF(plot.left() + i * slot, plot.bottom() + 2, slot, AXIS_LABEL_HEIGHT))
+
+        # Etiquetas que entran (en vertical se saltean si no hay espacio)
+        label_step = 1
+        if not self.horizontal:
+            widest = max(metrics.horizontalAdvance(label) for label in self.labels) + 4
+            label_step = max(1, math.ceil(widest / max(slot, 1)))
+
+        return {'plot': plot, 'bars': bars, 'value_areas': value_areas,
+                'label_rects': label_rects, 'label_step': label_step}
+
+    def _paint_chart(self, painter: QPainter, geometry: Dict):
+        plot = geometry['plot']
+        metrics = QFontMetrics(self.font())
+
+        painter.setPen(QPen(GRID_COLOR, 1))
+        if self.horizontal:
+            painter.drawLine(plot.topLeft(), plot.bottomLeft())
+        else:
+            painter.drawLine(plot.bottomLeft(), plot.bottomRight())
+
+        painter.setPen(QPen(self.color.darker(130), 1))
+        painter.setBrush(self.color)
+        for bar in geometry['bars']:
+            painter.drawRect(bar)
+
+        painter.setPen(TEXT_COLOR)
+        for i, (bar, label_rect) in enumerate(zip(geometry['bars'], geometry['label_rects'])):
+            label = self.labels[i]
+            if self.horizontal:
+                text = metrics.elidedText(label, Qt.TextElideMode.ElideRight, int(label_rect.width()))
+                painter.drawText(label_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, text)
+                if self.show_values:
+                    painter.drawText(QRectF(bar.right() + 4, bar.top(), plot.width(), bar.height()),
+                                     Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                                     format_value(self.values[i]))
+            else:
+                if i % geometry['label_step'] == 0:
+                    painter.drawText(label_rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, label)
+                if self.show_values and self.values[i]:
+                    painter.drawText(QRectF(bar.left() - 10, bar.top() - metrics.height(),
+                                            bar.width() + 20, metrics.height()),
+                                     Qt.AlignmentFlag.AlignCenter, format_value(self.values[i]))
+
+
+class LineChartWidget(ChartWidget):
+    """Gráfico de línea con área rellena y marcadores"""
+
+    # Etiquetas del eje X como máximo (el resto se saltea)
+    MAX_X_LABELS = 8
+
+    def __init__(self, title: str = "", color: str = DEFAULT_COLOR, parent=None):
+        super().__init__(title, parent)
+        self.color = QColor(color)
+        self.labels: List[str] = []
+        self.values: List[float] = []
+
+    def is_empty(self) -> bool:
+        return not self.values
+
+    def set_data(self, labels: Sequence[str], values: Sequence[float]):
+        """
+        Replace the series (no repaint if nothing changed)
+
+        Args:
+            labels: X axis labels
+            values: Y values (same length as labels)
+        """
+        labels, values = list(labels), [v or 0 for v in values]
+        if labels == self.labels and values == self.values:
+            return
+        self.labels, self.values = labels, values
+        self.invalidate()
+
+    def _compute_geometry(self, rect: QRectF) -> Dict:
+        metrics = QFontMetrics(self.font())
+        scale_max = max(max(self.values), 1)
+        axis_width = metrics.horizontalAdvance(format_value(scale_max)) + 8
+        plot = QRectF(rect.left() + axis_width, rect.top() + 4,
+                      max(rect.width() - axis_width - 8, 1), max(rect.height() - AXIS_LABEL_HEIGHT - 4, 1))
+
+        count = len(self.values)
+        step = plot.width() / (count - 1) if count > 1 else 0
+        points = [
+            QPointF(plot.left() + (i * step if count > 1 else plot.width() / 2),
+                    plot.bottom() - plot.height() * value / scale_max)
+            for i, value in enumerate(self.values)
+        ]
+
+        line = QPainterPath(points[0])
+        for point in points[1:]:
+            line.lineTo(point)
+        area = QPainterPath(line)
+        area.lineTo(points[-1].x(), plot.bottom())
+        area.lineTo(points[0].x(), plot.bottom())
+        area.closeSubpath()
+
+        label_step = max(1, math.ceil(count / self.MAX_X_LABELS))
+        return {'plot': plot, 'points': points, 'line': line, 'area': area,
+                'scale_max': scale_max, 'label_step': label_step}
+
+    def _paint_chart(self, painter: QPainter, geometry: Dict):
+        plot = geometry['plot']
+        metrics = QFontMetrics(self.font())
+
+        # Grilla horizontal y escala
+        painter.setPen(QPen(GRID_COLOR, 1))
+        for fraction in (0.0, 0.5, 1.0):
+            y = plot.bottom() - plot.height() * fraction
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+        painter.setPen(MUTED_COLOR)
+        for fraction in (0.0, 1.0):
+            y = plot.bottom() - plot.height() * fraction
+            painter.drawText(QRectF(0, y - metrics.height() / 2, plot.left() - 4, metrics.height()),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             format_value(geometry['scale_max'] * fraction))
+
+        fill = QColor(self.color)
+        fill.setAlphaF(0.3)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(fill)
+        painter.drawPath(geometry['area'])
+
+        painter.setPen(QPen(self.color, 2))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(geometry['line'])
+        painter.setBrush(self.color)
+        for point in geometry['points']:
+            painter.drawEllipse(point, 3, 3)
+
+        painter.setPen(TEXT_COLOR)
+        for i in range(0, len(self.labels), geometry['label_step']):
+            # Centrada en el punto, sin salir del widget
+            x = min(max(geometry['points'][i].x(), 40), self.width() - 40)
+            painter.drawText(QRectF(x - 40, plot.bottom() + 2, 80, AXIS_LABEL_HEIGHT),
+                             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, self.labels[i])
+
+
+class PieChartWidget(ChartWidget):
+    """Gráfico de torta con porcentajes y leyenda"""
+
+    def __init__(self, title: str = "", colors: Sequence[str] = PIE_COLORS, parent=None):
+        super().__init__(title, parent)
+        self.colors = [QColor(color) for color in colors]
+        self.labels: List[str] = []
+        self.values: List[float] = []
+
+    def is_empty(self) -> bool:
+        return not any(self.values)
+
+    def set_data(self, labels: Sequence[str], values: Sequence[float]):
+        """
+        Replace the slices (no repaint if nothing changed)
+
+        Args:
+            labels: Slice labels
+            values: Slice sizes (same length as labels)
+        """
+        labels, values = list(labels), [v or 0 for v in values]
+        if labels == self.labels and values == self.values:
+            return
+        self.labels, self.values = labels, values
+        self.invalidate()
+
+    def _compute_geometry(self, rect: QRectF) -> Dict:
+        metrics = QFontMetrics(self.font())
+        legend_width = min(max(metrics.horizontalAdvance(label) for label in self.labels) + 30,
+                           rect.width() * 0.4)
+        side = max(min(rect.width() - legend_width - MARGIN, rect.height()), 1)
+        pie = QRectF(rect.left() + (rect.width() - legend_width - side) / 2,
+                     rect.top() + (rect.height() - side) / 2, side, side)
+
+        total = sum(self.values)
+        slices = []
+        start = 90.0  # empezar arriba, sentido antihorario
+        for i, value in enumerate(self.values):
+            span = 360.0 * value / total
+            slices.append({'start': start, 'span': span, 'percent': 100.0 * value / total,
+                           'color': self.colors[i % len(self.colors)]})
+            start += span
+
+        legend = QRectF(rect.right() - legend_width, rect.top(), legend_width, rect.height())
+        return {'pie': pie, 'slices': slices, 'legend': legend}
+
+    def _paint_chart(self, painter: QPainter, geometry: Dict):
+        pie = geometry['pie']
+        metrics = QFontMetrics(self.font())
+
+        painter.setPen(QPen(BACKGROUND_COLOR, 1))
+        for part in geometry['slices']:
+            painter.setBrush(part['color'])
+            # drawPie usa 1/16 de grado
+            painter.drawPie(pie, int(part['start'] * 16), int(round(part['span'] * 16)))
+
+        bold = QFont(self.font())
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(QColor('white'))
+        radius = pie.width() / 2 * 0.65
+        for part in geometry['slices']:
+            if part['percent'] < PIE_LABEL_MIN_PERCENT:
+                continue
+            angle = math.radians(part['start'] + part['span'] / 2)
+            center = QPointF(pie.center().x() + radius * math.cos(angle),
+                             pie.center().y() - radius * math.sin(angle))
+            painter.drawText(QRectF(center.x() - 30, center.y() - 10, 60, 20),
+                             Qt.AlignmentFlag.AlignCenter, f"{part['percent']:.1f}%")
+        painter.setFont(self.font())
+
+        legend = geometry['legend']
+        row_height = metrics.height() + 6
+        top = legend.top() + max((legend.height() - row_height * len(self.labels)) / 2, 0)
+        for i, (label, part) in enumerate(zip(self.labels, geometry['slices'])):
+            y = top + i * row_height
+            if y + row_height > legend.bottom():
+                break
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(part['color'])
+            painter.drawRect(QRectF(legend.left(), y + (row_height - 10) / 2, 10, 10))
+            painter.setPen(TEXT_COLOR)
+            text = metrics.elidedText(label, Qt.TextElideMode.ElideRight, int(legend.width() - 18))
+            painter.drawText(QRectF(legend.left() + 16, y, legend.width() - 16, row_height),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+
+
+class HeatmapWidget(ChartWidget):
+    """Mapa de calor (filas x columnas) con intensidad según el valor"""
+
+    def __init__(self, title: str = "", color: str = DEFAULT_COLOR, parent=None):
+        super().__init__(title, parent)
+        self.color = QColor(color)
+        self.row_labels: List[str] = []
+        self.column_labels: List[str] = []
+        self.matrix: List[List[float]] = []
+
+    def is_empty(self) -> bool:
+        return not any(any(row) for row in self.matrix)
+
+    def set_data(self, row_labels: Sequence[str], column_labels: Sequence[str],
+                 matrix: Sequence[Sequence[float]]):
+        """
+        Replace the grid (no repaint if nothing changed)
+
+        Args:
+            row_labels: Label of each row
+            column_labels: Label of each column
+            matrix: Values, matrix[row][column]
+        """
+        row_labels, column_labels = list(row_labels), list(column_labels)
+        matrix = [[v or 0 for v in row] for row in matrix]
+        if (row_labels, column_labels, matrix) == (self.row_labels, self.column_labels, self.matrix):
+            return
+        self.row_labels, self.column_labels, self.matrix = row_labels, column_labels, matrix
+        self.invalidate()
+
+    def update_cell(self, row: int, column: int, value: float):
+        """
+        Change one cell; only that cell is repainted if the scale does not change
+
+        Args:
+            row: Row index
+            column: Column index
+            value: New value
+        """
+        value = value or 0
+        if self.matrix[row][column] == value:
+            return
+        scale_max = self._max()
+        self.matrix[row][column] = value
+        if self._geometry is None or self._max() != scale_max:
+            self.invalidate()
+            return
+        self.update(self._geometry['cells'][row][column].toAlignedRect())
+
+    def _max(self) -> float:
+        return max((max(row) for row in self.matrix if row), default=0)
+
+    def cell_color(self, value: float) -> QColor:
+        """Color de una celda: del fondo al color del mapa según value / máximo"""
+        fraction = value / self._max() if self._max() else 0
+        return QColor(
+            int(BACKGROUND_COLOR.red() + (self.color.red() - BACKGROUND_COLOR.red()) * fraction),
+            int(BACKGROUND_COLOR.green() + (self.color.green() - BACKGROUND_COLOR.green()) * fraction),
+            int(BACKGROUND_COLOR.blue() + (self.color.blue() - BACKGROUND_COLOR.blue()) * fraction),
+        )
+
+    def _compute_geometry(self, rect: QRectF) -> Dict:
+        metrics = QFontMetrics(self.font())
+        label_width = max(metrics.horizontalAdvance(label) for label in self.row_labels) + 8
+        plot = QRectF(rect.left() + label_width, rect.top(),
+                      max(rect.width() - label_width, 1), max(rect.height() - AXIS_LABEL_HEIGHT, 1))
+        cell_width = plot.width() / len(self.column_labels)
+        cell_height = plot.height() / len(self.row_labels)
+        cells = [
+            [QRectF(plot.left() + c * cell_width, plot.top() + r * cell_height, cell_width, cell_height)
+             for c in range(len(self.column_labels))]
+            for r in range(len(self.row_labels))
+        ]
+        widest = max(metrics.horizontalAdvance(label) for label in self.column_labels) + 4
+        label_step = max(1, math.ceil(widest / max(cell_width, 1)))
+        return {'plot': plot, 'cells': cells, 'label_width': label_width, 'label_step': label_step}
+
+    def _paint_chart(self, painter: QPainter, geometry: Dict):
+        painter.setPen(QPen(BACKGROUND_COLOR, 1))
+        for r, row in enumerate(geometry['cells']):
+            for c, cell in enumerate(row):
+                painter.setBrush(self.cell_color(self.matrix[r][c]))
+                painter.drawRect(cell)
+
+        painter.setPen(TEXT_COLOR)
+        plot = geometry['plot']
+        for r, label in enumerate(self.row_labels):
+            cell = geometry['cells'][r][0]
+            painter.drawText(QRectF(plot.left() - geometry['label_width'], cell.top(),
+                                    geometry['label_width'] - 6, cell.height()),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+        for c in range(0, len(self.column_labels), geometry['label_step']):
+            cell = geometry['cells'][-1][c]
+            painter.drawText(QRectF(cell.left() - 10, plot.bottom() + 2, cell.width() + 20, AXIS_LABEL_HEIGHT),
+                             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, self.column_labels[c])
@@ -30,8 +30,8 @@ class FavoritesPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.favorites_manager = FavoritesManager()
-        self.usage_tracker = UsageTracker()
+        self.favorites_manager = FavoritesManager.get_shared()
+        self.usage_tracker = UsageTracker.get_shared()
         self.init_ui()
         self.load_favorites()
 
@@ -0,0 +1,244 @@
+"""
+Item Actions
+Acciones sobre un item (abrir, ejecutar, favorito, tracking) sin estado de UI.
+Las usan tanto ItemButton como la lista virtualizada de items.
+"""
+import os
+import sys
+import platform
+import subprocess
+import webbrowser
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from models.item import Item, ItemType
+from core.usage_tracker import UsageTracker
+from core.favorites_manager import FavoritesManager
+from core.command_runner import CommandExecution, CommandRunner
+from core.clipboard_manager import ClipboardManager
+
+logger = logging.getLogger(__name__)
+
+
+class ItemActions:
+    """Acciones de un item con tracking de uso"""
+
+    def __init__(self, usage_tracker: UsageTracker = None,
+                 favorites_manager: FavoritesManager = None):
+        """
+        Initialize item actions
+
+        Args:
+            usage_tracker: UsageTracker to report usage (shared instance if None)
+            favorites_manager: FavoritesManager for favorite toggling (shared instance if None)
+        """
+        self.usage_tracker = usage_tracker or UsageTracker.get_shared()
+        self.favorites_manager = favorites_manager or FavoritesManager.get_shared()
+
+    def track_copy(self, item: Item):
+        """Registrar la copia de un item al portapapeles (comando simple)"""
+        if item.type in [ItemType.URL, ItemType.PATH]:
+            return
+        start_time = self.usage_tracker.track_execution_start(item.id)
+        self.usage_tracker.track_execution_end(item.id, start_time, True, None)
+
+    def open_in_browser(self, item: Item) -> bool:
+        """
+        Open URL in default browser
+
+        Returns:
+            bool: True if the browser was opened
+        """
+        if item.type != ItemType.URL:
+            return False
+
+        start_time = self.usage_tracker.track_execution_start(item.id)
+        success = False
+        error_msg = None
+
+        try:
+            url = item.content
+            # Ensure URL has proper protocol
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+
+            webbrowser.open(url)
+            success = True
+
+        except Exception as e:
+            logger.error(f"Error opening URL {item.label}: {e}")
+            error_msg = str(e)
+
+        finally:
+            self.usage_tracker.track_execution_end(item.id, start_time, success, error_msg)
+
+        return success
+
+    def open_in_explorer(self, item: Item) -> bool:
+        """
+        Open file/folder in system file explorer
+
+        Returns:
+            bool: True if the explorer was opened
+        """
+        if item.type != ItemType.PATH:
+            return False
+
+        start_time = self.usage_tracker.track_execution_start(item.id)
+        success = False
+        error_msg = None
+
+        try:
+            path = Path(item.content)
+            system = platform.system()
+
+            if system == 'Windows':
+                # Windows: Use explorer with /select to highlight the file/folder
+                if path.exists():
+                    subprocess.run(['explorer', '/select,', str(path.absolute())])
+                else:
+                    # If path doesn't exist, try to open parent directory
+                    parent = path.parent
+                    if parent.exists():
+                        subprocess.run(['explorer', str(parent.absolute())])
+
+            elif system == 'Darwin':  # macOS
+                if path.exists():
+                    subprocess.run(['open', '-R', str(path.absolute())])
+                else:
+                    parent = path.parent
+                    if parent.exists():
+                        subprocess.run(['open', str(parent.absolute())])
+
+            else:  # Linux
+                if path.exists():
+                    if path.is_file():
+                        subprocess.run(['xdg-open', str(path.parent.absolute())])
+                    else:
+                        subprocess.run(['xdg-open', str(path.absolute())])
+                else:
+                    parent = path.parent
+                    if parent.exists():
+                        subprocess.run(['xdg-open', str(parent.absolute())])
+
+            success = True
+
+        except Exception as e:
+            logger.error(f"Error opening explorer for {item.label}: {e}")
+            error_msg = str(e)
+
+        finally:
+            self.usage_tracker.track_execution_end(item.id, start_time, success, error_msg)
+
+        return success
+
+    @staticmethod
+    def is_openable_file(item: Item) -> bool:
+        """True si el item PATH apunta a un archivo existente"""
+        if item.type != ItemType.PATH:
+            return False
+        path = Path(item.content)
+        return path.exists() and path.is_file()
+
+    def open_file(self, item: Item) -> bool:
+        """
+        Open file with default application
+
+        Returns:
+            bool: True if the file was opened
+        """
+        if not self.is_openable_file(item):
+            logger.warning(f"File not found: {item.content}")
+            return False
+
+        path = Path(item.content)
+        try:
+            system = platform.system()
+
+            if system == 'Windows':
+                os.startfile(str(path.absolute()))
+            elif system == 'Darwin':  # macOS
+                subprocess.run(['open', str(path.absolute())])
+            else:  # Linux
+                subprocess.run(['xdg-open', str(path.absolute())])
+            return True
+
+        except Exception as e:
+            logger.error(f"Error opening file: {e}")
+            return False
+
+    def run_command(self, item: Item, timeout_ms: Optional[int] = None) -> Optional[CommandExecution]:
+        """
+        Ejecutar comando de tipo CODE sin bloquear la interfaz
+
+        El comando corre en el CommandRunner compartido (QProcess, con limite
+        de ejecuciones simultaneas); el uso se registra al terminar.
+
+        Args:
+            item: CODE item
+            timeout_ms: Maximum run time (default: the runner's)
+
+        Returns:
+            Optional[CommandExecution]: Running (or queued) execution, None if
+                the item is not a CODE item. Its finished(dict) signal carries
+                {'command', 'output', 'error', 'return_code', 'success', ...}
+        """
+        if item.type != ItemType.CODE:
+            return None
+
+        # Determinar directorio de trabajo
+        cwd = None
+        if getattr(item, 'working_dir', None):
+            working_dir_path = Path(item.working_dir)
+            if working_dir_path.exists() and working_dir_path.is_dir():
+                cwd = str(working_dir_path.absolute())
+                logger.info(f"Executing command in working directory: {cwd}")
+            else:
+                logger.warning(f"Working directory does not exist: {item.working_dir}")
+
+        execution = CommandRunner.get_shared().start(item.content.strip(), cwd=cwd, timeout_ms=timeout_ms)
+        execution.finished.connect(lambda result: self._track_command(item, result))
+        return execution
+
+    def _track_command(self, item: Item, result: Dict):
+        """Registrar en UsageTracker el resultado de un comando"""
+        if not result['success']:
+            logger.error(f"Command failed: {item.label} (code {result['return_code']})")
+        error_msg = None if result['success'] else (result['error'] or "Error desconocido")
+        self.usage_tracker.track_usage(item.id, result['duration_ms'], result['success'], error_msg)
+
+    @staticmethod
+    def show_command_output(execution: CommandExecution, parent=None):
+        """Mostrar la salida de un comando en un CommandOutputDialog (en vivo, no modal)"""
+        from views.command_output_dialog import CommandOutputDialog
+
+        dialog = CommandOutputDialog.for_execution(execution, parent=parent)
+        dialog.show()
+        return dialog
+
+    def toggle_favorite(self, item: Item) -> Optional[bool]:
+        """
+        Alternar estado de favorito (actualiza item.is_favorite)
+
+        Returns:
+            Optional[bool]: New favorite state, None on error
+        """
+        try:
+            is_fav = self.favorites_manager.toggle_favorite(item.id)
+            item.is_favorite = is_fav
+
+            msg = "agregado a" if is_fav else "quitado de"
+            logger.info(f"Item '{item.label}' {msg} favoritos")
+            return is_fav
+
+        except Exception as e:
+            logger.error(f"Error toggling favorite for item {item.id}: {e}")
+            return None
+
+    @staticmethod
+    def clear_clipboard():
+        """Clear clipboard content"""
+        if not ClipboardManager.get_shared().clear_clipboard():
+            logger.error("Error clearing clipboard")
@@ -0,0 +1,711 @@
+"""
+Item List View
+Lista virtualizada de items (modelo/vista): un QAbstractListModel con los
+items, un proxy para filtrar/ordenar y un delegate que pinta cada fila con el
+aspecto de ItemButton. Solo se pintan las filas visibles, asi que abrir o
+filtrar una categoria con miles de items no crea ningun widget por item.
+"""
+import sys
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView, QFrame
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractListModel, QSortFilterProxyModel, QModelIndex,
+    QRect, QSize, QTimer, QPoint
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from models.item import Item, ItemType
+from core.timer_scheduler import TimerScheduler
+
+logger = logging.getLogger(__name__)
+
+# Rol con el objeto Item de cada fila
+ITEM_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Tiempos de feedback (ms), los mismos que ItemButton
+COPIED_FEEDBACK_MS = 500
+ACTION_FEEDBACK_MS = 300
+EXECUTE_FEEDBACK_MS = 1000
+REVEAL_TIMEOUT_MS = 10000
+CLIPBOARD_CLEAR_MS = 30000
+
+# Colores de fondo de una fila: (normal, hover)
+ROW_COLORS = ("#2d2d2d", "#3d3d3d")
+SENSITIVE_ROW_COLORS = ("#3d2020", "#4d2525")
+COPIED_COLOR = "#007acc"
+SENSITIVE_COPIED_COLOR = "#cc7a00"
+SENSITIVE_BORDER_COLOR = "#cc0000"
+ROW_SEPARATOR_COLOR = "#1e1e1e"
+TEXT_COLOR = "#cccccc"
+
+# Botones de accion: accion -> (color, color hover)
+ACTION_COLORS = {
+    'favorite': (None, "#3e3e42"),
+    'reveal': ("#cc0000", "#9e0000"),
+    'execute': ("#cc7a00", "#ff9900"),
+    'open_url': ("#007acc", "#005a9e"),
+    'open_explorer': ("#2d7d2d", "#236123"),
+    'open_file': ("#cc7a00", "#9e5e00"),
+}
+ACTION_TOOLTIPS = {
+    'reveal': "Revelar/Ocultar contenido sensible",
+    'execute': "Ejecutar comando",
+    'open_url': "Abrir en navegador",
+    'open_explorer': "Abrir en explorador",
+    'open_file': "Abrir archivo",
+}
+
+
+def get_item_badge(item: Item) -> str:
+    """Obtener badge del item (🔥 Popular o 🆕 Nuevo)"""
+    use_count = getattr(item, 'use_count', 0)
+
+    # Popular: más de 50 usos
+    if use_count > 50:
+        return "🔥"
+
+    # Nuevo: 0 usos
+    if use_count == 0:
+        return "🆕"
+
+    return ""
+
+
+class ItemListModel(QAbstractListModel):
+    """Modelo con los items de un panel y su estado de presentacion"""
+
+    def __init__(self, show_category: bool = False, parent=None):
+        super().__init__(parent)
+        self.show_category = show_category
+        self._items: List[Item] = []
+        self._rows: Dict[str, int] = {}
+        self._revealed = set()  # ids con contenido sensible revelado
+        self._copied = set()  # ids con feedback de copiado activo
+        self._flashes: Dict[Tuple[str, str], str] = {}  # (id, accion) -> color temporal
+        self._openable_files: Dict[str, bool] = {}  # cache de Path.is_file() por id
+
+    # ----- QAbstractListModel -----
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+
+        item = self._items[index.row()]
+        if role == ITEM_ROLE:
+            return item
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_label(item)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.tooltip(item)
+        return None
+
+    # ----- Items -----
+
+    def set_items(self, items: Sequence[Item]):
+        """Reemplazar los items del modelo"""
+        self.beginResetModel()
+        self._items = list(items)
+        self._rows = {str(item.id): row for row, item in enumerate(self._items)}
+        self._revealed.clear()
+        self._copied.clear()
+        self._flashes.clear()
+        self._openable_files.clear()
+        self.endResetModel()
+
+    def items(self) -> List[Item]:
+        """Items del modelo (en orden)"""
+        return self._items
+
+    def item_at(self, row: int) -> Optional[Item]:
+        """Item de una fila"""
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def refresh_item(self, item_id):
+        """Repintar la fila de un item"""
+        row = self._rows.get(str(item_id))
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    # ----- Estado de presentacion -----
+
+    def display_label(self, item: Item) -> str:
+        """Get display label (ofuscado si es sensible y no revelado)"""
+        if not getattr(item, 'is_sensitive', False):
+            return item.label
+        if not self.is_revealed(item.id):
+            return f"{item.label} (********)"
+
+        content = item.content
+        if len(content) > 30:
+            return f"{item.label} ({content[:30]}...)"
+        return f"{item.label} ({content})"
+
+    def tooltip(self, item: Item) -> str:
+        """Tooltip con descripcion, preview del contenido y tipo"""
+        tooltip_parts = []
+
+        if getattr(item, 'description', None):
+            tooltip_parts.append(item.description)
+
+        # Content preview for non-sensitive items
+        if not item.is_sensitive and item.content:
+            content_preview = item.content[:100]
+            if len(item.content) > 100:
+                content_preview += "..."
+            if tooltip_parts:
+                tooltip_parts.append("\n---\n")
+            tooltip_parts.append(f"Contenido: {content_preview}")
+
+        if tooltip_parts:
+            tooltip_parts.append("\n")
+        tooltip_parts.append(f"Tipo: {item.type.value.upper()}")
+
+        return ''.join(tooltip_parts)
+
+    def is_revealed(self, item_id) -> bool:
+        return str(item_id) in self._revealed
+
+    def set_revealed(self, item_id, revealed: bool):
+        if revealed:
+            self._revealed.add(str(item_id))
+        else:
+            self._revealed.discard(str(item_id))
+        self.refresh_item(item_id)
+
+    def is_copied(self, item_id) -> bool:
+        return str(item_id) in self._copied
+
+    def set_copied(self, item_id, copied: bool):
+        if copied:
+            self._copied.add(str(item_id))
+        else:
+            self._copied.discard(str(item_id))
+        self.refresh_item(item_id)
+
+    def flash_color(self, item_id, action: str) -> Optional[str]:
+        """Color temporal de un boton de accion (feedback), si lo hay"""
+        return self._flashes.get((str(item_id), action))
+
+    def set_flash(self, item_id, action: str, color: Optional[str]):
+        if color:
+            self._flashes[(str(item_id), action)] = color
+        else:
+            self._flashes.pop((str(item_id), action), None)
+        self.refresh_item(item_id)
+
+    def has_openable_file(self, item: Item) -> bool:
+        """True si el item PATH apunta a un archivo (cacheado, evita IO al pintar)"""
+        item_id = str(item.id)
+        cached = self._openable_files.get(item_id)
+        if cached is None:
+            try:
+                path = Path(item.content)
+                cached = path.exists() and path.is_file()
+            except (OSError, ValueError):
+                cached = False
+            self._openable_files[item_id] = cached
+        return cached
+
+
+class ItemFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy que muestra un subconjunto de items en un orden dado
+
+    El filtrado (busqueda, filtros avanzados, estado) lo resuelven los motores
+    existentes; el proxy solo recibe el resultado, sin recrear filas.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ranks: Optional[Dict[str, int]] = None
+        self.setDynamicSortFilter(False)
+
+    def set_filter_items(self, items: Optional[Sequence[Item]]):
+        """
+        Mostrar solo estos items, en este orden
+
+        Args:
+            items: Items visibles (ordenados por relevancia), None para mostrar todos
+        """
+        if items is None:
+            self._ranks = None
+        else:
+            self._ranks = {str(item.id): rank for rank, item in enumerate(items)}
+        self.invalidate()
+        self.sort(0 if self._ranks is not None else -1)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._ranks is None:
+            return True
+        item = self.sourceModel().item_at(source_row)
+        return item is not None and str(item.id) in self._ranks
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        model = self.sourceModel()
+        left_item = model.item_at(left.row())
+        right_item = model.item_at(right.row())
+        return self._ranks.get(str(left_item.id), 0) < self._ranks.get(str(right_item.id), 0)
+
+
+class ItemDelegate(QStyledItemDelegate):
+    """Pinta cada item con el aspecto de ItemButton"""
+
+    MARGIN_H = 15
+    MARGIN_V = 8
+    SPACING = 10
+    MIN_HEIGHT = 50
+    COLOR_BAR_SIZE = QSize(6, 30)
+    FAVORITE_SIZE = 30
+    ACTION_SIZE = 35
+    ACTION_SPACING = 5
+    TAG_SPACING = 5
+    TAG_PADDING_H = 8
+    TAG_PADDING_V = 2
+    ROW_SPACING = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover_pos: Optional[QPoint] = None
+
+        self.label_font = QFont()
+        self.label_font.setPointSize(10)
+        self.bold_label_font = QFont(self.label_font)
+        self.bold_label_font.setBold(True)
+        self.tag_font = QFont()
+        self.tag_font.setPointSize(8)
+        self.badge_font = QFont(self.tag_font)
+        self.badge_font.setBold(True)
+        self.emoji_font = QFont()
+        self.emoji_font.setPointSize(14)
+        self.button_font = QFont()
+        self.button_font.setPointSize(16)
+
+        self._label_height = QFontMetrics(self.label_font).height()
+        self._tag_height = QFontMetrics(self.tag_font).height() + 2 * self.TAG_PADDING_V
+
+    # ----- Geometria -----
+
+    def actions_for(self, item: Item, model: ItemListModel) -> List[str]:
+        """Botones de accion de un item, de izquierda a derecha"""
+        actions = ['favorite']
+        if item.is_sensitive:
+            actions.append('reveal')
+        if item.type == ItemType.CODE:
+            actions.append('execute')
+        elif item.type == ItemType.URL:
+            actions.append('open_url')
+        elif item.type == ItemType.PATH:
+            actions.append('open_explorer')
+            if model.has_openable_file(item):
+                actions.append('open_file')
+        return actions
+
+    def action_rects(self, rect: QRect, item: Item, model: ItemListModel) -> List[Tuple[str, QRect]]:
+        """Rectangulos de los botones de accion de una fila"""
+        actions = self.actions_for(item, model)
+        rects = []
+        right = rect.right() - self.MARGIN_H
+        for action in reversed(actions):
+            size = self.FAVORITE_SIZE if action == 'favorite' else self.ACTION_SIZE
+            button_rect = QRect(right - size + 1, rect.center().y() - size // 2, size, size)
+            rects.append((action, button_rect))
+            right = button_rect.left() - (self.SPACING if action == 'favorite' else self.ACTION_SPACING)
+        rects.reverse()
+        return rects
+
+    def action_at(self, rect: QRect, index: QModelIndex, pos: QPoint) -> Optional[str]:
+        """Accion bajo una posicion (None si es el cuerpo de la fila)"""
+        item = index.data(ITEM_ROLE)
+        model = self._source_model(index)
+        if item is None or model is None:
+            return None
+        for action, button_rect in self.action_rects(rect, item, model):
+            if button_rect.contains(pos):
+                return action
+        return None
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        item = index.data(ITEM_ROLE)
+        height = 2 * self.MARGIN_V + self._label_height
+        if item is not None and item.tags:
+            height += self.ROW_SPACING + self._tag_height
+        return QSize(option.rect.width(), max(height, self.MIN_HEIGHT))
+
+    # ----- Pintado -----
+
+    def paint(self, painter: QPainter, option, index: QModelIndex):
+        item = index.data(ITEM_ROLE)
+        model = self._source_model(index)
+        if item is None or model is None:
+            return
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+
+        rect = option.rect
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        copied = model.is_copied(item.id)
+
+        # Fondo
+        if copied:
+            background = SENSITIVE_COPIED_COLOR if item.is_sensitive else COPIED_COLOR
+        else:
+            colors = SENSITIVE_ROW_COLORS if item.is_sensitive else ROW_COLORS
+            background = colors[1] if hovered else colors[0]
+        painter.fillRect(rect, QColor(background))
+        painter.fillRect(QRect(rect.left(), rect.bottom(), rect.width(), 1), QColor(ROW_SEPARATOR_COLOR))
+        if item.is_sensitive and not copied:
+            painter.fillRect(QRect(rect.left(), rect.top(), 3, rect.height()), QColor(SENSITIVE_BORDER_COLOR))
+
+        # Botones de accion
+        action_rects = self.action_rects(rect, item, model)
+        for action, button_rect in action_rects:
+            self._paint_action(painter, item, model, action, button_rect)
+
+        # Zona de texto
+        left = rect.left() + self.MARGIN_H
+        right = (action_rects[0][1].left() if action_rects else rect.right() - self.MARGIN_H) - self.SPACING
+
+        # Indicador de color
+        if getattr(item, 'color', None):
+            bar = QRect(QPoint(left, rect.center().y() - self.COLOR_BAR_SIZE.height() // 2), self.COLOR_BAR_SIZE)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(item.color))
+            painter.drawRoundedRect(bar, 2, 2)
+            left = bar.right() + 1 + self.SPACING
+
+        text_color = QColor("#ffffff" if copied else TEXT_COLOR)
+        top = rect.top() + self.MARGIN_V
+        if not item.tags:
+            top = rect.center().y() - self._label_height // 2
+
+        # Badges a la derecha del label (categoria + popular/nuevo)
+        line_rect = QRect(left, top, max(right - left, 0), self._label_height)
+        badge_right = line_rect.right()
+        badge = get_item_badge(item)
+        if badge:
+            painter.setFont(self.emoji_font)
+            painter.setPen(QColor(TEXT_COLOR))
+            width = QFontMetrics(self.emoji_font).horizontalAdvance(badge)
+            badge_rect = QRect(badge_right - width + 1, line_rect.top() - 4, width, line_rect.height() + 8)
+            painter.drawText(badge_rect, Qt.AlignmentFlag.AlignCenter, badge)
+            badge_right = badge_rect.left() - 8
+
+        category_name = getattr(item, 'category_name', '') if model.show_category else ''
+        if category_name:
+            text = f"📁 {category_name}"
+            metrics = QFontMetrics(self.badge_font)
+            width = min(metrics.horizontalAdvance(text) + 2 * self.TAG_PADDING_H, max(badge_right - left, 0) // 2)
+            badge_rect = QRect(badge_right - width + 1, line_rect.center().y() - self._tag_height // 2,
+                               width, self._tag_height)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#3d3d3d"))
+            painter.drawRoundedRect(badge_rect, 3, 3)
+            painter.setFont(self.badge_font)
+            painter.setPen(QColor("#f093fb"))
+            painter.drawText(badge_rect.adjusted(self.TAG_PADDING_H, 0, -self.TAG_PADDING_H, 0),
+                             Qt.AlignmentFlag.AlignVCenter,
+                             metrics.elidedText(text, Qt.TextElideMode.ElideRight,
+                                                width - 2 * self.TAG_PADDING_H))
+            badge_right = badge_rect.left() - 8
+
+        # Label
+        label_font = self.bold_label_font if copied else self.label_font
+        painter.setFont(label_font)
+        painter.setPen(text_color)
+        label_rect = QRect(left, line_rect.top(), max(badge_right - left, 0), line_rect.height())
+        label = QFontMetrics(label_font).elidedText(
+            model.display_label(item), Qt.TextElideMode.ElideRight, label_rect.width()
+        )
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, label)
+
+        # Tags
+        if item.tags:
+            self._paint_tags(painter, item.tags, left, right,
+                             line_rect.bottom() + 1 + self.ROW_SPACING)
+
+        painter.restore()
+
+    def _paint_tags(self, painter: QPainter, tags: List[str], left: int, right: int, top: int):
+        """Pintar las etiquetas como pildoras (las que quepan)"""
+        metrics = QFontMetrics(self.tag_font)
+        painter.setFont(self.tag_font)
+        x = left
+        for tag in tags:
+            width = metrics.horizontalAdvance(tag) + 2 * self.TAG_PADDING_H
+            if x + width > right:
+                break
+            tag_rect = QRect(x, top, width, self._tag_height)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor("#007acc"))
+            painter.drawRoundedRect(tag_rect, 3, 3)
+            painter.setPen(QColor("#ffffff"))
+            painter.drawText(tag_rect, Qt.AlignmentFlag.AlignCenter, tag)
+            x = tag_rect.right() + 1 + self.TAG_SPACING
+
+    def _paint_action(self, painter: QPainter, item: Item, model: ItemListModel,
+                      action: str, rect: QRect):
+        """Pintar un boton de accion"""
+        color, hover_color = ACTION_COLORS[action]
+        hovered = self.hover_pos is not None and rect.contains(self.hover_pos)
+        flash = model.flash_color(item.id, action)
+        if flash:
+            color = flash
+        elif hovered:
+            color = hover_color
+
+        if color:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(rect, 3 if action == 'favorite' else 4, 3 if action == 'favorite' else 4)
+
+        painter.setFont(self.button_font)
+        painter.setPen(QColor("#000000" if flash in ("#ffff00", "#00ff00") else "#ffffff"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self._action_text(item, model, action))
+
+    @staticmethod
+    def _action_text(item: Item, model: ItemListModel, action: str) -> str:
+        if action == 'favorite':
+            return "⭐" if getattr(item, 'is_favorite', False) else "☆"
+        if action == 'reveal':
+            return "🙈" if model.is_revealed(item.id) else "👁"
+        if action == 'execute':
+            return "⏳" if model.flash_color(item.id, action) == "#ffff00" else "⚡"
+        return {'open_url': "🌐", 'open_explorer': "📁", 'open_file': "📝"}[action]
+
+    @staticmethod
+    def action_tooltip(item: Item, action: str) -> str:
+        """Tooltip de un boton de accion"""
+        if action == 'favorite':
+            return "Quitar de favoritos" if getattr(item, 'is_favorite', False) else "Marcar como favorito"
+        return ACTION_TOOLTIPS.get(action, "")
+
+    @staticmethod
+    def _source_model(index: QModelIndex) -> Optional[ItemListModel]:
+        model = index.model()
+        while isinstance(model, QSortFilterProxyModel):
+            model = model.sourceModel()
+        return model if isinstance(model, ItemListModel) else None
+
+
+class ItemListView(QListView):
+    """Lista virtualizada de items (reemplaza un ItemButton por item)"""
+
+    # Signals (mismos que ItemButton)
+    item_clicked = pyqtSignal(object)
+    favorite_toggled = pyqtSignal(object, bool)  # item_id, is_favorite
+
+    def __init__(self, show_category: bool = False, parent=None):
+        super().__init__(parent)
+        self.source_model = ItemListModel(show_category=show_category, parent=self)
+        self.proxy_model = ItemFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.source_model)
+        self.item_delegate = ItemDelegate(self)
+
+        self.setModel(self.proxy_model)
+        self.setItemDelegate(self.item_delegate)
+
+        # Solo se calculan y pintan las filas visibles
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(100)
+        self.setUniformItemSizes(False)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(20)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setStyleSheet("QListView { background-color: transparent; border: none; }")
+
+        self._actions = None
+        self._scheduler = TimerScheduler.get_shared()
+        self._reveal_timers: Dict[str, int] = {}  # item id -> handle del scheduler
+        self._clipboard_item: Optional[Item] = None
+        self._clipboard_timer: Optional[int] = None
+
+    @property
+    def actions(self):
+        """ItemActions (creado al primer uso: requiere la base de datos)"""
+        if self._actions is None:
+            from views.widgets.item_actions import ItemActions
+            self._actions = ItemActions()
+        return self._actions
+
+    # ----- Datos -----
+
+    def set_items(self, items: Sequence[Item]):
+        """Cargar los items (p. ej. al abrir una categoria), sin filtro"""
+        self._stop_reveal_timers()
+        self.proxy_model.set_filter_items(None)
+        self.source_model.set_items(items)
+        self.scrollToTop()
+
+    def filter_items(self, items: Optional[Sequence[Item]]):
+        """
+        Mostrar solo estos items (resultado de busqueda/filtros), en este orden
+
+        Args:
+            items: Items visibles, None para mostrar todos
+        """
+        self.proxy_model.set_filter_items(items)
+        self.scrollToTop()
+
+    def visible_count(self) -> int:
+        """Numero de items visibles tras el filtro"""
+        return self.proxy_model.rowCount()
+
+    def item_at_row(self, row: int) -> Optional[Item]:
+        """Item visible en una fila"""
+        return self.proxy_model.index(row, 0).data(ITEM_ROLE)
+
+    # ----- Interaccion -----
+
+    def mousePressEvent(self, event):
+        """Click en una fila: copiar o lanzar la accion del boton pulsado"""
+        if event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        item = index.data(ITEM_ROLE) if index.isValid() else None
+        if item is None:
+            return
+
+        action = self.item_delegate.action_at(self.visualRect(index), index, pos)
+        if action:
+            self.trigger_action(item, action)
+        else:
+            self.on_item_clicked(item)
+
+    def mouseMoveEvent(self, event):
+        """Actualizar hover de los botones de accion"""
+        self.item_delegate.hover_pos = event.position().toPoint()
+        self.viewport().update()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.item_delegate.hover_pos = None
+        self.viewport().update()
+        super().leaveEvent(event)
+
+    def viewportEvent(self, event):
+        """Tooltips de los botones de accion"""
+        if event.type() == event.Type.ToolTip:
+            pos = event.pos()
+            index = self.indexAt(pos)
+            item = index.data(ITEM_ROLE) if index.isValid() else None
+            if item is not None:
+                action = self.item_delegate.action_at(self.visualRect(index), index, pos)
+                if action:
+                    from PyQt6.QtWidgets import QToolTip
+                    QToolTip.showText(event.globalPos(), self.item_delegate.action_tooltip(item, action), self)
+                    return True
+        return super().viewportEvent(event)
+
+    def on_item_clicked(self, item: Item):
+        """Copiar item: señal, feedback y tracking"""
+        self.item_clicked.emit(item)
+
+        # Feedback de copiado
+        self.source_model.set_copied(item.id, True)
+        QTimer.singleShot(COPIED_FEEDBACK_MS, lambda: self.source_model.set_copied(item.id, False))
+
+        self.actions.track_copy(item)
+
+        # If sensitive item, start clipboard auto-clear timer
+        if item.is_sensitive:
+            self._clipboard_item = item
+            self._scheduler.cancel(self._clipboard_timer)
+            self._clipboard_timer = self._scheduler.schedule(CLIPBOARD_CLEAR_MS, self.clear_clipboard, owner=self)
+
+    def trigger_action(self, item: Item, action: str):
+        """Lanzar la accion de un boton de una fila"""
+        if action == 'favorite':
+            is_fav = self.actions.toggle_favorite(item)
+            if is_fav is not None:
+                self.source_model.refresh_item(item.id)
+                self.favorite_toggled.emit(item.id, is_fav)
+
+        elif action == 'reveal':
+            self.toggle_reveal(item)
+
+        elif action == 'execute':
+            self.execute_command(item)
+
+        else:
+            handlers = {
+                'open_url': self.actions.open_in_browser,
+                'open_explorer': self.actions.open_in_explorer,
+                'open_file': self.actions.open_file,
+            }
+            if handlers[action](item):
+                self._flash(item, action, "#00ff00", ACTION_FEEDBACK_MS)
+
+    def execute_command(self, item: Item):
+        """Ejecutar un item CODE y mostrar el resultado"""
+        self.source_model.set_flash(item.id, 'execute', "#ffff00")
+
+        # El comando corre sin bloquear; el dialog muestra la salida en vivo
+        execution = self.actions.run_command(item)
+        execution.finished.connect(
+            lambda result: self._flash(item, 'execute', "#00ff00" if result['success'] else "#ff0000",
+                                       EXECUTE_FEEDBACK_MS)
+        )
+        self.actions.show_command_output(execution, parent=self.window())
+
+    def toggle_reveal(self, item: Item):
+        """Toggle reveal/hide sensitive content (auto-hide tras 10 segundos)"""
+        item_id = str(item.id)
+        revealed = not self.source_model.is_revealed(item_id)
+        self.source_model.set_revealed(item_id, revealed)
+
+        self._scheduler.cancel(self._reveal_timers.pop(item_id, None))
+
+        if revealed:
+            self._reveal_timers[item_id] = self._scheduler.schedule(
+                REVEAL_TIMEOUT_MS, lambda: self.auto_hide(item), owner=self
+            )
+
+    def auto_hide(self, item: Item):
+        """Auto-hide sensitive content after timeout"""
+        if self.source_model.is_revealed(item.id):
+            self.toggle_reveal(item)
+        # Descartar el texto plano descifrado
+        item.release_content()
+
+    def clear_clipboard(self):
+        """Limpiar el portapapeles tras copiar un item sensible"""
+        self._clipboard_timer = None
+        self.actions.clear_clipboard()
+        item = self._clipboard_item
+        self._clipboard_item = None
+        # Descartar el texto plano descifrado (salvo que siga revelado)
+        if item is not None and not self.source_model.is_revealed(item.id):
+            item.release_content()
+
+    def _flash(self, item: Item, action: str, color: str, duration_ms: int):
+        """Color temporal en un boton de accion"""
+        self.source_model.set_flash(item.id, action, color)
+        QTimer.singleShot(duration_ms, lambda: self.source_model.set_flash(item.id, action, None))
+
+    def _stop_reveal_timers(self):
+        for handle in self._reveal_timers.values():
+            self._scheduler.cancel(handle)
+        self._reveal_timers.clear()
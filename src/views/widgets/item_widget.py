@@ -5,18 +5,14 @@ from PyQt6.QtWidgets import QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QLab
 from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
 from PyQt6.QtGui import QFont
 import sys
-import webbrowser
-import os
-import subprocess
-import platform
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from models.item import Item, ItemType
 from core.usage_tracker import UsageTracker
 from core.favorites_manager import FavoritesManager
-from views.command_output_dialog import CommandOutputDialog
-import time
+from core.timer_scheduler import TimerScheduler
+from views.widgets.item_actions import ItemActions
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,15 +31,18 @@ class ItemButton(QFrame):
         self.show_category = show_category  # Show category badge in global search
         self.is_copied = False
         self.is_revealed = False  # Track if sensitive content is revealed
-        self.reveal_timer = None  # Timer for auto-hide
-        self.clipboard_clear_timer = None  # Timer for clipboard clearing
+        self.reveal_timer = None  # Handle del TimerScheduler para auto-ocultar
+        self.clipboard_clear_timer = None  # Handle del TimerScheduler para limpiar el portapapeles
 
-        # Usage tracking
-        self.usage_tracker = UsageTracker()
+        # Usage tracking (instancia compartida por todos los items)
+        self.usage_tracker = UsageTracker.get_shared()
         self.execution_start_time = None
 
-        # Favorites management
-        self.favorites_manager = FavoritesManager()
+        # Favorites management (instancia compartida por todos los items)
+        self.favorites_manager = FavoritesManager.get_shared()
+
+        # Acciones (abrir, ejecutar, favorito) compartidas con la lista virtualizada
+        self.actions = ItemActions(self.usage_tracker, self.favorites_manager)
 
         self.init_ui()
 
@@ -389,19 +388,14 @@ class ItemButton(QFrame):
 
     def on_clicked(self):
         """Handle button click"""
-        # Track clipboard copy (comando simple)
-        if self.item.type not in [ItemType.URL, ItemType.PATH]:
-            start_time = self.usage_tracker.track_execution_start(self.item.id)
-
         # Emit signal with item
         self.item_clicked.emit(self.item)
 
         # Show copied feedback
         self.show_copied_feedback()
 
-        # Track completion for clipboard copy
-        if self.item.type not in [ItemType.URL, ItemType.PATH]:
-            self.usage_tracker.track_execution_end(self.item.id, start_time, True, None)
+        # Track clipboard copy (comando simple)
+        self.actions.track_copy(self.item)
 
         # If sensitive item, start clipboard auto-clear timer
         if hasattr(self.item, 'is_sensitive') and self.item.is_sensitive:
@@ -409,147 +403,33 @@ class ItemButton(QFrame):
 
     def open_in_browser(self):
         """Open URL in default browser"""
-        if self.item.type == ItemType.URL:
-            # Track execution start
-            start_time = self.usage_tracker.track_execution_start(self.item.id)
-            success = False
-            error_msg = None
-
-            try:
-                url = self.item.content
-                # Ensure URL has proper protocol
-                if not url.startswith(('http://', 'https://')):
-                    if url.startswith('www.'):
-                        url = 'https://' + url
-                    else:
-                        url = 'https://' + url
-
-                # Open in browser
-                webbrowser.open(url)
-                success = True
-
-                # Update button style briefly to show it was clicked
-                original_style = self.open_url_button.styleSheet()
-                self.open_url_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_url_button.setStyleSheet(original_style))
-
-            except Exception as e:
-                logger.error(f"Error opening URL {self.item.label}: {e}")
-                error_msg = str(e)
-
-            finally:
-                # Track execution end
-                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+        if self.actions.open_in_browser(self.item):
+            self._flash_button(self.open_url_button)
 
     def open_in_explorer(self):
         """Open file/folder in system file explorer"""
-        if self.item.type == ItemType.PATH:
-            # Track execution start
-            start_time = self.usage_tracker.track_execution_start(self.item.id)
-            success = False
-            error_msg = None
-
-            try:
-                path = Path(self.item.content)
-                system = platform.system()
-
-                if system == 'Windows':
-                    # Windows: Use explorer with /select to highlight the file/folder
-                    if path.exists():
-                        subprocess.run(['explorer', '/select,', str(path.absolute())])
-                    else:
-                        # If path doesn't exist, try to open parent directory
-                        parent = path.parent
-                        if parent.exists():
-                            subprocess.run(['explorer', str(parent.absolute())])
-
-                elif system == 'Darwin':  # macOS
-                    if path.exists():
-                        subprocess.run(['open', '-R', str(path.absolute())])
-                    else:
-                        parent = path.parent
-                        if parent.exists():
-                            subprocess.run(['open', str(parent.absolute())])
-
-                else:  # Linux
-                    if path.exists():
-                        if path.is_file():
-                            subprocess.run(['xdg-open', str(path.parent.absolute())])
-                        else:
-                            subprocess.run(['xdg-open', str(path.absolute())])
-                    else:
-                        parent = path.parent
-                        if parent.exists():
-                            subprocess.run(['xdg-open', str(parent.absolute())])
-
-                success = True
-
-                # Visual feedback
-                original_style = self.open_explorer_button.styleSheet()
-                self.open_explorer_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_explorer_button.setStyleSheet(original_style))
-
-            except Exception as e:
-                logger.error(f"Error opening explorer for {self.item.label}: {e}")
-                error_msg = str(e)
-
-            finally:
-                # Track execution end
-                self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+        if self.actions.open_in_explorer(self.item):
+            self._flash_button(self.open_explorer_button)
 
     def open_file(self):
         """Open file with default application"""
-        if self.item.type == ItemType.PATH:
-            path = Path(self.item.content)
-
-            if not path.exists() or not path.is_file():
-                print(f"File not found: {path}")
-                return
-
-            try:
-                system = platform.system()
-
-                if system == 'Windows':
-                    # Windows: Use os.startfile
-                    os.startfile(str(path.absolute()))
-
-                elif system == 'Darwin':  # macOS
-                    subprocess.run(['open', str(path.absolute())])
-
-                else:  # Linux
-                    subprocess.run(['xdg-open', str(path.absolute())])
-
-                # Visual feedback
-                original_style = self.open_file_button.styleSheet()
-                self.open_file_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                QTimer.singleShot(300, lambda: self.open_file_button.setStyleSheet(original_style))
-
-            except Exception as e:
-                print(f"Error opening file: {e}")
+        if self.actions.open_file(self.item):
+            self._flash_button(self.open_file_button)
+
+    @staticmethod
+    def _flash_button(button):
+        """Feedback visual breve (verde) al pulsar un boton de accion"""
+        original_style = button.styleSheet()
+        button.setStyleSheet("""
+            QPushButton {
+                background-color: #00ff00;
+                color: #ffffff;
+                border: none;
+                border-radius: 4px;
+                font-size: 16pt;
+            }
+        """)
+        QTimer.singleShot(300, lambda: button.setStyleSheet(original_style))
 
     def show_copied_feedback(self):
         """Show visual feedback that item was copied"""
@@ -653,52 +533,45 @@ class ItemButton(QFrame):
             self.reveal_button.setText("🙈")
             self.reveal_button.setToolTip("Ocultar contenido sensible")
 
-            # Cancelar timer anterior si existe
-            if self.reveal_timer:
-                self.reveal_timer.stop()
-
-            # Auto-ocultar despues de 10 segundos
-            self.reveal_timer = QTimer()
-            self.reveal_timer.setSingleShot(True)
-            self.reveal_timer.timeout.connect(self.auto_hide)
-            self.reveal_timer.start(10000)  # 10 segundos
+            # Auto-ocultar despues de 10 segundos (reemplaza el plazo anterior)
+            scheduler = TimerScheduler.get_shared()
+            scheduler.cancel(self.reveal_timer)
+            self.reveal_timer = scheduler.schedule(10000, self.auto_hide, owner=self)
         else:
             # Cambiar icono del boton
             self.reveal_button.setText("👁")
             self.reveal_button.setToolTip("Revelar/Ocultar contenido sensible")
 
-            # Cancelar timer si existe
-            if self.reveal_timer:
-                self.reveal_timer.stop()
+            # Cancelar el auto-ocultado pendiente
+            TimerScheduler.get_shared().cancel(self.reveal_timer)
+            self.reveal_timer = None
 
     def auto_hide(self):
         """Auto-hide sensitive content after timeout"""
         if self.is_revealed:
             self.toggle_reveal()
+        # Descartar el texto plano descifrado
+        self.item.release_content()
 
     def start_clipboard_clear_timer(self):
         """Start timer to clear clipboard after 30 seconds for sensitive items"""
-        # Cancel previous timer if exists
-        if self.clipboard_clear_timer:
-            self.clipboard_clear_timer.stop()
-
-        # Start 30-second timer
-        self.clipboard_clear_timer = QTimer()
-        self.clipboard_clear_timer.setSingleShot(True)
-        self.clipboard_clear_timer.timeout.connect(self.clear_clipboard)
-        self.clipboard_clear_timer.start(30000)  # 30 seconds
+        # Replace the previous deadline; without owner: the clipboard is
+        # cleared even if this widget is destroyed before
+        scheduler = TimerScheduler.get_shared()
+        scheduler.cancel(self.clipboard_clear_timer)
+        self.clipboard_clear_timer = scheduler.schedule(30000, self.clear_clipboard)
 
     def clear_clipboard(self):
         """Clear clipboard content"""
-        try:
-            import pyperclip
-            pyperclip.copy("")  # Clear clipboard
-        except Exception as e:
-            print(f"Error clearing clipboard: {e}")
+        self.actions.clear_clipboard()
+        # Descartar el texto plano descifrado (salvo que siga revelado)
+        if not self.is_revealed:
+            self.item.release_content()
 
     def update_favorite_button(self):
         """Actualizar icono del botón de favorito"""
-        is_fav = self.favorites_manager.is_favorite(self.item.id)
+        # Estado ya cargado en el item (sin consultar la base de datos por widget)
+        is_fav = getattr(self.item, 'is_favorite', False)
 
         if is_fav:
             self.favorite_btn.setText("⭐")
@@ -709,19 +582,16 @@ class ItemButton(QFrame):
 
     def toggle_favorite(self):
         """Alternar estado de favorito"""
-        try:
-            is_fav = self.favorites_manager.toggle_favorite(self.item.id)
+        is_fav = self.actions.toggle_favorite(self.item)
+        if is_fav is None:
+            return
 
-            # Actualizar botón
-            self.update_favorite_button()
+        # Actualizar botón
+        self.update_favorite_button()
 
-            # Emitir señal
+        # Emitir señal
+        try:
             self.favorite_toggled.emit(self.item.id, is_fav)
-
-            # Log
-            msg = "agregado a" if is_fav else "quitado de"
-            logger.info(f"Item '{self.item.label}' {msg} favoritos")
-
         except Exception as e:
             logger.error(f"Error toggling favorite for item {self.item.id}: {e}")
 
@@ -798,117 +668,39 @@ class ItemButton(QFrame):
         if self.item.type != ItemType.CODE:
             return
 
-        # Track execution start
-        start_time = self.usage_tracker.track_execution_start(self.item.id)
-        success = False
-        error_msg = None
-
-        try:
-            command = self.item.content.strip()
-
-            # Visual feedback - cambiar botón a amarillo mientras ejecuta
-            original_style = self.execute_button.styleSheet()
+        # Visual feedback - cambiar botón a amarillo mientras ejecuta
+        original_style = self.execute_button.styleSheet()
+        self.execute_button.setStyleSheet("""
+            QPushButton {
+                background-color: #ffff00;
+                color: #000000;
+                border: none;
+                border-radius: 4px;
+                font-size: 16pt;
+            }
+        """)
+        self.execute_button.setText("⏳")
+        self._execute_original_style = original_style
+
+        # El comando corre sin bloquear; el dialog muestra la salida en vivo
+        execution = self.actions.run_command(self.item)
+        execution.finished.connect(self._on_command_finished)
+        self.actions.show_command_output(execution, parent=self.window())
+
+    def _on_command_finished(self, result: dict):
+        """Restaurar botón de ejecutar: verde si éxito, rojo si error"""
+        self.execute_button.setText("⚡")
+        if result['success']:
             self.execute_button.setStyleSheet("""
                 QPushButton {
-                    background-color: #ffff00;
+                    background-color: #00ff00;
                     color: #000000;
                     border: none;
                     border-radius: 4px;
                     font-size: 16pt;
                 }
             """)
-            self.execute_button.setText("⏳")
-
-            # Ejecutar comando usando subprocess
-            # En Windows, necesitamos usar shell=True para comandos como 'dir', 'git', etc.
-            system = platform.system()
-
-            # Determinar directorio de trabajo
-            cwd = None
-            if hasattr(self.item, 'working_dir') and self.item.working_dir:
-                from pathlib import Path
-                working_dir_path = Path(self.item.working_dir)
-                if working_dir_path.exists() and working_dir_path.is_dir():
-                    cwd = str(working_dir_path.absolute())
-                    logger.info(f"Executing command in working directory: {cwd}")
-                else:
-                    logger.warning(f"Working directory does not exist: {self.item.working_dir}")
-
-            if system == 'Windows':
-                # En Windows, usar cmd.exe para ejecutar el comando
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,  # Timeout de 30 segundos
-                    cwd=cwd  # Directorio de trabajo
-                )
-            else:
-                # En Unix-like systems, usar bash
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    executable='/bin/bash',
-                    cwd=cwd  # Directorio de trabajo
-                )
-
-            # Obtener output y error
-            stdout = result.stdout if result.stdout else ""
-            stderr = result.stderr if result.stderr else ""
-            return_code = result.returncode
-
-            # Considerar éxito si return code es 0
-            success = (return_code == 0)
-
-            # Restaurar botón
-            self.execute_button.setText("⚡")
-            if success:
-                # Verde si éxito
-                self.execute_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #00ff00;
-                        color: #000000;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-            else:
-                # Rojo si error
-                self.execute_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #ff0000;
-                        color: #ffffff;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 16pt;
-                    }
-                """)
-                error_msg = stderr if stderr else "Error desconocido"
-
-            # Restaurar estilo original después de 1 segundo
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
-
-            # Mostrar dialog con el resultado
-            dialog = CommandOutputDialog(
-                command=command,
-                output=stdout,
-                error=stderr,
-                return_code=return_code,
-                parent=self.window()
-            )
-            dialog.exec()
-
-        except subprocess.TimeoutExpired:
-            logger.error(f"Command timeout: {self.item.label}")
-            error_msg = "Comando excedió el tiempo de espera (30 segundos)"
-
-            # Restaurar botón con estilo de error
-            self.execute_button.setText("⚡")
+        else:
             self.execute_button.setStyleSheet("""
                 QPushButton {
                     background-color: #ff0000;
@@ -918,45 +710,7 @@ class ItemButton(QFrame):
                     font-size: 16pt;
                 }
             """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
-
-            # Mostrar dialog de error
-            dialog = CommandOutputDialog(
-                command=command,
-                output="",
-                error=error_msg,
-                return_code=-1,
-                parent=self.window()
-            )
-            dialog.exec()
-
-        except Exception as e:
-            logger.error(f"Error executing command {self.item.label}: {e}")
-            error_msg = str(e)
 
-            # Restaurar botón con estilo de error
-            self.execute_button.setText("⚡")
-            self.execute_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #ff0000;
-                    color: #ffffff;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 16pt;
-                }
-            """)
-            QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
-
-            # Mostrar dialog de error
-            dialog = CommandOutputDialog(
-                command=command if 'command' in locals() else self.item.content,
-                output="",
-                error=error_msg,
-                return_code=-1,
-                parent=self.window()
-            )
-            dialog.exec()
-
-        finally:
-            # Track execution end
-            self.usage_tracker.track_execution_end(self.item.id, start_time, success, error_msg)
+        # Restaurar estilo original después de 1 segundo
+        original_style = self._execute_original_style
+        QTimer.singleShot(1000, lambda: self.execute_button.setStyleSheet(original_style))
@@ -408,13 +408,12 @@ class ListWidget(QFrame):
 
     def on_step_copied(self, step_number: int, label: str, content: str):
         """Handler cuando se copia un paso individual"""
-        import pyperclip
-        try:
-            pyperclip.copy(content)
+        from core.clipboard_manager import ClipboardManager
+        if ClipboardManager.get_shared().copy_text(content):
             self.item_copied.emit(content)
             logger.info(f"[LIST_WIDGET] Step {step_number} copied: {label}")
-        except Exception as e:
-            logger.error(f"[LIST_WIDGET] Error copying step: {e}")
+        else:
+            logger.error(f"[LIST_WIDGET] Error copying step {step_number}")
 
     def on_execute_clicked(self):
         """Handler para ejecutar todos los pasos secuencialmente"""
@@ -5,17 +5,21 @@ Fecha: 2025-01-23
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.stats_manager import StatsManager
+from core.timer_scheduler import TimerScheduler
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Intervalo de auto-refresco (ms)
+REFRESH_INTERVAL_MS = 30000
+
 
 class StatsWidget(QWidget):
     """Widget compacto que muestra estadísticas básicas"""
@@ -26,10 +30,11 @@ class StatsWidget(QWidget):
         self.init_ui()
         self.load_stats()
 
-        # Auto-refresh cada 30 segundos
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh)
-        self.timer.start(30000)
+        # Auto-refresh cada 30 segundos (solo visible; oculto se refresca al mostrarse)
+        self._stale = False
+        self.timer_handle = TimerScheduler.get_shared().schedule(
+            REFRESH_INTERVAL_MS, self._on_refresh_tick, owner=self, repeat=True, suspendable=True
+        )
 
     def init_ui(self):
         """Inicializar UI"""
@@ -181,7 +186,7 @@ class StatsWidget(QWidget):
 
             # Total favoritos
             from core.favorites_manager import FavoritesManager
-            favorites_manager = FavoritesManager()
+            favorites_manager = FavoritesManager.get_shared()
             favorites = favorites_manager.get_all_favorites()
             favorites_count = len(favorites)
             self._update_stat_value(self.favorites_label, str(favorites_count))
@@ -200,10 +205,23 @@ class StatsWidget(QWidget):
     def refresh(self):
         """Refrescar estadísticas"""
         logger.debug("Refreshing stats widget")
+        self._stale = False
         self.load_stats()
 
+    def _on_refresh_tick(self):
+        """Auto-refresh: sin consultas mientras el widget está oculto"""
+        if self.isVisible():
+            self.refresh()
+        else:
+            self._stale = True
+
+    def showEvent(self, event):
+        """Refrescar al mostrarse si se saltó algún auto-refresh"""
+        super().showEvent(event)
+        if self._stale:
+            self.refresh()
+
     def closeEvent(self, event):
         """Cleanup al cerrar"""
-        if self.timer:
-            self.timer.stop()
+        TimerScheduler.get_shared().cancel(self.timer_handle)
         super().closeEvent(event)
@@ -0,0 +1,120 @@
+"""
+Test: acciones en bloque del Structure Dashboard (UPDATE/DELETE por lotes de ids)
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import database.db_manager as db_module
+from database.db_manager import DBManager
+from core.dashboard_manager import DashboardManager
+from views.dashboard.bulk_action_worker import BulkActionWorker
+
+
+def _create_items(db, count):
+    category_id = db.add_category("Dev")
+    item_ids = db.add_items_bulk([
+        {'category_id': category_id, 'label': f"Item {i}", 'content': f"content {i}"}
+        for i in range(count)
+    ])
+    return category_id, item_ids
+
+
+def test_chunked_update_and_delete():
+    """Test: update_items_by_ids y delete_items_bulk trabajan por lotes de ids"""
+    print("=" * 60)
+    print("TEST 1: UPDATE/DELETE ... WHERE id IN (...)")
+    print("=" * 60)
+
+    original_chunk = db_module.SQL_IN_CHUNK_SIZE
+    db_module.SQL_IN_CHUNK_SIZE = 4
+    try:
+        db = DBManager(":memory:")
+        _, item_ids = _create_items(db, 10)
+
+        progress = []
+        updated = db.update_items_by_ids(item_ids, {'is_favorite': 1, 'is_archived': 1},
+                                         progress_callback=progress.append)
+        print(f"  Actualizados: {updated}, lotes: {progress}")
+        assert updated == 10
+        assert progress == [4, 4, 2]
+        assert all(db.get_item(item_id)['is_favorite'] for item_id in item_ids)
+
+        try:
+            db.update_items_by_ids(item_ids, {'content': "x"})
+            assert False, "content no se puede asignar en bloque"
+        except ValueError:
+            pass
+
+        progress = []
+        deleted = db.delete_items_bulk(item_ids[:9], progress_callback=progress.append)
+        assert deleted == 9
+        assert progress == [4, 4, 1]
+        assert db.execute_query("SELECT COUNT(*) AS total FROM items")[0]['total'] == 1
+
+        db.close()
+    finally:
+        db_module.SQL_IN_CHUNK_SIZE = original_chunk
+
+    print("\n[PASS] Lotes de ids")
+
+
+def test_worker_single_transaction():
+    """Test: el worker aplica la accion en una transaccion y la deshace si falla"""
+    print("\n" + "=" * 60)
+    print("TEST 2: BulkActionWorker")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = DBManager(str(Path(tmpdir) / "bulk.db"))
+        category_id, item_ids = _create_items(db, 6)
+        other_id = db.add_category("Ops")
+
+        manager = DashboardManager(db)
+        structure = manager.get_full_structure()
+
+        worker = BulkActionWorker(db, item_ids, [other_id],
+                                  item_fields={'is_archived': 1}, category_fields={'is_active': 0})
+        results, progress = [], []
+        worker.completed.connect(results.append)
+        worker.progress.connect(lambda done, total: progress.append((done, total)))
+        worker.run()
+
+        print(f"  Resultado: {results}, progreso: {progress}")
+        assert results == [{'items': 6, 'categories': 1}]
+        assert progress[-1] == (7, 7)
+        assert all(db.get_item(item_id)['is_archived'] for item_id in item_ids)
+        assert not db.get_category(other_id)['is_active']
+
+        # La estructura en cache se parchea sin recargar
+        patched = manager.apply_item_changes(item_ids, worker.item_fields)
+        assert len(patched) == 6 and all(item['is_archived'] is True for item in patched)
+        manager.apply_category_changes([other_id], worker.category_fields)
+        assert [c['id'] for c in structure['categories']] == [category_id]
+
+        # Un fallo deshace tambien los cambios de categorias
+        errors = []
+        worker = BulkActionWorker(db, item_ids, [category_id],
+                                  item_fields={'is_favorite': 1, 'content': "x"},
+                                  category_fields={'is_active': 0})
+        worker.failed.connect(errors.append)
+        worker.run()
+        assert errors
+        assert db.get_category(category_id)['is_active']
+        assert not any(db.get_item(item_id)['is_favorite'] for item_id in item_ids)
+
+        worker = BulkActionWorker(db, item_ids[:2], [category_id], delete=True)
+        worker.run()
+        assert db.execute_query("SELECT COUNT(*) AS total FROM items")[0]['total'] == 0
+
+        db.close()
+
+    print("\n[PASS] Una transaccion por accion")
+
+
+if __name__ == "__main__":
+    test_chunked_update_and_delete()
+    test_worker_single_transaction()
+    print("\nTODOS LOS TESTS PASARON")
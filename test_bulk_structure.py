@@ -0,0 +1,102 @@
+"""
+Test: carga de estructura en bloque y filtros sin copias profundas
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from core.dashboard_manager import DashboardManager
+from core.config_manager import ConfigManager
+
+
+def _create_db(db=None):
+    db = db or DBManager(":memory:")
+    dev = db.add_category("Dev")
+    ops = db.add_category("Ops")
+    hidden = db.add_category("Hidden")
+    db.execute_update("UPDATE categories SET is_active = 0 WHERE id = ?", (hidden,))
+
+    db.add_item(dev, "Git status", "git status", tags=["vcs"])
+    db.add_item(dev, "Token", "secret-token", is_sensitive=True)
+    db.add_item(ops, "Deploy", "make deploy", item_type="CODE", is_favorite=True)
+    db.add_item(hidden, "Old", "old")
+    return db
+
+
+def test_bulk_loader_matches_per_category_queries():
+    """Test: get_categories_with_items devuelve lo mismo que la carga por categoria"""
+    print("=" * 60)
+    print("TEST 1: Carga en bloque")
+    print("=" * 60)
+
+    db = _create_db()
+
+    bulk = db.get_categories_with_items()
+    expected = db.get_categories()
+    for category in expected:
+        category['items'] = db.get_items_by_category(category['id'])
+
+    print(f"  Categorias: {[c['name'] for c in bulk]}")
+    assert bulk == expected
+    assert bulk[0]['items'][1]['content'] == "secret-token"
+    assert bulk[0]['items'][0]['tags'] == ["vcs"]
+
+    encrypted = db.get_categories_with_items(decrypt=False)
+    assert encrypted[0]['items'][1]['content_encrypted']
+
+    assert len(db.get_categories_with_items(include_inactive=True)) == 3
+
+    db.close()
+
+    # ConfigManager construye los Category con la misma carga
+    config = ConfigManager(db_path=":memory:")
+    _create_db(config.db)
+    categories = config.get_categories()
+    assert [c.name for c in categories] == ["Dev", "Ops"]
+    assert [len(c.items) for c in categories] == [2, 1]
+    config.db.close()
+    print("\n[PASS] Una consulta para todos los items")
+
+
+def test_filter_views_share_items():
+    """Test: filtrar/ordenar no copia ni modifica la estructura original"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Vistas filtradas")
+    print("=" * 60)
+
+    db = _create_db()
+    manager = DashboardManager(db)
+    structure = manager.get_full_structure()
+    original_counts = [len(c['items']) for c in structure['categories']]
+
+    favorites = manager.filter_and_sort_structure(
+        structure=structure,
+        state_filters={'favorites': True, 'sensitive': False, 'normal': False},
+        sort_by='items_desc'
+    )
+    assert [len(c['items']) for c in favorites['categories']] == [1, 0]
+    assert favorites['categories'][0]['items'][0] is structure['categories'][1]['items'][0]
+
+    code_only = manager.filter_and_sort_structure(structure=structure, type_filters={'TEXT': False})
+    assert sum(len(c['items']) for c in code_only['categories']) == 1
+
+    sorted_desc = manager.filter_and_sort_structure(structure=structure, sort_by='name_desc')
+    assert [c['name'] for c in sorted_desc['categories']] == ["Ops", "Dev"]
+
+    sensitive = manager.filter_structure_items(lambda item: item['is_sensitive'], structure)
+    assert [len(c['items']) for c in sensitive['categories']] == [1, 0]
+
+    # La estructura original sigue intacta
+    assert [c['name'] for c in structure['categories']] == ["Dev", "Ops"]
+    assert [len(c['items']) for c in structure['categories']] == original_counts
+
+    db.close()
+    print("\n[PASS] Vistas sin deepcopy")
+
+
+if __name__ == "__main__":
+    test_bulk_loader_matches_per_category_queries()
+    test_filter_views_share_items()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,107 @@
+"""
+Test: API de escritura en bloque de DBManager
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+
+
+def _count_items(db):
+    return db.execute_query("SELECT COUNT(*) AS total FROM items")[0]['total']
+
+
+def test_add_update_delete_bulk():
+    """Test: add/update/delete_items_bulk escriben todas las filas"""
+    print("=" * 60)
+    print("TEST 1: Escritura en bloque")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    category_id = db.add_category("Dev")
+
+    item_ids = db.add_items_bulk([
+        {'category_id': category_id, 'label': f"Item {i}", 'content': f"content {i}",
+         'tags': ["bulk"], 'is_sensitive': i == 2}
+        for i in range(5)
+    ])
+    print(f"  IDs: {item_ids}")
+    assert len(item_ids) == 5
+    assert [db.get_item(item_id)['label'] for item_id in item_ids] == [f"Item {i}" for i in range(5)]
+
+    # El contenido sensible se guarda cifrado
+    raw = db.execute_query("SELECT content FROM items WHERE id = ?", (item_ids[2],))[0]['content']
+    assert raw != "content 2"
+    assert db.get_item(item_ids[2])['content'] == "content 2"
+
+    updated = db.update_items_bulk(
+        [{'id': item_id, 'is_favorite': 1} for item_id in item_ids[:3]]
+        + [{'id': item_ids[2], 'content': "new secret"}, {'id': item_ids[3], 'tags': ["x"]}]
+    )
+    assert updated == 5
+    assert db.get_item(item_ids[0])['is_favorite'] == 1
+    assert db.get_item(item_ids[2])['content'] == "new secret"
+    raw = db.execute_query("SELECT content FROM items WHERE id = ?", (item_ids[2],))[0]['content']
+    assert raw != "new secret"
+    assert db.get_item(item_ids[3])['tags'] == ["x"]
+
+    assert db.delete_items_bulk(item_ids[:2]) == 2
+    assert _count_items(db) == 3
+
+    db.close()
+    print("\n[PASS] Filas escritas en bloque")
+
+
+def test_transaction_rollback():
+    """Test: un fallo deshace todo el lote y las transacciones anidadas"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Rollback")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    category_id = db.add_category("Dev")
+
+    try:
+        db.add_items_bulk([
+            {'category_id': category_id, 'label': "Ok", 'content': "ok"},
+            {'category_id': category_id, 'label': "Bad", 'content': "x", 'type': "INVALID"},
+        ])
+        assert False, "El lote invalido deberia fallar"
+    except Exception as e:
+        print(f"  Error esperado: {e}")
+    assert _count_items(db) == 0
+
+    # execute_update dentro de transaction() no confirma por su cuenta
+    try:
+        with db.transaction():
+            db.add_item(category_id, "Inside", "inside")
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    assert _count_items(db) == 0
+
+    # Una transaccion anidada fallida solo deshace su parte
+    with db.transaction():
+        db.add_item(category_id, "Kept", "kept")
+        try:
+            db.add_items_bulk([{'category_id': category_id, 'label': "Bad", 'content': "x", 'type': "INVALID"}])
+        except Exception:
+            pass
+    assert _count_items(db) == 1
+
+    # create_list y update_list usan la insercion en bloque
+    ids = db.create_list(category_id, "Deploy", [{'label': "Build"}, {'label': "Push"}])
+    assert len(ids) == 2
+    assert db.update_list(category_id, "Deploy", "Release", [{'label': "A"}, {'label': "B"}, {'label': "C"}])
+    assert [item['label'] for item in db.get_list_items(category_id, "Release")] == ["A", "B", "C"]
+
+    db.close()
+    print("\n[PASS] Transacciones reales")
+
+
+if __name__ == "__main__":
+    test_add_update_delete_bulk()
+    test_transaction_rollback()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,135 @@
+"""
+Test: eventos de cambio de DBManager y caches actualizadas por entrada
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from database.change_events import ChangeType
+from core.config_manager import ConfigManager
+from core.dashboard_manager import DashboardManager
+
+
+def test_writes_publish_events():
+    """Test: cada escritura publica un evento con generacion creciente"""
+    print("=" * 60)
+    print("TEST 1: Eventos publicados")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    events = []
+    db.changes.subscribe(events.append)
+
+    category_id = db.add_category("Dev")
+    item_id = db.add_item(category_id, "Deploy", "make deploy")
+    db.update_item(item_id, is_favorite=True)
+    db.update_item(item_id, label="Deploy prod")
+    bulk_ids = db.add_items_bulk([{'category_id': category_id, 'label': f"Cmd {i}", 'content': "x"}
+                                  for i in range(3)])
+    db.delete_items_bulk(bulk_ids)
+    db.delete_category(category_id)
+
+    print(f"  Eventos: {[(e.type.value, e.generation) for e in events]}")
+    assert [e.type for e in events] == [
+        ChangeType.CATEGORY_ADDED, ChangeType.ITEM_ADDED, ChangeType.FAVORITE_TOGGLED,
+        ChangeType.ITEM_UPDATED, ChangeType.ITEM_ADDED, ChangeType.ITEM_DELETED,
+        ChangeType.CATEGORY_DELETED,
+    ]
+    assert [e.generation for e in events] == list(range(1, 8))
+    assert events[3].fields == frozenset({'label'})
+    assert events[4].item_ids == tuple(bulk_ids) and events[5].category_ids == (category_id,)
+    db.close()
+
+    print("\n[PASS] Un evento por escritura")
+
+
+def test_transaction_defers_events():
+    """Test: dentro de transaction() los eventos se publican al confirmar"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Transacciones")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    events = []
+    db.changes.subscribe(events.append)
+    category_id = db.add_category("Dev")
+    events.clear()
+
+    with db.transaction():
+        db.add_item(category_id, "A", "a")
+        try:
+            with db.transaction():
+                db.add_item(category_id, "B", "b")
+                raise ValueError("deshacer el savepoint")
+        except ValueError:
+            pass
+        assert events == []
+    assert [e.type for e in events] == [ChangeType.ITEM_ADDED]
+
+    try:
+        with db.transaction():
+            db.add_item(category_id, "C", "c")
+            raise ValueError("deshacer todo")
+    except ValueError:
+        pass
+    assert len(events) == 1 and db.changes.generation == events[-1].generation
+    db.close()
+
+    print("\n[PASS] Eventos solo de cambios confirmados")
+
+
+def test_caches_reload_only_touched_categories():
+    """Test: ConfigManager y DashboardManager recargan solo las categorias afectadas"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Caches por categoria")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "changes.db")
+        config = ConfigManager(db_path=db_path, base_dir=Path(tmpdir))
+        db = config.db
+        dev = db.add_category("Dev", order_index=1)
+        ops = db.add_category("Ops", order_index=2)
+        deploy = db.add_item(dev, "Deploy", "make deploy")
+        db.add_item(ops, "Logs", "tail -f")
+        dashboard = DashboardManager(db)
+
+        categories = config.get_categories()
+        structure = dashboard.get_full_structure()
+        ops_category = next(c for c in categories if c.name == "Ops")
+        ops_entry = next(c for c in structure['categories'] if c['name'] == "Ops")
+        assert config.get_categories() is categories
+
+        db.update_item(deploy, label="Deploy prod")
+        db.add_item(dev, "Build", "make build")
+
+        categories = config.get_categories()
+        dev_category = next(c for c in categories if c.name == "Dev")
+        assert sorted(item.label for item in dev_category.items) == ["Build", "Deploy prod"]
+        # La otra categoria no se recargo
+        assert next(c for c in categories if c.name == "Ops") is ops_category
+
+        structure = dashboard.get_full_structure()
+        dev_entry = next(c for c in structure['categories'] if c['name'] == "Dev")
+        assert [item['label'] for item in dev_entry['items']] == ["Deploy prod", "Build"]
+        assert next(c for c in structure['categories'] if c['name'] == "Ops") is ops_entry
+
+        # Desactivar y agregar categorias mantiene el orden de la base de datos
+        db.update_category(dev, is_active=False)
+        new_id = db.add_category("Docs", order_index=0)
+        assert [c.name for c in config.get_categories()] == ["Docs", "Ops"]
+        assert [c['id'] for c in dashboard.get_full_structure()['categories']] == [new_id, ops]
+
+        config.close()
+
+    print("\n[PASS] Solo se recargan las categorias afectadas")
+
+
+if __name__ == "__main__":
+    test_writes_publish_events()
+    test_transaction_defers_events()
+    test_caches_reload_only_touched_categories()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,119 @@
+"""
+Test: graficos QPainter de las estadisticas (sin matplotlib)
+"""
+import sys
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from views.widgets.charts import (BarChartWidget, LineChartWidget, PieChartWidget,
+                                  HeatmapWidget, BACKGROUND_COLOR)
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+class CountingBarChart(BarChartWidget):
+    """BarChartWidget que cuenta los calculos de geometria"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.layouts = 0
+
+    def _compute_geometry(self, rect):
+        self.layouts += 1
+        return super()._compute_geometry(rect)
+
+
+def test_charts_render():
+    """Test: cada grafico se pinta con datos y sin datos"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Pintado de graficos")
+    print("=" * 60)
+
+    bar = BarChartWidget("Top", horizontal=True)
+    bar.set_data(["Deploy", "Build con un nombre muy largo"], [12, 3])
+    line = LineChartWidget("Uso")
+    line.set_data(["01/01", "02/01", "03/01"], [1, 0, 5])
+    pie = PieChartWidget("Categorias")
+    pie.set_data(["Dev", "Ops"], [3, 1])
+    heatmap = HeatmapWidget("Mapa")
+    heatmap.set_data(["Lun", "Mar"], ["0", "1", "2"], [[0, 1, 2], [3, 0, 0]])
+
+    for chart in (bar, line, pie, heatmap, BarChartWidget("Vacio"), PieChartWidget()):
+        chart.resize(400, 240)
+        image = chart.grab().toImage()
+        assert not image.isNull()
+        print(f"  {type(chart).__name__}: {image.width()}x{image.height()} empty={chart.is_empty()}")
+
+    # Celdas sin uso con el color de fondo, la mayor con el color del mapa
+    assert heatmap.cell_color(0) == BACKGROUND_COLOR
+    assert heatmap.cell_color(3) == heatmap.color
+
+    print("\n[PASS] Graficos pintados")
+
+
+def test_incremental_updates():
+    """Test: datos iguales no recalculan y un valor nuevo solo toca su barra"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 2: Actualizacion incremental")
+    print("=" * 60)
+
+    chart = CountingBarChart("Horas")
+    chart.resize(400, 240)
+    chart.set_data(["0", "1", "2"], [5, 2, 1])
+    chart.grab()
+    assert chart.layouts == 1
+
+    # Mismos datos: ni geometria nueva ni repintado
+    chart.set_data(["0", "1", "2"], [5, 2, 1])
+    assert chart._geometry is not None
+
+    # Cambia una barra sin cambiar la escala: la geometria se actualiza en el acto
+    old_bar = chart._geometry['bars'][1]
+    chart.update_value(1, 4)
+    assert chart._geometry is not None and chart._geometry['bars'][1] != old_bar
+
+    # Nuevo maximo: toda la escala cambia
+    chart.update_value(2, 10)
+    assert chart._geometry is None
+    chart.grab()
+    print(f"  Calculos de geometria: {chart.layouts}")
+    assert chart.layouts == 3
+
+    print("\n[PASS] Actualizaciones incrementales")
+
+
+def test_dashboard_does_not_import_matplotlib():
+    """Test: abrir el modulo del dashboard no carga matplotlib"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Dashboard sin matplotlib")
+    print("=" * 60)
+
+    code = (
+        "import sys; sys.path.insert(0, 'src');"
+        "import views.dialogs.stats_dashboard;"
+        "print(any(m.startswith('matplotlib') for m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+    print("\n[PASS] matplotlib sin cargar")
+
+
+if __name__ == "__main__":
+    test_charts_render()
+    test_incremental_updates()
+    test_dashboard_does_not_import_matplotlib()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,112 @@
+"""
+Test: ClipboardManager copia con el QClipboard de la aplicacion y usa pyperclip solo sin interfaz
+"""
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from core.clipboard_manager import ClipboardManager
+from core.clipboard_backend import ClipboardBackend
+from models.item import Item, ItemType
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+class RecordingBackend(ClipboardBackend):
+    """Backend de respaldo que registra las copias (sin lanzar xclip/xsel)"""
+
+    name = "pyperclip"
+
+    def __init__(self):
+        self.copies = []
+
+    def set_text(self, text):
+        self.copies.append(text)
+
+    def set_html(self, html, text):
+        self.set_text(text)
+
+    def set_urls(self, urls):
+        self.set_text("\n".join(urls))
+
+    def clear(self):
+        self.set_text("")
+
+    def text(self):
+        return self.copies[-1] if self.copies else ""
+
+
+def test_qt_backend_in_gui_thread():
+    """Test: en el hilo de la interfaz se copia en proceso, con tipos MIME"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Backend Qt")
+    print("=" * 60)
+
+    manager = ClipboardManager()
+    assert manager.get_backend().name == "qt"
+
+    assert manager.copy_text("hola")
+    assert app.clipboard().text() == "hola"
+    assert manager.get_clipboard_content() == "hola"
+
+    assert manager.copy_html("<b>negrita</b>", "negrita")
+    mime = app.clipboard().mimeData()
+    assert mime.hasHtml() and "<b>negrita</b>" in mime.html()
+    assert mime.text() == "negrita"
+
+    item = Item(item_id="1", label="Docs", content="https://example.com/docs", item_type=ItemType.URL)
+    assert manager.copy_item(item)
+    mime = app.clipboard().mimeData()
+    assert [url.toString() for url in mime.urls()] == ["https://example.com/docs"]
+    assert mime.text() == "https://example.com/docs"
+    assert manager.get_last_copied() is item
+
+    assert manager.clear_clipboard()
+    assert app.clipboard().text() == ""
+
+    metrics = manager.get_metrics()
+    print(f"  Metricas: {metrics}")
+    assert metrics['copies'] == 4 and metrics['qt'] == 4 and metrics['pyperclip'] == 0
+    assert metrics['max_latency_ms'] >= metrics['avg_latency_ms'] >= 0
+
+    print("\n[PASS] Copias en proceso")
+
+
+def test_fallback_outside_gui_thread():
+    """Test: fuera del hilo de la interfaz se usa el respaldo"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 2: Respaldo fuera del hilo de la interfaz")
+    print("=" * 60)
+
+    manager = ClipboardManager()
+    fallback = RecordingBackend()
+    manager._fallback_backend = fallback
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(
+        (manager.get_backend().name, manager.copy_html("<i>x</i>", "x"))))
+    thread.start()
+    thread.join()
+
+    assert results == [("pyperclip", True)]
+    assert fallback.copies == ["x"]
+    assert manager.get_metrics()['pyperclip'] == 1
+
+    print("\n[PASS] Respaldo sin interfaz")
+
+
+if __name__ == "__main__":
+    test_qt_backend_in_gui_thread()
+    test_fallback_outside_gui_thread()
+    print("\nTODOS LOS TESTS PASARON")
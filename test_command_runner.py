@@ -0,0 +1,127 @@
+"""
+Test: ejecucion no bloqueante de comandos (CommandRunner / CommandExecution)
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from core.command_runner import CommandRunner
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def wait_for(executions, timeout_ms=10000):
+    """Procesar eventos hasta que todas las ejecuciones terminen"""
+    loop = QEventLoop()
+    deadline = time.perf_counter() + timeout_ms / 1000
+    timer = QTimer()
+    timer.timeout.connect(lambda: (all(e.result is not None for e in executions)
+                                   or time.perf_counter() > deadline) and loop.quit())
+    timer.start(10)
+    loop.exec()
+    timer.stop()
+    assert all(e.result is not None for e in executions), "las ejecuciones no terminaron"
+    return [e.result for e in executions]
+
+
+def test_streams_output():
+    """Test: stdout y stderr llegan por output_received y quedan en el resultado"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Salida en vivo")
+    print("=" * 60)
+
+    runner = CommandRunner()
+    execution = runner.start("echo uno; echo dos 1>&2; exit 3")
+    received = []
+    execution.output_received.connect(lambda stream, text: received.append((stream, text)))
+
+    result, = wait_for([execution])
+    print(f"  Recibido: {received}")
+    assert ('stdout', "uno\n") in received and ('stderr', "dos\n") in received
+    assert result['output'] == "uno\n" and result['error'] == "dos\n"
+    assert result['return_code'] == 3 and not result['success']
+    assert result['duration_ms'] >= 0
+
+    print("\n[PASS] Salida emitida mientras se ejecuta")
+
+
+def test_timeout_and_cancel():
+    """Test: un comando que excede el tiempo o se cancela termina como fallido"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 2: Tiempo maximo y cancelacion")
+    print("=" * 60)
+
+    runner = CommandRunner(default_timeout_ms=200)
+    timed_out = runner.start("sleep 5")
+    cancelled = runner.start("sleep 5", timeout_ms=0)
+    QTimer.singleShot(100, cancelled.cancel)
+
+    start = time.perf_counter()
+    timed_out_result, cancelled_result = wait_for([timed_out, cancelled])
+    elapsed = time.perf_counter() - start
+    print(f"  Terminados en {elapsed:.2f} s")
+    assert elapsed < 3
+    assert timed_out_result['timed_out'] and not timed_out_result['success']
+    assert "tiempo de espera" in timed_out_result['error']
+    assert cancelled_result['cancelled'] and not cancelled_result['timed_out']
+
+    print("\n[PASS] Comandos detenidos")
+
+
+def test_concurrency_limit():
+    """Test: no corren mas comandos a la vez que max_concurrent"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 3: Limite de ejecuciones simultaneas")
+    print("=" * 60)
+
+    runner = CommandRunner(max_concurrent=2)
+    executions = [runner.start("sleep 0.2") for _ in range(4)]
+    peak = []
+    for execution in executions:
+        execution.started.connect(lambda: peak.append(runner.get_metrics()['running']))
+
+    wait_for(executions)
+    print(f"  En ejecucion al arrancar cada uno: {peak}")
+    assert len(peak) == 4 and max(peak) <= 2
+    assert runner.get_metrics() == {'running': 0, 'queued': 0, 'max_concurrent': 2}
+
+    print("\n[PASS] Comandos en cola respetan el limite")
+
+
+def test_output_truncated():
+    """Test: la salida capturada se limita a max_output_chars por stream"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 4: Salida truncada")
+    print("=" * 60)
+
+    runner = CommandRunner(max_output_chars=1000)
+    execution = runner.start("head -c 50000 /dev/zero | tr '\\0' 'x'")
+
+    result, = wait_for([execution])
+    print(f"  Caracteres guardados: {len(result['output'])}")
+    assert result['truncated'] and result['success']
+    assert result['output'].startswith("x" * 1000) and len(result['output']) < 1100
+
+    print("\n[PASS] Salida limitada")
+
+
+if __name__ == "__main__":
+    test_streams_output()
+    test_timeout_and_cancel()
+    test_concurrency_limit()
+    test_output_truncated()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,194 @@
+"""
+Test: pool de conexiones SQLite compartido entre managers
+"""
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.connection_pool import ConnectionPool
+from database.db_manager import DBManager
+
+
+def _create_pool(tmpdir, pool_size=2, timeout=10.0):
+    pool = ConnectionPool(str(Path(tmpdir) / "pool.db"), pool_size=pool_size, timeout=timeout)
+    with pool.write() as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS t (id INTEGER PRIMARY KEY, value TEXT)")
+    return pool
+
+
+def test_pragmas_and_reuse():
+    """Test: WAL activado y la misma conexion se reutiliza en el hilo"""
+    print("=" * 60)
+    print("TEST 1: PRAGMAs y reutilizacion")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = _create_pool(tmpdir)
+
+        conn = pool.acquire()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        # Re-entrante: el mismo hilo recibe la misma conexion
+        assert pool.acquire() is conn
+        conn.close()
+        conn.close()
+
+        for _ in range(5):
+            with pool.connection() as again:
+                assert again is conn
+
+        metrics = pool.get_metrics()
+        print(f"  Metricas: {metrics}")
+        assert metrics['open_connections'] == 1
+        assert metrics['hits'] >= 5
+        pool.close()
+
+    print("\n[PASS] Conexiones con WAL y reutilizadas")
+
+
+def test_pool_limit_and_write_serialization():
+    """Test: el pool limita conexiones y serializa escrituras entre hilos"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Limite del pool y escrituras concurrentes")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = _create_pool(tmpdir, pool_size=2)
+        errors = []
+
+        def writer(n):
+            try:
+                for i in range(20):
+                    conn = pool.acquire()
+                    conn.execute("INSERT INTO t (value) VALUES (?)", (f"{n}-{i}",))
+                    conn.commit()
+                    conn.close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors, errors
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 80
+
+        metrics = pool.get_metrics()
+        print(f"  Metricas: {metrics}")
+        assert metrics['open_connections'] <= 2
+        pool.close()
+
+    print("\n[PASS] 4 hilos escribieron sin 'database is locked'")
+
+
+def test_pool_timeout():
+    """Test: acquire falla con timeout si el pool esta agotado"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Timeout del pool")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = _create_pool(tmpdir, pool_size=1, timeout=0.2)
+        held = pool.acquire()
+        failed = []
+
+        def worker():
+            try:
+                pool.acquire()
+            except Exception as e:
+                failed.append(e)
+
+        thread = threading.Thread(target=worker)
+        start = time.perf_counter()
+        thread.start()
+        thread.join()
+        print(f"  Espera: {time.perf_counter() - start:.2f}s")
+
+        assert failed
+        assert pool.get_metrics()['waits'] >= 1
+        held.close()
+        pool.close()
+
+    print("\n[PASS] Timeout al agotar el pool")
+
+
+def test_db_manager_memory():
+    """Test: DBManager en memoria sigue usando una sola base privada"""
+    print("\n" + "=" * 60)
+    print("TEST 4: DBManager :memory:")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    category_id = db.add_category("Test")
+    assert db.get_category(category_id)['name'] == "Test"
+    assert db.connect() is db.connect()
+    print(f"  Metricas: {db.get_pool_metrics()}")
+    db.close()
+
+    print("\n[PASS] Base en memoria funcional")
+
+
+def test_thread_dies_holding_write_lock():
+    """Test: un hilo que termina dentro de una escritura no bloquea a los demas"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Hilo terminado con el bloqueo de escritura")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pool = _create_pool(tmpdir, pool_size=2, timeout=0.5)
+
+        def abandoned_writer():
+            conn = pool.acquire()
+            conn.execute("INSERT INTO t (value) VALUES ('perdido')")  # sin commit ni close
+
+        thread = threading.Thread(target=abandoned_writer)
+        thread.start()
+        thread.join()
+
+        # La conexion se recupera, se deshace la escritura y se libera el bloqueo
+        with pool.write() as conn:
+            conn.execute("INSERT INTO t (value) VALUES ('ok')")
+        with pool.connection() as conn:
+            values = [row['value'] for row in conn.execute("SELECT value FROM t")]
+        assert values == ['ok']
+        pool.close()
+
+    print("\n[PASS] Escrituras disponibles tras el hilo terminado")
+
+
+def test_managers_share_one_pool():
+    """Test: el motor de filtros usa el mismo pool que DBManager"""
+    print("\n" + "=" * 60)
+    print("TEST 6: Un pool por base de datos")
+    print("=" * 60)
+
+    from core.category_filter_engine import CategoryFilterEngine
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "shared.db")
+        engine = CategoryFilterEngine(db_path, cache_enabled=False)
+        conn = engine._get_connection()
+        try:
+            assert conn._pool is ConnectionPool.get_shared(db_path)
+        finally:
+            conn.close()
+        ConnectionPool.close_shared(db_path)
+
+    print("\n[PASS] Pool compartido")
+
+
+if __name__ == "__main__":
+    test_pragmas_and_reuse()
+    test_pool_limit_and_write_serialization()
+    test_pool_timeout()
+    test_db_manager_memory()
+    test_thread_dies_holding_write_lock()
+    test_managers_share_one_pool()
+    print("\nTODOS LOS TESTS PASARON")
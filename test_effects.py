@@ -0,0 +1,175 @@
+"""
+Test: efectos visuales con arrays de NumPy, pausa fuera de pantalla, frecuencia adaptativa y modo de efectos
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+import numpy as np
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from core.timer_scheduler import TimerScheduler
+from styles import effects
+from styles.effects import ParticleEffect, ScanLineEffect, set_effects_mode, get_effects_mode
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _run_events(duration_ms):
+    deadline = time.perf_counter() + duration_ms / 1000
+    while time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.002)
+
+
+def _make_panel():
+    panel = QWidget()
+    panel.resize(200, 100)
+    particles = ParticleEffect(panel, particle_count=40)
+    particles.setGeometry(panel.rect())
+    return panel, particles
+
+
+def test_vectorized_step():
+    """Test: un paso mueve, envuelve, desvanece y regenera todas las particulas"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Paso vectorizado")
+    print("=" * 60)
+
+    panel, particles = _make_panel()
+    panel.show()
+    assert particles.positions.shape == (40, 2)
+    assert np.all(particles.positions < (200, 100))
+
+    # Particula 0 saliendo por la derecha; particula 1 a punto de morir
+    particles.positions[0] = (199.5, 50)
+    particles.velocities[0] = (1.0, 0.0)
+    particles.ages[1] = particles.lifetimes[1] - 1
+    particles.lifetimes[2] = 100
+    particles.ages[2] = 89  # dentro del 20% final
+    particles.step()
+
+    assert abs(particles.positions[0, 0] - 0.5) < 1e-9
+    assert particles.ages[1] == 0  # regenerada en su sitio
+    assert particles.opacities[2] < particles.base_opacities[2]
+    assert np.all((particles.positions >= 0) & (particles.positions < (200, 100)))
+
+    # Al redimensionar las posiciones se reescalan
+    before = particles.positions.copy()
+    particles.resize(400, 200)
+    assert np.allclose(particles.positions, before * 2)
+
+    # El dibujo en lote pinta sobre la imagen
+    image = QImage(400, 200, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)
+    particles.render(image)
+    assert any(image.pixelColor(x, y).alpha() > 0 for x in range(400) for y in range(0, 200, 2))
+
+    panel.close()
+
+    print("\n[PASS] Paso vectorizado")
+
+
+def test_paused_when_not_visible():
+    """Test: sin frames con la ventana oculta o minimizada"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 2: Pausa fuera de pantalla")
+    print("=" * 60)
+
+    panel, particles = _make_panel()
+    _run_events(150)
+    assert particles.get_metrics()['frames'] == 0  # Nunca mostrado
+
+    panel.show()
+    _run_events(150)
+    frames = particles.get_metrics()['frames']
+    assert frames > 0
+
+    panel.hide()
+    _run_events(150)
+    assert particles.get_metrics()['frames'] == frames
+
+    panel.showMinimized()
+    _run_events(150)
+    if panel.isMinimized():  # El plugin offscreen puede ignorar el minimizado
+        assert particles.get_metrics()['frames'] == frames
+    panel.close()
+
+    print("\n[PASS] Pausa fuera de pantalla")
+
+
+def test_adaptive_frame_rate():
+    """Test: los frames fuera de presupuesto bajan la frecuencia y se recupera despues"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 3: Frecuencia adaptativa")
+    print("=" * 60)
+
+    panel, particles = _make_panel()
+    scheduler = TimerScheduler.get_shared()
+    first_handle = particles.timer_handle
+    assert particles.frame_interval_ms == 33
+
+    for _ in range(ParticleEffect.SLOW_FRAMES_TO_THROTTLE):
+        particles._adapt_frame_rate(ParticleEffect.FRAME_BUDGET_MS * 3)
+    assert particles.frame_interval_ms == 66
+    assert not scheduler.is_pending(first_handle) and scheduler.is_pending(particles.timer_handle)
+
+    for _ in range(ParticleEffect.FAST_FRAMES_TO_RECOVER):
+        particles._adapt_frame_rate(0.1)
+    metrics = particles.get_metrics()
+    print(f"  Metricas: {metrics}")
+    assert metrics['interval_ms'] == 33 and metrics['throttled'] == 1 and metrics['recovered'] == 1
+
+    print("\n[PASS] Frecuencia adaptativa")
+
+
+def test_effects_mode():
+    """Test: ahorro de energia congela los efectos y desactivados los oculta"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 4: Modo de efectos")
+    print("=" * 60)
+
+    scheduler = TimerScheduler.get_shared()
+    panel, particles = _make_panel()
+    scanlines = ScanLineEffect(panel)
+    panel.show()
+
+    try:
+        set_effects_mode(effects.EFFECTS_POWER_SAVING)
+        assert particles.timer_handle is None and scanlines.timer_handle is None
+        assert particles.isVisible()
+
+        set_effects_mode(effects.EFFECTS_OFF)
+        assert not particles.isVisible() and not scanlines.isVisible()
+        late = ScanLineEffect(panel)  # Creado con los efectos desactivados
+        assert late.isHidden() and late.timer_handle is None
+
+        set_effects_mode("desconocido")
+        assert get_effects_mode() == effects.EFFECTS_FULL
+        assert particles.isVisible() and scheduler.is_pending(particles.timer_handle)
+        assert scheduler.is_pending(late.timer_handle)
+    finally:
+        set_effects_mode(effects.EFFECTS_FULL)
+        panel.close()
+
+    print("\n[PASS] Modo de efectos")
+
+
+if __name__ == "__main__":
+    test_vectorized_step()
+    test_paused_when_not_visible()
+    test_adaptive_frame_rate()
+    test_effects_mode()
+    print("\nTODOS LOS TESTS PASARON")
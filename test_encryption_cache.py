@@ -0,0 +1,259 @@
+"""
+Test: Cifrador compartido y descifrado por lotes
+"""
+import os
+import sys
+import time
+import threading
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from cryptography.fernet import Fernet
+from dotenv import set_key
+from PyQt6.QtWidgets import QApplication
+
+from core.encryption_manager import EncryptionManager
+from core.config_manager import ConfigManager
+from database.db_manager import DBManager
+from models.item import SensitiveContent
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def test_shared_instance_reused():
+    """Test: get_shared devuelve siempre la misma instancia"""
+    print("=" * 60)
+    print("TEST 1: Instancia compartida")
+    print("=" * 60)
+
+    first = EncryptionManager.get_shared()
+    second = EncryptionManager.get_shared()
+
+    assert first is second
+    print("\n[PASS] La instancia compartida se reutiliza")
+
+
+def test_shared_instance_reloads_rotated_key():
+    """Test: si la clave del .env cambia, el cifrador se reconstruye"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Rotacion de clave")
+    print("=" * 60)
+
+    original_key = os.environ.get("ENCRYPTION_KEY")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env_file = Path(tmp_dir) / ".env"
+        first_key = Fernet.generate_key().decode()
+        set_key(env_file, "ENCRYPTION_KEY", first_key)
+
+        manager = EncryptionManager.get_shared(str(env_file))
+        manager._key = first_key
+        manager.cipher_suite = Fernet(first_key.encode())
+        manager._env_mtime = manager._get_env_mtime()
+        encrypted_old = manager.encrypt("secreto")
+
+        # Rotar clave en disco (forzar mtime distinto)
+        time.sleep(0.01)
+        new_key = Fernet.generate_key().decode()
+        set_key(env_file, "ENCRYPTION_KEY", new_key)
+
+        rotated = EncryptionManager.get_shared(str(env_file))
+        assert rotated is manager
+        assert rotated._key == new_key
+        assert Fernet(new_key.encode()).decrypt(rotated.encrypt("x").encode()) == b"x"
+
+        try:
+            rotated.decrypt(encrypted_old)
+            assert False, "El token antiguo no deberia descifrarse con la nueva clave"
+        except ValueError:
+            pass
+
+        EncryptionManager.invalidate_shared(str(env_file))
+
+    # Restaurar la clave del proceso
+    if original_key:
+        os.environ["ENCRYPTION_KEY"] = original_key
+
+    print("\n[PASS] El cifrador se recarga al rotar la clave")
+
+
+def test_decrypt_many():
+    """Test: decrypt_many conserva el orden, en secuencial y en hilos"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Descifrado por lotes")
+    print("=" * 60)
+
+    manager = EncryptionManager.get_shared()
+    plaintexts = [f"password-{i}" for i in range(200)]
+    encrypted = [manager.encrypt(text) for text in plaintexts]
+
+    assert manager.decrypt_many(encrypted) == plaintexts
+    assert manager.decrypt_many(encrypted, max_workers=4) == plaintexts
+    assert manager.decrypt_many(["", "not-a-token"], error_value="[ERR]") == ["", "[ERR]"]
+
+    print("\n[PASS] decrypt_many descifra correctamente")
+
+
+def test_db_reads_decrypt_in_batch():
+    """Test: las lecturas de DBManager siguen devolviendo texto plano"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Lecturas de BD con cifrador compartido")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    cat_id = db.add_category("Passwords", "lock", 0)
+    for i in range(5):
+        db.add_item(cat_id, f"Secret {i}", f"value-{i}", is_sensitive=True)
+    db.add_item(cat_id, "Plain", "plain-value")
+
+    contents = sorted(item['content'] for item in db.get_items_by_category(cat_id))
+    assert contents == sorted([f"value-{i}" for i in range(5)] + ["plain-value"])
+    assert all(not item['content'].startswith("gAAAAA") for item in db.get_all_items())
+
+    db.close()
+    print("\n[PASS] Las lecturas descifran por lotes")
+
+
+def test_lazy_sensitive_content():
+    """Test: los items sensibles se descifran solo al acceder al contenido"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Descifrado bajo demanda")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = ConfigManager(db_path=str(Path(tmp_dir) / "test.db"), base_dir=Path(tmp_dir))
+        cat_id = config.db.add_category("Vault", "lock", 0)
+        config.db.add_item(cat_id, "Token", "api-token-123", is_sensitive=True)
+
+        calls = []
+        original_decrypt = config.db.decrypt_content
+        config.db.decrypt_content = lambda text: calls.append(text) or original_decrypt(text)
+
+        items = config.get_category(str(cat_id)).items
+        item = items[0]
+
+        assert item.is_content_lazy()
+        assert calls == [], "Listar items no debe descifrar"
+
+        assert item.content == "api-token-123"
+        assert item.content == "api-token-123"
+        assert len(calls) == 1, "El texto plano se cachea durante la ventana"
+
+        item.release_content()
+        assert item.content == "api-token-123"
+        assert len(calls) == 2
+
+        config.close()
+
+    print("\n[PASS] El contenido sensible se descifra bajo demanda")
+
+
+def test_plaintext_dropped_on_expiry():
+    """Test: el texto plano se descarta al expirar sin esperar a otro acceso"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 6: Descarte del texto plano al expirar")
+    print("=" * 60)
+
+    calls = []
+    content = SensitiveContent("cifrado", lambda text: calls.append(text) or "secreto", ttl=0.05)
+    assert content.get() == "secreto" and content.is_decrypted()
+
+    # El plazo del TimerScheduler borra el texto plano
+    deadline = time.monotonic() + 1.0
+    while content._plaintext is not None and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+    assert content._plaintext is None and not content.is_decrypted()
+
+    # Aunque el plazo no haya llegado, is_decrypted() descarta lo expirado
+    content.get()
+    content._decrypted_at -= 1.0
+    assert not content.is_decrypted() and content._plaintext is None
+    assert content.get() == "secreto" and len(calls) == 3
+
+    content.release()
+    assert content._release_handle is None
+
+    print("\n[PASS] El texto plano no sobrevive a su ventana")
+
+
+def test_gitignore_matches_whole_lines():
+    """Test: .venv/ en .gitignore no cuenta como .env ignorado"""
+    print("\n" + "=" * 60)
+    print("TEST 7: .env en .gitignore")
+    print("=" * 60)
+
+    manager = EncryptionManager.get_shared()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            Path(".gitignore").write_text(".venv/\n*.env.bak\n", encoding="utf-8")
+            manager._add_to_gitignore()
+            manager._add_to_gitignore()
+            lines = Path(".gitignore").read_text(encoding="utf-8").splitlines()
+            assert lines.count(".env") == 1
+        finally:
+            os.chdir(cwd)
+
+    print("\n[PASS] .env se agrega a .gitignore")
+
+
+def test_rotation_swaps_cipher_under_lock():
+    """Test: la comprobacion de rotacion y el cambio de cifrador esperan al lock"""
+    print("\n" + "=" * 60)
+    print("TEST 8: Rotacion bajo el lock")
+    print("=" * 60)
+
+    original_key = os.environ.get("ENCRYPTION_KEY")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env_file = Path(tmp_dir) / ".env"
+        set_key(env_file, "ENCRYPTION_KEY", Fernet.generate_key().decode())
+        manager = EncryptionManager.get_shared(str(env_file))
+        old_key = manager._key
+
+        time.sleep(0.01)
+        new_key = Fernet.generate_key().decode()
+        set_key(env_file, "ENCRYPTION_KEY", new_key)
+
+        # Mientras otro hilo usa el cifrador, la rotacion no puede cambiarlo
+        with manager._lock:
+            thread = threading.Thread(
+                target=EncryptionManager.get_shared, args=(str(env_file),))
+            thread.start()
+            thread.join(0.1)
+            assert thread.is_alive()
+            assert manager._key == old_key
+
+        thread.join()
+        assert manager._key == new_key
+        assert Fernet(new_key.encode()).decrypt(manager.encrypt("x").encode()) == b"x"
+
+        EncryptionManager.invalidate_shared(str(env_file))
+
+    if original_key:
+        os.environ["ENCRYPTION_KEY"] = original_key
+
+    print("\n[PASS] El cifrador se reemplaza bajo el lock")
+
+
+if __name__ == "__main__":
+    test_shared_instance_reused()
+    test_shared_instance_reloads_rotated_key()
+    test_decrypt_many()
+    test_db_reads_decrypt_in_batch()
+    test_lazy_sensitive_content()
+    test_plaintext_dropped_on_expiry()
+    test_gitignore_matches_whole_lines()
+    test_rotation_swaps_cipher_under_lock()
+    print("\nTODOS LOS TESTS PASARON")
@@ -21,7 +21,7 @@ def test_clipboard_timer_starts_for_sensitive():
     try:
         from views.widgets.item_widget import ItemButton
         from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import QTimer
+        from core.timer_scheduler import TimerScheduler
 
         app = QApplication.instance()
         if app is None:
@@ -46,24 +46,21 @@ def test_clipboard_timer_starts_for_sensitive():
         if button.clipboard_clear_timer is not None:
             print("\n[PASS] clipboard_clear_timer fue creado")
 
-            if isinstance(button.clipboard_clear_timer, QTimer):
-                print("[PASS] clipboard_clear_timer es un QTimer")
+            scheduler = TimerScheduler.get_shared()
+            if scheduler.is_pending(button.clipboard_clear_timer):
+                print("[PASS] Plazo pendiente en el TimerScheduler")
 
-                if button.clipboard_clear_timer.isActive():
-                    print("[PASS] Timer esta activo")
-
-                    # Check interval is 30 seconds
-                    if button.clipboard_clear_timer.interval() == 30000:
-                        print("[PASS] Intervalo es 30 segundos (30000ms)")
-                        return True
-                    else:
-                        print(f"[FAIL] Intervalo incorrecto: {button.clipboard_clear_timer.interval()}ms")
-                        return False
+                # Check interval is 30 seconds
+                entry = scheduler._entries[button.clipboard_clear_timer]
+                interval_ms = entry.interval_ticks * scheduler.tick_ms
+                if 30000 <= interval_ms < 30000 + scheduler.tick_ms:
+                    print("[PASS] Intervalo es 30 segundos (30000ms)")
+                    return True
                 else:
-                    print("[FAIL] Timer NO esta activo")
+                    print(f"[FAIL] Intervalo incorrecto: {interval_ms}ms")
                     return False
             else:
-                print("[FAIL] clipboard_clear_timer NO es QTimer")
+                print("[FAIL] Plazo NO esta pendiente")
                 return False
         else:
             print("\n[FAIL] clipboard_clear_timer NO fue creado")
@@ -84,6 +81,7 @@ def test_clipboard_timer_not_starts_for_normal():
 
     try:
         from views.widgets.item_widget import ItemButton
+        from core.timer_scheduler import TimerScheduler
         from PyQt6.QtWidgets import QApplication
 
         app = QApplication.instance()
@@ -109,7 +107,7 @@ def test_clipboard_timer_not_starts_for_normal():
         if button.clipboard_clear_timer is None:
             print("\n[PASS] Timer NO fue creado para item normal (correcto)")
             return True
-        elif not button.clipboard_clear_timer.isActive():
+        elif not TimerScheduler.get_shared().is_pending(button.clipboard_clear_timer):
             print("\n[PASS] Timer existe pero NO esta activo (correcto)")
             return True
         else:
@@ -289,6 +287,7 @@ def test_multiple_clicks_reset_timer():
 
     try:
         from views.widgets.item_widget import ItemButton
+        from core.timer_scheduler import TimerScheduler
         from PyQt6.QtWidgets import QApplication
 
         app = QApplication.instance()
@@ -312,7 +311,8 @@ def test_multiple_clicks_reset_timer():
         first_timer = button.clipboard_clear_timer
         print("\n[INFO] Primer click realizado")
 
-        if first_timer is None or not first_timer.isActive():
+        scheduler = TimerScheduler.get_shared()
+        if first_timer is None or not scheduler.is_pending(first_timer):
             print("[FAIL] Primer timer no se inicio")
             return False
 
@@ -321,12 +321,13 @@ def test_multiple_clicks_reset_timer():
         second_timer = button.clipboard_clear_timer
         print("[INFO] Segundo click realizado")
 
-        if second_timer is None or not second_timer.isActive():
+        if second_timer is None or not scheduler.is_pending(second_timer):
             print("[FAIL] Segundo timer no se inicio")
             return False
 
-        # Verify timer is still active and interval is correct
-        if second_timer.isActive() and second_timer.interval() == 30000:
+        # Verify the first deadline was replaced and the interval is correct
+        interval_ms = scheduler._entries[second_timer].interval_ticks * scheduler.tick_ms
+        if not scheduler.is_pending(first_timer) and 30000 <= interval_ms < 30000 + scheduler.tick_ms:
             print("[PASS] Timer fue reiniciado correctamente")
             print("[PASS] Intervalo sigue siendo 30 segundos")
             return True
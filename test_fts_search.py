@@ -0,0 +1,179 @@
+"""
+Test: Indice FTS5 de items con busqueda por relevancia
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from database.db_manager import DBManager
+from core.dashboard_manager import DashboardManager
+from models.item import Item
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _create_db():
+    db = DBManager(":memory:")
+    cat_id = db.add_category("Dev", "code", 0)
+    db.add_item(cat_id, "Docker compose up", "docker compose up -d", item_type='CODE',
+                tags=["docker", "deploy"])
+    db.add_item(cat_id, "Git status", "git status --short", item_type='CODE',
+                description="Ver estado del repositorio docker")
+    db.add_item(cat_id, "Token", "docker-secret-token", is_sensitive=True)
+    return db, cat_id
+
+
+def test_fts_ranked_prefix_search():
+    """Test: busqueda por prefijo, ranking BM25 y contenido sensible excluido"""
+    print("=" * 60)
+    print("TEST 1: Busqueda FTS con ranking")
+    print("=" * 60)
+
+    db, _ = _create_db()
+    assert db.fts_enabled
+
+    results = db.search_items_fts("dock")
+    labels = [item['label'] for item in results]
+    print(f"\n[OK] Resultados: {labels}")
+
+    # Label match primero, descripcion despues; el item sensible no aparece
+    assert labels[0] == "Docker compose up"
+    assert "Git status" in labels
+    assert "Token" not in labels
+
+    # search_items sigue buscando subcadenas (LIKE) aunque haya indice
+    assert [item['label'] for item in db.search_items("ompos")] == ["Docker compose up"]
+    assert db.search_items_fts("ompos") == []
+
+    db.close()
+    print("\n[PASS] Ranking y prefijos correctos")
+
+
+def test_fts_triggers_keep_index_in_sync():
+    """Test: los triggers mantienen el indice al editar y borrar"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Sincronizacion por triggers")
+    print("=" * 60)
+
+    db, cat_id = _create_db()
+    item_id = db.add_item(cat_id, "Kubernetes pods", "kubectl get pods")
+    assert db.search_item_ids("kube") == [item_id]
+
+    db.update_item(item_id, label="Cluster pods")
+    assert db.search_item_ids("kube") == [item_id]  # contenido sigue indexado
+    assert db.search_item_ids("cluster") == [item_id]
+    assert db.search_item_ids("cluster", columns=["content"]) == []
+
+    db.delete_item(item_id)
+    assert db.search_item_ids("cluster") == []
+
+    db.close()
+    print("\n[PASS] El indice se mantiene sincronizado")
+
+
+def test_dashboard_search_uses_index():
+    """Test: DashboardManager.search encuentra por subcadena y ordena con el indice"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Busqueda del dashboard")
+    print("=" * 60)
+
+    db, cat_id = _create_db()
+    db.add_item(cat_id, "Correo", "yo@hello.com")
+    db.add_item(cat_id, "Notas c++", "templates")
+    db.add_item(cat_id, "Imagenes", "docker images")
+    db.add_item(cat_id, "Docker images", "docker image ls")
+    manager = DashboardManager(db)
+    structure = manager.get_full_structure()
+    scope = {'categories': True, 'items': True, 'tags': True, 'content': True}
+    items = structure['categories'][0]['items']
+
+    def labels(query):
+        return [items[item_idx]['label'] for _, _, item_idx in manager.search(query, scope, structure)]
+
+    matches = manager.search("docker", scope, structure)
+    matched = {(match_type, items[item_idx]['label']) for match_type, _, item_idx in matches}
+    assert ('item', "Docker compose up") in matched
+    assert not any(label == "Token" for _, label in matched)
+    # El indice ordena: la coincidencia en el label va primero
+    assert labels("images") == ["Docker images", "Imagenes"]
+
+    # Subcadenas a mitad de palabra y puntuacion (sin terminos para el indice)
+    assert labels("ello") == ["Correo"]
+    assert labels("@") == ["Correo"]
+    assert labels("c++") == ["Notas c++"]
+
+    # Con y sin indice se encuentran las mismas coincidencias
+    with_index = sorted(manager.search("ocker", scope, structure))
+    db.fts_enabled = False
+    assert sorted(manager.search("ocker", scope, structure)) == with_index
+    assert labels("images") == ["Imagenes", "Docker images"]
+    db.fts_enabled = True
+
+    db.close()
+    print("\n[PASS] El dashboard busca en el indice")
+
+
+def test_global_search_keeps_substring_matches():
+    """Test: la busqueda global usa el indice solo para ordenar"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 4: Busqueda global con y sin indice")
+    print("=" * 60)
+
+    from views.global_search_panel import GlobalSearchPanel
+
+    db, cat_id = _create_db()
+    items = [
+        Item(item_id=str(row['id']), label=row['label'], content=row['content'],
+             tags=row['tags'], description=row['description'])
+        for row in db.get_all_items(include_inactive=False, decrypt=False)
+        if not row['is_sensitive']
+    ]
+    items.append(Item(item_id="900", label="Correo", content="yo@hello.com"))
+    items.append(Item(item_id="901", label="Notas c++", content="templates"))
+
+    for panel_db in (db, None):
+        panel = GlobalSearchPanel(db_manager=panel_db)
+        panel.all_items = items
+        panel.search_engine.set_items(items)
+        labels = lambda query: [item.label for item in panel.search_items(query, items)]
+
+        # Subcadenas a mitad de palabra y consultas sin terminos indexables
+        assert labels("ello") == ["Correo"]
+        assert labels("@") == ["Correo"]
+        assert labels("c++") == ["Notas c++"]
+        assert labels("dock")[0] == "Docker compose up"
+        assert "Git status" in labels("dock")  # por la descripcion
+        # Subconjunto filtrado
+        subset = [item for item in items if item.label != "Docker compose up"]
+        assert [item.label for item in panel.search_items("docker", subset)] == ["Git status"]
+        panel.deleteLater()
+
+    db.fts_enabled = False
+    panel = GlobalSearchPanel(db_manager=db)
+    panel.all_items = items
+    panel.search_engine.set_items(items)
+    assert [item.label for item in panel.search_items("compose", items)] == ["Docker compose up"]
+
+    # Las coincidencias salen del indice del SearchEngine, no de recorrer la lista
+    panel.search_engine.find_matching_ids = lambda query: set()
+    assert panel.search_items("compose", items) == []
+
+    db.close()
+    print("\n[PASS] Busqueda global sin perder coincidencias")
+
+
+if __name__ == "__main__":
+    test_fts_ranked_prefix_search()
+    test_fts_triggers_keep_index_in_sync()
+    test_dashboard_search_uses_index()
+    test_global_search_keeps_substring_matches()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,174 @@
+"""
+Test: Busqueda difusa con ranking
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from models.item import Item
+from models.category import Category
+from core import fuzzy_matcher
+from core.fuzzy_matcher import FuzzyIndex, fuzzy_score, fold_text
+from core.search_engine import SearchEngine
+from database.db_manager import DBManager
+from core.dashboard_manager import DashboardManager
+
+
+def test_fuzzy_score():
+    """Test: subsecuencias, limites de palabra y acentos"""
+    print("=" * 60)
+    print("TEST 1: Puntuacion difusa")
+    print("=" * 60)
+
+    assert fold_text("Configuración") == "configuracion"
+    assert fuzzy_score("dkr", "docker compose") is not None
+    assert fuzzy_score("xyz", "docker compose") is None
+
+    # Coincidencia consecutiva al inicio de palabra puntua mas que dispersa
+    assert fuzzy_score("comp", "docker compose") > fuzzy_score("comp", "cloud map provider")
+
+    print("\n[PASS] Puntuacion correcta")
+
+
+def test_ranking_and_limit():
+    """Test: label sobre contenido, uso como desempate y top-k"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Ranking")
+    print("=" * 60)
+
+    index = FuzzyIndex()
+    index.set("content", "Deploy script", ["docker compose up"])
+    index.set("label", "Docker compose", ["up -d"])
+    index.set("used", "Docker compose prod", ["up -d"], use_count=50,
+              last_used=datetime.now())
+    for i in range(20):
+        index.set(f"noise-{i}", f"Nota {i}", ["texto"])
+
+    results = [key for key, _ in index.search("dockr cmpose")]
+    print(f"  'dockr cmpose': {results}")
+    assert results[:2] == ["used", "label"]
+    assert "content" not in results  # 'dockr' no es literal en el contenido
+
+    results = [key for key, _ in index.search("docker")]
+    assert results[-1] == "content"
+
+    assert len(index.search("nota", limit=5)) == 5
+    assert index.search("nota 1", limit=0) == []
+
+    print("\n[PASS] Ranking correcto")
+
+
+def test_search_engine_fuzzy_mode():
+    """Test: SearchEngine en modo difuso tolera errores y respeta sensibles"""
+    print("\n" + "=" * 60)
+    print("TEST 3: SearchEngine difuso")
+    print("=" * 60)
+
+    category = Category("1", "Dev")
+    category.items = [
+        Item("1", "Configuración de red", "ip addr"),
+        Item("2", "Git status", "git status --short"),
+        Item("3", "Token", "configuracion-secreta", is_sensitive=True),
+    ]
+    engine = SearchEngine()
+
+    results = engine.search_in_category("confgiuracion", category, fuzzy=True)
+    assert results == []  # letras transpuestas no son subsecuencia
+    results = engine.search_in_category("cnfg red", category, fuzzy=True)
+    assert [item.id for item in results] == ["1"]
+    results = engine.search_in_category("configuracion", category, fuzzy=True)
+    assert [item.id for item in results] == ["1"]  # el sensible no se busca por contenido
+
+    print("\n[PASS] Modo difuso correcto")
+
+
+def test_dashboard_fuzzy_search():
+    """Test: DashboardManager.search con el filtro 'fuzzy'"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Busqueda difusa del dashboard")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    cat_id = db.add_category("Docker", "code", 0)
+    db.add_item(cat_id, "Compose up", "docker compose up -d")
+    db.add_item(cat_id, "Kubectl pods", "kubectl get pods")
+    manager = DashboardManager(db)
+    structure = manager.get_full_structure()
+    scope = {'categories': True, 'items': True, 'tags': True, 'content': True, 'fuzzy': True}
+
+    matches = manager.search("cmps", scope, structure)
+    items = structure['categories'][0]['items']
+    assert [(t, items[i]['label']) for t, _, i in matches] == [('item', "Compose up")]
+
+    matches = manager.search("dockr", scope, structure)
+    assert matches == [('category', 0, -1)]
+
+    matches = manager.search("pods", dict(scope, items=False), structure)
+    assert [(t, items[i]['label']) for t, _, i in matches] == [('content', "Kubectl pods")]
+
+    db.close()
+    print("\n[PASS] El dashboard soporta busqueda difusa")
+
+
+def test_cold_search_uses_postings():
+    """Test: la primera pulsacion solo puntua candidatos y da el mismo top-k"""
+    print("\n" + "=" * 60)
+    print("TEST 5: Candidatos desde los postings")
+    print("=" * 60)
+
+    index = FuzzyIndex()
+    records = {}
+    for i in range(2000):
+        label, texts, use_count = f"Nota {i}", [f"texto {i % 7}"], i % 5
+        if i % 100 == 0:
+            label, texts = f"Docker {i}", ["docker compose up"]
+        elif i % 40 == 0:
+            label = f"Deploy {i}"
+        records[i] = (label, texts, use_count)
+        index.set(i, label, texts, use_count=use_count)
+
+    scored = []
+
+    def counting_score(pattern, text):
+        scored.append(pattern)
+        return fuzzy_score(pattern, text)
+
+    def brute_force(query, limit, keys=None):
+        """Top-k puntuando todos los registros uno a uno"""
+        reference = FuzzyIndex()
+        for i, (label, texts, use_count) in records.items():
+            if keys is None or i in keys:
+                reference.set(i, label, texts, use_count=use_count)
+        # Re-puntuar "coincidencias anteriores" que son todos los registros
+        reference._last_pattern = fold_text(query)[0]
+        reference._last_matches = list(reference._entries)
+        return reference.search(query, limit=limit)
+
+    fuzzy_matcher.fuzzy_score = counting_score
+    try:
+        for query, limit in [("dockr", 50), ("d", 10), ("n", 5), ("compose", 50), ("dp 4", 3)]:
+            index._last_pattern = None
+            scored.clear()
+            results = index.search(query, limit=limit)
+            print(f"  {query!r}: {len(scored)} puntuados, {len(results)} resultados")
+            assert len(scored) < 500
+            assert results == brute_force(query, limit)
+
+        keys = set(range(0, 2000, 3))
+        index._last_pattern = None
+        assert index.search("d", limit=10, keys=keys) == brute_force("d", 10, keys)
+    finally:
+        fuzzy_matcher.fuzzy_score = fuzzy_score
+
+    print("\n[PASS] La primera pulsacion no puntua toda la biblioteca")
+
+
+if __name__ == "__main__":
+    test_fuzzy_score()
+    test_ranking_and_limit()
+    test_search_engine_fuzzy_mode()
+    test_dashboard_fuzzy_search()
+    test_cold_search_uses_postings()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,109 @@
+"""
+Test: HotkeyManager resuelve atajos con una tabla precompilada y ejecuta los callbacks en el hilo de la interfaz
+"""
+import sys
+import time
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from core.hotkey_manager import HotkeyManager
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _special(name):
+    return SimpleNamespace(name=name)
+
+
+def _char(char):
+    return SimpleNamespace(char=char)
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+    assert condition(), "timeout esperando al callback"
+
+
+def test_lookup_table():
+    """Test: la combinacion se resuelve sin importar orden ni lado del modificador"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Tabla de atajos")
+    print("=" * 60)
+
+    manager = HotkeyManager()
+    calls = []
+    manager.register_hotkey("Ctrl + Shift + V", lambda: calls.append("toggle"))
+    manager.register_hotkey("ctrl+shift+1", lambda: calls.append("panel"))
+    manager.is_running = True
+
+    # Shift derecho y Ctrl izquierdo; Ctrl+V llega como caracter de control
+    manager._on_press(_special("shift_r"))
+    manager._on_press(_special("ctrl_l"))
+    manager._on_press(_char("\x16"))
+    manager._on_release(_char("\x16"))
+    manager._on_press(_char("1"))
+    manager._on_press(_char("2"))  # ctrl+shift+1+2: sin atajo
+    QApplication.processEvents()
+    assert calls == ["toggle", "panel"]
+
+    manager.unregister_hotkey("ctrl+shift+v")
+    manager.current_keys = {"ctrl", "shift", "v"}
+    manager._check_hotkeys()
+    QApplication.processEvents()
+    assert calls == ["toggle", "panel"]
+
+    metrics = manager.get_metrics()
+    print(f"  Metricas: {metrics}")
+    assert metrics['registered'] == 1 and metrics['matches'] == 2 and metrics['dispatched'] == 2
+
+    print("\n[PASS] Tabla de atajos")
+
+
+def test_callbacks_run_in_gui_thread():
+    """Test: el callback llega por señal encolada al hilo de la interfaz"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 2: Callback en el hilo de la interfaz")
+    print("=" * 60)
+
+    manager = HotkeyManager()
+    callback_threads = []
+    manager.register_hotkey("ctrl+shift+v", lambda: callback_threads.append(threading.get_ident()))
+    manager.is_running = True
+
+    def listener():
+        for key in (_special("ctrl"), _special("shift"), _char("v")):
+            manager._on_press(key)
+
+    thread = threading.Thread(target=listener)
+    thread.start()
+    thread.join()
+    # Nada se ejecuta en el hilo del listener
+    assert callback_threads == []
+
+    _wait_until(lambda: callback_threads)
+    assert callback_threads == [threading.get_ident()]
+    print(f"  Latencia: {manager.get_metrics()['last_latency_ms']} ms")
+    assert manager.get_metrics()['max_latency_ms'] >= 0
+
+    print("\n[PASS] Callback en el hilo de la interfaz")
+
+
+if __name__ == "__main__":
+    test_lookup_table()
+    test_callbacks_run_in_gui_thread()
+    print("\nTODOS LOS TESTS PASARON")
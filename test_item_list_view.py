@@ -0,0 +1,117 @@
+"""
+Test: Lista virtualizada de items (modelo, proxy y delegate)
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QPoint
+
+from models.item import Item, ItemType
+from views.widgets.item_list_view import ItemListView, ITEM_ROLE
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _create_items(count):
+    return [
+        Item(str(i), f"Item {i}", f"content {i}", tags=["tag"] if i % 2 else [])
+        for i in range(count)
+    ]
+
+
+def test_large_list_is_virtualized():
+    """Test: cargar y filtrar miles de items no crea widgets por item"""
+    print("=" * 60)
+    print("TEST 1: Carga y filtrado de 10000 items")
+    print("=" * 60)
+
+    app = _get_app()
+    view = ItemListView()
+    view.resize(400, 600)
+    items = _create_items(10000)
+
+    start = time.perf_counter()
+    view.set_items(items)
+    view.show()
+    QApplication.processEvents()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n[INFO] Carga: {elapsed:.1f} ms")
+
+    assert view.visible_count() == 10000
+    assert len(view.viewport().children()) == 0, "No debe haber un widget por item"
+
+    # Filtrar respeta el orden dado (ranking de busqueda)
+    view.filter_items([items[42], items[7], items[9000]])
+    assert view.visible_count() == 3
+    assert [view.item_at_row(row).id for row in range(3)] == ["42", "7", "9000"]
+
+    view.filter_items(None)
+    assert view.visible_count() == 10000
+    assert view.item_at_row(0).id == "0"
+
+    view.close()
+    app.processEvents()
+    print("\n[PASS] La lista se carga y filtra sin crear widgets")
+
+
+def test_delegate_rows_and_actions():
+    """Test: altura de fila, botones de accion y ofuscacion de sensibles"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Delegate")
+    print("=" * 60)
+
+    app = _get_app()
+    view = ItemListView()
+    view.resize(400, 300)
+    items = [
+        Item("1", "Deploy", "docker compose up", item_type=ItemType.CODE),
+        Item("2", "Token", "secret-value", is_sensitive=True, tags=["api"]),
+    ]
+    view.set_items(items)
+    view.show()
+    QApplication.processEvents()
+
+    code_index = view.model().index(0, 0)
+    sensitive_index = view.model().index(1, 0)
+    assert code_index.data(ITEM_ROLE) is items[0]
+    assert sensitive_index.data() == "Token (********)"
+
+    # Los items con tags son mas altos
+    assert view.visualRect(sensitive_index).height() > view.visualRect(code_index).height() - 1
+
+    delegate = view.item_delegate
+    rect = view.visualRect(code_index)
+    actions = delegate.action_rects(rect, items[0], view.source_model)
+    assert [action for action, _ in actions] == ['favorite', 'execute']
+    execute_rect = actions[-1][1]
+    assert delegate.action_at(rect, code_index, execute_rect.center()) == 'execute'
+    assert delegate.action_at(rect, code_index, QPoint(rect.left() + 20, rect.center().y())) is None
+
+    # Revelar muestra el contenido
+    view.toggle_reveal(items[1])
+    assert sensitive_index.data() == "Token (secret-value)"
+    view.toggle_reveal(items[1])
+    assert sensitive_index.data() == "Token (********)"
+
+    # Pintar no falla
+    assert not view.grab().isNull()
+
+    view.close()
+    print("\n[PASS] El delegate pinta y resuelve las acciones")
+
+
+if __name__ == "__main__":
+    test_large_list_is_virtualized()
+    test_delegate_rows_and_actions()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,155 @@
+"""
+Test: NotificationManager calcula todas las reglas en una pasada y cachea por generacion
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from core.usage_tracker import UsageTracker
+from core.notification_manager import NotificationManager
+
+
+class CountingNotificationManager(NotificationManager):
+    """NotificationManager que cuenta las consultas de metricas"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.queries = 0
+
+    def _load_item_metrics(self):
+        self.queries += 1
+        return super()._load_item_metrics()
+
+
+def _categories(notifications):
+    return [n['category'] for n in notifications]
+
+
+def test_rules_single_pass():
+    """Test: las reglas se disparan con una sola consulta de metricas"""
+    print("=" * 60)
+    print("TEST 1: Reglas en una sola pasada")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "notifications.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Dev")
+        popular = db.add_item(category_id, "Deploy", "make deploy")
+        failing = db.add_item(category_id, "Tests", "make test")
+        slow = db.add_item(category_id, "Build", "make build")
+        for index in range(6):
+            db.add_item(category_id, f"Nunca {index}", "echo")
+
+        tracker = UsageTracker(db_path, flush_interval_ms=60000, flush_max_events=1000)
+        for _ in range(30):
+            tracker.track_usage(popular, execution_time_ms=50)
+        for index in range(10):
+            tracker.track_usage(failing, execution_time_ms=50, success=index % 2 == 0,
+                                error_message=None if index % 2 == 0 else "boom")
+        for _ in range(10):
+            tracker.track_usage(slow, execution_time_ms=6000)
+        # Los fallos rapidos no bajan el promedio de las ejecuciones correctas
+        for _ in range(4):
+            tracker.track_usage(slow, execution_time_ms=0, success=False, error_message="timeout")
+        tracker.flush()
+
+        manager = CountingNotificationManager(db_path)
+        notifications = manager.get_pending_notifications()
+        print(f"  Notificaciones: {_categories(notifications)}")
+        assert manager.queries == 1
+
+        # Ordenadas por prioridad
+        # Sin campo de atajo en los items la regla de atajos no se dispara
+        assert _categories(notifications) == ['errors', 'favorites', 'performance', 'cleanup']
+        by_category = {n['category']: n for n in notifications}
+        assert [i['id'] for i in by_category['errors']['data']] == [failing]
+        assert by_category['errors']['data'][0]['error_rate'] == 50.0
+        assert [i['id'] for i in by_category['performance']['data']] == [slow]
+        assert by_category['performance']['data'][0]['avg_time_seconds'] == 6.0
+        assert by_category['performance']['data'][0]['executions'] == 10
+        assert by_category['favorites']['data'][0]['id'] == popular
+        assert len(by_category['cleanup']['data']) == 6
+
+        tracker.shutdown()
+
+    print("\n[PASS] Reglas evaluadas en memoria")
+
+
+def test_cache_invalidated_by_changes():
+    """Test: sin cambios se sirve de cache; un uso nuevo o una edicion la invalidan"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Cache por generacion del ChangeBus")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "notifications.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Dev")
+        item_id = db.add_item(category_id, "Deploy", "make deploy")
+
+        tracker = UsageTracker(db_path, flush_interval_ms=60000, flush_max_events=1000)
+        manager = CountingNotificationManager(db_path)
+
+        first = manager.get_pending_notifications()
+        second = manager.get_pending_notifications()
+        assert second == first and second is not manager._cache[1]
+        assert manager.queries == 1
+        assert manager.get_metrics() == {'evaluations': 1, 'cache_hits': 1}
+
+        # Escribir usos publica USAGE_RECORDED
+        for _ in range(11):
+            tracker.track_usage(item_id, execution_time_ms=10)
+        tracker.flush()
+        notifications = manager.get_pending_notifications()
+        assert manager.queries == 2
+        assert 'favorites' in _categories(notifications)
+
+        # Marcar como favorito tambien invalida y la sugerencia desaparece
+        db.update_item(item_id, is_favorite=1)
+        notifications = manager.get_pending_notifications()
+        assert manager.queries == 3
+        assert 'favorites' not in _categories(notifications)
+        print(f"  Metricas: {manager.get_metrics()}")
+
+        tracker.shutdown()
+
+    print("\n[PASS] Cache invalidada por cambios")
+
+
+def test_cache_expires_each_hour():
+    """Test: sin escrituras, el cambio de hora fuerza la reevaluacion"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Cache caduca al cambiar la hora")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "notifications.db")
+        db = DBManager(db_path)
+        db.add_item(db.add_category("Dev"), "Deploy", "make deploy")
+
+        manager = CountingNotificationManager(db_path)
+        period = ['2026-01-01 10']
+        manager._cache_period = lambda: period[0]
+
+        manager.get_pending_notifications()
+        manager.get_pending_notifications()
+        assert manager.queries == 1
+
+        # Las ventanas de RECENT_DAYS/ABANDONED_DAYS avanzan con la hora
+        period[0] = '2026-01-01 11'
+        manager.get_pending_notifications()
+        assert manager.queries == 2
+        assert manager.get_metrics() == {'evaluations': 2, 'cache_hits': 1}
+
+    print("\n[PASS] Cache reevaluada al cambiar la hora")
+
+
+if __name__ == "__main__":
+    test_rules_single_pass()
+    test_cache_invalidated_by_changes()
+    test_cache_expires_each_hour()
+    print("\nTODOS LOS TESTS PASARON")
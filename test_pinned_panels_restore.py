@@ -0,0 +1,141 @@
+"""
+Test: restauracion diferida de paneles anclados (cache de categorias, contenido bajo demanda, escritura en lote)
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from database.db_manager import DBManager
+from core.config_manager import ConfigManager
+from core.pinned_panels_manager import PinnedPanelsManager
+from views.floating_panel import FloatingPanel
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _make_config(tmpdir):
+    config = ConfigManager(db_path=str(Path(tmpdir) / "panels.db"))
+    category_id = config.db.add_category("Dev")
+    for label in ("Deploy", "Build", "Test"):
+        config.db.add_item(category_id, label, f"make {label.lower()}", tags=["ci"] if label == "Build" else None)
+    return config, category_id
+
+
+class CountingItemList:
+    """Envuelve ItemListView.set_items para contar los renderizados"""
+
+    def __init__(self, panel):
+        self.calls = 0
+        original = panel.item_list.set_items
+
+        def set_items(items):
+            self.calls += 1
+            original(items)
+        panel.item_list.set_items = set_items
+
+
+def test_batched_last_opened():
+    """Test: last_opened de varios paneles en una sola escritura"""
+    print("=" * 60)
+    print("TEST 1: last_opened en lote")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = DBManager(str(Path(tmpdir) / "panels.db"))
+        category_id = db.add_category("Dev")
+        panel_ids = [db.save_pinned_panel(category_id, 10 * i, 10, 300, 400) for i in range(3)]
+
+        PinnedPanelsManager(db).mark_panels_opened(panel_ids[:2])
+        counts = {panel['id']: panel['open_count'] for panel in db.get_pinned_panels()}
+        print(f"  open_count: {counts}")
+        assert counts == {panel_ids[0]: 1, panel_ids[1]: 1, panel_ids[2]: 0}
+        db.close()
+
+    print("\n[PASS] Escritura en lote")
+
+
+def test_get_category_uses_warm_cache():
+    """Test: con la cache caliente get_category no consulta la base de datos"""
+    print("\n" + "=" * 60)
+    print("TEST 2: get_category desde la cache")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config, category_id = _make_config(tmpdir)
+        categories = config.get_categories()
+
+        queries = []
+        original = config.db.get_category
+        config.db.get_category = lambda cat_id: queries.append(cat_id) or original(cat_id)
+
+        category = config.get_category(str(category_id))
+        assert category is categories[0] and queries == []
+
+        # Un item nuevo se ve en la cache sin recargar las demas
+        config.db.add_item(category_id, "Lint", "make lint")
+        category = config.get_category(category_id)
+        assert [item.label for item in category.items][-1] == "Lint"
+        print(f"  Consultas por id: {queries}")
+        config.db.close()
+
+    print("\n[PASS] Cache compartida")
+
+
+def test_panel_content_deferred():
+    """Test: un panel minimizado solo crea su marco hasta que se expande"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 3: Contenido bajo demanda")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config, category_id = _make_config(tmpdir)
+        category = config.get_category(category_id)
+
+        panel = FloatingPanel(config_manager=config, panel_id=1)
+        renders = CountingItemList(panel)
+        filter_config = {'advanced_filters': {}, 'state_filter': 'normal', 'search_text': 'build'}
+        panel.restore_category(category, filter_config, materialize=False)
+        panel.is_pinned = True
+        panel.toggle_minimize()
+        panel.show()
+
+        # Solo el marco: filtros aplicados al estado, sin items cargados
+        assert panel.header_label.text() == "Dev"
+        assert panel.search_bar.search_input.text() == "build"
+        assert renders.calls == 0 and panel.all_items == []
+
+        # Expandir carga y pinta una sola vez, ya filtrado
+        panel.toggle_minimize()
+        assert renders.calls == 1
+        assert len(panel.all_items) == 3
+        assert [panel.item_list.item_at_row(row).label
+                for row in range(panel.item_list.visible_count())] == ["Build"]
+
+        # Volver a minimizar/expandir no recarga
+        panel.toggle_minimize()
+        panel.toggle_minimize()
+        assert renders.calls == 1
+        print(f"  Renderizados: {renders.calls}")
+
+        panel.update_timer.stop()
+        panel.close()
+        config.db.close()
+
+    print("\n[PASS] Contenido diferido")
+
+
+if __name__ == "__main__":
+    test_batched_last_opened()
+    test_get_category_uses_warm_cache()
+    test_panel_content_deferred()
+    print("\nTODOS LOS TESTS PASARON")
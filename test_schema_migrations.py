@@ -0,0 +1,119 @@
+"""
+Test: migraciones versionadas del esquema (PRAGMA user_version)
+"""
+import sys
+import sqlite3
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from database.schema_migrations import (
+    LATEST_VERSION, Migration, get_schema_version, run_migrations, _m007_bookmarks_and_speed_dials
+)
+
+
+def _indexes(db, table):
+    return {row['name'] for row in db.execute_query(f"PRAGMA index_list({table})")}
+
+
+def _columns(db, table):
+    return {row['name'] for row in db.execute_query(f"PRAGMA table_info({table})")}
+
+
+def test_new_and_legacy_databases_reach_latest_version():
+    """Test: una base nueva y una antigua quedan en la ultima version"""
+    print("=" * 60)
+    print("TEST 1: Migrar al abrir")
+    print("=" * 60)
+
+    db = DBManager(":memory:")
+    print(f"  Aplicadas: {db.applied_migrations}")
+    assert get_schema_version(db.connect()) == LATEST_VERSION
+    assert [m['version'] for m in db.applied_migrations] == list(range(1, LATEST_VERSION + 1))
+    assert all(m['duration_ms'] >= 0 for m in db.applied_migrations)
+    assert {'idx_usage_history_item', 'idx_usage_history_date'} <= _indexes(db, 'item_usage_history')
+    assert {'idx_items_favorite', 'idx_items_use_count'} <= _indexes(db, 'items')
+    assert {'filter_config', 'keyboard_shortcut'} <= _columns(db, 'pinned_panels')
+    db.close()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "legacy.db")
+        # Esquema de una version antigua, sin columnas ni tablas nuevas
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE categories (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL,
+                                     icon TEXT, order_index INTEGER NOT NULL, is_active BOOLEAN DEFAULT 1);
+            CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, category_id INTEGER NOT NULL,
+                                label TEXT NOT NULL, content TEXT NOT NULL, type TEXT DEFAULT 'TEXT',
+                                icon TEXT, is_sensitive BOOLEAN DEFAULT 0, tags TEXT,
+                                created_at TIMESTAMP, updated_at TIMESTAMP);
+            INSERT INTO categories (name, order_index) VALUES ('Dev', 0);
+            INSERT INTO items (category_id, label, content) VALUES (1, 'Old', 'old');
+        """)
+        conn.close()
+
+        db = DBManager(db_path)
+        assert get_schema_version(db.connect()) == LATEST_VERSION
+        assert {'is_favorite', 'favorite_order', 'use_count', 'working_dir', 'is_list'} <= _columns(db, 'items')
+        assert db.execute_query("SELECT name FROM browser_profiles")[0]['name'] == "Default"
+        assert db.execute_query("SELECT use_count FROM items")[0]['use_count'] == 0
+        assert {'idx_bookmarks_order', 'idx_bookmarks_url'} <= _indexes(db, 'bookmarks')
+        assert 'idx_speed_dials_position' in _indexes(db, 'speed_dials')
+        assert [row['title'] for row in db.execute_query(
+            "SELECT title FROM speed_dials ORDER BY position")] == ["Google", "YouTube", "GitHub"]
+        db.close()
+
+        # Al reabrir no se aplica nada
+        db = DBManager(db_path)
+        assert db.applied_migrations == []
+        db.close()
+
+    # Los speed dials por defecto solo se agregan a una tabla vacia
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE speed_dials (id INTEGER PRIMARY KEY, title TEXT, url TEXT, "
+                 "icon TEXT, background_color TEXT, position INTEGER)")
+    conn.execute("INSERT INTO speed_dials (title, url, position) VALUES ('Mio', 'https://example.com', 0)")
+    _m007_bookmarks_and_speed_dials(conn)
+    assert conn.execute("SELECT title FROM speed_dials").fetchall() == [("Mio",)]
+    conn.close()
+
+    print("\n[PASS] Esquema en la ultima version")
+
+
+def test_failed_migration_is_rolled_back():
+    """Test: una migracion que falla no deja cambios ni sube la version"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Migracion fallida")
+    print("=" * 60)
+
+    conn = sqlite3.connect(":memory:")
+    conn.isolation_level = None
+
+    def create_table(c):
+        c.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY)")
+
+    def broken(c):
+        c.execute("CREATE TABLE other (id INTEGER PRIMARY KEY)")
+        c.execute("INSERT INTO missing_table VALUES (1)")
+
+    migrations = [Migration(1, "notes", create_table), Migration(2, "broken", broken)]
+    try:
+        run_migrations(conn, migrations)
+        assert False, "La migracion 2 deberia fallar"
+    except sqlite3.OperationalError as e:
+        print(f"  Error esperado: {e}")
+
+    assert get_schema_version(conn) == 1
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert 'notes' in tables and 'other' not in tables
+    conn.close()
+
+    print("\n[PASS] Version y cambios intactos tras el fallo")
+
+
+if __name__ == "__main__":
+    test_new_and_legacy_databases_reach_latest_version()
+    test_failed_migration_is_rolled_back()
+    print("\nTODOS LOS TESTS PASARON")
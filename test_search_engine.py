@@ -0,0 +1,133 @@
+"""
+Test: SearchEngine con indice invertido de n-gramas
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from models.item import Item
+from models.category import Category
+from core.search_engine import SearchEngine
+from database.change_events import ChangeBus, ChangeType
+
+
+def _create_category():
+    category = Category("1", "Dev")
+    category.items = [
+        Item("1", "Docker compose", "docker compose up -d", tags=["deploy"]),
+        Item("2", "Git status", "git status --short", tags=["vcs"]),
+        Item("3", "Password", "docker-registry-pass", is_sensitive=True),
+    ]
+    return category
+
+
+def test_substring_search_matches_linear_scan():
+    """Test: el indice devuelve lo mismo que una busqueda lineal"""
+    print("=" * 60)
+    print("TEST 1: Busqueda por subcadena")
+    print("=" * 60)
+
+    category = _create_category()
+    engine = SearchEngine()
+
+    for query in ["dock", "OSE", "st", "s", "deploy", "compose up", "nada", "d\x00"]:
+        expected = [
+            item for item in category.items
+            if query.lower() in item.label.lower()
+            or (not item.is_sensitive and query.lower() in item.content.lower())
+            or any(query.lower() in tag.lower() for tag in item.tags)
+        ]
+        results = engine.search_in_category(query, category)
+        print(f"  '{query}': {[item.label for item in results]}")
+        assert results == expected
+
+    # Las coincidencias no cruzan campos (contenido + tag)
+    assert engine.search_in_category("-ddeploy", category) == []
+
+    print("\n[PASS] Resultados iguales a la busqueda lineal")
+
+
+def test_incremental_updates():
+    """Test: add/update/delete actualizan el indice sin reconstruirlo"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Actualizacion incremental")
+    print("=" * 60)
+
+    category = _create_category()
+    engine = SearchEngine()
+    engine.index_items(category.items)
+
+    new_item = Item("4", "Kubectl pods", "kubectl get pods")
+    category.items.append(new_item)
+    engine.add_item(new_item)
+    assert engine.find_matching_ids("pods") == {"4"}
+
+    new_item.label = "Cluster nodes"
+    new_item.content = "kubectl get nodes"
+    engine.update_item(new_item)
+    assert engine.find_matching_ids("pods") == set()
+    assert engine.find_matching_ids("nodes") == {"4"}
+
+    engine.delete_item("4")
+    assert engine.find_matching_ids("nodes") == set()
+    assert not any("4" in postings for postings in engine._postings.values())
+
+    print("\n[PASS] El indice se actualiza de forma incremental")
+
+
+def test_index_follows_change_bus():
+    """Test: los cambios publicados por DBManager actualizan el indice"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Indice sincronizado con ChangeBus")
+    print("=" * 60)
+
+    bus = ChangeBus()
+    category = _create_category()
+    engine = SearchEngine(change_bus=bus)
+    assert [item.id for item in engine.search_in_category("git", category)] == ["2"]
+
+    # Editado en su sitio (mismo objeto) y borrado
+    category.items[1].label = "Kubectl logs"
+    category.items[1].content = "kubectl logs -f"
+    bus.publish(ChangeType.ITEM_UPDATED, item_ids=[2], fields=["label", "content"])
+    bus.publish(ChangeType.ITEM_DELETED, item_ids=[1])
+    assert engine.search_in_category("git", category) == []
+    assert [item.id for item in engine.search_in_category("kub", category)] == ["2"]
+    assert engine.find_matching_ids("docker") == set()
+    assert not any("1" in postings for postings in engine._postings.values())
+
+    print("\n[PASS] Indice al dia con los cambios")
+
+
+def test_queries_use_postings_only():
+    """Test: las consultas no recorren ni re-indexan todos los items"""
+    print("\n" + "=" * 60)
+    print("TEST 4: Consultas desde los postings")
+    print("=" * 60)
+
+    category = Category("1", "Grande")
+    category.items = [Item(str(n), f"Item {n}", f"contenido {n}") for n in range(2000)]
+    category.items.append(Item("z", "Zeta", "ultimo"))
+    engine = SearchEngine()
+    engine.search_in_category("zeta", category)
+
+    indexed = []
+    original_update = engine.update_item
+    engine.update_item = lambda item: (indexed.append(item.id), original_update(item))
+    for query in ["z", "ze", "zet", "zeta", "m 19", "1999"]:
+        results = engine.search_in_category(query, category)
+        print(f"  '{query}': {len(results)} resultados")
+    assert indexed == []  # el alcance ya estaba indexado
+    assert [item.id for item in engine.search_in_category("ze", category)] == ["z"]
+    assert [item.id for item in engine.search_in_category("m 19", category)][:2] == ["19", "190"]
+
+    print("\n[PASS] Resultados desde los postings")
+
+
+if __name__ == "__main__":
+    test_substring_search_matches_linear_scan()
+    test_incremental_updates()
+    test_index_follows_change_bus()
+    test_queries_use_postings_only()
+    print("\nTODOS LOS TESTS PASARON")
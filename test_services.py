@@ -0,0 +1,80 @@
+"""
+Test: registro de instancias compartidas (core.services)
+"""
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core import services
+from database.change_events import ChangeBus
+from database.connection_pool import ConnectionPool
+
+
+class Service:
+    created = 0
+
+    def __init__(self, name="default"):
+        Service.created += 1
+        self.name = name
+        self.valid = True
+
+
+def test_one_instance_per_key():
+    """Test: una instancia por (clase, clave), tambien entre hilos"""
+    print("=" * 60)
+    print("TEST 1: Una instancia por clave")
+    print("=" * 60)
+
+    Service.created = 0
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(services.get_shared(Service, "a")))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert Service.created == 1 and all(result is results[0] for result in results)
+    other = services.get_shared(Service, "b", factory=lambda: Service("b"))
+    assert other.name == "b" and other is not results[0]
+    assert services.find_shared(Service, "c") is None
+    assert len(services.all_shared(Service)) == 2
+
+    # Instancia invalida: se reemplaza
+    results[0].valid = False
+    replacement = services.get_shared(Service, "a", is_valid=lambda service: service.valid)
+    assert replacement is not results[0] and Service.created == 3
+
+    assert services.remove_shared(Service, all_keys=True) and services.all_shared(Service) == []
+
+    print("\n[PASS] Instancias compartidas")
+
+
+def test_managers_use_registry():
+    """Test: los managers comparten sus instancias a traves del registro"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Managers sobre el registro")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "servicios.db")
+        # Rutas distintas del mismo fichero: misma instancia
+        relative = str(Path(tmpdir) / "." / "servicios.db")
+        assert ChangeBus.get_shared(db_path) is ChangeBus.get_shared(relative)
+
+        pool = ConnectionPool.get_shared(db_path)
+        assert services.find_shared(ConnectionPool, services.path_key(db_path)) is pool
+        ConnectionPool.close_shared(db_path)
+        assert ConnectionPool.get_shared(db_path) is not pool
+        ConnectionPool.close_shared(db_path)
+
+    print("\n[PASS] Managers sobre el registro")
+
+
+if __name__ == "__main__":
+    test_one_instance_per_key()
+    test_managers_use_registry()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,75 @@
+"""
+Test: UsageTracker y FavoritesManager compartidos por los widgets
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from models.item import Item
+from database.db_manager import DBManager
+from core.usage_tracker import UsageTracker
+from core.favorites_manager import FavoritesManager
+
+
+def test_item_buttons_share_managers():
+    """Test: los ItemButton reutilizan los managers y no consultan favoritos"""
+    print("=" * 60)
+    print("TEST 1: Managers compartidos")
+    print("=" * 60)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    original_cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            db = DBManager("widget_sidebar.db")
+            cat_id = db.add_category("Dev", "code", 0)
+            item_id = db.add_item(cat_id, "Deploy", "make deploy")
+
+            from views.widgets.item_widget import ItemButton
+
+            assert UsageTracker.get_shared() is UsageTracker.get_shared()
+            favorites = FavoritesManager.get_shared()
+            assert favorites is FavoritesManager.get_shared()
+
+            # El estado de favorito sale del Item, sin consultas por widget
+            queries = []
+            original_is_favorite = favorites.is_favorite
+            favorites.is_favorite = lambda i: queries.append(i) or original_is_favorite(i)
+
+            buttons = [
+                ItemButton(Item(str(item_id), "Deploy", "make deploy", is_favorite=i % 2 == 0))
+                for i in range(20)
+            ]
+            assert queries == []
+            assert all(button.usage_tracker is buttons[0].usage_tracker for button in buttons)
+            assert all(button.favorites_manager is favorites for button in buttons)
+            assert buttons[0].favorite_btn.text() == "⭐"
+            assert buttons[1].favorite_btn.text() == "☆"
+
+            # Alternar actualiza el Item y la base de datos
+            buttons[1].toggle_favorite()
+            assert buttons[1].item.is_favorite is True
+            assert buttons[1].favorite_btn.text() == "⭐"
+
+            favorites.is_favorite = original_is_favorite
+            for button in buttons:
+                button.deleteLater()
+            app.processEvents()
+            db.close()
+        finally:
+            os.chdir(original_cwd)
+
+    print("\n[PASS] Los widgets comparten managers")
+
+
+if __name__ == "__main__":
+    test_item_buttons_share_managers()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,87 @@
+"""
+Test: linea de tiempo del arranque y subsistemas cargados bajo demanda
+"""
+import sys
+import json
+import builtins
+import subprocess
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from core.startup_timeline import StartupTimeline
+
+
+def test_timeline_measures_imports_and_phases():
+    """Test: tiempos de import por modulo, fases excluidas e informe JSON"""
+    print("=" * 60)
+    print("TEST 1: Informe de arranque")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "slow_child_mod.py").write_text("import time\ntime.sleep(0.02)\n")
+        (Path(tmpdir) / "slow_parent_mod.py").write_text("import time\nimport slow_child_mod\ntime.sleep(0.01)\n")
+        sys.path.insert(0, tmpdir)
+        original_import = builtins.__import__
+        try:
+            timeline = StartupTimeline()
+            timeline.install_import_timer()
+            import slow_parent_mod  # noqa: F401
+            timeline.mark("modules imported")
+            with timeline.exclude("authentication"):
+                import time
+                time.sleep(0.05)
+            timeline.mark("window shown")
+
+            report_path = Path(tmpdir) / "startup.json"
+            timeline.finish(str(report_path))
+            assert builtins.__import__ is original_import
+        finally:
+            builtins.__import__ = original_import
+            sys.path.remove(tmpdir)
+            for name in ("slow_parent_mod", "slow_child_mod"):
+                sys.modules.pop(name, None)
+
+        print(timeline.format_report())
+        imports = {entry['module']: entry for entry in timeline.get_report()['imports']}
+        parent, child = imports['slow_parent_mod'], imports['slow_child_mod']
+        assert child['self_ms'] >= 15 and parent['total_ms'] >= parent['self_ms'] + child['total_ms'] - 1
+        assert parent['self_ms'] < child['self_ms']
+
+        phases = timeline.get_report()['phases']
+        assert [phase['label'] for phase in phases] == [
+            "modules imported", "authentication (excluded)", "window shown"
+        ]
+        # La espera del login no cuenta en el tiempo de arranque
+        assert phases[2]['at_ms'] - phases[0]['at_ms'] < 40
+        assert json.loads(report_path.read_text())['phases'][-1]['label'] == "window shown"
+
+    print("\n[PASS] Informe de arranque generado")
+
+
+def test_controller_defers_heavy_subsystems():
+    """Test: importar el controlador no carga el navegador ni el motor de filtros"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Imports diferidos")
+    print("=" * 60)
+
+    code = (
+        "import sys; sys.path.insert(0, 'src');"
+        "import controllers.main_controller;"
+        "print(sorted(m for m in sys.modules if 'WebEngine' in m or 'matplotlib' in m"
+        " or m.endswith(('simple_browser_manager', 'category_filter_engine'))))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent,
+                            capture_output=True, text=True, timeout=60)
+    print(f"  Modulos pesados cargados: {result.stdout.strip()}")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+    print("\n[PASS] Subsistemas pesados sin cargar")
+
+
+if __name__ == "__main__":
+    test_timeline_measures_imports_and_phases()
+    test_controller_defers_heavy_subsystems()
+    print("\nTODOS LOS TESTS PASARON")
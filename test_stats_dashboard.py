@@ -0,0 +1,118 @@
+"""
+Test: StatsDashboard carga sus datos en segundo plano y construye las pestañas bajo demanda
+"""
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtWidgets import QApplication
+
+from database.db_manager import DBManager
+from core.usage_tracker import UsageTracker
+from core.stats_manager import StatsManager
+from views.dialogs import stats_dashboard
+from views.dialogs.stats_loader import SECTIONS
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _wait_until(condition, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+    assert condition(), "timeout esperando al dashboard"
+
+
+class RecordingStatsManager(StatsManager):
+    """StatsManager que registra el hilo de cada consulta"""
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.query_threads = set()
+
+    def get_dashboard_stats(self):
+        self.query_threads.add(threading.get_ident())
+        return super().get_dashboard_stats()
+
+    def get_usage_by_day(self, days=30):
+        self.query_threads.add(threading.get_ident())
+        return super().get_usage_by_day(days=days)
+
+
+def test_dashboard_loads_in_background():
+    """Test: el dialog abre sin consultar y cada pestaña se pinta al llegar sus datos"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Carga en segundo plano y pestañas diferidas")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "stats.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Dev")
+        deploy = db.add_item(category_id, "Deploy", "make deploy")
+        tracker = UsageTracker(db_path, flush_interval_ms=60000, flush_max_events=1000)
+        for _ in range(3):
+            tracker.track_usage(deploy, execution_time_ms=100)
+        tracker.flush()
+
+        manager = RecordingStatsManager(db_path)
+        original_get_shared = stats_dashboard.FavoritesManager.get_shared
+        original_manager = stats_dashboard.StatsManager
+        stats_dashboard.StatsManager = lambda: manager
+        stats_dashboard.FavoritesManager.get_shared = classmethod(lambda cls: original_get_shared(db_path))
+        try:
+            dialog = stats_dashboard.StatsDashboard()
+        finally:
+            stats_dashboard.StatsManager = original_manager
+            stats_dashboard.FavoritesManager.get_shared = classmethod(original_get_shared.__func__)
+
+        # Nada se construye ni se pinta durante el constructor
+        assert dialog._built_tabs == {} and dialog._section_data == {}
+
+        _wait_until(lambda: set(dialog._section_data) == set(SECTIONS))
+        assert threading.get_ident() not in manager.query_threads
+        print(f"  Hilos de consulta: {len(manager.query_threads)}")
+
+        # Solo la pestaña visible se construyo
+        assert list(dialog._built_tabs) == ['summary']
+        assert dialog.total_executions_card.findChild(
+            stats_dashboard.QLabel, "value_label").text() == "3"
+        assert dialog._tab_placeholders['summary'].isHidden()
+
+        # Visitar una pestaña la construye y la pinta con los datos ya cargados
+        dialog.tabs.setCurrentIndex(SECTIONS.index('categories'))
+        assert 'categories' in dialog._built_tabs
+        assert dialog.categories_table.item(0, 0).text() == "Dev"
+
+        # Cambiar el período recarga solo el uso; un resultado viejo se ignora
+        dialog.tabs.setCurrentIndex(SECTIONS.index('usage'))
+        dialog.period_combo.setCurrentIndex(1)
+        dialog.period_combo.setCurrentIndex(2)
+        _wait_until(lambda: not dialog._pending_tasks)
+        assert dialog._section_data['usage']['days'] == 90
+        assert len(dialog.usage_timeline_chart.values) == 90
+        assert dialog.usage_timeline_chart.values[-1] == 3
+        assert sum(dialog.usage_by_hour_chart.values) == 3
+        assert sum(map(sum, dialog.usage_heatmap.matrix)) == 3
+
+        dialog.done(0)
+        dialog.thread_pool.waitForDone()
+        tracker.shutdown()
+
+    print("\n[PASS] Dashboard cargado de forma progresiva")
+
+
+if __name__ == "__main__":
+    test_dashboard_loads_in_background()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,119 @@
+"""
+Test: TimerScheduler (rueda de tiempo con un solo QTimer)
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from core.timer_scheduler import TimerScheduler
+
+
+def _get_app():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    return app
+
+
+def _run_events(duration_ms):
+    deadline = time.perf_counter() + duration_ms / 1000
+    while time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.002)
+
+
+def test_deadlines_and_cancel():
+    """Test: los plazos se disparan en orden, una vez, y se pueden cancelar"""
+    app = _get_app()
+    print("=" * 60)
+    print("TEST 1: Plazos y cancelacion")
+    print("=" * 60)
+
+    scheduler = TimerScheduler(tick_ms=5, slots=8)
+    fired = []
+    scheduler.schedule(60, lambda: fired.append("largo"))  # mas de una vuelta de la rueda
+    scheduler.schedule(10, lambda: fired.append("corto"))
+    cancelled = scheduler.schedule(20, lambda: fired.append("cancelado"))
+    assert scheduler.cancel(cancelled) and not scheduler.cancel(cancelled)
+
+    _run_events(150)
+    assert fired == ["corto", "largo"]
+
+    # Sin plazos pendientes el QTimer se detiene
+    metrics = scheduler.get_metrics()
+    print(f"  Metricas: {metrics}")
+    assert metrics['pending'] == 0 and not metrics['timer_active']
+    assert metrics['fired'] == 2 and metrics['cancelled'] == 1
+
+    print("\n[PASS] Plazos")
+
+
+def test_owner_destroyed_cancels():
+    """Test: destruir el owner cancela sus callbacks"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 2: Cancelacion al destruir el owner")
+    print("=" * 60)
+
+    scheduler = TimerScheduler(tick_ms=5)
+    owners = [QWidget() for _ in range(1000)]
+    fired = []
+    for index, owner in enumerate(owners):
+        scheduler.schedule(30, lambda index=index: fired.append(index), owner=owner)
+    scheduler.schedule(30, lambda: fired.append("repetido"), owner=owners[0], repeat=True)
+    assert scheduler.pending_count() == 1001
+
+    for owner in owners[1:]:
+        owner.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    scheduler.cancel_owner(owners[0])
+    _run_events(100)
+
+    print(f"  Disparados: {fired}")
+    assert fired == [] and scheduler.pending_count() == 0
+
+    print("\n[PASS] Owners destruidos")
+
+
+def test_suspend_holds_suspendable_only():
+    """Test: suspendido retiene las animaciones pero no los plazos normales"""
+    app = _get_app()
+    print("\n" + "=" * 60)
+    print("TEST 3: Suspension")
+    print("=" * 60)
+
+    scheduler = TimerScheduler(tick_ms=5)
+    frames = []
+    deadlines = []
+    owner = QObject()
+    scheduler.schedule(10, lambda: frames.append(1), owner=owner, repeat=True, suspendable=True)
+    scheduler.suspend()
+    scheduler.schedule(20, lambda: deadlines.append(1))
+
+    _run_events(80)
+    assert deadlines == [1]
+    assert frames == []
+    metrics = scheduler.get_metrics()
+    # Solo queda la animacion retenida: el QTimer no despierta
+    assert metrics['held'] == 1 and not metrics['timer_active']
+
+    scheduler.resume()
+    _run_events(80)
+    print(f"  Frames tras reanudar: {len(frames)}")
+    assert len(frames) >= 3
+    scheduler.cancel_owner(owner)
+    assert not scheduler.get_metrics()['timer_active']
+
+    print("\n[PASS] Suspension")
+
+
+if __name__ == "__main__":
+    test_deadlines_and_cancel()
+    test_owner_destroyed_cancels()
+    test_suspend_holds_suspendable_only()
+    print("\nTODOS LOS TESTS PASARON")
@@ -0,0 +1,156 @@
+"""
+Test: tablas de rollup de uso (por hora y por dia)
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from database.usage_rollups import rebuild_rollups
+from core.usage_tracker import UsageTracker
+from core.stats_manager import StatsManager
+
+
+def _rollup_rows(db, table):
+    return [dict(row) for row in db.execute_query(f"SELECT * FROM {table} ORDER BY 1, 2")]
+
+
+def test_rollups_follow_tracked_usage():
+    """Test: track_usage mantiene los rollups y las estadisticas los leen"""
+    print("=" * 60)
+    print("TEST 1: Rollups incrementales")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "rollups.db")
+        db = DBManager(db_path)
+        category_id = db.add_category("Dev")
+        deploy = db.add_item(category_id, "Deploy", "make deploy")
+        build = db.add_item(category_id, "Build", "make build")
+
+        tracker = UsageTracker(db_path, flush_interval_ms=60000, flush_max_events=1000)
+        for i in range(12):
+            tracker.track_usage(deploy, execution_time_ms=100, success=i != 0)
+        tracker.track_usage(build, execution_time_ms=50)
+        tracker.flush()
+
+        daily = _rollup_rows(db, "item_usage_daily")
+        print(f"  Diario por item: {daily}")
+        assert sorted(row['executions'] for row in daily) == [1, 12]
+        totals = _rollup_rows(db, "usage_daily_totals")
+        assert totals[0]['executions'] == 13 and totals[0]['failed'] == 1
+        assert totals[0]['total_time_ms'] == 1250 and totals[0]['success_time_ms'] == 1150
+
+        # Los rollups coinciden con recalcularlos desde el historial
+        snapshot = [_rollup_rows(db, table) for table in
+                    ("item_usage_hourly", "item_usage_daily", "usage_hourly_totals", "usage_daily_totals")]
+        conn = db.connect()
+        rebuild_rollups(conn)
+        conn.commit()
+        assert snapshot == [_rollup_rows(db, table) for table in
+                            ("item_usage_hourly", "item_usage_daily", "usage_hourly_totals", "usage_daily_totals")]
+
+        stats = StatsManager(db_path)
+        assert [item['id'] for item in stats.get_most_used_items(limit=2, period='week')] == [deploy, build]
+        assert stats.get_most_used_items(limit=1, period='today')[0]['recent_uses'] == 12
+        assert stats.get_trending_items(days=7)[0]['recent_uses'] in (1, 12)
+        assert [item['id'] for item in stats.suggest_favorites()] == [deploy]
+        dashboard = stats.get_dashboard_stats()
+        assert dashboard['total_executions'] == 13 and dashboard['executions_week'] == 13
+        assert stats.get_productivity_stats(days=7)['active_days'] == 1
+
+        by_day = tracker.get_usage_by_day(days=7)
+        assert by_day[0]['executions'] == 13 and by_day[0]['unique_items'] == 2
+        assert sum(row['executions'] for row in tracker.get_usage_by_hour(days=1)) == 13
+        assert tracker.get_total_executions_week() == 13
+
+        # Eliminar un item borra sus rollups pero no los totales globales
+        db.delete_item(build)
+        assert len(_rollup_rows(db, "item_usage_daily")) == 1
+        assert tracker.get_total_executions() == 13
+
+        tracker.shutdown()
+        db.close()
+
+    print("\n[PASS] Rollups actualizados en cada escritura")
+
+
+def test_rollups_backfilled_from_history():
+    """Test: una base con historial previo rellena los rollups al abrirse"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Relleno inicial")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "legacy.db")
+        db = DBManager(db_path)
+        item_id = db.add_item(db.add_category("Dev"), "Old", "old")
+        conn = db.connect()
+        conn.executemany(
+            "INSERT INTO item_usage_history (item_id, used_at, success) VALUES (?, ?, ?)",
+            [(item_id, "2020-01-01 10:15:00", 1), (item_id, "2020-01-01 10:45:00", 0),
+             (item_id, "2020-01-02 08:00:00", 1)]
+        )
+        # Base de datos anterior a la migracion de rollups
+        for table in ("item_usage_hourly", "item_usage_daily", "usage_hourly_totals", "usage_daily_totals"):
+            conn.execute(f"DROP TABLE {table}")
+        conn.execute("PRAGMA user_version = 4")
+        conn.commit()
+        db.close()
+
+        db = DBManager(db_path)
+        totals = _rollup_rows(db, "usage_daily_totals")
+        print(f"  Totales diarios: {totals}")
+        assert [(row['day'], row['executions']) for row in totals] == [("2020-01-01", 2), ("2020-01-02", 1)]
+        hourly = _rollup_rows(db, "item_usage_hourly")
+        assert hourly[0]['hour_start'] == "2020-01-01 10:00:00" and hourly[0]['failed'] == 1
+        db.close()
+
+    print("\n[PASS] Rollups rellenados desde el historial")
+
+
+def test_success_time_added_to_existing_rollups():
+    """Test: una base con rollups sin success_time_ms la agrega y la rellena"""
+    print("\n" + "=" * 60)
+    print("TEST 3: Tiempo de ejecuciones correctas")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "v5.db")
+        db = DBManager(db_path)
+        item_id = db.add_item(db.add_category("Dev"), "Build", "make")
+        conn = db.connect()
+        conn.executemany(
+            "INSERT INTO item_usage_history (item_id, used_at, execution_time_ms, success) VALUES (?, ?, ?, ?)",
+            [(item_id, "2020-01-01 10:15:00", 6000, 1), (item_id, "2020-01-01 10:45:00", 200, 0)]
+        )
+        # Rollups de la version 5 (sin success_time_ms)
+        conn.execute("DROP TABLE item_usage_daily")
+        conn.execute("""
+            CREATE TABLE item_usage_daily (
+                day TEXT NOT NULL, item_id INTEGER NOT NULL,
+                executions INTEGER NOT NULL DEFAULT 0, successful INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0, total_time_ms INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, item_id)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("PRAGMA user_version = 5")
+        conn.commit()
+        db.close()
+
+        db = DBManager(db_path)
+        daily = _rollup_rows(db, "item_usage_daily")
+        print(f"  Diario por item: {daily}")
+        assert daily[0]['total_time_ms'] == 6200 and daily[0]['success_time_ms'] == 6000
+        db.close()
+
+    print("\n[PASS] success_time_ms agregado a los rollups existentes")
+
+
+if __name__ == "__main__":
+    test_rollups_follow_tracked_usage()
+    test_rollups_backfilled_from_history()
+    test_success_time_added_to_existing_rollups()
+    print("\nTODOS LOS TESTS PASARON")
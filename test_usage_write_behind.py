@@ -0,0 +1,102 @@
+"""
+Test: UsageTracker con cola de escritura en segundo plano (write-behind)
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from database.db_manager import DBManager
+from core.usage_tracker import UsageTracker
+from core.stats_manager import StatsManager
+
+
+def _create_db(tmpdir):
+    db_path = str(Path(tmpdir) / "usage.db")
+    db = DBManager(db_path)
+    category_id = db.add_category("Dev")
+    item_id = db.add_item(category_id, "Deploy", "make deploy")
+    return db, db_path, item_id
+
+
+def _db_use_count(db, item_id):
+    return db.execute_query("SELECT use_count FROM items WHERE id = ?", (item_id,))[0]['use_count']
+
+
+def test_read_your_writes_and_batched_flush():
+    """Test: los usos encolados se ven antes de escribirse y se escriben en lote"""
+    print("=" * 60)
+    print("TEST 1: Lecturas con usos pendientes")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, db_path, item_id = _create_db(tmpdir)
+        # Intervalo largo: nada se escribe hasta flush()
+        tracker = UsageTracker(db_path, flush_interval_ms=60000, flush_max_events=1000)
+
+        for i in range(10):
+            assert tracker.track_usage(item_id, execution_time_ms=i, success=i != 3, error_message=None)
+
+        assert _db_use_count(db, item_id) == 0
+        assert tracker.get_use_count(item_id) == 10
+        assert tracker.get_total_executions() == 10
+        assert len(tracker.get_usage_history(item_id, limit=4)) == 4
+        assert tracker.get_last_used(item_id) is not None
+
+        written = tracker.flush()
+        print(f"  Escritos: {written}, metricas: {tracker.get_queue_metrics()}")
+        assert written == 10
+        assert _db_use_count(db, item_id) == 10
+        assert tracker.get_use_count(item_id) == 10
+        assert tracker.get_total_executions() == 10
+        assert tracker.get_error_count(item_id) == 1
+        assert tracker.get_queue_metrics()['flushes'] == 1
+
+        tracker.shutdown()
+        db.close()
+
+    print("\n[PASS] Lecturas consistentes y un solo lote")
+
+
+def test_background_flush_and_shutdown():
+    """Test: el hilo escribe al llenar el lote y shutdown escribe el resto"""
+    print("\n" + "=" * 60)
+    print("TEST 2: Escritura en segundo plano")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db, db_path, item_id = _create_db(tmpdir)
+        tracker = UsageTracker(db_path, flush_interval_ms=60000, flush_max_events=5)
+
+        for _ in range(5):
+            tracker.track_usage(item_id)
+
+        deadline = time.monotonic() + 5
+        while tracker.get_queue_metrics()['pending'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _db_use_count(db, item_id) == 5
+
+        tracker.track_usage(item_id)
+        tracker.shutdown()
+        assert _db_use_count(db, item_id) == 6
+        assert not tracker._writer
+
+        # StatsManager ve los usos pendientes del tracker compartido
+        shared = UsageTracker.get_shared(db_path)
+        shared.flush_interval_ms = 60000
+        shared.track_usage(item_id)
+        most_used = StatsManager(db_path).get_most_used_items(limit=1)
+        assert most_used[0]['use_count'] == 7
+        UsageTracker.shutdown_shared()
+
+        db.close()
+
+    print("\n[PASS] Lotes escritos en segundo plano")
+
+
+if __name__ == "__main__":
+    test_read_your_writes_and_batched_flush()
+    test_background_flush_and_shutdown()
+    print("\nTODOS LOS TESTS PASARON")